@@ -4,11 +4,8 @@ from importlib.metadata import (
     version as __version,
 )
 
-from eth.chains import (
-    Chain,
-    MainnetChain,
-    MainnetTesterChain,
-    RopstenChain,
+from eth._utils.module_loading import (
+    lazy_module_attributes,
 )
 
 #
@@ -19,3 +16,14 @@ sys.setrecursionlimit(max(EVM_RECURSION_LIMIT, sys.getrecursionlimit()))
 
 
 __version__ = __version("py-evm")
+
+# The chains import every fork, so they are only imported when first accessed
+__getattr__, __dir__ = lazy_module_attributes(
+    __name__,
+    {
+        "Chain": "eth.chains.Chain",
+        "MainnetChain": "eth.chains.MainnetChain",
+        "MainnetTesterChain": "eth.chains.MainnetTesterChain",
+        "RopstenChain": "eth.chains.RopstenChain",
+    },
+)
@@ -1,3 +1,7 @@
+from itertools import (
+    cycle,
+    islice,
+)
 import struct
 from typing import (
     Tuple,
@@ -29,44 +33,33 @@ doc = """
 """
 
 
-class Blake2:
-    """Blake2 is a base class for Blake2b and Blake2s"""
-
-    # for more than 10 rounds, the schedule wraps around to the beginning
-    sigma_schedule = (
-        (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15),
-        (14, 10, 4, 8, 9, 15, 13, 6, 1, 12, 0, 2, 11, 7, 5, 3),
-        (11, 8, 12, 0, 5, 2, 15, 13, 10, 14, 3, 6, 7, 1, 9, 4),
-        (7, 9, 3, 1, 13, 12, 11, 14, 2, 6, 5, 10, 4, 0, 15, 8),
-        (9, 0, 5, 7, 2, 4, 10, 15, 14, 1, 11, 12, 6, 8, 3, 13),
-        (2, 12, 6, 10, 0, 11, 8, 3, 4, 13, 7, 5, 15, 14, 1, 9),
-        (12, 5, 1, 15, 14, 13, 4, 10, 0, 7, 6, 3, 9, 2, 8, 11),
-        (13, 11, 7, 14, 12, 1, 3, 9, 5, 0, 15, 4, 8, 6, 2, 10),
-        (6, 15, 14, 9, 11, 3, 0, 8, 12, 2, 13, 7, 1, 4, 10, 5),
-        (10, 2, 8, 4, 7, 6, 1, 5, 15, 11, 9, 14, 3, 12, 13, 0),
-    )
-
+MASK_64 = 2**64 - 1
 
-class Blake2b(Blake2):
-    WORDBITS = 64
-    MASKBITS = 2**WORDBITS - 1
-    WORDFMT = "Q"
-
-    IV = (
-        0x6A09E667F3BCC908,
-        0xBB67AE8584CAA73B,
-        0x3C6EF372FE94F82B,
-        0xA54FF53A5F1D36F1,
-        0x510E527FADE682D1,
-        0x9B05688C2B3E6C1F,
-        0x1F83D9ABFB41BD6B,
-        0x5BE0CD19137E2179,
-    )
+IV = (
+    0x6A09E667F3BCC908,
+    0xBB67AE8584CAA73B,
+    0x3C6EF372FE94F82B,
+    0xA54FF53A5F1D36F1,
+    0x510E527FADE682D1,
+    0x9B05688C2B3E6C1F,
+    0x1F83D9ABFB41BD6B,
+    0x5BE0CD19137E2179,
+)
 
-    ROT1 = 32
-    ROT2 = 24
-    ROT3 = 16
-    ROT4 = 63
+# The order of the message words in each round. For more than 10 rounds, the
+# schedule wraps around to the beginning
+SIGMA_SCHEDULE = (
+    (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15),
+    (14, 10, 4, 8, 9, 15, 13, 6, 1, 12, 0, 2, 11, 7, 5, 3),
+    (11, 8, 12, 0, 5, 2, 15, 13, 10, 14, 3, 6, 7, 1, 9, 4),
+    (7, 9, 3, 1, 13, 12, 11, 14, 2, 6, 5, 10, 4, 0, 15, 8),
+    (9, 0, 5, 7, 2, 4, 10, 15, 14, 1, 11, 12, 6, 8, 3, 13),
+    (2, 12, 6, 10, 0, 11, 8, 3, 4, 13, 7, 5, 15, 14, 1, 9),
+    (12, 5, 1, 15, 14, 13, 4, 10, 0, 7, 6, 3, 9, 2, 8, 11),
+    (13, 11, 7, 14, 12, 1, 3, 9, 5, 0, 15, 4, 8, 6, 2, 10),
+    (6, 15, 14, 9, 11, 3, 0, 8, 12, 2, 13, 7, 1, 4, 10, 5),
+    (10, 2, 8, 4, 7, 6, 1, 5, 15, 11, 9, 14, 3, 12, 13, 0),
+)
 
 
 TMessageBlock = Tuple[int, int, int, int, int, int, int, int]
@@ -83,107 +76,145 @@ def blake2b_compress(
     'F Compression' from section 3.2 of RFC 7693:
     https://tools.ietf.org/html/rfc7693#section-3.2
     """
-    # Dereference these for [very small] speed improvement.
-    # Perhaps more than anything, this makes the code
-    # easier to read.
-    MASKBITS = Blake2b.MASKBITS
-    WORDBITS = Blake2b.WORDBITS
-    IV = Blake2b.IV
-    ROT1 = Blake2b.ROT1
-    ROT2 = Blake2b.ROT2
-    ROT3 = Blake2b.ROT3
-    ROT4 = Blake2b.ROT4
-    WB_ROT1 = WORDBITS - ROT1
-    WB_ROT2 = WORDBITS - ROT2
-    WB_ROT3 = WORDBITS - ROT3
-    WB_ROT4 = WORDBITS - ROT4
-
-    sigma_schedule = Blake2b.sigma_schedule
-    sigma_schedule_len = len(sigma_schedule)
-
     # convert block (if bytes) into tuple of 16 LE words
     # *later versions of blake2b use the tuple form, but older versions use bytes
-    m = (
-        block
-        if isinstance(block, tuple)
-        else struct.unpack_from(f"<16{Blake2b.WORDFMT}", bytes(block))
-    )
+    m = block if isinstance(block, tuple) else struct.unpack_from("<16Q", bytes(block))
 
-    v = [0] * 16
-    v[0:8] = h_starting_state
-    v[8:12] = IV[:4]
-    v[12] = t_offset_counters[0] ^ IV[4]
-    v[13] = t_offset_counters[1] ^ IV[5]
+    # The message words of each round, in the order that the round mixes them in, so
+    # that rounds only unpack them into locals
+    permuted_messages = tuple(
+        tuple(m[index] for index in sigma) for sigma in SIGMA_SCHEDULE
+    )
 
+    v0, v1, v2, v3, v4, v5, v6, v7 = h_starting_state
+    v8, v9, v10, v11, v12, v13, v14, v15 = IV
+    v12 ^= t_offset_counters[0]
+    v13 ^= t_offset_counters[1]
     if final_block_flag:
-        v[14] = Blake2b.MASKBITS ^ IV[6]
-    else:
-        v[14] = IV[6]
-
-    # The original code had a mechanism to turn on a "tree mode",
-    # setting f[1] to MASKBITS here.
-    # There seems to be no reference to that bit flip in the 3.2 section of RFC 7693,
-    # and there is no such setting in EIP-152. So the bit flip option is removed.
-    v[15] = IV[7]
-
-    # Within the confines of the Python language, this is a
-    # highly optimized version of G().  It differs some from
-    # the formal specification and reference implementation.
-    def G(a: int, b: int, c: int, d: int) -> None:
-        # dereference v[] for another small speed improvement
-        va = v[a]
-        vb = v[b]
-        vc = v[c]
-        vd = v[d]
-        va = (va + vb + msri2) & MASKBITS
-        w = vd ^ va
-        vd = (w >> ROT1) | (w << (WB_ROT1)) & MASKBITS
-        vc = (vc + vd) & MASKBITS
-        w = vb ^ vc
-        vb = (w >> ROT2) | (w << (WB_ROT2)) & MASKBITS
-        va = (va + vb + msri21) & MASKBITS
-        w = vd ^ va
-        vd = (w >> ROT3) | (w << (WB_ROT3)) & MASKBITS
-        vc = (vc + vd) & MASKBITS
-        w = vb ^ vc
-        vb = (w >> ROT4) | (w << (WB_ROT4)) & MASKBITS
-        # re-reference v[]
-        v[a] = va
-        v[b] = vb
-        v[c] = vc
-        v[d] = vd
-
-    # time to ChaCha
-    for r in range(num_rounds):
-        # resolve as much as possible outside G() and
-        # don't pass as argument, let scope do its job.
-        # Result is a 50% speed increase, but sadly,
-        # "slow" divided by 1.5 is still "slow".  :-/
-        sr = sigma_schedule[r % sigma_schedule_len]
-        msri2 = m[sr[0]]
-        msri21 = m[sr[1]]
-        G(0, 4, 8, 12)
-        msri2 = m[sr[2]]
-        msri21 = m[sr[3]]
-        G(1, 5, 9, 13)
-        msri2 = m[sr[4]]
-        msri21 = m[sr[5]]
-        G(2, 6, 10, 14)
-        msri2 = m[sr[6]]
-        msri21 = m[sr[7]]
-        G(3, 7, 11, 15)
-        msri2 = m[sr[8]]
-        msri21 = m[sr[9]]
-        G(0, 5, 10, 15)
-        msri2 = m[sr[10]]
-        msri21 = m[sr[11]]
-        G(1, 6, 11, 12)
-        msri2 = m[sr[12]]
-        msri21 = m[sr[13]]
-        G(2, 7, 8, 13)
-        msri2 = m[sr[14]]
-        msri21 = m[sr[15]]
-        G(3, 4, 9, 14)
-
-    result_message_words = (h_starting_state[i] ^ v[i] ^ v[i + 8] for i in range(8))
-    return struct.pack(f"<8{Blake2b.WORDFMT}", *result_message_words)
+        v14 ^= MASK_64
+
+    # The state is kept in locals, and G is inlined with constant rotations, rather
+    # than reading and writing a list in a nested function for each G
+    mask = MASK_64
+    for m0, m1, m2, m3, m4, m5, m6, m7, m8, m9, m10, m11, m12, m13, m14, m15 in islice(
+        cycle(permuted_messages), num_rounds
+    ):
+        # mix the columns
+        # G(v0, v4, v8, v12)
+        v0 = (v0 + v4 + m0) & mask
+        w = v12 ^ v0
+        v12 = (w >> 32) | ((w << 32) & mask)
+        v8 = (v8 + v12) & mask
+        w = v4 ^ v8
+        v4 = (w >> 24) | ((w << 40) & mask)
+        v0 = (v0 + v4 + m1) & mask
+        w = v12 ^ v0
+        v12 = (w >> 16) | ((w << 48) & mask)
+        v8 = (v8 + v12) & mask
+        w = v4 ^ v8
+        v4 = (w >> 63) | ((w << 1) & mask)
+        # G(v1, v5, v9, v13)
+        v1 = (v1 + v5 + m2) & mask
+        w = v13 ^ v1
+        v13 = (w >> 32) | ((w << 32) & mask)
+        v9 = (v9 + v13) & mask
+        w = v5 ^ v9
+        v5 = (w >> 24) | ((w << 40) & mask)
+        v1 = (v1 + v5 + m3) & mask
+        w = v13 ^ v1
+        v13 = (w >> 16) | ((w << 48) & mask)
+        v9 = (v9 + v13) & mask
+        w = v5 ^ v9
+        v5 = (w >> 63) | ((w << 1) & mask)
+        # G(v2, v6, v10, v14)
+        v2 = (v2 + v6 + m4) & mask
+        w = v14 ^ v2
+        v14 = (w >> 32) | ((w << 32) & mask)
+        v10 = (v10 + v14) & mask
+        w = v6 ^ v10
+        v6 = (w >> 24) | ((w << 40) & mask)
+        v2 = (v2 + v6 + m5) & mask
+        w = v14 ^ v2
+        v14 = (w >> 16) | ((w << 48) & mask)
+        v10 = (v10 + v14) & mask
+        w = v6 ^ v10
+        v6 = (w >> 63) | ((w << 1) & mask)
+        # G(v3, v7, v11, v15)
+        v3 = (v3 + v7 + m6) & mask
+        w = v15 ^ v3
+        v15 = (w >> 32) | ((w << 32) & mask)
+        v11 = (v11 + v15) & mask
+        w = v7 ^ v11
+        v7 = (w >> 24) | ((w << 40) & mask)
+        v3 = (v3 + v7 + m7) & mask
+        w = v15 ^ v3
+        v15 = (w >> 16) | ((w << 48) & mask)
+        v11 = (v11 + v15) & mask
+        w = v7 ^ v11
+        v7 = (w >> 63) | ((w << 1) & mask)
+        # mix the diagonals
+        # G(v0, v5, v10, v15)
+        v0 = (v0 + v5 + m8) & mask
+        w = v15 ^ v0
+        v15 = (w >> 32) | ((w << 32) & mask)
+        v10 = (v10 + v15) & mask
+        w = v5 ^ v10
+        v5 = (w >> 24) | ((w << 40) & mask)
+        v0 = (v0 + v5 + m9) & mask
+        w = v15 ^ v0
+        v15 = (w >> 16) | ((w << 48) & mask)
+        v10 = (v10 + v15) & mask
+        w = v5 ^ v10
+        v5 = (w >> 63) | ((w << 1) & mask)
+        # G(v1, v6, v11, v12)
+        v1 = (v1 + v6 + m10) & mask
+        w = v12 ^ v1
+        v12 = (w >> 32) | ((w << 32) & mask)
+        v11 = (v11 + v12) & mask
+        w = v6 ^ v11
+        v6 = (w >> 24) | ((w << 40) & mask)
+        v1 = (v1 + v6 + m11) & mask
+        w = v12 ^ v1
+        v12 = (w >> 16) | ((w << 48) & mask)
+        v11 = (v11 + v12) & mask
+        w = v6 ^ v11
+        v6 = (w >> 63) | ((w << 1) & mask)
+        # G(v2, v7, v8, v13)
+        v2 = (v2 + v7 + m12) & mask
+        w = v13 ^ v2
+        v13 = (w >> 32) | ((w << 32) & mask)
+        v8 = (v8 + v13) & mask
+        w = v7 ^ v8
+        v7 = (w >> 24) | ((w << 40) & mask)
+        v2 = (v2 + v7 + m13) & mask
+        w = v13 ^ v2
+        v13 = (w >> 16) | ((w << 48) & mask)
+        v8 = (v8 + v13) & mask
+        w = v7 ^ v8
+        v7 = (w >> 63) | ((w << 1) & mask)
+        # G(v3, v4, v9, v14)
+        v3 = (v3 + v4 + m14) & mask
+        w = v14 ^ v3
+        v14 = (w >> 32) | ((w << 32) & mask)
+        v9 = (v9 + v14) & mask
+        w = v4 ^ v9
+        v4 = (w >> 24) | ((w << 40) & mask)
+        v3 = (v3 + v4 + m15) & mask
+        w = v14 ^ v3
+        v14 = (w >> 16) | ((w << 48) & mask)
+        v9 = (v9 + v14) & mask
+        w = v4 ^ v9
+        v4 = (w >> 63) | ((w << 1) & mask)
+
+    h0, h1, h2, h3, h4, h5, h6, h7 = h_starting_state
+    return struct.pack(
+        "<8Q",
+        h0 ^ v0 ^ v8,
+        h1 ^ v1 ^ v9,
+        h2 ^ v2 ^ v10,
+        h3 ^ v3 ^ v11,
+        h4 ^ v4 ^ v12,
+        h5 ^ v5 ^ v13,
+        h6 ^ v6 ^ v14,
+        h7 ^ v7 ^ v15,
+    )
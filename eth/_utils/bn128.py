@@ -13,6 +13,15 @@ from py_ecc.optimized_bn128 import (
     FQP,
 )
 
+# The parameter x of the BN curve, of which the field modulus and curve order are
+# polynomials
+BN128_X = 4965661367192848881
+
+# Coefficients of the endomorphism psi, which untwists a point of the twist, applies
+# the Frobenius map to it, and twists it back
+PSI_X_COEFF = FQ2([9, 1]) ** ((bn128.field_modulus - 1) // 3)
+PSI_Y_COEFF = FQ2([9, 1]) ** ((bn128.field_modulus - 1) // 2)
+
 
 def validate_point(x: int, y: int) -> Tuple[bn128.FQ, bn128.FQ, bn128.FQ]:
     FQ = bn128.FQ
@@ -41,3 +50,32 @@ def FQP_point_to_FQ2_point(pt: Tuple[FQP, FQP, FQP]) -> Tuple[FQ2, FQ2, FQ2]:
         FQ2(pt[1].coeffs),
         FQ2(pt[2].coeffs),
     )
+
+
+def _conjugate(fq2: FQ2) -> FQ2:
+    coord0, coord1 = fq2.coeffs
+    return FQ2([coord0, -coord1])
+
+
+def psi(pt: Tuple[FQ2, FQ2, FQ2]) -> Tuple[FQ2, FQ2, FQ2]:
+    x, y, z = pt
+    return (
+        _conjugate(x) * PSI_X_COEFF,
+        _conjugate(y) * PSI_Y_COEFF,
+        _conjugate(z),
+    )
+
+
+def is_in_g2_subgroup(pt: Tuple[FQ2, FQ2, FQ2]) -> bool:
+    """
+    Check that a point of the twist is in G2, with
+    ``[x + 1]P + psi([x]P) + psi^2([x]P) == psi^3([2x]P)``, which only holds in G2
+    (https://eprint.iacr.org/2022/348, section 5.1). It takes a multiplication by
+    ``x``, of 63 bits, instead of one by ``curve_order``.
+    """
+    x_pt = bn128.multiply(pt, BN128_X)
+    psi_x_pt = psi(x_pt)
+    psi2_x_pt = psi(psi_x_pt)
+    lhs = bn128.add(bn128.add(x_pt, pt), bn128.add(psi_x_pt, psi2_x_pt))
+    rhs = psi(psi(psi(bn128.double(x_pt))))
+    return bn128.eq(lhs, rhs)
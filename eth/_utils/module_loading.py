@@ -2,10 +2,15 @@ from importlib import (
     import_module,
 )
 import operator
+import sys
 from types import (
     ModuleType,
 )
 from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
     Tuple,
 )
 
@@ -54,3 +59,31 @@ def split_at_longest_importable_path(dotted_path: str) -> Tuple[str, str]:
             return import_part, remainder
     else:
         return "", dotted_path
+
+
+def lazy_module_attributes(
+    module_name: str, attribute_paths: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Return the ``__getattr__`` and ``__dir__`` functions of the module
+    ``module_name``, which import each of its attributes in ``attribute_paths``
+    from its dotted path, relative to ``module_name`` if it starts with a dot, when
+    it is first accessed (see PEP 562).
+    """
+
+    def __getattr__(name: str) -> Any:
+        try:
+            attribute_path = attribute_paths[name]
+        except KeyError:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+        module_path, attribute_name = attribute_path.rsplit(".", 1)
+        value = getattr(import_module(module_path, module_name), attribute_name)
+        # later accesses find the attribute without calling __getattr__
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[module_name])) | set(attribute_paths))
+
+    return __getattr__, __dir__
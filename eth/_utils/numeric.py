@@ -1,5 +1,4 @@
 import decimal
-import itertools
 from typing import (
     Union,
 )
@@ -12,8 +11,6 @@ from eth_utils.toolz import (
 )
 
 from eth.constants import (
-    UINT_255_MAX,
-    UINT_256_CEILING,
     UINT_256_MAX,
 )
 
@@ -38,18 +35,16 @@ def ceil8(x: int) -> int:
     return (x + 7) & ~7
 
 
+# The sign bit of 256-bit words, interpreted as two's complement signed integers
+SIGN_BIT = 2**255
+
+
 def unsigned_to_signed(value: int) -> int:
-    if value <= UINT_255_MAX:
-        return value
-    else:
-        return value - UINT_256_CEILING
+    return (value ^ SIGN_BIT) - SIGN_BIT
 
 
 def signed_to_unsigned(value: int) -> int:
-    if value < 0:
-        return value + UINT_256_CEILING
-    else:
-        return value
+    return value & UINT_256_MAX
 
 
 def is_even(value: int) -> bool:
@@ -61,13 +56,10 @@ def is_odd(value: int) -> bool:
 
 
 def get_highest_bit_index(value: int) -> int:
-    value >>= 1
-    for bit_length in itertools.count():
-        if not value:
-            return bit_length
-        value >>= 1
-
-    raise Exception("Invariant: unreachable code path")
+    """
+    Return the index of the highest set bit of ``value``, or 0 if ``value`` is 0.
+    """
+    return max(value.bit_length() - 1, 0)
 
 
 @curry
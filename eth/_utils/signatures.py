@@ -0,0 +1,111 @@
+from typing import (
+    Tuple,
+)
+
+from eth_keys import (
+    keys,
+)
+from eth_typing import (
+    Address,
+    Hash32,
+)
+from lru import (
+    LRU,
+)
+
+from eth.db.cache import (
+    CacheStats,
+)
+from eth.typing import (
+    VRS,
+)
+
+SIGNATURE_RECOVERY_CACHE_SIZE = 16384
+
+# Bytes of the message hash, the signature and the recovered address of each entry
+_ENTRY_SIZE = 32 + 65 + 20
+
+
+class SignatureRecoveryCache:
+    """
+    Bounded cache of the signers recovered from signatures, by message hash and
+    signature. Signatures that can't be recovered are not cached.
+    """
+
+    def __init__(self, max_size: int = SIGNATURE_RECOVERY_CACHE_SIZE) -> None:
+        self._signers: LRU[Tuple[Hash32, int, int, int], Address] = LRU(
+            max_size, callback=self._count_eviction
+        )
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def recover_signer(self, vrs: VRS, message_hash: Hash32) -> Address:
+        """
+        Return the address whose key signed ``message_hash`` with the signature
+        ``vrs``, where v is the y parity. Raise like
+        :meth:`eth_keys.datatypes.Signature.recover_public_key_from_msg_hash` if
+        the signature is invalid.
+        """
+        key = (message_hash, *vrs)
+        try:
+            signer = self._signers[key]
+        except KeyError:
+            self._misses += 1
+        else:
+            self._hits += 1
+            return signer
+
+        signature = keys.Signature(vrs=vrs)
+        public_key = signature.recover_public_key_from_msg_hash(message_hash)
+        signer = Address(public_key.to_canonical_address())
+        self._signers[key] = signer
+        return signer
+
+    def _count_eviction(
+        self, key: Tuple[Hash32, int, int, int], value: Address
+    ) -> None:
+        self._evictions += 1
+
+    @property
+    def max_size(self) -> int:
+        return self._signers.get_size()
+
+    def resize(self, max_size: int) -> None:
+        self._signers.set_size(max_size)
+
+    def clear(self) -> None:
+        self._signers.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            rejections=0,
+            entries=len(self._signers),
+            size_in_bytes=len(self._signers) * _ENTRY_SIZE,
+        )
+
+    def reset_stats(self) -> None:
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+
+# Shared by sender and authority recovery and the ecrecover precompile, which often
+# see the same signatures again, when blocks are re-executed or calls simulated
+_signature_recovery_cache = SignatureRecoveryCache()
+
+
+def get_signature_recovery_cache() -> SignatureRecoveryCache:
+    """
+    Return the process-wide cache of recovered signers, to read its stats or resize
+    it.
+    """
+    return _signature_recovery_cache
+
+
+def recover_signer_from_msg_hash(vrs: VRS, message_hash: Hash32) -> Address:
+    return _signature_recovery_cache.recover_signer(vrs, message_hash)
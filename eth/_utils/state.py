@@ -6,9 +6,6 @@ from eth.typing import (
     AccountDiff,
     AccountState,
 )
-from eth.vm.forks.prague.constants import (
-    DELEGATION_DESIGNATION_PREFIX,
-)
 from eth.vm.state import (
     BaseState,
 )
@@ -47,4 +44,12 @@ def code_is_delegation_designation(code: bytes) -> bool:
     """
     Check if code loaded from the state is a delegation designation.
     """
-    return len(code) == 23 and code[:3] == DELEGATION_DESIGNATION_PREFIX
+    if len(code) != 23:
+        return False
+
+    # imported here, because the Prague state imports this module
+    from eth.vm.forks.prague.constants import (
+        DELEGATION_DESIGNATION_PREFIX,
+    )
+
+    return code[:3] == DELEGATION_DESIGNATION_PREFIX
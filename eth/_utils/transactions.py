@@ -1,5 +1,13 @@
+from concurrent.futures import (
+    Executor,
+)
 from typing import (
+    Iterable,
+    List,
     NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
     Union,
 )
 
@@ -10,16 +18,24 @@ from eth_keys import (
 from eth_keys.exceptions import (
     BadSignature,
 )
+from eth_typing import (
+    Hash32,
+)
 from eth_utils import (
     ValidationError,
     int_to_big_endian,
+    keccak,
 )
 import rlp
 
 from eth._utils.numeric import (
     is_even,
 )
+from eth._utils.signatures import (
+    recover_signer_from_msg_hash,
+)
 from eth.abc import (
+    SetCodeAuthorizationAPI,
     SignedTransactionAPI,
     UnsignedTransactionAPI,
 )
@@ -99,13 +115,75 @@ def validate_transaction_signature(transaction: SignedTransactionAPI) -> None:
         raise ValidationError("Invalid Signature")
 
 
+def recover_signer(vrs: VRS, message: bytes) -> Address:
+    return recover_signer_from_msg_hash(vrs, Hash32(keccak(message)))
+
+
 def extract_transaction_sender(transaction: SignedTransactionAPI) -> Address:
-    vrs = (transaction.y_parity, transaction.r, transaction.s)
-    signature = keys.Signature(vrs=vrs)
-    message = transaction.get_message_for_signing()
-    public_key = signature.recover_public_key_from_msg(message)
-    sender = public_key.to_canonical_address()
-    return Address(sender)
+    vrs = VRS((transaction.y_parity, transaction.r, transaction.s))
+    return recover_signer(vrs, transaction.get_message_for_signing())
+
+
+# Number of signatures handed to an executor's worker at a time
+RECOVERY_CHUNK_SIZE = 16
+
+
+def _try_recover_signer(vrs_and_message: Tuple[VRS, bytes]) -> Optional[Address]:
+    try:
+        return recover_signer(*vrs_and_message)
+    except (BadSignature, ValidationError):
+        # Leave invalid signatures to be reported when the sender is requested
+        return None
+
+
+def _get_authorizations(
+    transaction: SignedTransactionAPI,
+) -> Sequence[SetCodeAuthorizationAPI]:
+    try:
+        return transaction.authorization_list
+    except (AttributeError, NotImplementedError):
+        # authorization lists were introduced in Prague
+        return ()
+
+
+def recover_senders(
+    transactions: Iterable[SignedTransactionAPI],
+    executor: Executor = None,
+) -> None:
+    """
+    Recover the sender of each transaction, and the authority of each set-code
+    authorization, ahead of executing them, and cache the results on the
+    ``sender`` and ``authority`` properties.
+
+    If an ``executor`` is given, the signatures are recovered in its workers. Only
+    signatures and messages are sent to the workers, so both thread and process
+    pools work. Invalid signatures are skipped, and only raise when the property
+    is accessed.
+    """
+    # (object with a cached property, property name, (vrs, message))
+    pending: List[Tuple[object, str, Tuple[VRS, bytes]]] = []
+    for transaction in transactions:
+        if "sender" not in vars(transaction):
+            vrs = VRS((transaction.y_parity, transaction.r, transaction.s))
+            message = transaction.get_message_for_signing()
+            pending.append((transaction, "sender", (vrs, message)))
+
+        for authorization in _get_authorizations(transaction):
+            if "authority" not in vars(authorization):
+                vrs = VRS((authorization.y_parity, authorization.r, authorization.s))
+                message = authorization.get_message_for_signing()
+                pending.append((authorization, "authority", (vrs, message)))
+
+    jobs = [job for _, _, job in pending]
+    if executor is None:
+        signers: Iterable[Optional[Address]] = map(_try_recover_signer, jobs)
+    else:
+        signers = executor.map(_try_recover_signer, jobs, chunksize=RECOVERY_CHUNK_SIZE)
+
+    for (obj, attribute, _), signer in zip(pending, signers):
+        if signer is not None:
+            # Prime the ``cached_property``, as if it had been accessed
+            vars(obj)[attribute] = signer
 
 
 class IntrinsicGasSchedule(NamedTuple):
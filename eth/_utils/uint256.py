@@ -0,0 +1,89 @@
+"""
+Arithmetic on the unsigned 256-bit words of the EVM stack, for the opcodes that
+don't map to a single Python operator. Every function takes and returns words in
+``[0, 2**256)``, and checks for common operands, like non-negative signed values
+or powers of two, before falling back to the general case.
+"""
+import functools
+from typing import (
+    Tuple,
+)
+
+from eth._utils.numeric import (
+    SIGN_BIT,
+    unsigned_to_signed,
+)
+from eth.constants import (
+    UINT_256_CEILING,
+    UINT_256_MAX,
+)
+
+# Products of words below this bound don't overflow
+UINT_128_CEILING = 2**128
+
+
+def sdiv(numerator: int, denominator: int) -> int:
+    if denominator == 0:
+        return 0
+    elif numerator < SIGN_BIT and denominator < SIGN_BIT:
+        return numerator // denominator
+
+    signed_numerator = unsigned_to_signed(numerator)
+    signed_denominator = unsigned_to_signed(denominator)
+    quotient = abs(signed_numerator) // abs(signed_denominator)
+    if (signed_numerator < 0) != (signed_denominator < 0):
+        quotient = -quotient
+    return quotient & UINT_256_MAX
+
+
+def smod(value: int, mod: int) -> int:
+    if mod == 0:
+        return 0
+    elif value < SIGN_BIT and mod < SIGN_BIT:
+        return value % mod
+
+    signed_value = unsigned_to_signed(value)
+    remainder = abs(signed_value) % abs(unsigned_to_signed(mod))
+    if signed_value < 0:
+        remainder = -remainder
+    return remainder & UINT_256_MAX
+
+
+def exp(base: int, exponent: int) -> int:
+    if exponent == 0:
+        return 1
+    elif base <= 1 or exponent == 1:
+        return base
+    elif base == 2:
+        return 1 << exponent if exponent < 256 else 0
+    else:
+        return pow(base, exponent, UINT_256_CEILING)
+
+
+@functools.lru_cache(maxsize=None)
+def get_exp_gas_by_byte_length(gas_per_byte: int) -> Tuple[int, ...]:
+    """
+    Return the gas that EXP charges for exponents of each byte length, from 0 to 32.
+    """
+    return tuple(gas_per_byte * byte_length for byte_length in range(33))
+
+
+def signextend(bits: int, value: int) -> int:
+    if bits >= 31:
+        # the sign bit is the highest bit of the word, or beyond it
+        return value
+
+    sign_bit = 1 << (bits * 8 + 7)
+    if value & sign_bit:
+        return value | (UINT_256_CEILING - sign_bit)
+    else:
+        return value & (sign_bit - 1)
+
+
+def sar(shift_length: int, value: int) -> int:
+    if shift_length >= 256:
+        return UINT_256_MAX if value & SIGN_BIT else 0
+    elif value < SIGN_BIT:
+        return value >> shift_length
+    else:
+        return (unsigned_to_signed(value) >> shift_length) & UINT_256_MAX
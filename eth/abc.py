@@ -2,6 +2,9 @@ from abc import (
     ABC,
     abstractmethod,
 )
+from concurrent.futures import (
+    Executor,
+)
 from typing import (
     Any,
     Callable,
@@ -40,6 +43,8 @@ from eth_utils import (
 
 from eth.constants import (
     BLANK_ROOT_HASH,
+    GENESIS_PARENT_HASH,
+    HEADER_STREAM_SEGMENT_SIZE,
 )
 from eth.exceptions import (
     VMError,
@@ -427,6 +432,23 @@ class SetCodeAuthorizationAPI(ABC):
         """
         ...
 
+    @abstractmethod
+    def get_message_for_signing(self) -> bytes:
+        """
+        Return the message the authority signed to produce this authorization.
+        """
+        ...
+
+    @property
+    @abstractmethod
+    def authority(self) -> Address:
+        """
+        Return the address that signed this authorization. Raises
+        :class:`~eth_keys.exceptions.BadSignature` or
+        :class:`~eth_utils.ValidationError` if the signature is invalid.
+        """
+        ...
+
 
 class TransactionFieldsAPI(ABC):
     """
@@ -1255,6 +1277,22 @@ class HeaderDatabaseAPI(ABC):
         """
         ...
 
+    @abstractmethod
+    def persist_header_stream(
+        self,
+        headers: Iterable[BlockHeaderAPI],
+        genesis_parent_hash: Hash32 = GENESIS_PARENT_HASH,
+        segment_size: int = HEADER_STREAM_SEGMENT_SIZE,
+    ) -> Tuple[Tuple[BlockHeaderAPI, ...], Tuple[BlockHeaderAPI, ...]]:
+        """
+        Persist a long chain of headers, such as one read from an RLP stream, in
+        segments of ``segment_size`` contiguous headers. Each segment is persisted
+        like :meth:`persist_header_chain`, in a single atomic batch, so that an
+        interrupted import keeps the segments that were persisted.
+        Return the new and the old canonical headers of all segments.
+        """
+        ...
+
 
 class ChainDatabaseAPI(HeaderDatabaseAPI):
     """
@@ -1296,6 +1334,22 @@ class ChainDatabaseAPI(HeaderDatabaseAPI):
         """
         ...
 
+    @abstractmethod
+    def persist_blocks(
+        self,
+        blocks: Sequence[BlockAPI],
+        genesis_parent_hash: Hash32 = None,
+    ) -> Tuple[Tuple[Tuple[Hash32, ...], Tuple[Hash32, ...]], ...]:
+        """
+        Persist the given blocks, in order, in a single atomic batch. Return, for
+        each block, the same canonical hash changes as :meth:`persist_block`.
+
+        .. warning::
+            Like :meth:`persist_block`, this assumes all block transactions have been
+            persisted already.
+        """
+        ...
+
     @abstractmethod
     def persist_unexecuted_block(
         self,
@@ -2277,6 +2331,16 @@ class ComputationAPI(
         """
         ...
 
+    @classmethod
+    @abstractmethod
+    def configure_precompile_backend(cls, backend_name: str) -> Type["ComputationAPI"]:
+        """
+        Return a subclass of this computation class that runs the precompiles of the
+        backend registered as ``backend_name``, after checking that they behave like
+        the precompiles that they replace.
+        """
+        ...
+
     @abstractmethod
     def get_opcode_fn(self, opcode: int) -> OpcodeAPI:
         """
@@ -3487,6 +3551,18 @@ class ConsensusAPI(ABC):
         """
         ...
 
+    def validate_seals(
+        self, headers: Sequence[BlockHeaderAPI], executor: Executor
+    ) -> None:
+        """
+        Validate the seals on the given headers, like :meth:`validate_seal`, and
+        raise the error of the first invalid one. Consensus schemes whose seals
+        can be checked independently may spread the work across ``executor``. By
+        default, seals are validated one at a time, in the calling thread.
+        """
+        for header in headers:
+            self.validate_seal(header)
+
     @abstractmethod
     def validate_seal_extension(
         self, header: BlockHeaderAPI, parents: Iterable[BlockHeaderAPI]
@@ -3999,6 +4075,15 @@ class VirtualMachineAPI(ConfigurableAPI):
         """
         ...
 
+    @abstractmethod
+    def validate_seals(
+        self, headers: Sequence[BlockHeaderAPI], executor: Executor
+    ) -> None:
+        """
+        Validate the seals on the given headers, possibly in ``executor``.
+        """
+        ...
+
     @abstractmethod
     def validate_seal_extension(
         self, header: BlockHeaderAPI, parents: Iterable[BlockHeaderAPI]
@@ -4494,6 +4579,37 @@ class ChainAPI(ConfigurableAPI):
         """
         ...
 
+    @abstractmethod
+    def import_blocks(
+        self,
+        blocks: Iterable[Union[BlockAPI, bytes]],
+        perform_validation: bool = True,
+        executor: Executor = None,
+        max_pending: int = 16,
+    ) -> Iterator[BlockImportResult]:
+        """
+        Import the given ``blocks``, in order, and yield a
+        :class:`~eth.abc.BlockImportResult` for each, as it is persisted.
+
+        ``blocks`` may also contain RLP-encoded blocks, which are decoded with
+        the block class of the fork they belong to.
+
+        Importing is pipelined: blocks are decoded, seals are checked and senders
+        are recovered in ``executor`` ahead of execution, blocks are executed in
+        order, and executed blocks are validated and persisted by a writer
+        thread, in batches. At most ``max_pending`` blocks are queued between two
+        stages.
+        Blocks are only imported as the returned iterator is consumed. If an
+        error interrupts the import, the blocks before the failing one are still
+        persisted, as if they had been imported one at a time.
+
+        ``executor`` must be a thread pool, because seals are checked through the
+        chain's VMs and consensus context, which can't be sent to other
+        processes. Pure-Python seal checks, like proof of work, hold the GIL, so
+        they mostly overlap with I/O rather than with execution.
+        """
+        ...
+
     #
     # Validation API
     #
@@ -4537,6 +4653,7 @@ class ChainAPI(ConfigurableAPI):
         root: BlockHeaderAPI,
         descendants: Tuple[BlockHeaderAPI, ...],
         seal_check_random_sample_rate: int = 1,
+        executor: Executor = None,
     ) -> None:
         """
         Validate that all of the descendents are valid, given that the
@@ -4545,6 +4662,12 @@ class ChainAPI(ConfigurableAPI):
         By default, check the seal validity (Proof-of-Work on Ethereum 1.x mainnet)
         of all headers. This can be expensive. Instead, check a random sample of seals
         using seal_check_random_sample_rate.
+
+        If ``executor`` is given, the headers are linked and validated in order
+        first, and then their seals are validated in ``executor``, which should be
+        a process pool for proof of work. Workers keep their own epoch caches, so
+        forked workers reuse the caches generated before the pool was started, and
+        all workers can load them from :func:`eth.consensus.pow.set_cache_dir`.
         """
         ...
 
@@ -1,12 +1,14 @@
-from .base import (  # noqa: F401
-    Chain,
-)
-from .mainnet import (  # noqa: F401
-    MainnetChain,
-)
-from .ropsten import (  # noqa: F401
-    RopstenChain,
-)
-from .tester import (  # noqa: F401
-    MainnetTesterChain,
+from eth._utils.module_loading import (
+    lazy_module_attributes,
+)
+
+# Each chain imports its forks, so they are only imported when first accessed
+__getattr__, __dir__ = lazy_module_attributes(
+    __name__,
+    {
+        "Chain": ".base.Chain",
+        "MainnetChain": ".mainnet.MainnetChain",
+        "MainnetTesterChain": ".tester.MainnetTesterChain",
+        "RopstenChain": ".ropsten.RopstenChain",
+    },
 )
@@ -1,15 +1,31 @@
+from collections import (
+    deque,
+)
+from concurrent.futures import (
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+)
+import copy
+import functools
 import logging
 import operator
 import random
 from typing import (
     Any,
     Callable,
+    Deque,
     Dict,
     Iterable,
+    Iterator,
+    List,
     Optional,
     Sequence,
     Tuple,
     Type,
+    TypeVar,
+    Union,
+    cast,
 )
 
 from eth_typing import (
@@ -31,6 +47,7 @@ from eth_utils.toolz import (
     sliding_window,
     take,
 )
+import rlp
 
 from eth._utils.datatypes import (
     Configurable,
@@ -41,6 +58,9 @@ from eth._utils.db import (
 from eth._utils.rlp import (
     validate_imported_block_unchanged,
 )
+from eth._utils.transactions import (
+    recover_senders,
+)
 from eth.abc import (
     AtomicDatabaseAPI,
     BlockAndMetaWitness,
@@ -73,6 +93,9 @@ from eth.db.chain import (
 from eth.db.header import (
     HeaderDB,
 )
+from eth.db.prefetch import (
+    PrefetchCacheDB,
+)
 from eth.estimators import (
     get_gas_estimator,
 )
@@ -81,6 +104,9 @@ from eth.exceptions import (
     TransactionNotFound,
     VMNotFound,
 )
+from eth.rlp.blocks import (
+    BaseBlock,
+)
 from eth.rlp.headers import (
     BlockHeader,
 )
@@ -98,6 +124,16 @@ from eth.validation import (
 from eth.vm.chain_context import (
     ChainContext,
 )
+from eth.vm.header import (
+    HeaderSedes,
+)
+
+TItem = TypeVar("TItem")
+TResult = TypeVar("TResult")
+
+# The results of persisting the valid blocks of a batch, and the error raised by
+# the first invalid one, if any
+_BatchPersistResult = Tuple[Tuple[BlockPersistResult, ...], Optional[Exception]]
 
 
 class BaseChain(Configurable, ChainAPI):
@@ -139,6 +175,7 @@ class BaseChain(Configurable, ChainAPI):
         root: BlockHeaderAPI,
         descendants: Tuple[BlockHeaderAPI, ...],
         seal_check_random_sample_rate: int = 1,
+        executor: Executor = None,
     ) -> None:
         all_indices = range(len(descendants))
         if seal_check_random_sample_rate == 1:
@@ -150,6 +187,7 @@ class BaseChain(Configurable, ChainAPI):
             indices_to_check_seal = set(random.sample(all_indices, sample_size))
 
         header_pairs = sliding_window(2, concatv([root], descendants))
+        headers_to_check_seal: List[BlockHeaderAPI] = []
 
         for index, (parent, child) in enumerate(header_pairs):
             if child.parent_hash != parent.hash:
@@ -167,7 +205,15 @@ class BaseChain(Configurable, ChainAPI):
                 ) from exc
 
             if index in indices_to_check_seal:
-                vm.validate_seal(child)
+                if executor is None:
+                    vm.validate_seal(child)
+                else:
+                    headers_to_check_seal.append(child)
+
+        # seals are independent of each other, so they are checked last, in bulk
+        seals_by_vm_class = groupby(self.get_vm_class, headers_to_check_seal)
+        for headers in seals_by_vm_class.values():
+            self.get_vm(headers[0]).validate_seals(headers, executor)
 
     def validate_chain_extension(self, headers: Tuple[BlockHeaderAPI, ...]) -> None:
         for index, header in enumerate(headers):
@@ -484,8 +530,108 @@ class Chain(BaseChain):
     def import_block(
         self, block: BlockAPI, perform_validation: bool = True
     ) -> BlockImportResult:
+        parent_header = self._get_parent_header_for_import(block)
+        block_result = self._execute_block(block, parent_header, perform_validation)
+        imported_block = block_result.block
+
+        persist_result = self.persist_block(imported_block, perform_validation)
+        return BlockImportResult(*persist_result, block_result.meta_witness)
+
+    def import_blocks(
+        self,
+        blocks: Iterable[Union[BlockAPI, bytes]],
+        perform_validation: bool = True,
+        executor: Executor = None,
+        max_pending: int = 16,
+    ) -> Iterator[BlockImportResult]:
+        # Headers of executed blocks that aren't persisted yet. The next block's VM
+        # looks up its ancestors by hash, so the pipeline reads through them
+        # instead of waiting for the writer. They never reach the database.
+        pending_headers: Dict[bytes, bytes] = {}
+        pipeline = copy.copy(self)
+        pipeline.chaindb = self.get_chaindb_class()(
+            PrefetchCacheDB(self.chaindb.db, pending_headers)
+        )
+
+        prepare_block = functools.partial(
+            pipeline._prepare_block_for_import, perform_validation=perform_validation
+        )
+        prepared_blocks = iter(_map_ahead(prepare_block, blocks, executor, max_pending))
+
+        # executed blocks that were not persisted yet, in order
+        pending_results: Deque[BlockAndMetaWitness] = deque()
+        # executed blocks that were not handed to the writer yet
+        unsubmitted: List[BlockAPI] = []
+
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            write_in_progress: "Optional[Future[_BatchPersistResult]]" = None
+
+            def submit_write() -> "Future[_BatchPersistResult]":
+                blocks_to_write = tuple(unsubmitted)
+                unsubmitted.clear()
+                return writer.submit(
+                    pipeline._persist_block_batch, blocks_to_write, perform_validation
+                )
+
+            def collect_write(
+                write: "Future[_BatchPersistResult]",
+            ) -> Iterator[BlockImportResult]:
+                persist_results, error = write.result()
+                for persist_result in persist_results:
+                    block_result = pending_results.popleft()
+                    del pending_headers[block_result.block.hash]
+                    yield BlockImportResult(*persist_result, block_result.meta_witness)
+                if error is not None:
+                    raise error
+
+            parent_header = None
+            while True:
+                try:
+                    block = next(prepared_blocks, None)
+                    if block is None:
+                        break
+
+                    if (
+                        parent_header is None
+                        or parent_header.hash != block.header.parent_hash
+                    ):
+                        parent_header = pipeline._get_parent_header_for_import(block)
+
+                    block_result = pipeline._execute_block(
+                        block, parent_header, perform_validation
+                    )
+                except Exception:
+                    # Persist the blocks before the failing one, as if they had been
+                    # imported one at a time
+                    if write_in_progress is not None:
+                        yield from collect_write(write_in_progress)
+                    if unsubmitted:
+                        yield from collect_write(submit_write())
+                    raise
+
+                parent_header = block_result.block.header
+                pending_headers[parent_header.hash] = rlp.encode(parent_header)
+                pending_results.append(block_result)
+                unsubmitted.append(block_result.block)
+
+                if write_in_progress is not None and (
+                    write_in_progress.done() or len(unsubmitted) >= max_pending
+                ):
+                    # blocks until the write is done, if the writer is falling behind
+                    yield from collect_write(write_in_progress)
+                    write_in_progress = None
+
+                if write_in_progress is None:
+                    write_in_progress = submit_write()
+
+            if write_in_progress is not None:
+                yield from collect_write(write_in_progress)
+            if unsubmitted:
+                yield from collect_write(submit_write())
+
+    def _get_parent_header_for_import(self, block: BlockAPI) -> BlockHeaderAPI:
         try:
-            parent_header = self.get_block_header_by_hash(block.header.parent_hash)
+            return self.get_block_header_by_hash(block.header.parent_hash)
         except HeaderNotFound:
             raise ValidationError(
                 f"Attempt to import block #{block.number}.  "
@@ -493,6 +639,29 @@ class Chain(BaseChain):
                 f"its parent block at {block.header.parent_hash!r}"
             )
 
+    def _prepare_block_for_import(
+        self, block: Union[BlockAPI, bytes], perform_validation: bool
+    ) -> BlockAPI:
+        if isinstance(block, bytes):
+            block = self._decode_block(block)
+        if perform_validation and not block.is_genesis:
+            self.validate_seal(block.header)
+        recover_senders(block.transactions)
+        return block
+
+    def _decode_block(self, encoded_block: bytes) -> BlockAPI:
+        serial_block = rlp.decode(encoded_block)
+        # the block's fields depend on its fork, which depends on its number
+        header = HeaderSedes.deserialize(serial_block[0])
+        block_class = cast(Type[BaseBlock], self.get_vm_class(header).get_block_class())
+        return block_class.deserialize(serial_block)
+
+    def _execute_block(
+        self,
+        block: BlockAPI,
+        parent_header: BlockHeaderAPI,
+        perform_validation: bool,
+    ) -> BlockAndMetaWitness:
         base_header_for_import = self.create_header_from_parent(parent_header)
         # Make a copy of the empty header, adding in the expected amount of gas used.
         #   This allows for richer logging in the VM.
@@ -510,8 +679,7 @@ class Chain(BaseChain):
                 )
                 raise
 
-        persist_result = self.persist_block(imported_block, perform_validation)
-        return BlockImportResult(*persist_result, block_result.meta_witness)
+        return block_result
 
     def persist_block(
         self, block: BlockAPI, perform_validation: bool = True
@@ -524,6 +692,47 @@ class Chain(BaseChain):
             old_canonical_hashes,
         ) = self.chaindb.persist_block(block)
 
+        return self._get_persist_result(
+            block, new_canonical_hashes, old_canonical_hashes
+        )
+
+    def _persist_block_batch(
+        self, blocks: Sequence[BlockAPI], perform_validation: bool
+    ) -> "_BatchPersistResult":
+        """
+        Validate and persist ``blocks``. If a block is invalid, only persist the
+        blocks before it, and return the validation error along with their
+        results, for the caller to raise once they are reported.
+        """
+        error: Optional[Exception] = None
+        if perform_validation:
+            for index, block in enumerate(blocks):
+                try:
+                    # seals were already checked by _prepare_block_for_import()
+                    self._validate_block(block, check_seal=False)
+                except Exception as exc:
+                    blocks, error = blocks[:index], exc
+                    break
+
+        if not blocks:
+            return (), error
+
+        canonical_hash_changes = self.chaindb.persist_blocks(blocks)
+
+        persist_results = tuple(
+            self._get_persist_result(block, new_canonical_hashes, old_canonical_hashes)
+            for block, (new_canonical_hashes, old_canonical_hashes) in zip(
+                blocks, canonical_hash_changes
+            )
+        )
+        return persist_results, error
+
+    def _get_persist_result(
+        self,
+        block: BlockAPI,
+        new_canonical_hashes: Tuple[Hash32, ...],
+        old_canonical_hashes: Tuple[Hash32, ...],
+    ) -> BlockPersistResult:
         self.logger.debug(
             "Persisted block: number %s | hash %s",
             block.number,
@@ -551,12 +760,16 @@ class Chain(BaseChain):
         VM_class.validate_receipt(receipt)
 
     def validate_block(self, block: BlockAPI) -> None:
+        self._validate_block(block, check_seal=True)
+
+    def _validate_block(self, block: BlockAPI, check_seal: bool) -> None:
         if block.is_genesis:
             raise ValidationError("Cannot validate genesis block this way")
         vm = self.get_vm(block.header)
         parent_header = self.get_block_header_by_hash(block.header.parent_hash)
         vm.validate_header(block.header, parent_header)
-        vm.validate_seal(block.header)
+        if check_seal:
+            vm.validate_seal(block.header)
         vm.validate_seal_extension(block.header, ())
         self.validate_uncles(block)
 
@@ -645,6 +858,34 @@ def _extract_uncle_hashes(blocks: Iterable[BlockAPI]) -> Iterable[Hash32]:
             yield uncle.hash
 
 
+def _map_ahead(
+    func: Callable[[TItem], TResult],
+    items: Iterable[TItem],
+    executor: Optional[Executor],
+    max_pending: int,
+) -> Iterator[TResult]:
+    """
+    Like ``executor.map``, but only submit up to ``max_pending`` items ahead of the
+    consumer, so that a slow consumer doesn't let results pile up in memory. If
+    ``executor`` is ``None``, call ``func`` lazily, in the consumer's thread.
+    """
+    if executor is None:
+        yield from map(func, items)
+        return
+
+    pending: Deque["Future[TResult]"] = deque()
+    try:
+        for item in items:
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+            pending.append(executor.submit(func, item))
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
 class MiningChain(Chain, MiningChainAPI):
     header: BlockHeaderAPI = None
 
@@ -693,6 +934,20 @@ class MiningChain(Chain, MiningChainAPI):
         self.header = self.ensure_header()
         return result
 
+    def import_blocks(
+        self,
+        blocks: Iterable[Union[BlockAPI, bytes]],
+        perform_validation: bool = True,
+        executor: Executor = None,
+        max_pending: int = 16,
+    ) -> Iterator[BlockImportResult]:
+        try:
+            yield from super().import_blocks(
+                blocks, perform_validation, executor, max_pending
+            )
+        finally:
+            self.header = self.ensure_header()
+
     def set_header_timestamp(self, timestamp: int) -> None:
         self.header = self.header.copy(timestamp=timestamp)
 
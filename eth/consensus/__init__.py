@@ -1,9 +1,19 @@
-from .applier import ConsensusApplier
-from .clique.clique import (
-    CliqueApplier,
-    CliqueConsensus,
-    CliqueConsensusContext,
+from eth._utils.module_loading import (
+    lazy_module_attributes,
 )
+
+from .applier import ConsensusApplier
 from .context import ConsensusContext
 from .noproof import NoProofConsensus
 from .pow import PowConsensus
+
+# Clique imports the chain database, which imports every fork, so it is only
+# imported when first accessed
+__getattr__, __dir__ = lazy_module_attributes(
+    __name__,
+    {
+        "CliqueApplier": ".clique.clique.CliqueApplier",
+        "CliqueConsensus": ".clique.clique.CliqueConsensus",
+        "CliqueConsensusContext": ".clique.clique.CliqueConsensusContext",
+    },
+)
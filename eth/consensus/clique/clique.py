@@ -1,5 +1,9 @@
+from concurrent.futures import (
+    Executor,
+)
 import logging
 from typing import (
+    ClassVar,
     Iterable,
     Sequence,
 )
@@ -37,6 +41,7 @@ from ._utils import (
 )
 from .constants import (
     EPOCH_LENGTH,
+    SNAPSHOT_PERSIST_INTERVAL,
 )
 from .datatypes import (
     Snapshot,
@@ -73,10 +78,18 @@ def _construct_turn_error_message(
 
 class CliqueConsensusContext(ConsensusContextAPI):
     epoch_length = EPOCH_LENGTH
+    snapshot_persist_interval = SNAPSHOT_PERSIST_INTERVAL
+    # If set, signers of long ranges of headers are recovered in this executor
+    signer_recovery_executor: ClassVar[Executor] = None
 
     def __init__(self, db: AtomicDatabaseAPI):
         self.db = db
-        self.snapshot_manager = SnapshotManager(ChainDB(db), self.epoch_length)
+        self.snapshot_manager = SnapshotManager(
+            ChainDB(db),
+            self.epoch_length,
+            persist_interval=self.snapshot_persist_interval,
+            signer_recovery_executor=self.signer_recovery_executor,
+        )
 
 
 class CliqueConsensus(ConsensusAPI):
@@ -131,7 +144,7 @@ class CliqueConsensus(ConsensusAPI):
 
         validate_header_integrity(header, self._epoch_length)
 
-        signer = get_block_signer(header)
+        signer = self._snapshot_manager.get_block_signer(header)
         snapshot = self._snapshot_manager.get_or_create_snapshot(
             header.block_number - 1, header.parent_hash, parents
         )
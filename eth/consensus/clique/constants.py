@@ -10,6 +10,12 @@ EPOCH_LENGTH = 30000
 
 IN_MEMORY_SNAPSHOTS = 128
 
+IN_MEMORY_SIGNERS = 4096
+
+# Persist a snapshot every this many blocks, to bound the headers that have to be
+# re-applied after a restart
+SNAPSHOT_PERSIST_INTERVAL = 1024
+
 NONCE_AUTH = decode_hex("0xffffffffffffffff")
 NONCE_DROP = decode_hex("0x0000000000000000")
 
@@ -1,7 +1,15 @@
+from concurrent.futures import (
+    Executor,
+)
 from typing import (
     Iterable,
+    Optional,
+    Sequence,
 )
 
+from eth_keys.exceptions import (
+    BadSignature,
+)
 from eth_typing import (
     Address,
     Hash32,
@@ -27,9 +35,11 @@ from ._utils import (
     is_checkpoint,
 )
 from .constants import (
+    IN_MEMORY_SIGNERS,
     IN_MEMORY_SNAPSHOTS,
     NONCE_AUTH,
     NONCE_DROP,
+    SNAPSHOT_PERSIST_INTERVAL,
 )
 from .datatypes import (
     MutableSnapshot,
@@ -51,6 +61,22 @@ def make_snapshot_lookup_key(block_hash: Hash32) -> bytes:
     return f"block-hash-to-snapshot:{block_hash!r}".encode()
 
 
+# Number of headers handed to an executor's worker at a time
+RECOVERY_CHUNK_SIZE = 16
+
+
+def _try_get_block_signer(header: BlockHeaderAPI) -> Optional[Address]:
+    try:
+        return get_block_signer(header)
+    except (BadSignature, ValidationError, ValueError):
+        # Leave invalid signatures to be reported when the signer is requested
+        return None
+
+
+def _is_vote(header: BlockHeaderAPI) -> bool:
+    return header.nonce in {NONCE_AUTH, NONCE_DROP}
+
+
 class SnapshotManager:
     """
     The ``SnapshotManager`` is responsible for managing the snapshots that hold the
@@ -63,10 +89,20 @@ class SnapshotManager:
         "eth.consensus.clique.snapshot_manager.SnapshotManager"
     )
 
-    def __init__(self, chain_db: ChainDatabaseAPI, epoch_length: int) -> None:
+    def __init__(
+        self,
+        chain_db: ChainDatabaseAPI,
+        epoch_length: int,
+        persist_interval: int = SNAPSHOT_PERSIST_INTERVAL,
+        max_snapshots: int = IN_MEMORY_SNAPSHOTS,
+        signer_recovery_executor: Executor = None,
+    ) -> None:
         self._chain_db = chain_db
         self._epoch_length = epoch_length
-        self._snapshots: lru.LRU[Hash32, Snapshot] = lru.LRU(IN_MEMORY_SNAPSHOTS)
+        self._persist_interval = persist_interval
+        self._snapshots: lru.LRU[Hash32, Snapshot] = lru.LRU(max_snapshots)
+        self._signers: lru.LRU[Hash32, Address] = lru.LRU(IN_MEMORY_SIGNERS)
+        self._signer_recovery_executor = signer_recovery_executor
 
     def _lookup_header(
         self, block_hash: Hash32, parents: Iterable[BlockHeaderAPI]
@@ -90,6 +126,38 @@ class SnapshotManager:
         )
         return self.add_snapshot(snapshot)
 
+    def get_block_signer(self, header: BlockHeaderAPI) -> Address:
+        """
+        Return the address of the signer of the ``header``, which is remembered by
+        block hash.
+        """
+        try:
+            return self._signers[header.hash]
+        except KeyError:
+            signer = get_block_signer(header)
+            self._signers[header.hash] = signer
+            return signer
+
+    def recover_signers(self, headers: Sequence[BlockHeaderAPI]) -> None:
+        """
+        Recover the signers of ``headers`` that are not remembered yet, in a batch,
+        and remember them. If the manager has a signer recovery executor, the
+        signers are recovered in its workers. Invalid signatures are skipped, and
+        only raise when the signer is requested.
+        """
+        pending = [header for header in headers if header.hash not in self._signers]
+        executor = self._signer_recovery_executor
+        if executor is None or len(pending) < 2:
+            signers: Iterable[Optional[Address]] = map(_try_get_block_signer, pending)
+        else:
+            signers = executor.map(
+                _try_get_block_signer, pending, chunksize=RECOVERY_CHUNK_SIZE
+            )
+
+        for header, signer in zip(pending, signers):
+            if signer is not None:
+                self._signers[header.hash] = signer
+
     def apply(self, current_snapshot: Snapshot, header: BlockHeaderAPI) -> Snapshot:
         """
         Apply the given header on top of the current snapshot to create a new snapshot.
@@ -99,8 +167,8 @@ class SnapshotManager:
 
         snapshot = current_snapshot.get_mutable_clone(header.hash)
 
-        if header.nonce in {NONCE_AUTH, NONCE_DROP}:
-            signer = get_block_signer(header)
+        if _is_vote(header):
+            signer = self.get_block_signer(header)
             # Clear any votes from the signer regarding the subject that is voted on
             for vote in snapshot.votes:
                 if vote.signer == signer and vote.subject == header.coinbase:
@@ -143,9 +211,13 @@ class SnapshotManager:
 
                     snapshot.tallies.pop(header.coinbase)
 
-        self.add_snapshot(snapshot)
+        new_snapshot = self.add_snapshot(snapshot)
+
+        if header.block_number % self._persist_interval == 0:
+            self.logger.debug2(f"Persisting snapshot at {header.block_number}")
+            self.persist_snapshot(new_snapshot)
 
-        return snapshot.get_immutable_clone()
+        return new_snapshot
 
     def get_or_create_snapshot(
         self,
@@ -184,7 +256,7 @@ class SnapshotManager:
         while True:
             try:
                 new_snapshot = self.get_snapshot(
-                    current_header.block_number, current_header.parent_hash
+                    current_header.block_number - 1, current_header.parent_hash
                 )
             except SnapshotNotFound:
                 current_header = self._lookup_header(
@@ -201,16 +273,12 @@ class SnapshotManager:
             else:
                 break
 
-        for parent in reversed(parents):
-            new_snapshot = self.apply(new_snapshot, parent)
+        headers_to_apply = tuple(reversed(parents)) + (header,)
+        # only votes need their signer, which is the costly part of applying headers
+        self.recover_signers(tuple(filter(_is_vote, headers_to_apply)))
 
-        new_snapshot = self.apply(new_snapshot, header)
-
-        if is_checkpoint(header.block_number, self._epoch_length):
-            self.logger.debug2(
-                f"Persisting checkpoint snapshot at {header.block_number}",
-            )
-            self.persist_snapshot(new_snapshot)
+        for header_to_apply in headers_to_apply:
+            new_snapshot = self.apply(new_snapshot, header_to_apply)
 
         return new_snapshot
 
@@ -224,13 +292,19 @@ class SnapshotManager:
         if block_hash in self._snapshots:
             return self._snapshots[block_hash]
 
-        if is_checkpoint(block_number, self._epoch_length):
+        if block_number % self._persist_interval == 0 or is_checkpoint(
+            block_number, self._epoch_length
+        ):
             try:
                 # We might have it saved on disk
-                return self.get_snapshot_from_db(block_hash)
+                snapshot = self.get_snapshot_from_db(block_hash)
             except SnapshotNotFound:
                 pass
+            else:
+                self._snapshots[block_hash] = snapshot
+                return snapshot
 
+        if is_checkpoint(block_number, self._epoch_length):
             try:
                 # Otherwise, we can retrieve it on the fly
                 header = self._chain_db.get_block_header_by_hash(block_hash)
@@ -2,6 +2,8 @@
 This file was heavily inspired by and borrowed from the ethereum.org page on Ethash,
 as well as the ``ethereum/execution-specs`` repository implementation of Ethash.
 """
+import mmap
+import struct
 from typing import (
     Callable,
     Dict,
@@ -32,6 +34,9 @@ ACCESSES = 64  # number of accesses in hashimoto loop
 
 FNV_PRIME = 0x01000193
 
+# a cache item, as 16 little-endian uint32 words
+_CACHE_ITEM_FORMAT = struct.Struct("<16I")
+
 
 def fnv(v1: int, v2: int) -> int:
     return ((v1 * FNV_PRIME) ^ v2) % 2**32
@@ -92,8 +97,8 @@ def generate_seed_hash(block_number: int) -> bytes:
     return seed
 
 
-def xor(first_item: bytes, second_item: int) -> bytes:
-    return bytes([a ^ b for a, b in zip(first_item, bytes(second_item))])
+def xor(first_item: bytes, second_item: bytes) -> bytes:
+    return bytes([a ^ b for a, b in zip(first_item, second_item)])
 
 
 def mkcache(block_number: int) -> Tuple[Tuple[int, ...], ...]:
@@ -116,12 +121,26 @@ def mkcache(block_number: int) -> Tuple[Tuple[int, ...], ...]:
             first_cache_item = cache[i - 1 + int(cache_size_words) % cache_size_words]
             foo = bytes_to_int(cache[i][0:4])
             second_cache_item = foo % cache_size_words
-            result = xor(first_cache_item, second_cache_item)
+            result = xor(first_cache_item, cache[second_cache_item])
             cache[i] = keccak_512(result)
 
     return tuple(le_bytes_to_uint32_sequence(cache_item) for cache_item in cache)
 
 
+def cache_to_bytes(cache: Tuple[Tuple[int, ...], ...]) -> bytes:
+    """
+    Serialize a cache as its concatenated items, in little-endian uint32 words.
+    """
+    return b"".join(_CACHE_ITEM_FORMAT.pack(*cache_item) for cache_item in cache)
+
+
+def cache_from_buffer(buffer: Union[bytes, mmap.mmap]) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Deserialize a cache serialized by :func:`cache_to_bytes`.
+    """
+    return tuple(_CACHE_ITEM_FORMAT.iter_unpack(buffer))
+
+
 def int_to_le_bytes(val: int, num_bytes: int = None) -> bytes:
     if num_bytes is None:
         bit_length = int(val).bit_length()
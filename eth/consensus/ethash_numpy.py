@@ -0,0 +1,206 @@
+"""
+NumPy implementations of the Ethash cache generation and hashimoto functions in
+:mod:`eth.consensus.ethash`, which remains the reference. Results are
+bit-identical, but caches and dataset items are arrays of uint32 words, with one
+row per item, instead of tuples of ints.
+
+Dataset items are computed in lockstep, so that each of their parents is fetched
+and mixed for all items with a few array operations.
+"""
+import itertools
+import mmap
+from typing import (
+    Callable,
+    Dict,
+    Union,
+)
+
+from eth_typing import (
+    Hash32,
+)
+import numpy as np
+from numpy.typing import (
+    NDArray,
+)
+
+from eth.consensus.ethash import (
+    ACCESSES,
+    CACHE_ROUNDS,
+    DATASET_PARENTS,
+    FNV_PRIME,
+    HASH_BYTES,
+    MIX_BYTES,
+    WORD_BYTES,
+    generate_seed_hash,
+    get_cache_size,
+    keccak_256,
+    keccak_512,
+)
+
+# uint32 words, in little-endian order, as Ethash serializes them
+WORD_DTYPE = np.dtype("<u4")
+HASH_WORDS = HASH_BYTES // WORD_BYTES  # 16
+MIX_HASHES = MIX_BYTES // HASH_BYTES  # 2
+
+_PARENT_NUMBERS = np.arange(DATASET_PARENTS, dtype=np.uint32)
+
+# dataset items computed in lockstep by fill_dataset, small enough to fit in caches
+DATASET_ITEMS_PER_BATCH = 4096
+
+Words = NDArray[np.uint32]
+
+
+def fnv(v1: Words, v2: Words) -> Words:
+    """
+    Element-wise FNV mix of two arrays of uint32 words, which wraps around
+    like :func:`eth.consensus.ethash.fnv`.
+    """
+    return (v1 * np.uint32(FNV_PRIME)) ^ v2
+
+
+def keccak_512_rows(rows: Words) -> Words:
+    """
+    Hash each row of 16 words with Keccak-512, into a new row of 16 words.
+    """
+    data = rows.astype(WORD_DTYPE, copy=False).tobytes()
+    digests = b"".join(
+        keccak_512(data[start : start + HASH_BYTES])
+        for start in range(0, len(data), HASH_BYTES)
+    )
+    return np.frombuffer(digests, dtype=WORD_DTYPE).reshape(-1, HASH_WORDS)
+
+
+def mkcache(block_number: int) -> Words:
+    cache_size_words = get_cache_size(block_number) // HASH_BYTES
+
+    # Both passes are sequential chains of Keccak-512 hashes, so items are kept as
+    # bytes, and XORed as ints, which is the cheapest without the array overhead
+    cache = [keccak_512(generate_seed_hash(block_number))]
+    for _ in range(1, cache_size_words):
+        cache.append(keccak_512(cache[-1]))
+
+    for _ in range(CACHE_ROUNDS):
+        for i in range(cache_size_words):
+            first_cache_item = cache[i - 1]
+            second_cache_item = cache[
+                int.from_bytes(cache[i][:WORD_BYTES], "little") % cache_size_words
+            ]
+            mixed = int.from_bytes(first_cache_item, "little") ^ int.from_bytes(
+                second_cache_item, "little"
+            )
+            cache[i] = keccak_512(mixed.to_bytes(HASH_BYTES, "little"))
+
+    return np.frombuffer(b"".join(cache), dtype=WORD_DTYPE).reshape(-1, HASH_WORDS)
+
+
+def cache_to_bytes(cache: Words) -> bytes:
+    return cache.astype(WORD_DTYPE, copy=False).tobytes()
+
+
+def cache_from_buffer(buffer: Union[bytes, mmap.mmap]) -> Words:
+    """
+    Use a cache serialized by :func:`cache_to_bytes` without copying it, so that
+    processes which map the same file share its memory.
+    """
+    return np.frombuffer(buffer, dtype=WORD_DTYPE).reshape(-1, HASH_WORDS)
+
+
+def calc_dataset_items(cache: Words, indices: Words) -> Words:
+    """
+    Compute the dataset items at ``indices``, an array of uint32, as one row of
+    16 words per index.
+    """
+    n = len(cache)
+    indices = indices.astype(np.uint32, copy=False)
+
+    mix = cache[indices % n]
+    mix[:, 0] ^= indices
+    mix = keccak_512_rows(mix).copy()
+
+    # fnv it with a lot of random cache nodes based on each index. With few
+    # indices, the loop is dominated by per-call overhead, so everything that
+    # doesn't depend on the mix is computed up front, and buffers are reused.
+    prime = np.uint32(FNV_PRIME)
+    parent_keys = (indices ^ _PARENT_NUMBERS[:, np.newaxis]) * prime
+    mix_columns = itertools.cycle(mix.T)
+    cache_indices = np.empty_like(indices)
+    for parent_key, mix_column in zip(parent_keys, mix_columns):
+        np.bitwise_xor(parent_key, mix_column, out=cache_indices)
+        np.remainder(cache_indices, n, out=cache_indices)
+        np.multiply(mix, prime, out=mix)
+        np.bitwise_xor(mix, cache.take(cache_indices, axis=0), out=mix)
+
+    return keccak_512_rows(mix)
+
+
+def calc_dataset_item(cache: Words, i: int) -> Words:
+    return calc_dataset_items(cache, np.array([i], dtype=np.uint32))[0]
+
+
+def dataset_from_buffer(buffer: Union[bytes, bytearray, mmap.mmap]) -> Words:
+    """
+    Use a full dataset, as its concatenated items, without copying it.
+    """
+    return np.frombuffer(buffer, dtype=WORD_DTYPE).reshape(-1, HASH_WORDS)
+
+
+def fill_dataset(
+    buffer: Union[bytearray, mmap.mmap], cache: Words, start: int, stop: int
+) -> None:
+    """
+    Compute the dataset items from ``start`` up to ``stop``, and write them to the
+    writable ``buffer`` of the full dataset.
+    """
+    dataset = dataset_from_buffer(buffer)
+    for batch_start in range(start, stop, DATASET_ITEMS_PER_BATCH):
+        batch_stop = min(batch_start + DATASET_ITEMS_PER_BATCH, stop)
+        indices = np.arange(batch_start, batch_stop, dtype=np.uint32)
+        dataset[batch_start:batch_stop] = calc_dataset_items(cache, indices)
+
+
+def _hashimoto(
+    header_hash: bytes,
+    nonce: bytes,
+    dataset_size: int,
+    fetch_dataset_items: Callable[[Words], Words],
+) -> Dict[str, bytes]:
+    seed_hash = keccak_512(header_hash + bytes(reversed(nonce)))
+    seed_head = int.from_bytes(seed_hash[:WORD_BYTES], "little")
+
+    rows = dataset_size // MIX_BYTES
+    mix = np.tile(np.frombuffer(seed_hash, dtype=WORD_DTYPE), MIX_HASHES)
+    mix_offsets = np.arange(MIX_HASHES, dtype=np.uint32)
+
+    for i in range(ACCESSES):
+        parent = (((i ^ seed_head) * FNV_PRIME) ^ int(mix[i % len(mix)])) % 2**32
+        new_data = fetch_dataset_items(MIX_HASHES * (parent % rows) + mix_offsets)
+        mix = fnv(mix, new_data.reshape(-1))
+
+    compressed_mix = fnv(fnv(fnv(mix[0::4], mix[1::4]), mix[2::4]), mix[3::4])
+
+    mix_digest = compressed_mix.astype(WORD_DTYPE, copy=False).tobytes()
+    result = keccak_256(seed_hash + mix_digest)
+
+    return {"mix_digest": mix_digest, "result": result}
+
+
+def hashimoto_light(
+    full_size: int, cache: Words, header: Hash32, nonce: bytes
+) -> Dict[str, bytes]:
+    return _hashimoto(
+        header,
+        nonce,
+        full_size,
+        lambda indices: calc_dataset_items(cache, indices),
+    )
+
+
+def hashimoto(
+    full_size: int, dataset: Words, header: Hash32, nonce: bytes
+) -> Dict[str, bytes]:
+    return _hashimoto(
+        header,
+        nonce,
+        full_size,
+        lambda indices: dataset[indices],
+    )
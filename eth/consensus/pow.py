@@ -1,9 +1,25 @@
 from collections import (
     OrderedDict,
 )
+from concurrent.futures import (
+    Executor,
+)
+import logging
+import mmap
+import os
+from pathlib import (
+    Path,
+)
+import tempfile
 from typing import (
+    IO,
+    Any,
     Iterable,
+    Optional,
+    Sequence,
+    Set,
     Tuple,
+    Union,
 )
 
 from eth_typing import (
@@ -15,6 +31,10 @@ from eth_utils import (
     big_endian_to_int,
     encode_hex,
 )
+from eth_utils.toolz import (
+    groupby,
+    partition_all,
+)
 
 from eth.abc import (
     AtomicDatabaseAPI,
@@ -22,9 +42,9 @@ from eth.abc import (
     ConsensusAPI,
 )
 from eth.consensus.ethash import (
+    HASH_BYTES,
+    get_cache_size,
     get_dataset_full_size,
-    hashimoto_light,
-    mkcache,
 )
 from eth.constants import (
     EPOCH_LENGTH,
@@ -34,12 +54,38 @@ from eth.validation import (
     validate_lte,
 )
 
-# Type annotation here is to ensure we don't accidentally use strings instead of bytes.
-cache_by_epoch: "OrderedDict[int, Tuple[Tuple[int, ...], ...]]" = OrderedDict()
+try:
+    from eth.consensus.ethash_numpy import (
+        cache_from_buffer,
+        cache_to_bytes,
+        dataset_from_buffer,
+        fill_dataset,
+        hashimoto,
+        hashimoto_light,
+        mkcache,
+    )
+except ImportError:
+    from eth.consensus.ethash import (  # type: ignore[assignment]
+        cache_from_buffer,
+        cache_to_bytes,
+        hashimoto_light,
+        mkcache,
+    )
+
+    # the full dataset is a gigabyte or more, which takes NumPy to handle
+    full_dataset_available = False
+else:
+    full_dataset_available = True
+
+logger = logging.getLogger("eth.consensus.pow")
+
+# Epoch caches, as arrays of uint32 words when NumPy is installed, and as tuples of
+# words otherwise.
+cache_by_epoch: "OrderedDict[int, Any]" = OrderedDict()
 CACHE_MAX_ITEMS = 10
 
 
-def get_cache(block_number: int) -> Tuple[Tuple[int, ...], ...]:
+def get_cache(block_number: int) -> Any:
     epoch_index = block_number // EPOCH_LENGTH
 
     # doing explicit caching, because functools.lru_cache is 70% slower in the tests
@@ -50,10 +96,10 @@ def get_cache(block_number: int) -> Tuple[Tuple[int, ...], ...]:
         cache_by_epoch[epoch_index] = c
         return c
 
-    # Generate the cache if it was not already in memory
+    # Load or generate the cache if it was not already in memory
     # Simulate requesting mkcache by block number: multiply index by epoch length
     block_number = epoch_index * EPOCH_LENGTH
-    c = mkcache(block_number)
+    c = _load_or_make_cache(block_number)
     cache_by_epoch[epoch_index] = c
 
     # Limit memory usage for cache
@@ -63,6 +109,207 @@ def get_cache(block_number: int) -> Tuple[Tuple[int, ...], ...]:
     return c
 
 
+# Bumped whenever the cache file format changes, to ignore older files
+CACHE_FILE_REVISION = 1
+CACHE_DIR_ENV_VAR = "ETHASH_CACHE_DIR"
+
+_cache_dir: Optional[Path] = None
+
+
+def set_cache_dir(cache_dir: Optional[Union[str, Path]]) -> None:
+    """
+    Persist the epoch caches that :func:`get_cache` generates in ``cache_dir``,
+    and load them from there, instead of generating them again in each process.
+    Caches are memory-mapped, so with NumPy, processes that load the same epoch
+    share its memory. If no directory is set, the ``ETHASH_CACHE_DIR`` environment
+    variable is used, which worker processes inherit. If neither is set, caches
+    only live in memory.
+    """
+    global _cache_dir
+    _cache_dir = None if cache_dir is None else Path(cache_dir)
+
+
+def get_cache_dir() -> Optional[Path]:
+    if _cache_dir is not None:
+        return _cache_dir
+    env_cache_dir = os.environ.get(CACHE_DIR_ENV_VAR)
+    return Path(env_cache_dir) if env_cache_dir else None
+
+
+def _load_or_make_cache(block_number: int) -> Any:
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return mkcache(block_number)
+
+    epoch_index = block_number // EPOCH_LENGTH
+    cache_path = cache_dir / f"cache-R{CACHE_FILE_REVISION}-{epoch_index}"
+    mapped_file = _load_file(cache_path, get_cache_size(block_number))
+    if mapped_file is not None:
+        return cache_from_buffer(mapped_file)
+
+    cache = mkcache(block_number)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first, so that readers never see a partial file
+        temporary_file = _new_temporary_file(cache_path)
+        try:
+            with temporary_file:
+                temporary_file.write(cache_to_bytes(cache))
+            os.replace(temporary_file.name, cache_path)
+        except OSError:
+            os.unlink(temporary_file.name)
+            raise
+    except OSError:
+        logger.warning(
+            "Could not persist the Ethash cache for epoch %d in %s",
+            epoch_index,
+            cache_dir,
+            exc_info=True,
+        )
+    return cache
+
+
+def _new_temporary_file(path: Path) -> IO[bytes]:
+    return tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f"{path.name}.", delete=False
+    )
+
+
+def _load_file(path: Path, size: int) -> Optional[mmap.mmap]:
+    try:
+        with open(path, "rb") as loaded_file:
+            # a file of the wrong size was truncated, so it is replaced
+            if os.fstat(loaded_file.fileno()).st_size == size:
+                return mmap.mmap(loaded_file.fileno(), 0, access=mmap.ACCESS_READ)
+    except OSError:
+        # a missing or unreadable file is generated and written again
+        pass
+    return None
+
+
+# Full datasets that were loaded, as arrays of uint32 words mapped from their files
+dataset_by_epoch: "OrderedDict[int, Any]" = OrderedDict()
+DATASET_MAX_ITEMS = 2
+
+# Dataset files that were looked up and not found, so that headers of epochs
+# without a dataset don't each look for its file again
+_missing_dataset_paths: Set[Path] = set()
+
+# Dataset items computed by one worker task of generate_dataset
+DATASET_ITEMS_PER_TASK = 2**16
+
+
+def _get_dataset_path(cache_dir: Path, epoch_index: int) -> Path:
+    return cache_dir / f"full-R{CACHE_FILE_REVISION}-{epoch_index}"
+
+
+def get_dataset(block_number: int) -> Any:
+    """
+    Return the full dataset for the epoch of ``block_number``, if it was generated
+    with :func:`generate_dataset`, and ``None`` otherwise. A dataset that is
+    missing is only looked up once per process, unless this process generates it.
+    """
+    epoch_index = block_number // EPOCH_LENGTH
+    if epoch_index in dataset_by_epoch:
+        dataset_by_epoch.move_to_end(epoch_index)
+        return dataset_by_epoch[epoch_index]
+
+    cache_dir = get_cache_dir()
+    if cache_dir is None or not full_dataset_available:
+        return None
+    dataset_path = _get_dataset_path(cache_dir, epoch_index)
+    if dataset_path in _missing_dataset_paths:
+        return None
+    mapped_file = _load_file(dataset_path, get_dataset_full_size(block_number))
+    if mapped_file is None:
+        _missing_dataset_paths.add(dataset_path)
+        return None
+
+    dataset = dataset_from_buffer(mapped_file)
+    dataset_by_epoch[epoch_index] = dataset
+    if len(dataset_by_epoch) > DATASET_MAX_ITEMS:
+        dataset_by_epoch.popitem(last=False)
+    return dataset
+
+
+def generate_dataset(block_number: int, executor: Executor = None) -> Path:
+    """
+    Generate the full dataset for the epoch of ``block_number`` in the cache
+    directory, split into tasks across ``executor``, which should be a process
+    pool. From then on, :func:`check_pow` looks up the dataset directly for that
+    epoch, instead of computing 128 dataset items from the cache for each header.
+
+    The dataset is larger than a gigabyte, and takes minutes of CPU time to
+    generate, so it only pays off when validating many headers of one epoch.
+    Requires NumPy, and a cache directory, see :func:`set_cache_dir`.
+    """
+    if not full_dataset_available:
+        raise ImportError("Generating the full Ethash dataset requires NumPy")
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        raise ValueError(
+            "The full Ethash dataset is stored in the cache directory, which must "
+            "be set with set_cache_dir or the ETHASH_CACHE_DIR environment variable"
+        )
+
+    epoch_index = block_number // EPOCH_LENGTH
+    dataset_path = _get_dataset_path(cache_dir, epoch_index)
+    dataset_size = get_dataset_full_size(block_number)
+    if _load_file(dataset_path, dataset_size) is not None:
+        # it may have been generated by another process
+        _missing_dataset_paths.discard(dataset_path)
+        return dataset_path
+
+    # persist the cache, so that workers load it instead of generating it again
+    get_cache(block_number)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    temporary_file = _new_temporary_file(dataset_path)
+    try:
+        with temporary_file:
+            temporary_file.truncate(dataset_size)
+
+        num_items = dataset_size // HASH_BYTES
+        task_args = [
+            (
+                temporary_file.name,
+                block_number,
+                start,
+                min(start + DATASET_ITEMS_PER_TASK, num_items),
+            )
+            for start in range(0, num_items, DATASET_ITEMS_PER_TASK)
+        ]
+        if executor is None:
+            for args in task_args:
+                fill_dataset_file(*args)
+        else:
+            tasks = [executor.submit(fill_dataset_file, *args) for args in task_args]
+            try:
+                for task in tasks:
+                    task.result()
+            finally:
+                for task in tasks:
+                    task.cancel()
+        os.replace(temporary_file.name, dataset_path)
+        _missing_dataset_paths.discard(dataset_path)
+    except BaseException:
+        os.unlink(temporary_file.name)
+        raise
+
+    return dataset_path
+
+
+def fill_dataset_file(path: str, block_number: int, start: int, stop: int) -> None:
+    """
+    Compute the dataset items from ``start`` up to ``stop`` for the epoch of
+    ``block_number``, into the dataset file at ``path``. This is a plain function
+    of plain values, so that it can run in a worker process.
+    """
+    cache = get_cache(block_number)
+    with open(path, "r+b") as dataset_file:
+        with mmap.mmap(dataset_file.fileno(), 0) as mapped_file:
+            fill_dataset(mapped_file, cache, start, stop)
+
+
 def check_pow(
     block_number: int,
     mining_hash: Hash32,
@@ -73,13 +320,21 @@ def check_pow(
     validate_length(mix_hash, 32, title="Mix Hash")
     validate_length(mining_hash, 32, title="Mining Hash")
     validate_length(nonce, 8, title="POW Nonce")
-    cache = get_cache(block_number)
-    mining_output = hashimoto_light(
-        get_dataset_full_size(block_number),
-        cache,
-        mining_hash,
-        nonce,
-    )
+    dataset = get_dataset(block_number)
+    if dataset is None:
+        mining_output = hashimoto_light(
+            get_dataset_full_size(block_number),
+            get_cache(block_number),
+            mining_hash,
+            nonce,
+        )
+    else:
+        mining_output = hashimoto(
+            get_dataset_full_size(block_number),
+            dataset,
+            mining_hash,
+            nonce,
+        )
     if mining_output["mix_digest"] != mix_hash:
         raise ValidationError(
             f"mix hash mismatch; expected: {encode_hex(mining_output['mix_digest'])} "
@@ -93,6 +348,24 @@ def check_pow(
     validate_lte(result, 2**256 // difficulty, title="POW Difficulty")
 
 
+# (block number, mining hash, mix hash, nonce, difficulty), as taken by check_pow
+PowSeal = Tuple[int, Hash32, Hash32, bytes, int]
+
+# Seals checked by one worker task. Each task loads or generates the cache for an
+# epoch at most once, and then reuses it from cache_by_epoch in its process.
+SEALS_PER_TASK = 32
+
+
+def check_pow_seals(seals: Iterable[PowSeal]) -> None:
+    """
+    Check the proof of work of each seal, in order, and raise the error of the
+    first invalid one. This is a plain function of plain values, so that it can
+    run in a worker process.
+    """
+    for seal in seals:
+        check_pow(*seal)
+
+
 MAX_TEST_MINE_ATTEMPTS = 1000
 
 
@@ -135,6 +408,38 @@ class PowConsensus(ConsensusAPI):
             header.difficulty,
         )
 
+    def validate_seals(
+        self, headers: Sequence[BlockHeaderAPI], executor: Executor
+    ) -> None:
+        """
+        Validate the seals on the given headers, in parallel across ``executor``.
+        Headers are split into tasks by epoch, so that no task needs more than one
+        epoch cache.
+        """
+        seals = [
+            (
+                header.block_number,
+                header.mining_hash,
+                header.mix_hash,
+                header.nonce,
+                header.difficulty,
+            )
+            for header in headers
+        ]
+        seals_by_epoch = groupby(lambda seal: seal[0] // EPOCH_LENGTH, seals)
+        tasks = [
+            executor.submit(check_pow_seals, task_seals)
+            for epoch_seals in seals_by_epoch.values()
+            for task_seals in partition_all(SEALS_PER_TASK, epoch_seals)
+        ]
+        try:
+            # report the first invalid seal, like validating them in order would
+            for task in tasks:
+                task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+
     def validate_seal_extension(
         self, header: BlockHeaderAPI, parents: Iterable[BlockHeaderAPI]
     ) -> None:
@@ -1,8 +1,10 @@
 from typing import (
     Dict,
     Iterable,
+    Optional,
     Set,
     Tuple,
+    Type,
     cast,
 )
 
@@ -46,6 +48,9 @@ from eth.db.accesslog import (
     KeyAccessLoggerAtomicDB,
     KeyAccessLoggerDB,
 )
+from eth.db.backends.base import (
+    BaseDB,
+)
 from eth.db.backends.memory import (
     MemoryDB,
 )
@@ -53,13 +58,16 @@ from eth.db.batch import (
     BatchDB,
 )
 from eth.db.cache import (
+    BaseAdmissionPolicy,
     CacheDB,
+    CacheStats,
 )
 from eth.db.diff import (
     DBDiff,
 )
 from eth.db.journal import (
     JournalDB,
+    UndoLogJournalDB,
 )
 from eth.db.storage import (
     AccountStorageDB,
@@ -92,11 +100,116 @@ from .hash_trie import (
 IS_PRESENT_VALUE = b""
 
 
+class AccountRecord:
+    """
+    Lightweight in-memory account, used by :class:`AccountDB` in place of the
+    :class:`~eth.rlp.accounts.Account` RLP object. It is only RLP-encoded when
+    written into the account trie.
+
+    Records are shared between the account cache and the journal, so they must be
+    treated as immutable: build a new record to change a field.
+    """
+
+    __slots__ = ("nonce", "balance", "storage_root", "code_hash")
+
+    def __init__(
+        self,
+        nonce: int = 0,
+        balance: int = 0,
+        storage_root: Hash32 = BLANK_ROOT_HASH,
+        code_hash: Hash32 = EMPTY_SHA3,
+    ) -> None:
+        self.nonce = nonce
+        self.balance = balance
+        self.storage_root = storage_root
+        self.code_hash = code_hash
+
+    @classmethod
+    def from_rlp(cls, encoded: bytes) -> "AccountRecord":
+        account = rlp.decode(encoded, sedes=Account)
+        return cls(
+            account.nonce, account.balance, account.storage_root, account.code_hash
+        )
+
+    def to_rlp(self) -> bytes:
+        # Same encoding as the Account sedes, without building the Serializable
+        return rlp.encode([self.nonce, self.balance, self.storage_root, self.code_hash])
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not AccountRecord:
+            return NotImplemented
+        return (
+            self.nonce == other.nonce
+            and self.balance == other.balance
+            and self.storage_root == other.storage_root
+            and self.code_hash == other.code_hash
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"AccountRecord(nonce={self.nonce}, balance={self.balance}, "
+            f"storage_root=0x{self.storage_root.hex()}, "
+            f"code_hash=0x{self.code_hash.hex()})"
+        )
+
+
+class AccountRecordLookup(BaseDB):
+    """
+    Presents the account trie as a mapping of address to :class:`AccountRecord`.
+    Missing accounts read as ``None``.
+    """
+
+    def __init__(self, trie: DatabaseAPI) -> None:
+        self._trie = trie
+
+    def __getitem__(self, address: bytes) -> Optional[AccountRecord]:  # type: ignore
+        encoded_account = self._trie[address]
+        if encoded_account:
+            return AccountRecord.from_rlp(encoded_account)
+        else:
+            return None
+
+    def __setitem__(  # type: ignore # Breaks LSP
+        self, address: bytes, record: AccountRecord
+    ) -> None:
+        self._trie[address] = record.to_rlp()
+
+    def _exists(self, address: bytes) -> bool:
+        return address in self._trie
+
+    def __delitem__(self, address: bytes) -> None:
+        del self._trie[address]
+
+
+def _account_entry_size(address: bytes, record: Optional[AccountRecord]) -> int:
+    if record is None:
+        return len(address)
+    else:
+        # approximately the size of the address and the rlp-encoded account
+        return (
+            len(address)
+            + 70
+            + (record.nonce.bit_length() + 7) // 8
+            + (record.balance.bit_length() + 7) // 8
+        )
+
+
 class AccountDB(AccountDatabaseAPI):
     logger = get_extended_debug_logger("eth.db.account.AccountDB")
 
+    # Set to False when replaying already-validated blocks, to skip re-checking
+    # that addresses are canonical and values fit in their fields on every access.
+    validate_inputs = True
+
     def __init__(
-        self, db: AtomicDatabaseAPI, state_root: Hash32 = BLANK_ROOT_HASH
+        self,
+        db: AtomicDatabaseAPI,
+        state_root: Hash32 = BLANK_ROOT_HASH,
+        trie_cache_size: int = 2048,
+        trie_cache_max_bytes: int = None,
+        trie_cache_admission_policy: Type[BaseAdmissionPolicy] = None,
+        storage_cache_size: int = 2048,
+        storage_cache_max_bytes: int = None,
     ) -> None:
         r"""
         Internal implementation details (subject to rapid change):
@@ -106,7 +219,9 @@ class AccountDB(AccountDatabaseAPI):
 
             db > _batchdb ------------------------> _journaldb -----------> code lookups
              \
-              -> _batchtrie -> _trie -> _trie_cache -> _journaltrie ---> account lookups
+              -> _batchtrie -> _trie -> _account_lookup -> _trie_cache -> _journaltrie
+                                                                   \
+                                                                    -> account lookups
 
         Journaling sequesters writes at the _journal* attrs ^, until persist is called.
 
@@ -121,12 +236,16 @@ class AccountDB(AccountDatabaseAPI):
 
         _trie is a hash-trie, used to generate the state root
 
+        _account_lookup decodes the rlp-encoded accounts of _trie into
+        :class:`AccountRecord` objects, which every layer above it works with.
+        Accounts are only rlp-encoded again in :meth:`make_state_root`.
+
         _trie_cache is a cache tied to the state root of the trie. It
         is important that this cache is checked *after* looking for
         the key in _journaltrie, because the cache is only invalidated
         after a state root change.
 
-        _journaltrie is a journaling of the accounts (an address->rlp mapping,
+        _journaltrie is a journaling of the accounts (an address->record mapping,
         rather than the nodes stored by the trie). This enables
         a squashing of all account changes before pushing them into the trie.
 
@@ -134,6 +253,12 @@ class AccountDB(AccountDatabaseAPI):
 
         AccountDB synchronizes the snapshot/revert/persist of both of the
         journals.
+
+        _trie_cache holds up to ``trie_cache_size`` entries, or is bounded to
+        ``trie_cache_max_bytes`` if supplied. ``trie_cache_admission_policy`` is
+        instantiated for the cache, to keep account scans from flushing hot nodes.
+        The ``storage_cache_*`` arguments are passed on to every
+        :class:`~eth.db.storage.AccountStorageDB`.
         """
         self._raw_store_db = KeyAccessLoggerAtomicDB(db, log_missing_keys=False)
         self._batchdb = BatchDB(self._raw_store_db)
@@ -141,9 +266,24 @@ class AccountDB(AccountDatabaseAPI):
         self._journaldb = JournalDB(self._batchdb)
         self._trie = HashTrie(HexaryTrie(self._batchtrie, state_root, prune=True))
         self._trie_logger = KeyAccessLoggerDB(self._trie, log_missing_keys=False)
-        self._trie_cache = CacheDB(self._trie_logger)
-        self._journaltrie = JournalDB(self._trie_cache)
-        self._account_cache: LRU[Address, Account] = LRU(2048)
+        self._account_lookup = AccountRecordLookup(self._trie_logger)
+        self._trie_cache = CacheDB(
+            self._account_lookup,
+            cache_size=trie_cache_size,
+            max_bytes=trie_cache_max_bytes,
+            admission_policy=(
+                trie_cache_admission_policy()
+                if trie_cache_admission_policy is not None
+                else None
+            ),
+            entry_size=_account_entry_size,
+        )
+        self._storage_cache_size = storage_cache_size
+        self._storage_cache_max_bytes = storage_cache_max_bytes
+        # The changeset-based Journal only accepts bytes values, so the account
+        # record journal uses the undo log
+        self._journaltrie = UndoLogJournalDB(self._trie_cache)
+        self._account_cache: LRU[Address, AccountRecord] = LRU(2048)
         self._account_stores: Dict[Address, AccountStorageDatabaseAPI] = {}
         self._dirty_accounts: Set[Address] = set()
         self._root_hash_at_last_persist = state_root
@@ -163,6 +303,10 @@ class AccountDB(AccountDatabaseAPI):
             self._trie_cache.reset_cache()
             self._trie.root_hash = value
 
+    @property
+    def trie_cache_stats(self) -> CacheStats:
+        return self._trie_cache.stats
+
     def has_root(self, state_root: bytes) -> bool:
         return state_root in self._batchtrie
 
@@ -172,23 +316,26 @@ class AccountDB(AccountDatabaseAPI):
     def get_storage(
         self, address: Address, slot: int, from_journal: bool = True
     ) -> int:
-        validate_canonical_address(address, title="Storage Address")
-        validate_uint256(slot, title="Storage Slot")
+        if self.validate_inputs:
+            validate_canonical_address(address, title="Storage Address")
+            validate_uint256(slot, title="Storage Slot")
 
         account_store = self._get_address_store(address)
         return account_store.get(slot, from_journal)
 
     def set_storage(self, address: Address, slot: int, value: int) -> None:
-        validate_uint256(value, title="Storage Value")
-        validate_uint256(slot, title="Storage Slot")
-        validate_canonical_address(address, title="Storage Address")
+        if self.validate_inputs:
+            validate_uint256(value, title="Storage Value")
+            validate_uint256(slot, title="Storage Slot")
+            validate_canonical_address(address, title="Storage Address")
 
         account_store = self._get_address_store(address)
         self._dirty_accounts.add(address)
         account_store.set(slot, value)
 
     def delete_storage(self, address: Address) -> None:
-        validate_canonical_address(address, title="Storage Address")
+        if self.validate_inputs:
+            validate_canonical_address(address, title="Storage Address")
 
         self._set_storage_root(address, BLANK_ROOT_HASH)
         self._wipe_storage(address)
@@ -222,7 +369,13 @@ class AccountDB(AccountDatabaseAPI):
             store = self._account_stores[address]
         else:
             storage_root = self._get_storage_root(address)
-            store = AccountStorageDB(self._raw_store_db, storage_root, address)
+            store = AccountStorageDB(
+                self._raw_store_db,
+                storage_root,
+                address,
+                cache_size=self._storage_cache_size,
+                cache_max_bytes=self._storage_cache_max_bytes,
+            )
             self._account_stores[address] = store
         return store
 
@@ -246,7 +399,12 @@ class AccountDB(AccountDatabaseAPI):
 
     def _set_storage_root(self, address: Address, new_storage_root: Hash32) -> None:
         account = self._get_account(address)
-        self._set_account(address, account.copy(storage_root=new_storage_root))
+        self._set_account(
+            address,
+            AccountRecord(
+                account.nonce, account.balance, new_storage_root, account.code_hash
+            ),
+        )
 
     def _validate_flushed_storage(
         self, address: Address, store: AccountStorageDatabaseAPI
@@ -265,35 +423,49 @@ class AccountDB(AccountDatabaseAPI):
     # Balance
     #
     def get_balance(self, address: Address) -> int:
-        validate_canonical_address(address, title="Storage Address")
+        if self.validate_inputs:
+            validate_canonical_address(address, title="Storage Address")
 
         account = self._get_account(address)
         return account.balance
 
     def set_balance(self, address: Address, balance: int) -> None:
-        validate_canonical_address(address, title="Storage Address")
-        validate_uint256(balance, title="Account Balance")
+        if self.validate_inputs:
+            validate_canonical_address(address, title="Storage Address")
+            validate_uint256(balance, title="Account Balance")
 
         account = self._get_account(address)
-        self._set_account(address, account.copy(balance=balance))
+        self._set_account(
+            address,
+            AccountRecord(
+                account.nonce, balance, account.storage_root, account.code_hash
+            ),
+        )
 
     #
     # Nonce
     #
     def get_nonce(self, address: Address) -> int:
-        validate_canonical_address(address, title="Storage Address")
+        if self.validate_inputs:
+            validate_canonical_address(address, title="Storage Address")
 
         account = self._get_account(address)
         return account.nonce
 
     def set_nonce(self, address: Address, nonce: int) -> None:
-        validate_canonical_address(address, title="Storage Address")
-        # we can skip the check for ``<2**64 - 1`` here (``validate_nonce``) since we
-        # should allow the nonce to be set to 2**64-1
-        validate_uint64(nonce, title="Nonce")
+        if self.validate_inputs:
+            validate_canonical_address(address, title="Storage Address")
+            # we can skip the check for ``<2**64 - 1`` here (``validate_nonce``) since
+            # we should allow the nonce to be set to 2**64-1
+            validate_uint64(nonce, title="Nonce")
 
         account = self._get_account(address)
-        self._set_account(address, account.copy(nonce=nonce))
+        self._set_account(
+            address,
+            AccountRecord(
+                nonce, account.balance, account.storage_root, account.code_hash
+            ),
+        )
 
     def increment_nonce(self, address: Address) -> None:
         current_nonce = self.get_nonce(address)
@@ -303,7 +475,8 @@ class AccountDB(AccountDatabaseAPI):
     # Code
     #
     def get_code(self, address: Address) -> bytes:
-        validate_canonical_address(address, title="Storage Address")
+        if self.validate_inputs:
+            validate_canonical_address(address, title="Storage Address")
 
         code_hash = self.get_code_hash(address)
         if code_hash == EMPTY_SHA3:
@@ -318,26 +491,39 @@ class AccountDB(AccountDatabaseAPI):
                     self._accessed_bytecodes.add(address)
 
     def set_code(self, address: Address, code: bytes) -> None:
-        validate_canonical_address(address, title="Storage Address")
-        validate_is_bytes(code, title="Code")
+        if self.validate_inputs:
+            validate_canonical_address(address, title="Storage Address")
+            validate_is_bytes(code, title="Code")
 
         account = self._get_account(address)
 
-        code_hash = keccak(code)
+        code_hash = Hash32(keccak(code))
         self._journaldb[code_hash] = code
-        self._set_account(address, account.copy(code_hash=code_hash))
+        self._set_account(
+            address,
+            AccountRecord(
+                account.nonce, account.balance, account.storage_root, code_hash
+            ),
+        )
 
     def get_code_hash(self, address: Address) -> Hash32:
-        validate_canonical_address(address, title="Storage Address")
+        if self.validate_inputs:
+            validate_canonical_address(address, title="Storage Address")
 
         account = self._get_account(address)
         return account.code_hash
 
     def delete_code(self, address: Address) -> None:
-        validate_canonical_address(address, title="Storage Address")
+        if self.validate_inputs:
+            validate_canonical_address(address, title="Storage Address")
 
         account = self._get_account(address)
-        self._set_account(address, account.copy(code_hash=EMPTY_SHA3))
+        self._set_account(
+            address,
+            AccountRecord(
+                account.nonce, account.balance, account.storage_root, EMPTY_SHA3
+            ),
+        )
 
     #
     # Account Methods
@@ -346,7 +532,8 @@ class AccountDB(AccountDatabaseAPI):
         return self.get_nonce(address) != 0 or self.get_code_hash(address) != EMPTY_SHA3
 
     def delete_account(self, address: Address) -> None:
-        validate_canonical_address(address, title="Storage Address")
+        if self.validate_inputs:
+            validate_canonical_address(address, title="Storage Address")
 
         # We must wipe the storage first, because if it's the first time we load it,
         #   then we want to load it with the original storage root hash, not the
@@ -359,12 +546,13 @@ class AccountDB(AccountDatabaseAPI):
         del self._journaltrie[address]
 
     def account_exists(self, address: Address) -> bool:
-        validate_canonical_address(address, title="Storage Address")
-        account_rlp = self._get_encoded_account(address, from_journal=True)
-        return account_rlp != b""
+        if self.validate_inputs:
+            validate_canonical_address(address, title="Storage Address")
+        return self._get_account_record(address, from_journal=True) is not None
 
     def touch_account(self, address: Address) -> None:
-        validate_canonical_address(address, title="Storage Address")
+        if self.validate_inputs:
+            validate_canonical_address(address, title="Storage Address")
 
         account = self._get_account(address)
         self._set_account(address, account)
@@ -385,38 +573,36 @@ class AccountDB(AccountDatabaseAPI):
     #
     # Internal
     #
-    def _get_encoded_account(
+    def _get_account_record(
         self, address: Address, from_journal: bool = True
-    ) -> bytes:
+    ) -> Optional[AccountRecord]:
         self._accessed_accounts.add(address)
         lookup_trie = self._journaltrie if from_journal else self._trie_cache
 
         try:
-            return lookup_trie[address]
+            return lookup_trie[address]  # type: ignore # record-valued journal
         except trie_exceptions.MissingTrieNode as exc:
             raise MissingAccountTrieNode(*exc.args) from exc
         except KeyError:
             # In case the account is deleted in the JournalDB
-            return b""
+            return None
 
-    def _get_account(self, address: Address, from_journal: bool = True) -> Account:
+    def _get_account(
+        self, address: Address, from_journal: bool = True
+    ) -> AccountRecord:
         if from_journal and address in self._account_cache:
             return self._account_cache[address]
 
-        rlp_account = self._get_encoded_account(address, from_journal)
-
-        if rlp_account:
-            account = rlp.decode(rlp_account, sedes=Account)
-        else:
-            account = Account()
+        account = self._get_account_record(address, from_journal)
+        if account is None:
+            account = AccountRecord()
         if from_journal:
             self._account_cache[address] = account
         return account
 
-    def _set_account(self, address: Address, account: Account) -> None:
+    def _set_account(self, address: Address, account: AccountRecord) -> None:
         self._account_cache[address] = account
-        rlp_account = rlp.encode(account, sedes=Account)
-        self._journaltrie[address] = rlp_account
+        self._journaltrie[address] = account  # type: ignore # record-valued journal
 
     def _reset_access_counters(self) -> None:
         # Account accesses and storage accesses recorded in the same journal
@@ -642,7 +828,8 @@ class AccountDB(AccountDatabaseAPI):
         #       be rebuilt
         #   - We need the full body of the old (1, 2) leaf node, to rebuild
 
-        for key, val in diff.pending_items():
+        for key, account in diff.pending_items():
+            val = cast(AccountRecord, account).to_rlp()
             try:
                 trie[key] = val
             except trie_exceptions.MissingTrieNode as exc:
@@ -1,3 +1,22 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from collections import (
+    OrderedDict,
+)
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    NamedTuple,
+    TypeVar,
+    Union,
+)
+
 from lru import (
     LRU,
 )
@@ -10,25 +29,306 @@ from eth.db.backends.base import (
 )
 
 
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    rejections: int
+    entries: int
+    size_in_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+        else:
+            return self.hits / lookups
+
+
+class BaseAdmissionPolicy(ABC):
+    """
+    Decide whether a freshly loaded value may displace the least-recently-used
+    entries of a full cache. Used to keep one-off scans from flushing hot entries.
+    """
+
+    @abstractmethod
+    def record_access(self, key: Hashable) -> None:
+        """
+        Register a lookup of ``key``, whether it was a hit or a miss.
+        """
+        ...
+
+    @abstractmethod
+    def should_admit(self, candidate: Hashable, victim: Hashable) -> bool:
+        """
+        Return whether ``candidate`` should be cached, at the cost of evicting
+        ``victim``.
+        """
+        ...
+
+
+class TinyLFUAdmission(BaseAdmissionPolicy):
+    """
+    TinyLFU admission: estimate the access frequency of keys with a count-min
+    sketch, and only admit a new key if it is accessed more often than every entry
+    it would evict, so that one large value can't flush many small hot ones.
+    Counters are halved every ``sample_size`` accesses, so the estimate favors
+    recent popularity.
+    """
+
+    _depth = 4
+
+    def __init__(self, width: int = 4096, sample_size: int = None) -> None:
+        if not 1 <= width <= 2**16:
+            raise ValueError(f"Sketch width must be in [1, 2**16], got {width}")
+        self._width = width
+        self._sample_size = sample_size if sample_size is not None else width * 10
+        self._rows: List[List[int]] = [[0] * width for _ in range(self._depth)]
+        self._accesses = 0
+
+    def _indices(self, key: Hashable) -> List[int]:
+        # Use independent 16-bit slices of the 64-bit key hash, one per row
+        key_hash = hash(key)
+        return [
+            ((key_hash >> (16 * row)) & 0xFFFF) % self._width
+            for row in range(self._depth)
+        ]
+
+    def estimate(self, key: Hashable) -> int:
+        return min(row[index] for row, index in zip(self._rows, self._indices(key)))
+
+    def record_access(self, key: Hashable) -> None:
+        for row, index in zip(self._rows, self._indices(key)):
+            row[index] += 1
+
+        self._accesses += 1
+        if self._accesses >= self._sample_size:
+            self._age()
+
+    def should_admit(self, candidate: Hashable, victim: Hashable) -> bool:
+        return self.estimate(candidate) > self.estimate(victim)
+
+    def _age(self) -> None:
+        for row in self._rows:
+            for index, count in enumerate(row):
+                row[index] = count >> 1
+        self._accesses //= 2
+
+
+EntrySizer = Callable[[Any, Any], int]
+
+TKey = TypeVar("TKey", bound=Hashable)
+TValue = TypeVar("TValue")
+
+
+def bytes_entry_size(key: bytes, value: bytes) -> int:
+    return len(key) + len(value)
+
+
+class BoundedLRU(Generic[TKey, TValue]):
+    """
+    An LRU mapping bounded by entry count and/or by the total size of its keys and
+    values, in bytes, as measured by ``entry_size``. If an admission policy is
+    supplied, values offered through :meth:`offer` only displace older entries if
+    the policy agrees.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = None,
+        max_bytes: int = None,
+        admission_policy: BaseAdmissionPolicy = None,
+        on_evict: Callable[[TKey, TValue], None] = None,
+        entry_size: EntrySizer = bytes_entry_size,
+    ) -> None:
+        if max_entries is None and max_bytes is None:
+            raise ValueError("Must bound the cache by entry count or by bytes")
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._admission_policy = admission_policy
+        self._on_evict = on_evict
+        self._entry_size = entry_size
+        self._values: OrderedDict[TKey, TValue] = OrderedDict()
+        self.size_in_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, key: TKey) -> bool:
+        return key in self._values
+
+    def __getitem__(self, key: TKey) -> TValue:
+        value = self._values[key]
+        self._values.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: TKey, value: TValue) -> None:
+        if key in self._values:
+            self._remove(key)
+        size = self._entry_size(key, value)
+        if self._max_bytes is not None and size > self._max_bytes:
+            # A single entry larger than the whole byte budget is not cached
+            return
+        self._values[key] = value
+        self.size_in_bytes += size
+        self._shrink()
+
+    def __delitem__(self, key: TKey) -> None:
+        self._remove(key)
+
+    def offer(self, key: TKey, value: TValue) -> bool:
+        """
+        Cache a value loaded on a miss, subject to the admission policy.
+
+        :return: whether the value was admitted
+        """
+        if self._admission_policy is not None:
+            should_admit = self._admission_policy.should_admit
+            if not all(
+                should_admit(key, victim) for victim in self._get_victims(key, value)
+            ):
+                return False
+        self[key] = value
+        return True
+
+    def clear(self) -> None:
+        self._values.clear()
+        self.size_in_bytes = 0
+
+    def _get_victims(self, key: TKey, value: TValue) -> Iterable[TKey]:
+        """
+        Yield the keys that :meth:`_shrink` would evict to make room for ``key``,
+        oldest first.
+        """
+        num_entries = len(self._values) + 1
+        size_in_bytes = self.size_in_bytes + self._entry_size(key, value)
+        if key in self._values:
+            num_entries -= 1
+            size_in_bytes -= self._entry_size(key, self._values[key])
+
+        for old_key, old_value in self._values.items():
+            if not (
+                (self._max_entries is not None and num_entries > self._max_entries)
+                or (self._max_bytes is not None and size_in_bytes > self._max_bytes)
+            ):
+                return
+            elif old_key == key:
+                continue
+            yield old_key
+            num_entries -= 1
+            size_in_bytes -= self._entry_size(old_key, old_value)
+
+    def _remove(self, key: TKey) -> TValue:
+        value = self._values.pop(key)
+        self.size_in_bytes -= self._entry_size(key, value)
+        return value
+
+    def _shrink(self) -> None:
+        while self._values and (
+            (self._max_entries is not None and len(self._values) > self._max_entries)
+            or (self._max_bytes is not None and self.size_in_bytes > self._max_bytes)
+        ):
+            oldest_key = next(iter(self._values))
+            evicted_value = self._remove(oldest_key)
+            if self._on_evict is not None:
+                self._on_evict(oldest_key, evicted_value)
+
+
 class CacheDB(BaseDB):
     """
     Set and get decoded RLP objects, where the underlying db stores
     encoded objects.
+
+    By default, the cache holds up to ``cache_size`` entries. Pass ``max_bytes``
+    to bound it by the total size of cached keys and values instead, and
+    ``admission_policy`` (like :class:`TinyLFUAdmission`) to keep values that are
+    read once, like during a trie scan, from evicting frequently used ones.
+    ``entry_size`` measures cached entries, for caches that don't hold bytes.
     """
 
-    def __init__(self, db: DatabaseAPI, cache_size: int = 2048) -> None:
+    def __init__(
+        self,
+        db: DatabaseAPI,
+        cache_size: int = 2048,
+        max_bytes: int = None,
+        admission_policy: BaseAdmissionPolicy = None,
+        entry_size: EntrySizer = bytes_entry_size,
+    ) -> None:
         self._db = db
         self._cache_size = cache_size
+        self._max_bytes = max_bytes
+        self._admission_policy = admission_policy
+        self._entry_size = entry_size
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._rejections = 0
+
+        self._cached_values: Union[LRU[bytes, bytes], BoundedLRU[bytes, bytes]]
         self.reset_cache()
-        self._cached_values: LRU[bytes, bytes] = LRU(cache_size)
 
     def reset_cache(self) -> None:
-        self._cached_values = LRU(self._cache_size)
+        if self._max_bytes is None and self._admission_policy is None:
+            self._cached_values = LRU(self._cache_size, callback=self._count_eviction)
+        else:
+            self._cached_values = BoundedLRU(
+                max_entries=self._cache_size if self._max_bytes is None else None,
+                max_bytes=self._max_bytes,
+                admission_policy=self._admission_policy,
+                on_evict=self._count_eviction,
+                entry_size=self._entry_size,
+            )
+
+    def _count_eviction(self, key: bytes, value: bytes) -> None:
+        self._evictions += 1
+
+    @property
+    def stats(self) -> CacheStats:
+        cached_values = self._cached_values
+        if isinstance(cached_values, BoundedLRU):
+            size_in_bytes = cached_values.size_in_bytes
+        else:
+            size_in_bytes = sum(
+                self._entry_size(key, value) for key, value in cached_values.items()
+            )
+
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            rejections=self._rejections,
+            entries=len(cached_values),
+            size_in_bytes=size_in_bytes,
+        )
+
+    def reset_stats(self) -> None:
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._rejections = 0
 
     def __getitem__(self, key: bytes) -> bytes:
-        if key not in self._cached_values:
-            self._cached_values[key] = self._db[key]
-        return self._cached_values[key]
+        if self._admission_policy is not None:
+            self._admission_policy.record_access(key)
+
+        cached_values = self._cached_values
+        try:
+            value = cached_values[key]
+        except KeyError:
+            self._misses += 1
+        else:
+            self._hits += 1
+            return value
+
+        value = self._db[key]
+        if type(cached_values) is BoundedLRU:
+            if not cached_values.offer(key, value):
+                self._rejections += 1
+        else:
+            cached_values[key] = value
+        return value
 
     def __setitem__(self, key: bytes, value: bytes) -> None:
         self._cached_values[key] = value
@@ -127,16 +127,16 @@ class ChainDB(HeaderDB, ChainDatabaseAPI):
         return gap_change, gaps
 
     @classmethod
-    def _update_header_chain_gaps(
+    def _fill_header_chain_gap(
         cls,
         db: DatabaseAPI,
         persisting_header: BlockHeaderAPI,
-        base_gaps: ChainGaps = None,
+        base_gaps: ChainGaps,
     ) -> GapInfo:
         # The only reason we overwrite this here is to be able to detect when the
         # HeaderDB de-canonicalizes an uncle that should cause us to
         # re-open a block gap.
-        gap_change, gaps = super()._update_header_chain_gaps(
+        gap_change, gaps = super()._fill_header_chain_gap(
             db, persisting_header, base_gaps
         )
 
@@ -220,6 +220,16 @@ class ChainDB(HeaderDB, ChainDatabaseAPI):
         with self.db.atomic_batch() as db:
             return self._persist_block(db, block, genesis_parent_hash)
 
+    def persist_blocks(
+        self,
+        blocks: Sequence[BlockAPI],
+        genesis_parent_hash: Hash32 = GENESIS_PARENT_HASH,
+    ) -> Tuple[Tuple[Tuple[Hash32, ...], Tuple[Hash32, ...]], ...]:
+        with self.db.atomic_batch() as db:
+            return tuple(
+                self._persist_block(db, block, genesis_parent_hash) for block in blocks
+            )
+
     def persist_unexecuted_block(
         self,
         block: BlockAPI,
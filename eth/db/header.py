@@ -1,6 +1,7 @@
 import functools
 from typing import (
     Iterable,
+    List,
     Sequence,
     Tuple,
     cast,
@@ -18,7 +19,7 @@ from eth_utils import (
 from eth_utils.toolz import (
     concat,
     first,
-    sliding_window,
+    partition_all,
 )
 import rlp
 
@@ -30,6 +31,7 @@ from eth.abc import (
 )
 from eth.constants import (
     GENESIS_PARENT_HASH,
+    HEADER_STREAM_SEGMENT_SIZE,
 )
 from eth.db.chain_gaps import (
     GAP_WRITES,
@@ -91,7 +93,7 @@ class HeaderDB(HeaderDatabaseAPI):
         if base_gaps is None:
             base_gaps = cls._get_header_chain_gaps(db)
 
-        gap_change, gaps = fill_gap(persisted_header.block_number, base_gaps)
+        gap_change, gaps = cls._fill_header_chain_gap(db, persisted_header, base_gaps)
 
         if gap_change is not GapChange.NoChange:
             db.set(
@@ -101,6 +103,19 @@ class HeaderDB(HeaderDatabaseAPI):
 
         return gap_change, gaps
 
+    @classmethod
+    def _fill_header_chain_gap(
+        cls,
+        db: DatabaseAPI,
+        persisted_header: BlockHeaderAPI,
+        base_gaps: ChainGaps,
+    ) -> GapInfo:
+        """
+        Return the header chain gaps after persisting ``persisted_header``, without
+        writing them to the database.
+        """
+        return fill_gap(persisted_header.block_number, base_gaps)
+
     #
     # Canonical Chain API
     #
@@ -203,6 +218,23 @@ class HeaderDB(HeaderDatabaseAPI):
         with self.db.atomic_batch() as db:
             return self._persist_header_chain(db, headers, genesis_parent_hash)
 
+    def persist_header_stream(
+        self,
+        headers: Iterable[BlockHeaderAPI],
+        genesis_parent_hash: Hash32 = GENESIS_PARENT_HASH,
+        segment_size: int = HEADER_STREAM_SEGMENT_SIZE,
+    ) -> Tuple[Tuple[BlockHeaderAPI, ...], Tuple[BlockHeaderAPI, ...]]:
+        new_canonical_headers: List[BlockHeaderAPI] = []
+        old_canonical_headers: List[BlockHeaderAPI] = []
+        for segment in partition_all(segment_size, headers):
+            new_canonical, old_canonical = self.persist_header_chain(
+                segment, genesis_parent_hash
+            )
+            new_canonical_headers.extend(new_canonical)
+            old_canonical_headers.extend(old_canonical)
+
+        return tuple(new_canonical_headers), tuple(old_canonical_headers)
+
     def persist_checkpoint_header(self, header: BlockHeaderAPI, score: int) -> None:
         with self.db.atomic_batch() as db:
             return self._persist_checkpoint_header(db, header, score)
@@ -384,54 +416,72 @@ class HeaderDB(HeaderDatabaseAPI):
         else:
             score = cls._get_score(db, first_header.parent_hash)
 
-        curr_chain_head = first_header
-        db.set(
-            curr_chain_head.hash,
-            rlp.encode(curr_chain_head),
-        )
-        score = cls._set_hash_scores_to_db(db, curr_chain_head, score)
-
-        base_gaps = cls._get_header_chain_gaps(db)
-        gap_info = cls._update_header_chain_gaps(db, curr_chain_head, base_gaps)
-        gaps = cls._handle_gap_change(
-            db, gap_info, curr_chain_head, genesis_parent_hash
-        )
+        # Gap changes are tracked in memory, and only written to the database before
+        # handling a change that reads them back, and once after the last header.
+        gaps = cls._get_header_chain_gaps(db)
+        has_unwritten_gaps = False
 
-        orig_headers_seq = concat([(first_header,), headers_iterator])
-        for parent, child in sliding_window(2, orig_headers_seq):
-            if parent.hash != child.parent_hash:
+        persisted_headers: List[BlockHeaderAPI] = []
+        for header in concat([(first_header,), headers_iterator]):
+            if persisted_headers and persisted_headers[-1].hash != header.parent_hash:
                 raise ValidationError(
-                    f"Non-contiguous chain. Expected {encode_hex(child.hash)} "
-                    f"to have {encode_hex(parent.hash)} as parent "
-                    f"but was {encode_hex(child.parent_hash)}"
+                    f"Non-contiguous chain. Expected {encode_hex(header.hash)} "
+                    f"to have {encode_hex(persisted_headers[-1].hash)} as parent "
+                    f"but was {encode_hex(header.parent_hash)}"
                 )
+            persisted_headers.append(header)
 
-            curr_chain_head = child
             db.set(
-                curr_chain_head.hash,
-                rlp.encode(curr_chain_head),
+                header.hash,
+                rlp.encode(header),
             )
+            score = cls._set_hash_scores_to_db(db, header, score)
+
+            gap_change, gaps = cls._fill_header_chain_gap(db, header, gaps)
+            if gap_change in GAP_WRITES:
+                db.set(
+                    SchemaV1.make_header_chain_gaps_lookup_key(),
+                    rlp.encode(gaps, sedes=chain_gaps),
+                )
+                has_unwritten_gaps = False
+                gaps = cls._handle_gap_change(
+                    db, (gap_change, gaps), header, genesis_parent_hash
+                )
+            elif gap_change is not GapChange.NoChange:
+                has_unwritten_gaps = True
 
-            score = cls._set_hash_scores_to_db(db, curr_chain_head, score)
-            gap_info = cls._update_header_chain_gaps(db, curr_chain_head, gaps)
-            gaps = cls._handle_gap_change(
-                db, gap_info, curr_chain_head, genesis_parent_hash
+        if has_unwritten_gaps:
+            db.set(
+                SchemaV1.make_header_chain_gaps_lookup_key(),
+                rlp.encode(gaps, sedes=chain_gaps),
             )
+
         try:
             previous_canonical_head = cls._get_canonical_head_hash(db)
-            head_score = cls._get_score(db, previous_canonical_head)
         except CanonicalHeadNotFound:
-            return cls._set_as_canonical_chain_head(
-                db, curr_chain_head, genesis_parent_hash
+            extends_canonical_chain = is_genesis
+        else:
+            if score <= cls._get_score(db, previous_canonical_head):
+                return (), ()
+            extends_canonical_chain = (
+                first_header.parent_hash == previous_canonical_head
             )
 
-        if score > head_score:
+        if extends_canonical_chain:
+            # All headers are new canonical headers, so there is no need to walk back
+            # from the last one through the database to find them
+            for header in persisted_headers:
+                cls._add_block_number_to_hash_lookup(db, header)
+            db.set(
+                SchemaV1.make_canonical_head_hash_lookup_key(),
+                persisted_headers[-1].hash,
+            )
+            return tuple(persisted_headers), ()
+        else:
             return cls._set_as_canonical_chain_head(
-                db, curr_chain_head, genesis_parent_hash
+                db, persisted_headers[-1], genesis_parent_hash
             )
 
-        return (), ()
-
     @classmethod
     def _handle_gap_change(
         cls,
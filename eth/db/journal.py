@@ -7,6 +7,8 @@ from typing import (
     Dict,
     List,
     Set,
+    Tuple,
+    Type,
     Union,
     cast,
 )
@@ -54,6 +56,11 @@ REVERT_TO_WRAPPED = DeletedEntry()
 ChangesetValue = Union[bytes, DeletedEntry]
 ChangesetDict = Dict[bytes, ChangesetValue]
 
+# Marks a clear in the undo log of an UndoLogJournal
+_CLEAR_ENTRY = object()
+
+UndoLogEntry = Tuple[object, object]
+
 get_next_checkpoint = cast(Callable[[], JournalDBCheckpoint], count().__next__)
 
 
@@ -328,6 +335,260 @@ class Journal(BaseDB):
         return tracker.diff()
 
 
+class UndoLogJournal(BaseDB):
+    """
+    An alternative to :class:`Journal`, with the same interface, backed by a single
+    append-only undo log instead of one reversion changeset per checkpoint.
+
+    Every change appends the key's previous value to the log (at most once per key
+    per checkpoint). A checkpoint is simply the length of the log at the time it was
+    recorded, so recording and committing a checkpoint are O(1): nothing is merged.
+    Discarding replays the log backwards down to the checkpoint, which costs time
+    proportional to the changes being thrown away.
+
+    Checkpoints are referenced by an internally-generated integer.
+    This is *not* threadsafe.
+    """
+
+    __slots__ = [
+        "_current_values",
+        "_undo_log",
+        "_checkpoints",
+        "_checkpoint_stack",
+        "_logged_at",
+        "_clears_at",
+        "_ignore_wrapped_db",
+    ]
+
+    def __init__(self) -> None:
+        # If the journal was persisted right now,
+        # these would be the current changes to push:
+        self._current_values: ChangesetDict = {}
+
+        # (key, previous value) pairs, in the order the changes were made. A clear
+        # is logged as (_CLEAR_ENTRY, (previous values, previous ignore flag)).
+        self._undo_log: List[UndoLogEntry] = []
+
+        # Position in the undo log of every recorded checkpoint, including the
+        # committed ones, in the order they were recorded.
+        self._checkpoints: Dict[JournalDBCheckpoint, int] = {}
+
+        # The checkpoints that can still be discarded or committed
+        self._checkpoint_stack: List[JournalDBCheckpoint] = []
+
+        # The checkpoint that was active the last time each key was logged. There is
+        # no need to log a key again until a new checkpoint is recorded.
+        self._logged_at: Dict[bytes, JournalDBCheckpoint] = {}
+
+        # Positions in the undo log of every clear
+        self._clears_at: List[int] = []
+
+        # If a clear was called, then any missing keys should be treated as missing
+        self._ignore_wrapped_db = False
+
+    @property
+    def root_checkpoint(self) -> JournalDBCheckpoint:
+        """
+        Returns the starting checkpoint
+        """
+        return first(self._checkpoints.keys())
+
+    @property
+    def is_flattened(self) -> bool:
+        """
+        :return: whether there are any explicitly committed checkpoints
+        """
+        return len(self._checkpoint_stack) < 2
+
+    @property
+    def last_checkpoint(self) -> JournalDBCheckpoint:
+        """
+        Returns the latest checkpoint
+        """
+        return self._checkpoint_stack[-1]
+
+    def has_checkpoint(self, checkpoint: JournalDBCheckpoint) -> bool:
+        return checkpoint in self._checkpoint_stack
+
+    def record_checkpoint(
+        self, custom_checkpoint: JournalDBCheckpoint = None
+    ) -> JournalDBCheckpoint:
+        """
+        Creates a new checkpoint. Checkpoints are a sequential int chosen by the
+        journal to prevent collisions.
+        """
+        if custom_checkpoint is not None:
+            if custom_checkpoint in self._checkpoints:
+                raise ValidationError(
+                    "Tried to record with an existing checkpoint: "
+                    f"{custom_checkpoint!r}"
+                )
+            else:
+                checkpoint = custom_checkpoint
+        else:
+            checkpoint = get_next_checkpoint()
+
+        self._checkpoints[checkpoint] = len(self._undo_log)
+        self._checkpoint_stack.append(checkpoint)
+        return checkpoint
+
+    def discard(self, through_checkpoint_id: JournalDBCheckpoint) -> None:
+        while self._checkpoint_stack:
+            checkpoint_id = self._checkpoint_stack.pop()
+            if checkpoint_id == through_checkpoint_id:
+                break
+        else:
+            # checkpoint not found!
+            raise ValidationError(f"No checkpoint {through_checkpoint_id} was found")
+
+        # Forget the discarded checkpoint, and all (possibly committed) checkpoints
+        # that were recorded after it
+        while True:
+            checkpoint_id, position = self._checkpoints.popitem()
+            if checkpoint_id == through_checkpoint_id:
+                break
+
+        undo_log = self._undo_log
+        current_values = self._current_values
+        logged_at = self._logged_at
+        for idx in range(len(undo_log) - 1, position - 1, -1):
+            key, old_value = undo_log[idx]
+            if key is _CLEAR_ENTRY:
+                current_values, self._ignore_wrapped_db = cast(
+                    Tuple[ChangesetDict, bool], old_value
+                )
+                continue
+
+            logged_at.pop(cast(bytes, key), None)
+            if old_value is REVERT_TO_WRAPPED:
+                # The current value may not exist, if it was a delete followed by a
+                # clear, so pop it off, or ignore if it is already missing
+                current_values.pop(cast(bytes, key), None)
+            else:
+                current_values[cast(bytes, key)] = cast(ChangesetValue, old_value)
+
+        del undo_log[position:]
+        self._current_values = current_values
+        while self._clears_at and self._clears_at[-1] >= position:
+            self._clears_at.pop()
+
+    def clear(self) -> None:
+        """
+        Treat as if the *underlying* database will also be cleared by some other
+        mechanism. The previous values are moved into the undo log as a whole, in
+        case of a discard.
+        """
+        self._clears_at.append(len(self._undo_log))
+        self._undo_log.append(
+            (_CLEAR_ENTRY, (self._current_values, self._ignore_wrapped_db))
+        )
+        self._current_values = {}
+        self._ignore_wrapped_db = True
+
+    def has_clear(self, at_checkpoint: JournalDBCheckpoint) -> bool:
+        try:
+            position = self._checkpoints[at_checkpoint]
+        except KeyError:
+            raise ValidationError(f"Checkpoint {at_checkpoint} is not in the journal")
+        return bool(self._clears_at) and self._clears_at[-1] >= position
+
+    def commit_checkpoint(self, commit_to: JournalDBCheckpoint) -> ChangesetDict:
+        """
+        Collapses all changes since the given checkpoint. Can no longer discard to any
+        of the checkpoints that followed the given checkpoint.
+        """
+        for positions_before_last, checkpoint in enumerate(
+            reversed(self._checkpoint_stack)
+        ):
+            if checkpoint == commit_to:
+                checkpoint_idx = -1 - positions_before_last
+                break
+        else:
+            raise ValidationError(f"No checkpoint {commit_to} was found")
+
+        if checkpoint_idx == -1 * len(self._checkpoint_stack):
+            raise ValidationError(
+                "Should not commit root changeset with commit_changeset, "
+                "use pop_all() instead"
+            )
+
+        # The undo log is left untouched, for discards to earlier checkpoints
+        del self._checkpoint_stack[checkpoint_idx:]
+
+        return self._current_values
+
+    def pop_all(self) -> ChangesetDict:
+        final_changes = self._current_values
+        self._current_values = {}
+        self._undo_log.clear()
+        self._checkpoints.clear()
+        self._checkpoint_stack.clear()
+        self._logged_at.clear()
+        self._clears_at.clear()
+        self.record_checkpoint()
+        self._ignore_wrapped_db = False
+        return final_changes
+
+    def flatten(self) -> None:
+        if self.is_flattened:
+            return
+
+        checkpoint_after_root = nth(1, self._checkpoint_stack)
+        self.commit_checkpoint(checkpoint_after_root)
+
+    #
+    # Database API
+    #
+    def __getitem__(self, key: bytes) -> ChangesetValue:  # type: ignore # Breaks LSP
+        if self._ignore_wrapped_db:
+            default_result = REVERT_TO_WRAPPED
+        else:
+            default_result = None  # indicate that caller should check wrapped database
+        return self._current_values.get(key, default_result)
+
+    def _log(self, key: bytes) -> None:
+        last_checkpoint = self._checkpoint_stack[-1]
+        if self._logged_at.get(key) != last_checkpoint:
+            self._logged_at[key] = last_checkpoint
+            self._undo_log.append(
+                (key, self._current_values.get(key, REVERT_TO_WRAPPED))
+            )
+
+    def __setitem__(self, key: bytes, value: bytes) -> None:
+        self._log(key)
+        self._current_values[key] = value
+
+    def _exists(self, key: bytes) -> bool:
+        val = self.get(key)
+        return val is not None and val not in (REVERT_TO_WRAPPED, DELETE_WRAPPED)
+
+    def __delitem__(self, key: bytes) -> None:
+        raise NotImplementedError(
+            "You must delete with one of delete_local or delete_wrapped"
+        )
+
+    def delete_wrapped(self, key: bytes) -> None:
+        self._log(key)
+        self._current_values[key] = DELETE_WRAPPED
+
+    def delete_local(self, key: bytes) -> None:
+        self._log(key)
+        self._current_values[key] = REVERT_TO_WRAPPED
+
+    def diff(self) -> DBDiff:
+        tracker = DBDiffTracker()
+
+        for key, value in self._current_values.items():
+            if value is DELETE_WRAPPED:
+                del tracker[key]
+            elif value is REVERT_TO_WRAPPED:
+                pass
+            else:
+                tracker[key] = value  # type: ignore  # cast(bytes, value)
+
+        return tracker.diff()
+
+
 class JournalDB(BaseDB):
     """
     A wrapper around the basic DB objects that keeps a journal of all changes.
@@ -349,9 +610,11 @@ class JournalDB(BaseDB):
 
     __slots__ = ["_wrapped_db", "_journal", "record", "commit"]
 
+    journal_class: Type[Union[Journal, UndoLogJournal]] = Journal
+
     def __init__(self, wrapped_db: DatabaseAPI) -> None:
         self._wrapped_db = wrapped_db
-        self._journal = Journal()
+        self._journal = self.journal_class()
         self.record = self._journal.record_checkpoint
         self.commit = self._journal.commit_checkpoint
         self.reset()
@@ -480,3 +743,16 @@ class JournalDB(BaseDB):
         These are the changes that would occur if :meth:`persist()` were called.
         """
         return self._journal.diff()
+
+
+class UndoLogJournalDB(JournalDB):
+    """
+    A :class:`JournalDB` backed by an :class:`UndoLogJournal`. Checkpoints are
+    cheaper to record and commit, at the cost of holding on to the undo log until
+    the next persist. Suited to deep call stacks, where many checkpoints
+    are committed and few are discarded.
+    """
+
+    __slots__: List[str] = []
+
+    journal_class = UndoLogJournal
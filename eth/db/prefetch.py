@@ -0,0 +1,368 @@
+from concurrent.futures import (
+    Executor,
+)
+from contextlib import (
+    contextmanager,
+)
+import logging
+import threading
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from eth_hash.auto import (
+    keccak,
+)
+from eth_typing import (
+    Address,
+    Hash32,
+)
+from eth_utils import (
+    big_endian_to_int,
+    int_to_big_endian,
+)
+from lru import (
+    LRU,
+)
+import rlp
+from trie import (
+    HexaryTrie,
+)
+from trie.exceptions import (
+    MissingTrieNode,
+)
+
+from eth._utils.padding import (
+    pad32,
+)
+from eth.abc import (
+    AtomicDatabaseAPI,
+    AtomicWriteBatchAPI,
+    DatabaseAPI,
+    MetaWitnessAPI,
+    SignedTransactionAPI,
+)
+from eth.constants import (
+    BLANK_ROOT_HASH,
+    CREATE_CONTRACT_ADDRESS,
+    EMPTY_SHA3,
+)
+from eth.db.backends.base import (
+    BaseAtomicDB,
+    BaseDB,
+)
+from eth.rlp.accounts import (
+    Account,
+)
+from eth.vm import (
+    opcode_values,
+)
+
+_PUSH_SIZES = {
+    opcode: opcode - opcode_values.PUSH1 + 1
+    for opcode in range(opcode_values.PUSH1, opcode_values.PUSH32 + 1)
+}
+_STORAGE_OPCODES = {opcode_values.SLOAD, opcode_values.SSTORE}
+
+
+def get_constant_storage_slots(code: bytes) -> FrozenSet[int]:
+    """
+    Statically find the storage slots that ``code`` accesses with a constant
+    slot number, i.e. an ``SLOAD`` or ``SSTORE`` right after a ``PUSH``. Data
+    bytes of ``PUSH`` instructions are skipped, like ``JUMPDEST`` analysis does.
+    """
+    slots = set()
+    previous_push_value = None
+    position = 0
+    code_length = len(code)
+    while position < code_length:
+        opcode = code[position]
+        push_size = _PUSH_SIZES.get(opcode)
+        if push_size is not None:
+            push_data = code[position + 1 : position + 1 + push_size]
+            previous_push_value = big_endian_to_int(push_data)
+            position += 1 + push_size
+            continue
+        elif opcode in _STORAGE_OPCODES and previous_push_value is not None:
+            slots.add(previous_push_value)
+        previous_push_value = None
+        position += 1
+    return frozenset(slots)
+
+
+class PrefetchCacheDB(BaseAtomicDB):
+    """
+    Wraps around an atomic database, and serves reads from ``cache`` when
+    possible. A :class:`StatePrefetcher` fills the cache from another thread
+    with trie nodes and bytecode, which are keyed by their hash, so a cached
+    value never goes stale. Writes go straight to the wrapped database.
+
+    Any other values keyed by their hash, like block headers, can be overlaid
+    the same way, without writing them to the wrapped database.
+
+    :attr:`hits` counts the reads that were served from the cache.
+    """
+
+    logger = logging.getLogger("eth.db.PrefetchCacheDB")
+
+    def __init__(
+        self, wrapped_db: AtomicDatabaseAPI, cache: Dict[bytes, bytes]
+    ) -> None:
+        self.wrapped_db = wrapped_db
+        self._cache = cache
+        self.hits = 0
+
+    def __getitem__(self, key: bytes) -> bytes:
+        try:
+            value = self._cache[key]
+        except KeyError:
+            return self.wrapped_db[key]
+        else:
+            self.hits += 1
+            return value
+
+    def __setitem__(self, key: bytes, value: bytes) -> None:
+        self.wrapped_db[key] = value
+
+    def __delitem__(self, key: bytes) -> None:
+        self._cache.pop(key, None)
+        del self.wrapped_db[key]
+
+    def _exists(self, key: bytes) -> bool:
+        return key in self._cache or key in self.wrapped_db
+
+    @contextmanager
+    def atomic_batch(self) -> Iterator[AtomicWriteBatchAPI]:
+        with self.wrapped_db.atomic_batch() as readable_batch:
+            yield readable_batch
+
+
+class _CachingReadDB(BaseDB):
+    """
+    Read-only view of a database, that copies every value it reads into a cache.
+    """
+
+    def __init__(self, wrapped_db: DatabaseAPI, cache: Dict[bytes, bytes]) -> None:
+        self._wrapped_db = wrapped_db
+        self._cache = cache
+
+    def __getitem__(self, key: bytes) -> bytes:
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._wrapped_db[key]
+            self._cache[key] = value
+            return value
+
+    def __setitem__(self, key: bytes, value: bytes) -> None:
+        raise NotImplementedError("The prefetcher must never write to the database")
+
+    def __delitem__(self, key: bytes) -> None:
+        raise NotImplementedError("The prefetcher must never write to the database")
+
+    def _exists(self, key: bytes) -> bool:
+        return key in self._cache or key in self._wrapped_db
+
+
+class BlockPrefetch:
+    """
+    The prefetching of one block's state, as started by
+    :meth:`StatePrefetcher.prefetch_block`. Execution should read state through
+    :attr:`db`.
+    """
+
+    def __init__(self, db: PrefetchCacheDB, stop_event: threading.Event) -> None:
+        self.db = db
+        self._stop_event = stop_event
+
+    def stop(self) -> None:
+        """
+        Stop prefetching, if it isn't done yet.
+        """
+        self._stop_event.set()
+
+
+class StatePrefetcher:
+    """
+    Load the state a block is likely to access, in ``executor``, ahead of its
+    execution: the account and bytecode of every transaction's sender and
+    recipient, the accounts and storage slots in their access lists, and the
+    storage slots that the recipient accesses with a constant slot number, or
+    that were accessed in recently imported blocks.
+
+    The prefetcher walks the tries of the block's pre-state, and keeps every node
+    it reads, so that execution rarely waits for the underlying database. If
+    ``executor`` is ``None``, prefetching runs before execution starts instead.
+    """
+
+    logger = logging.getLogger("eth.db.prefetch.StatePrefetcher")
+
+    def __init__(
+        self,
+        executor: Executor = None,
+        max_hot_slots_per_account: int = 64,
+        max_tracked_accounts: int = 4096,
+        hot_slot_decay: float = 0.8,
+    ) -> None:
+        if not 0 < hot_slot_decay < 1:
+            raise ValueError(f"Hot slot decay must be in (0, 1), got {hot_slot_decay}")
+        self._executor = executor
+        self._max_hot_slots_per_account = max_hot_slots_per_account
+        self._hot_slot_decay = hot_slot_decay
+        self._num_blocks_recorded = 0
+        # address -> (block at which the counts were last decayed, count per slot)
+        self._slot_counts: LRU[Address, Tuple[int, Dict[int, float]]] = LRU(
+            max_tracked_accounts
+        )
+        self._hot_slots: LRU[Address, FrozenSet[int]] = LRU(max_tracked_accounts)
+        self._constant_slots: LRU[Hash32, FrozenSet[int]] = LRU(max_tracked_accounts)
+
+    def get_hot_slots(self, address: Address) -> FrozenSet[int]:
+        return self._hot_slots.get(address, frozenset())
+
+    def record_meta_witness(self, meta_witness: MetaWitnessAPI) -> None:
+        """
+        Learn which storage slots were accessed by an imported block, to prefetch
+        them for the following blocks.
+
+        Each account keeps a count of accesses per slot, which decays by
+        ``hot_slot_decay`` with every recorded block. The slots with the highest
+        counts are the hot ones.
+        """
+        self._num_blocks_recorded += 1
+        block_index = self._num_blocks_recorded
+        max_hot_slots = self._max_hot_slots_per_account
+
+        for address in meta_witness.accounts_queried:
+            slots = meta_witness.get_slots_queried(address)
+            if not slots:
+                continue
+
+            try:
+                last_decayed_at, old_counts = self._slot_counts[address]
+            except KeyError:
+                counts: Dict[int, float] = {}
+            else:
+                decay = self._hot_slot_decay ** (block_index - last_decayed_at)
+                counts = {slot: count * decay for slot, count in old_counts.items()}
+            for slot in slots:
+                counts[slot] = counts.get(slot, 0) + 1
+
+            # rank by count, then by slot number, to keep the choice deterministic
+            ranked_slots = sorted(counts, key=lambda slot: (-counts[slot], slot))
+            # remember a few more slots than are hot, so they can catch up
+            counts = {slot: counts[slot] for slot in ranked_slots[: max_hot_slots * 4]}
+
+            self._slot_counts[address] = (block_index, counts)
+            self._hot_slots[address] = frozenset(ranked_slots[:max_hot_slots])
+
+    def prefetch_block(
+        self,
+        db: AtomicDatabaseAPI,
+        state_root: Hash32,
+        transactions: Sequence[SignedTransactionAPI],
+    ) -> BlockPrefetch:
+        """
+        Start loading the state that ``transactions`` will likely access, from
+        the state at ``state_root``.
+        """
+        cache: Dict[bytes, bytes] = {}
+        stop_event = threading.Event()
+        prefetch = BlockPrefetch(PrefetchCacheDB(db, cache), stop_event)
+
+        reader = _CachingReadDB(db, cache)
+        if self._executor is None:
+            self._prefetch_transactions(reader, state_root, transactions, stop_event)
+        else:
+            self._executor.submit(
+                self._prefetch_transactions,
+                reader,
+                state_root,
+                transactions,
+                stop_event,
+            )
+        return prefetch
+
+    def read_likely_state(
+        self,
+        db: DatabaseAPI,
+        state_root: Hash32,
+        transactions: Sequence[SignedTransactionAPI],
+    ) -> Dict[bytes, bytes]:
+        """
+        Load the state that ``transactions`` will likely access right away, and
+        return every trie node and bytecode that was read, keyed by its hash.
+        """
+        nodes: Dict[bytes, bytes] = {}
+        self._prefetch_transactions(
+            _CachingReadDB(db, nodes), state_root, transactions, threading.Event()
+        )
+        return nodes
+
+    def _prefetch_transactions(
+        self,
+        db: DatabaseAPI,
+        state_root: Hash32,
+        transactions: Sequence[SignedTransactionAPI],
+        stop_event: threading.Event,
+    ) -> None:
+        state_trie = HexaryTrie(db, root_hash=state_root)
+        prefetched: Set[Tuple[Address, int]] = set()
+        try:
+            for transaction in transactions:
+                for address, slots in self._get_likely_accesses(transaction):
+                    if stop_event.is_set():
+                        return
+                    self._prefetch_account(db, state_trie, address, slots, prefetched)
+        except Exception:
+            # Execution will load whatever wasn't prefetched, and report any error
+            self.logger.debug("Stopped prefetching state", exc_info=True)
+
+    def _get_likely_accesses(
+        self, transaction: SignedTransactionAPI
+    ) -> Iterable[Tuple[Address, Iterable[int]]]:
+        yield transaction.sender, ()
+        if transaction.to != CREATE_CONTRACT_ADDRESS:
+            yield transaction.to, self.get_hot_slots(transaction.to)
+        for address, slots in transaction.access_list:
+            yield address, slots
+
+    def _prefetch_account(
+        self,
+        db: DatabaseAPI,
+        state_trie: HexaryTrie,
+        address: Address,
+        slots: Iterable[int],
+        prefetched: Set[Tuple[Address, int]],
+    ) -> None:
+        encoded_account = state_trie[keccak(address)]
+        if not encoded_account:
+            return
+        account = rlp.decode(encoded_account, sedes=Account)
+
+        if account.code_hash != EMPTY_SHA3:
+            code = db[account.code_hash]
+            try:
+                constant_slots = self._constant_slots[account.code_hash]
+            except KeyError:
+                constant_slots = get_constant_storage_slots(code)
+                self._constant_slots[account.code_hash] = constant_slots
+            slots = constant_slots.union(slots)
+
+        if account.storage_root == BLANK_ROOT_HASH:
+            return
+        storage_trie = HexaryTrie(db, root_hash=account.storage_root)
+        for slot in slots:
+            if (address, slot) in prefetched:
+                continue
+            prefetched.add((address, slot))
+            try:
+                storage_trie[keccak(pad32(int_to_big_endian(slot)))]
+            except MissingTrieNode:
+                continue
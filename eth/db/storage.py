@@ -51,6 +51,7 @@ from eth.db.cache import (
 )
 from eth.db.journal import (
     JournalDB,
+    UndoLogJournalDB,
 )
 from eth.typing import (
     JournalDBCheckpoint,
@@ -256,6 +257,40 @@ class StorageLookup(BaseDB):
         del self._historical_write_tries[trie_index:]
 
 
+class StorageSlotLookup(BaseDB):
+    """
+    Presents a :class:`StorageLookup` as a mapping of slot integers to value
+    integers, so that the caches and journals layered on top of it never touch RLP.
+    Values are only encoded when changes are flushed down into the trie.
+
+    Missing slots read as 0.
+    """
+
+    def __init__(self, storage_lookup: StorageLookup) -> None:
+        self._storage_lookup = storage_lookup
+
+    def __getitem__(self, slot: int) -> int:  # type: ignore # Breaks LSP
+        encoded_value = self._storage_lookup[int_to_big_endian(slot)]
+        if encoded_value == b"":
+            return 0
+        else:
+            return rlp.decode(encoded_value, sedes=rlp.sedes.big_endian_int)
+
+    def __setitem__(self, slot: int, value: int) -> None:  # type: ignore # Breaks LSP
+        self._storage_lookup[int_to_big_endian(slot)] = rlp.encode(value)
+
+    def _exists(self, slot: int) -> bool:
+        return int_to_big_endian(slot) in self._storage_lookup
+
+    def __delitem__(self, slot: int) -> None:  # type: ignore # Breaks LSP
+        del self._storage_lookup[int_to_big_endian(slot)]
+
+
+def _slot_entry_size(slot: int, value: int) -> int:
+    # approximately the size of the big-endian slot key and the encoded value
+    return (slot.bit_length() + 7) // 8 + (value.bit_length() + 7) // 8 + 1
+
+
 CLEAR_COUNT_KEY_NAME = b"clear-count"
 
 
@@ -263,14 +298,20 @@ class AccountStorageDB(AccountStorageDatabaseAPI):
     logger = get_extended_debug_logger("eth.db.storage.AccountStorageDB")
 
     def __init__(
-        self, db: AtomicDatabaseAPI, storage_root: Hash32, address: Address
+        self,
+        db: AtomicDatabaseAPI,
+        storage_root: Hash32,
+        address: Address,
+        cache_size: int = 2048,
+        cache_max_bytes: int = None,
     ) -> None:
         """
         Database entries go through several pipes, like so...
 
         .. code::
 
-          db -> _storage_lookup -> _storage_cache -> _locked_changes -> _journal_storage
+          db -> _storage_lookup -> _slot_lookup -> _storage_cache -> _locked_changes
+             -> _journal_storage
 
         db is the raw database, we can assume it hits disk when written to.
         Keys are stored as node hashes and rlp-encoded node values.
@@ -281,11 +322,15 @@ class AccountStorageDB(AccountStorageDatabaseAPI):
         writes are *not* persisted to db, until _storage_lookup is explicitly instructed
         to, via :meth:`StorageLookup.commit_to`
 
+        _slot_lookup converts between the slot and value integers used by every
+        layer above it, and the keys and rlp-encoded values of _storage_lookup.
+
         _storage_cache is a cache tied to the state root of the trie. It
         is important that this cache is checked *after* looking for
         the key in _journal_storage, because the cache is only invalidated
         after a state root change. Otherwise, you will see data since the last
-        storage root was calculated.
+        storage root was calculated. It holds up to ``cache_size`` slots, or is
+        bounded to ``cache_max_bytes`` if supplied.
 
         _locked_changes is a batch database that includes only those values that are
         un-revertable in the EVM. Currently, that means changes that completed in a
@@ -295,14 +340,24 @@ class AccountStorageDB(AccountStorageDatabaseAPI):
         called. It manages all the checkpointing and rollbacks that happen during
         EVM execution.
 
-        In both _storage_cache and _journal_storage, Keys are set/retrieved as the
-        big_endian encoding of the slot integer, and the rlp-encoded value.
+        In _storage_cache, _locked_changes and _journal_storage, keys are the slot
+        integers and values are the stored integers, so that SLOAD and SSTORE
+        don't pay for any encoding. Values are rlp-encoded when they are flushed
+        to _storage_lookup, in :meth:`make_storage_root`.
         """
         self._address = address
         self._storage_lookup = StorageLookup(db, storage_root, address)
-        self._storage_cache = CacheDB(self._storage_lookup)
-        self._locked_changes = JournalDB(self._storage_cache)
-        self._journal_storage = JournalDB(self._locked_changes)
+        self._slot_lookup = StorageSlotLookup(self._storage_lookup)
+        self._storage_cache = CacheDB(
+            self._slot_lookup,
+            cache_size=cache_size,
+            max_bytes=cache_max_bytes,
+            entry_size=_slot_entry_size,
+        )
+        # The changeset-based Journal only accepts bytes values, so the integer
+        # journals use the undo log
+        self._locked_changes = UndoLogJournalDB(self._storage_cache)
+        self._journal_storage = UndoLogJournalDB(self._locked_changes)
         self._accessed_slots: Set[int] = set()
 
         # Track how many times we have cleared the storage. This is journaled
@@ -313,34 +368,27 @@ class AccountStorageDB(AccountStorageDatabaseAPI):
 
     def get(self, slot: int, from_journal: bool = True) -> int:
         self._accessed_slots.add(slot)
-        key = int_to_big_endian(slot)
         lookup_db = self._journal_storage if from_journal else self._locked_changes
         try:
-            encoded_value = lookup_db[key]
+            return lookup_db[slot]  # type: ignore # int-keyed journal
         except MissingStorageTrieNode:
             raise
         except KeyError:
             return 0
 
-        if encoded_value == b"":
-            return 0
-        else:
-            return rlp.decode(encoded_value, sedes=rlp.sedes.big_endian_int)
-
     def set(self, slot: int, value: int) -> None:
-        key = int_to_big_endian(slot)
         if value:
-            self._journal_storage[key] = rlp.encode(value)
+            self._journal_storage[slot] = value  # type: ignore # int-keyed journal
         else:
             try:
-                current_val = self._journal_storage[key]
+                current_val = self._journal_storage[slot]  # type: ignore
             except KeyError:
                 # deleting an empty key has no effect
                 return
             else:
-                if current_val != b"":
+                if current_val:
                     # only try to delete the value if it's present
-                    del self._journal_storage[key]
+                    del self._journal_storage[slot]  # type: ignore
 
     def delete(self) -> None:
         self.logger.debug2(
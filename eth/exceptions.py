@@ -9,6 +9,13 @@ class PyEVMError(Exception):
     """
 
 
+class PrecompileBackendMismatch(PyEVMError):
+    """
+    Raised when an alternative implementation of a precompile does not behave like
+    the implementation that it replaces.
+    """
+
+
 class VMNotFound(PyEVMError):
     """
     Raised when no VM is available for the provided block number.
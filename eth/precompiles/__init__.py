@@ -1,18 +1,46 @@
+import sys
+from types import (
+    ModuleType,
+)
+from typing import (
+    Any,
+)
+
+from eth._utils.module_loading import (
+    lazy_module_attributes,
+)
+
 from .sha256 import sha256
 from .identity import identity
 from .ecrecover import ecrecover
 from .ripemd160 import ripemd160
 from .modexp import modexp
-from .ecadd import ecadd
-from .ecmul import ecmul
-from .ecpairing import ecpairing
 from .blake2 import blake2b_fcompress
-from .bls12_381 import (
-    bls12_g1_add,
-    bls12_g1_msm,
-    bls12_map_fp_to_g1,
-    bls12_g2_add,
-    bls12_g2_msm,
-    bls12_map_fp2_to_g2,
-    bls12_pairing_check,
-)
+from .lazy import LazyPrecompile
+
+# The precompiles that need py_ecc or ckzg are only imported when first accessed
+_LAZY_PRECOMPILE_PATHS = {
+    "ecadd": ".ecadd.ecadd",
+    "ecmul": ".ecmul.ecmul",
+    "ecpairing": ".ecpairing.ecpairing",
+    "bls12_g1_add": ".bls12_381.bls12_g1_add",
+    "bls12_g1_msm": ".bls12_381.bls12_g1_msm",
+    "bls12_map_fp_to_g1": ".bls12_381.bls12_map_fp_to_g1",
+    "bls12_g2_add": ".bls12_381.bls12_g2_add",
+    "bls12_g2_msm": ".bls12_381.bls12_g2_msm",
+    "bls12_map_fp2_to_g2": ".bls12_381.bls12_map_fp2_to_g2",
+    "bls12_pairing_check": ".bls12_381.bls12_pairing_check",
+    "point_evaluation_precompile": ".point_evaluation.point_evaluation_precompile",
+}
+__getattr__, __dir__ = lazy_module_attributes(__name__, _LAZY_PRECOMPILE_PATHS)
+
+
+class _PrecompilesModule(ModuleType):
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Importing a submodule binds it to this package, which would hide the lazy
+        # precompile of the same name, like ``ecadd``, if it wasn't accessed before
+        if not (isinstance(value, ModuleType) and name in _LAZY_PRECOMPILE_PATHS):
+            super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _PrecompilesModule
@@ -0,0 +1,319 @@
+"""
+Registry of alternative implementations of precompiles, such as bindings to native
+cryptography libraries, which computation classes can use in place of the reference
+implementations with
+:meth:`~eth.vm.computation.BaseComputation.configure_precompile_backend`.
+
+Every alternative implementation is checked against the reference one when it is
+selected: both run the same self-test inputs, and must return the same output,
+consume the same gas and fail on the same inputs.
+"""
+import functools
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Mapping,
+    Tuple,
+    Type,
+)
+
+from eth_typing import (
+    Address,
+)
+from eth_utils import (
+    encode_hex,
+)
+
+from eth._utils.address import (
+    force_bytes_to_address,
+)
+from eth.abc import (
+    ComputationAPI,
+)
+from eth.constants import (
+    ZERO_ADDRESS,
+)
+from eth.exceptions import (
+    PrecompileBackendMismatch,
+)
+from eth.vm.message import (
+    Message,
+)
+from eth.vm.transaction_context import (
+    BaseTransactionContext,
+)
+
+Precompile = Callable[[ComputationAPI], Any]
+
+# Gas of the messages that self-test inputs are run with, enough for all of them
+SELF_TEST_GAS = 10**8
+
+ECADD_ADDRESS = force_bytes_to_address(b"\x06")
+ECMUL_ADDRESS = force_bytes_to_address(b"\x07")
+ECPAIRING_ADDRESS = force_bytes_to_address(b"\x08")
+BLAKE2B_ADDRESS = force_bytes_to_address(b"\x09")
+BLS12_G1ADD_ADDRESS = force_bytes_to_address(b"\x0b")
+BLS12_G1MSM_ADDRESS = force_bytes_to_address(b"\x0c")
+BLS12_G2ADD_ADDRESS = force_bytes_to_address(b"\x0d")
+BLS12_G2MSM_ADDRESS = force_bytes_to_address(b"\x0e")
+BLS12_PAIRING_CHECK_ADDRESS = force_bytes_to_address(b"\x0f")
+BLS12_MAP_FP_TO_G1_ADDRESS = force_bytes_to_address(b"\x10")
+BLS12_MAP_FP2_TO_G2_ADDRESS = force_bytes_to_address(b"\x11")
+
+# Inputs that every precompile is self-tested with, in addition to its own ones
+GENERIC_SELF_TEST_INPUTS = (
+    b"",
+    b"\x01",
+    bytes(range(256)),
+)
+
+_precompile_backends: Dict[str, Dict[Address, Precompile]] = {}
+
+
+def register_precompile_backend(
+    name: str, precompiles: Mapping[Address, Precompile]
+) -> None:
+    """
+    Register the precompiles of a backend, by address, under ``name``. A backend
+    only needs to implement some precompiles; the others keep their reference
+    implementation.
+    """
+    _precompile_backends[name] = dict(precompiles)
+
+
+def get_precompile_backend_names() -> Tuple[str, ...]:
+    return tuple(_precompile_backends)
+
+
+def get_precompile_backend(name: str) -> Dict[Address, Precompile]:
+    try:
+        return _precompile_backends[name]
+    except KeyError:
+        raise KeyError(
+            f"Unknown precompile backend {name!r}. "
+            f"Registered backends: {get_precompile_backend_names()}"
+        )
+
+
+def run_precompile(
+    computation_class: Type[ComputationAPI],
+    precompile: Precompile,
+    data: bytes,
+    address: Address = ZERO_ADDRESS,
+    gas: int = SELF_TEST_GAS,
+) -> Tuple[bool, bytes, int]:
+    """
+    Run ``precompile`` in a computation of ``computation_class`` with ``data`` and
+    ``gas``, and without any state, and return whether it failed, its output and
+    the gas left.
+    """
+    message = Message(
+        to=address,
+        sender=ZERO_ADDRESS,
+        value=0,
+        data=data,
+        code=b"",
+        gas=gas,
+    )
+    transaction_context = BaseTransactionContext(gas_price=0, origin=ZERO_ADDRESS)
+    with computation_class(None, message, transaction_context) as computation:
+        precompile(computation)
+    return computation.is_error, computation.output, computation.get_gas_remaining()
+
+
+def check_precompile_backend(
+    computation_class: Type[ComputationAPI],
+    address: Address,
+    reference: Precompile,
+    candidate: Precompile,
+) -> None:
+    """
+    Run the reference and candidate implementations of the precompile at
+    ``address`` with its self-test inputs, and raise a
+    :class:`~eth.exceptions.PrecompileBackendMismatch` if their results differ.
+    """
+    for data in get_self_test_inputs(address):
+        expected = run_precompile(computation_class, reference, data, address)
+        actual = run_precompile(computation_class, candidate, data, address)
+        if actual != expected:
+            raise PrecompileBackendMismatch(
+                f"{candidate!r} returned (is_error, output, gas_remaining) {actual} "
+                f"instead of {expected} for the precompile at {encode_hex(address)}, "
+                f"with input {encode_hex(data)}"
+            )
+
+
+def get_self_test_inputs(address: Address) -> Tuple[bytes, ...]:
+    try:
+        make_inputs = _SELF_TEST_INPUT_FACTORIES[address]
+    except KeyError:
+        return GENERIC_SELF_TEST_INPUTS
+    else:
+        return GENERIC_SELF_TEST_INPUTS + make_inputs()
+
+
+@functools.lru_cache(maxsize=None)
+def _make_bn128_inputs() -> Dict[str, bytes]:
+    from py_ecc import (
+        optimized_bn128 as bn128,
+    )
+
+    def encode_g1(point: Any) -> bytes:
+        x, y = bn128.normalize(point)
+        return int(x).to_bytes(32, "big") + int(y).to_bytes(32, "big")
+
+    def encode_g2(point: Any) -> bytes:
+        x, y = bn128.normalize(point)
+        return b"".join(
+            coord.to_bytes(32, "big")
+            for coord in (x.coeffs[1], x.coeffs[0], y.coeffs[1], y.coeffs[0])
+        )
+
+    p1 = bn128.multiply(bn128.G1, 3)
+    p2 = bn128.multiply(bn128.G2, 5)
+    return {
+        "g1": encode_g1(bn128.G1),
+        "p1": encode_g1(p1),
+        "neg_p1": encode_g1(bn128.neg(p1)),
+        "p2": encode_g2(p2),
+    }
+
+
+def _make_ecadd_inputs() -> Tuple[bytes, ...]:
+    points = _make_bn128_inputs()
+    return (
+        points["g1"] + points["p1"],
+        points["p1"] + points["neg_p1"],
+        points["p1"] + bytes(64),
+        points["p1"] + (1).to_bytes(32, "big") * 2,
+    )
+
+
+def _make_ecmul_inputs() -> Tuple[bytes, ...]:
+    points = _make_bn128_inputs()
+    return (
+        points["p1"] + (7).to_bytes(32, "big"),
+        points["p1"] + bytes(32),
+        bytes(64) + (7).to_bytes(32, "big"),
+        points["p1"] + b"\xff" * 32,
+    )
+
+
+def _make_ecpairing_inputs() -> Tuple[bytes, ...]:
+    points = _make_bn128_inputs()
+    return (
+        points["p1"] + points["p2"] + points["neg_p1"] + points["p2"],
+        points["p1"] + points["p2"],
+        points["p1"] + points["p2"][:-1] + b"\x00",
+    )
+
+
+def _make_blake2b_inputs() -> Tuple[bytes, ...]:
+    # EIP-152 test vectors 4 and 5
+    state = bytes.fromhex(
+        "48c9bdf267e6096a3ba7ca8485ae67bb2bf894fe72f36e3cf1361d5f3af54fa5"
+        "d182e6ad7f520e511f6c3e2b8c68059b6bbd41fbabd9831f79217e1319cde05b"
+    )
+    message = b"abc" + bytes(125)
+    offsets = (3).to_bytes(8, "little") + bytes(8)
+    return (
+        (0).to_bytes(4, "big") + state + message + offsets + b"\x01",
+        (12).to_bytes(4, "big") + state + message + offsets + b"\x01",
+        (12).to_bytes(4, "big") + state + message + offsets + b"\x02",
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _make_bls12_381_inputs() -> Dict[str, bytes]:
+    from py_ecc.optimized_bls12_381 import (
+        optimized_curve as bls12_381,
+    )
+
+    from eth.precompiles.bls12_381.bls12_381_g1 import (
+        g1_optimized_3d_to_bytes,
+    )
+    from eth.precompiles.bls12_381.bls12_381_g2 import (
+        g2_optimized_3d_to_bytes,
+    )
+
+    p1 = bls12_381.multiply(bls12_381.G1, 3)
+    p2 = bls12_381.multiply(bls12_381.G2, 5)
+    return {
+        "g1": g1_optimized_3d_to_bytes(bls12_381.G1),
+        "p1": g1_optimized_3d_to_bytes(p1),
+        "neg_p1": g1_optimized_3d_to_bytes(bls12_381.neg(p1)),
+        "g2": g2_optimized_3d_to_bytes(bls12_381.G2),
+        "p2": g2_optimized_3d_to_bytes(p2),
+    }
+
+
+def _make_bls12_g1add_inputs() -> Tuple[bytes, ...]:
+    points = _make_bls12_381_inputs()
+    return (
+        points["g1"] + points["p1"],
+        points["p1"] + points["neg_p1"],
+        points["p1"] + b"\xff" * 128,
+    )
+
+
+def _make_bls12_g1msm_inputs() -> Tuple[bytes, ...]:
+    points = _make_bls12_381_inputs()
+    return (
+        points["p1"] + (7).to_bytes(32, "big"),
+        points["g1"] + b"\xff" * 32 + points["p1"] + (7).to_bytes(32, "big"),
+        points["p1"] + (7).to_bytes(31, "big"),
+    )
+
+
+def _make_bls12_g2add_inputs() -> Tuple[bytes, ...]:
+    points = _make_bls12_381_inputs()
+    return (
+        points["g2"] + points["p2"],
+        points["p2"] + b"\xff" * 256,
+    )
+
+
+def _make_bls12_g2msm_inputs() -> Tuple[bytes, ...]:
+    points = _make_bls12_381_inputs()
+    return (
+        points["p2"] + (7).to_bytes(32, "big"),
+        points["g2"] + b"\xff" * 32 + points["p2"] + (7).to_bytes(32, "big"),
+    )
+
+
+def _make_bls12_pairing_check_inputs() -> Tuple[bytes, ...]:
+    points = _make_bls12_381_inputs()
+    return (
+        points["p1"] + points["p2"] + points["neg_p1"] + points["p2"],
+        points["p1"] + points["p2"],
+    )
+
+
+def _make_bls12_map_fp_to_g1_inputs() -> Tuple[bytes, ...]:
+    return (
+        (12345).to_bytes(64, "big"),
+        b"\xff" * 64,
+    )
+
+
+def _make_bls12_map_fp2_to_g2_inputs() -> Tuple[bytes, ...]:
+    return (
+        (12345).to_bytes(64, "big") + (6789).to_bytes(64, "big"),
+        b"\xff" * 128,
+    )
+
+
+_SELF_TEST_INPUT_FACTORIES: Dict[Address, Callable[[], Tuple[bytes, ...]]] = {
+    ECADD_ADDRESS: _make_ecadd_inputs,
+    ECMUL_ADDRESS: _make_ecmul_inputs,
+    ECPAIRING_ADDRESS: _make_ecpairing_inputs,
+    BLAKE2B_ADDRESS: _make_blake2b_inputs,
+    BLS12_G1ADD_ADDRESS: _make_bls12_g1add_inputs,
+    BLS12_G1MSM_ADDRESS: _make_bls12_g1msm_inputs,
+    BLS12_G2ADD_ADDRESS: _make_bls12_g2add_inputs,
+    BLS12_G2MSM_ADDRESS: _make_bls12_g2msm_inputs,
+    BLS12_PAIRING_CHECK_ADDRESS: _make_bls12_pairing_check_inputs,
+    BLS12_MAP_FP_TO_G1_ADDRESS: _make_bls12_map_fp_to_g1_inputs,
+    BLS12_MAP_FP2_TO_G2_ADDRESS: _make_bls12_map_fp2_to_g2_inputs,
+}
@@ -19,10 +19,10 @@ from py_ecc.fields import (
 from py_ecc.optimized_bls12_381.optimized_curve import (
     add as bls12_add_optimized,
     b,
-    curve_order,
-    is_inf,
+    eq,
     is_on_curve,
     multiply as bls12_multiply_optimized,
+    neg,
     normalize,
 )
 from py_ecc.typing import (
@@ -40,10 +40,15 @@ from .constants import (
     BLS12_G1_ADD_GAS,
     BLS12_G1_MSM_GAS,
     BLS12_MAP_FP_G1_GAS,
+    BLS12_X,
+    G1_ENDOMORPHISM_BETA,
     G1_MSM_DISCOUNTS,
     G1_MSM_MAX_DISCOUNT,
     MSM_MULTIPLIER,
 )
+from .msm import (
+    multi_scalar_multiply,
+)
 
 MSM_LEN_PER_PAIR = 160
 
@@ -75,6 +80,18 @@ def bytes_to_g1_optimized_point3D(
     return point
 
 
+def is_in_g1_subgroup(point: Optimized_Point3D[OPTIMIZED_FQ]) -> bool:
+    """
+    Check that a point of the curve is in G1, with the endomorphism
+    ``phi(x, y) = (beta * x, y)``: ``phi(P) == -[z^2]P`` only holds in G1
+    (https://eprint.iacr.org/2019/814), and takes a multiplication by a scalar of
+    128 bits instead of one by ``curve_order``.
+    """
+    x, y, z = point
+    endomorphism = (x * G1_ENDOMORPHISM_BETA, y, z)
+    return eq(endomorphism, neg(bls12_multiply_optimized(point, BLS12_X**2)))
+
+
 def g1_optimized_3d_to_bytes(
     g1_optimized_3d: Optimized_Point3D[OPTIMIZED_FQ],
 ) -> bytes:
@@ -89,7 +106,7 @@ def decode_g1_scalar_pair(data: bytes) -> Tuple[Optimized_Point3D[OPTIMIZED_FQ],
 
     point = bytes_to_g1_optimized_point3D(data[:128])
 
-    if not is_inf(bls12_multiply_optimized(point, curve_order)):
+    if not is_in_g1_subgroup(point):
         raise VMError("Point failed sub-group check.")
 
     n = int.from_bytes(data[128 : 128 + 32], "big")
@@ -128,18 +145,11 @@ def bls12_g1_msm(computation: ComputationAPI) -> None:
     gas_cost = k * BLS12_G1_MSM_GAS * discount // MSM_MULTIPLIER
     computation.consume_gas(gas_cost, reason="BLS12_G1MSM gas")
 
-    result = None
-    for i in range(k):
-        start_index = i * MSM_LEN_PER_PAIR
-        end_index = start_index + MSM_LEN_PER_PAIR
-
-        point, n = decode_g1_scalar_pair(data[start_index:end_index])
-        product = bls12_multiply_optimized(point, n)
-
-        if i == 0:
-            result = product
-        else:
-            result = bls12_add_optimized(result, product)
+    pairs = tuple(
+        decode_g1_scalar_pair(data[start_index : start_index + MSM_LEN_PER_PAIR])
+        for start_index in range(0, len(data), MSM_LEN_PER_PAIR)
+    )
+    result = multi_scalar_multiply(pairs)
 
     computation.output = g1_optimized_3d_to_bytes(result)
 
@@ -18,10 +18,10 @@ from py_ecc.optimized_bls12_381.optimized_curve import (
     FQ2 as OPTIMIZED_FQ2,
     add as bls12_add_optimized,
     b2,
-    curve_order,
-    is_inf,
+    eq,
     is_on_curve,
     multiply as bls12_multiply_optimized,
+    neg,
     normalize,
 )
 from py_ecc.typing import (
@@ -39,13 +39,22 @@ from .constants import (
     BLS12_G2_ADD_GAS,
     BLS12_G2_MSM_GAS,
     BLS12_MAP_FP2_G2_GAS,
+    BLS12_X,
     G2_MSM_DISCOUNTS,
     G2_MSM_MAX_DISCOUNT,
     MSM_MULTIPLIER,
 )
+from .msm import (
+    multi_scalar_multiply,
+)
 
 MSM_LEN_PER_PAIR = 288
 
+# Coefficients of the endomorphism psi, which untwists a point of the twist, applies
+# the Frobenius map to it, and twists it back
+PSI_X_COEFF = (OPTIMIZED_FQ2((1, 1)) ** ((OPTIMIZED_FQ.field_modulus - 1) // 3)).inv()
+PSI_Y_COEFF = (OPTIMIZED_FQ2((1, 1)) ** ((OPTIMIZED_FQ.field_modulus - 1) // 2)).inv()
+
 # -- utils -- #
 
 
@@ -91,6 +100,31 @@ def bytes_to_g2_optimized_point3D(
     return point
 
 
+def _conjugate(fq2: OPTIMIZED_FQ2) -> OPTIMIZED_FQ2:
+    coord0, coord1 = fq2.coeffs
+    return OPTIMIZED_FQ2((coord0, -coord1))
+
+
+def psi(
+    point: Optimized_Point3D[OPTIMIZED_FQ2],
+) -> Optimized_Point3D[OPTIMIZED_FQ2]:
+    x, y, z = point
+    return (
+        _conjugate(x) * PSI_X_COEFF,
+        _conjugate(y) * PSI_Y_COEFF,
+        _conjugate(z),
+    )
+
+
+def is_in_g2_subgroup(point: Optimized_Point3D[OPTIMIZED_FQ2]) -> bool:
+    """
+    Check that a point of the twist is in G2: ``psi(P) == [z]P`` only holds in G2
+    (https://eprint.iacr.org/2021/1130), and takes a multiplication by a scalar of
+    64 bits instead of one by ``curve_order``.
+    """
+    return eq(psi(point), neg(bls12_multiply_optimized(point, BLS12_X)))
+
+
 def g2_optimized_3d_to_bytes(
     g2_optimized_3d: Optimized_Point3D[OPTIMIZED_FQ2],
 ) -> bytes:
@@ -105,7 +139,7 @@ def decode_G2_scalar_pair(data: bytes) -> Tuple[Optimized_Point3D[OPTIMIZED_FQ2]
 
     point = bytes_to_g2_optimized_point3D(data[:256])
 
-    if not is_inf(bls12_multiply_optimized(point, curve_order)):
+    if not is_in_g2_subgroup(point):
         raise VMError("Point failed sub-group check.")
 
     n = int.from_bytes(data[256 : 256 + 32], "big")
@@ -146,18 +180,11 @@ def bls12_g2_msm(computation: ComputationAPI) -> None:
     gas_cost = k * BLS12_G2_MSM_GAS * discount // MSM_MULTIPLIER
     computation.consume_gas(gas_cost, "BLS12_G2MSM gas")
 
-    result = None
-    for i in range(k):
-        start_index = i * MSM_LEN_PER_PAIR
-        end_index = start_index + MSM_LEN_PER_PAIR
-
-        p, m = decode_G2_scalar_pair(data[start_index:end_index])
-        product = bls12_multiply_optimized(p, m)
-
-        if i == 0:
-            result = product
-        else:
-            result = bls12_add_optimized(result, product)
+    pairs = tuple(
+        decode_G2_scalar_pair(data[start_index : start_index + MSM_LEN_PER_PAIR])
+        for start_index in range(0, len(data), MSM_LEN_PER_PAIR)
+    )
+    result = multi_scalar_multiply(pairs)
 
     computation.output = g2_optimized_3d_to_bytes(result)
 
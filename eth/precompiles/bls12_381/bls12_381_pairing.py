@@ -5,13 +5,11 @@ coordinates.
 """
 
 from py_ecc.optimized_bls12_381 import (
+    final_exponentiate,
     pairing,
 )
 from py_ecc.optimized_bls12_381.optimized_curve import (
     FQ12,
-    curve_order,
-    is_inf,
-    multiply as bls12_multiply_optimized,
 )
 
 from eth.abc import (
@@ -22,9 +20,11 @@ from eth.exceptions import (
 )
 from eth.precompiles.bls12_381.bls12_381_g1 import (
     bytes_to_g1_optimized_point3D,
+    is_in_g1_subgroup,
 )
 from eth.precompiles.bls12_381.bls12_381_g2 import (
     bytes_to_g2_optimized_point3D,
+    is_in_g2_subgroup,
 )
 
 
@@ -45,15 +45,18 @@ def bls12_pairing_check(computation: ComputationAPI) -> None:
         g2_start = 384 * i + 128
 
         g1_point = bytes_to_g1_optimized_point3D(data[g1_start : g1_start + 128])
-        if not is_inf(bls12_multiply_optimized(g1_point, curve_order)):
+        if not is_in_g1_subgroup(g1_point):
             raise VMError("Sub-group check failed for G1 point.")
 
         g2_point = bytes_to_g2_optimized_point3D(data[g2_start : g2_start + 256])
-        if not is_inf(bls12_multiply_optimized(g2_point, curve_order)):
+        if not is_in_g2_subgroup(g2_point):
             raise VMError("Sub-group check failed for G2 point.")
 
-        result *= pairing(g2_point, g1_point)
+        # The product of the Miller loops only needs one final exponentiation
+        result *= pairing(g2_point, g1_point, final_exponentiate=False)
 
     computation.output = (
-        b"\x00" * 31 + b"\x01" if result == FQ12.one() else b"\x00" * 32
+        b"\x00" * 31 + b"\x01"
+        if final_exponentiate(result) == FQ12.one()
+        else b"\x00" * 32
     )
@@ -9,6 +9,12 @@ BLS12_MAP_FP2_G2_GAS = 23800
 
 MSM_MULTIPLIER = 1_000
 
+# Absolute value of the parameter z of BLS12-381, which is negative
+BLS12_X = 0xD201000000010000
+
+# Cube root of unity of the base field, for the G1 endomorphism (x, y) -> (beta * x, y)
+G1_ENDOMORPHISM_BETA = 0x5F19672FDF76CE51BA69C6076A0F77EADDB3A93BE6F89688DE17D813620A00022E01FFFFFFFEFFFE  # noqa: E501
+
 G1_MSM_MAX_DISCOUNT = 519
 G1_MSM_DISCOUNTS = [  # 1-indexed list, should use (k - 1) for index
     1000,
@@ -0,0 +1,100 @@
+"""
+Multi-scalar multiplication with the bucket method of Pippenger, over the optimized
+(x, y, z) points of ``py_ecc``, for both G1 and G2.
+"""
+
+import functools
+from typing import (
+    Sequence,
+    Tuple,
+)
+
+from py_ecc.optimized_bls12_381.optimized_curve import (
+    add as bls12_add_optimized,
+    curve_order,
+    double as bls12_double_optimized,
+    multiply as bls12_multiply_optimized,
+)
+from py_ecc.typing import (
+    Optimized_Field,
+    Optimized_Point3D,
+)
+
+# Points are in the subgroup of order ``curve_order``, so scalars are reduced modulo
+# the curve order, and never have more bits than it
+SCALAR_BITS = curve_order.bit_length()
+
+MAX_WINDOW_SIZE = 16
+
+
+def _count_msm_operations(k: int, window_size: int) -> int:
+    # Each window adds every point to a bucket, sums the buckets with two additions
+    # per bucket, and is shifted into place with as many doublings as its size
+    num_windows = -(-SCALAR_BITS // window_size)
+    return num_windows * (k + 2 ** (window_size + 1) + window_size)
+
+
+@functools.lru_cache(maxsize=None)
+def get_window_size(k: int) -> int:
+    """
+    Return the size, in bits, of the windows that minimize the point operations of a
+    multi-scalar multiplication of ``k`` pairs.
+    """
+    return min(
+        range(1, MAX_WINDOW_SIZE + 1),
+        key=lambda window_size: _count_msm_operations(k, window_size),
+    )
+
+
+def naive_multi_scalar_multiply(
+    pairs: Sequence[Tuple[Optimized_Point3D[Optimized_Field], int]],
+) -> Optimized_Point3D[Optimized_Field]:
+    """
+    Multiply each point by its scalar, and add up the products.
+    """
+    return functools.reduce(
+        bls12_add_optimized,
+        (bls12_multiply_optimized(point, scalar) for point, scalar in pairs),
+    )
+
+
+def multi_scalar_multiply(
+    pairs: Sequence[Tuple[Optimized_Point3D[Optimized_Field], int]],
+) -> Optimized_Point3D[Optimized_Field]:
+    """
+    Return the sum of the points of ``pairs`` multiplied by their scalars, with the
+    bucket method of Pippenger. All points must be in the subgroup of order
+    ``curve_order``.
+    """
+    if len(pairs) == 1:
+        point, scalar = pairs[0]
+        return bls12_multiply_optimized(point, scalar % curve_order)
+
+    first_point = pairs[0][0]
+    infinity = (first_point[0].one(), first_point[0].one(), first_point[0].zero())
+
+    window_size = get_window_size(len(pairs))
+    num_buckets = 2**window_size - 1
+    reduced_pairs = [(point, scalar % curve_order) for point, scalar in pairs]
+
+    result = infinity
+    for window_start in reversed(range(0, SCALAR_BITS, window_size)):
+        for _ in range(window_size):
+            result = bls12_double_optimized(result)
+
+        # buckets[digit - 1] holds the sum of the points with that digit in the window
+        buckets = [infinity] * num_buckets
+        for point, scalar in reduced_pairs:
+            digit = (scalar >> window_start) & num_buckets
+            if digit:
+                buckets[digit - 1] = bls12_add_optimized(buckets[digit - 1], point)
+
+        # sum of digit * buckets[digit - 1], as a sum of running sums
+        running_sum = window_sum = infinity
+        for bucket in reversed(buckets):
+            running_sum = bls12_add_optimized(running_sum, bucket)
+            window_sum = bls12_add_optimized(window_sum, running_sum)
+
+        result = bls12_add_optimized(result, window_sum)
+
+    return result
@@ -19,6 +19,7 @@ from eth import (
 )
 from eth._utils.bn128 import (
     FQP_point_to_FQ2_point,
+    is_in_g2_subgroup,
     validate_point,
 )
 from eth._utils.padding import (
@@ -98,8 +99,8 @@ def _process_point(data_buffer: bytes, exponent: int) -> bn128.FQP:
         if not bn128.is_on_curve(p2, bn128.b2):
             raise ValidationError("point is not on curve")
 
-    if bn128.multiply(p2, bn128.curve_order)[-1] != bn128.FQ2.zero():
-        raise ValidationError("TODO: what case is this?????")
+    if not is_in_g2_subgroup(p2):
+        raise ValidationError("point is not in the G2 subgroup")
 
     return exponent * bn128.pairing(
         FQP_point_to_FQ2_point(p2), p1, final_exponentiate=False
@@ -1,9 +1,9 @@
-from eth_keys import (
-    keys,
-)
 from eth_keys.exceptions import (
     BadSignature,
 )
+from eth_typing import (
+    Hash32,
+)
 from eth_utils import (
     ValidationError,
     big_endian_to_int,
@@ -16,9 +16,15 @@ from eth._utils.padding import (
     pad32,
     pad32r,
 )
+from eth._utils.signatures import (
+    recover_signer_from_msg_hash,
+)
 from eth.abc import (
     ComputationAPI,
 )
+from eth.typing import (
+    VRS,
+)
 from eth.validation import (
     validate_gte,
     validate_lt_secpk1n,
@@ -52,12 +58,12 @@ def ecrecover(computation: ComputationAPI) -> ComputationAPI:
     canonical_v = v - 27
 
     try:
-        signature = keys.Signature(vrs=(canonical_v, r, s))
-        public_key = signature.recover_public_key_from_msg_hash(message_hash)
+        address = recover_signer_from_msg_hash(
+            VRS((canonical_v, r, s)), Hash32(message_hash)
+        )
     except BadSignature:
         return computation
 
-    address = public_key.to_canonical_address()
     padded_address = pad32(address)
 
     computation.output = padded_address
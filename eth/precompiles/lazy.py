@@ -0,0 +1,39 @@
+from typing import (
+    Any,
+    Callable,
+    Optional,
+)
+
+from eth.abc import (
+    ComputationAPI,
+)
+
+
+class LazyPrecompile:
+    """
+    A precompile of :mod:`eth.precompiles`, called with ``kwargs`` if it is curried,
+    which is only imported when it first runs. Forks refer to the precompiles that
+    need ``py_ecc`` or ``ckzg`` this way, so that importing a fork doesn't import it.
+    """
+
+    def __init__(self, name: str, **kwargs: Any) -> None:
+        self.name = name
+        self.kwargs = kwargs
+        self._precompile: Optional[Callable[[ComputationAPI], ComputationAPI]] = None
+
+    def resolve(self) -> Callable[[ComputationAPI], ComputationAPI]:
+        if self._precompile is None:
+            from eth import (
+                precompiles,
+            )
+
+            precompile = getattr(precompiles, self.name)
+            self._precompile = precompile(**self.kwargs) if self.kwargs else precompile
+        return self._precompile
+
+    def __call__(self, computation: ComputationAPI) -> ComputationAPI:
+        return self.resolve()(computation)
+
+    def __repr__(self) -> str:
+        arguments = "".join(f", {key}={value!r}" for key, value in self.kwargs.items())
+        return f"{type(self).__name__}({self.name!r}{arguments})"
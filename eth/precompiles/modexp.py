@@ -3,10 +3,6 @@ from typing import (
     Tuple,
 )
 
-from eth_utils import (
-    big_endian_to_int,
-    int_to_big_endian,
-)
 from eth_utils.toolz import (
     curry,
 )
@@ -17,28 +13,54 @@ from eth import (
 from eth._utils.numeric import (
     get_highest_bit_index,
 )
-from eth._utils.padding import (
-    pad32r,
-    zpad_left,
-    zpad_right,
-)
 from eth.abc import (
     ComputationAPI,
 )
+from eth.typing import (
+    BytesOrView,
+)
+
+try:
+    from gmpy2 import (
+        powmod,
+    )
+except ImportError:
+    powmod = pow
+
+
+def read_padded_int(data: BytesOrView, start: int, length: int) -> int:
+    """
+    Read ``length`` bytes of ``data`` from ``start`` as a big-endian integer, as if
+    ``data`` was padded with zeros on the right.
+    """
+    chunk = data[start : start + length]
+    return int.from_bytes(chunk, "big") << (8 * (length - len(chunk)))
+
+
+def extract_lengths(data: BytesOrView) -> Tuple[int, int, int]:
+    # extract argument lengths
+    base_length = read_padded_int(data, 0, 32)
+    exponent_length = read_padded_int(data, 32, 32)
+    modulus_length = read_padded_int(data, 64, 32)
+
+    return base_length, exponent_length, modulus_length
 
 
-def _compute_adjusted_exponent_length(
-    exponent_length: int, first_32_exponent_bytes: bytes
+def extract_exponent_head(
+    data: BytesOrView, base_length: int, exponent_length: int
 ) -> int:
-    exponent = big_endian_to_int(first_32_exponent_bytes)
+    """
+    Return the integer of the first 32 bytes of the exponent, or of all of it if it
+    is shorter, as used to price the exponentiation.
+    """
+    return read_padded_int(data, 96 + base_length, min(exponent_length, 32))
 
-    if exponent_length <= 32 and exponent == 0:
-        return 0
-    elif exponent_length <= 32:
-        return get_highest_bit_index(exponent)
+
+def _compute_adjusted_exponent_length(exponent_length: int, exponent_head: int) -> int:
+    if exponent_length <= 32:
+        return get_highest_bit_index(exponent_head)
     else:
-        first_32_bytes_as_int = big_endian_to_int(first_32_exponent_bytes)
-        return 8 * (exponent_length - 32) + get_highest_bit_index(first_32_bytes_as_int)
+        return 8 * (exponent_length - 32) + get_highest_bit_index(exponent_head)
 
 
 def _compute_complexity(length: int) -> int:
@@ -50,30 +72,12 @@ def _compute_complexity(length: int) -> int:
         return length**2 // 16 + 480 * length - 199680
 
 
-def extract_lengths(data: bytes) -> Tuple[int, int, int]:
-    # extract argument lengths
-    base_length_bytes = pad32r(data[:32])
-    base_length = big_endian_to_int(base_length_bytes)
-
-    exponent_length_bytes = pad32r(data[32:64])
-    exponent_length = big_endian_to_int(exponent_length_bytes)
-
-    modulus_length_bytes = pad32r(data[64:96])
-    modulus_length = big_endian_to_int(modulus_length_bytes)
-
-    return base_length, exponent_length, modulus_length
-
-
-def _compute_modexp_gas_fee_eip_198(data: bytes) -> int:
+def _compute_modexp_gas_fee_eip_198(data: BytesOrView) -> int:
     base_length, exponent_length, modulus_length = extract_lengths(data)
 
-    first_32_exponent_bytes = zpad_right(
-        data[96 + base_length : 96 + base_length + exponent_length],
-        to_size=min(exponent_length, 32),
-    )[:32]
     adjusted_exponent_length = _compute_adjusted_exponent_length(
         exponent_length,
-        first_32_exponent_bytes,
+        extract_exponent_head(data, base_length, exponent_length),
     )
     complexity = _compute_complexity(max(modulus_length, base_length))
 
@@ -85,7 +89,7 @@ def _compute_modexp_gas_fee_eip_198(data: bytes) -> int:
     return gas_fee
 
 
-def _modexp(data: bytes) -> int:
+def _modexp(data: BytesOrView) -> int:
     base_length, exponent_length, modulus_length = extract_lengths(data)
 
     if base_length == 0:
@@ -93,43 +97,32 @@ def _modexp(data: bytes) -> int:
     elif modulus_length == 0:
         return 0
 
-    # compute start:end indexes
-    base_end_idx = 96 + base_length
-    exponent_end_idx = base_end_idx + exponent_length
-    modulus_end_dx = exponent_end_idx + modulus_length
+    # compute start indexes
+    base_start_idx = 96
+    exponent_start_idx = base_start_idx + base_length
+    modulus_start_idx = exponent_start_idx + exponent_length
 
     # extract arguments
-    modulus_bytes = zpad_right(
-        data[exponent_end_idx:modulus_end_dx],
-        to_size=modulus_length,
-    )
-    modulus = big_endian_to_int(modulus_bytes)
+    modulus = read_padded_int(data, modulus_start_idx, modulus_length)
     if modulus == 0:
         return 0
 
-    base_bytes = zpad_right(data[96:base_end_idx], to_size=base_length)
-    base = big_endian_to_int(base_bytes)
-
-    exponent_bytes = zpad_right(
-        data[base_end_idx:exponent_end_idx],
-        to_size=exponent_length,
-    )
-    exponent = big_endian_to_int(exponent_bytes)
+    base = read_padded_int(data, base_start_idx, base_length)
+    exponent = read_padded_int(data, exponent_start_idx, exponent_length)
 
-    result = pow(base, exponent, modulus)
-
-    return result
+    return int(powmod(base, exponent, modulus))
 
 
 @curry
 def modexp(
     computation: ComputationAPI,
-    gas_calculator: Callable[[bytes], int] = _compute_modexp_gas_fee_eip_198,
+    gas_calculator: Callable[[BytesOrView], int] = _compute_modexp_gas_fee_eip_198,
 ) -> ComputationAPI:
     """
     https://github.com/ethereum/EIPs/pull/198
     """
-    data = computation.msg.data_as_bytes
+    # read the arguments from the message data without copying it
+    data = computation.msg.data
 
     gas_fee = gas_calculator(data)
     computation.consume_gas(gas_fee, reason="MODEXP Precompile")
@@ -140,11 +133,5 @@ def modexp(
 
     # Modulo 0 is undefined, return zero
     # https://math.stackexchange.com/questions/516251/why-is-n-mod-0-undefined
-    result_bytes = (
-        b""
-        if modulus_length == 0
-        else zpad_left(int_to_big_endian(result), to_size=modulus_length)
-    )
-
-    computation.output = result_bytes
+    computation.output = result.to_bytes(modulus_length, "big")
     return computation
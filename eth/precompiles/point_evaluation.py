@@ -1,6 +1,10 @@
 import hashlib
 import os
+import threading
 from typing import (
+    Any,
+    Iterable,
+    Tuple,
     cast,
 )
 
@@ -31,23 +35,52 @@ TRUSTED_SETUP_PATH = os.path.join(
 )
 
 
+# The trusted setup takes seconds to load, so it is loaded once per process
+_trusted_setup: Any = None
+_trusted_setup_precompute = 0
+_trusted_setup_lock = threading.Lock()
+
+
+def get_trusted_setup() -> Any:
+    """
+    Return the KZG trusted setup, which is loaded on first use and shared by all
+    calls and threads of the process.
+    """
+    global _trusted_setup
+
+    if _trusted_setup is None:
+        with _trusted_setup_lock:
+            if _trusted_setup is None:
+                _trusted_setup = load_trusted_setup(
+                    TRUSTED_SETUP_PATH, _trusted_setup_precompute
+                )
+    return _trusted_setup
+
+
+def set_trusted_setup_precompute(precompute: int) -> None:
+    """
+    Set the precomputation level that the trusted setup is loaded with, from 0 to
+    15. Higher levels use more memory to speed up computing KZG proofs of cells.
+    The trusted setup is reloaded on its next use.
+    """
+    global _trusted_setup, _trusted_setup_precompute
+
+    with _trusted_setup_lock:
+        _trusted_setup_precompute = precompute
+        _trusted_setup = None
+
+
 def kzg_to_versioned_hash(commitment: bytes) -> Hash32:
     return cast(
         Hash32, VERSIONED_HASH_VERSION_KZG + hashlib.sha256(commitment).digest()[1:]
     )
 
 
-def point_evaluation_precompile(computation: ComputationAPI) -> ComputationAPI:
+def verify_point_evaluation(input_: bytes) -> None:
     """
-    Verify p(z) = y given commitment that corresponds to the polynomial p(x) and a KZG
-    proof. Also verify that the provided commitment matches the provided versioned_hash.
+    Verify the input of the point evaluation precompile, and raise a ``VMError`` if
+    it is invalid.
     """
-    computation.consume_gas(
-        POINT_EVALUATION_PRECOMPILE_GAS, reason="Point Evaluation Precompile"
-    )
-
-    input_ = computation.msg.data_as_bytes
-
     # The data is encoded as follows: versioned_hash | z | y | commitment | proof
     # with z and y being padded 32 byte big endian values
     try:
@@ -69,14 +102,40 @@ def point_evaluation_precompile(computation: ComputationAPI) -> ComputationAPI:
 
     # Verify KZG proof with z and y in big endian format
     try:
-        assert verify_kzg_proof(
-            commitment, z, y, proof, load_trusted_setup(TRUSTED_SETUP_PATH, 0)
-        )
+        assert verify_kzg_proof(commitment, z, y, proof, get_trusted_setup())
     except (AssertionError, RuntimeError):
         # RuntimeError is raised when the KZG proof verification fails within the C code
         # from the method itself
         raise VMError("Point evaluation KZG proof verification failed.")
 
+
+def verify_point_evaluations(inputs: Iterable[bytes]) -> Tuple[bool, ...]:
+    """
+    Verify the inputs of many point evaluations, such as those of the transactions
+    of a block, and return whether each of them is valid.
+    """
+    results = []
+    for input_ in inputs:
+        try:
+            verify_point_evaluation(input_)
+        except VMError:
+            results.append(False)
+        else:
+            results.append(True)
+    return tuple(results)
+
+
+def point_evaluation_precompile(computation: ComputationAPI) -> ComputationAPI:
+    """
+    Verify p(z) = y given commitment that corresponds to the polynomial p(x) and a KZG
+    proof. Also verify that the provided commitment matches the provided versioned_hash.
+    """
+    computation.consume_gas(
+        POINT_EVALUATION_PRECOMPILE_GAS, reason="Point Evaluation Precompile"
+    )
+
+    verify_point_evaluation(computation.msg.data_as_bytes)
+
     # Return FIELD_ELEMENTS_PER_BLOB and BLS_MODULUS as padded 32 byte big endian values
     computation.output = FIELD_ELEMENTS_PER_BLOB.to_bytes(
         32, "big"
@@ -0,0 +1,168 @@
+"""
+Cache of the results of precompiles, which are pure functions of their input, for
+workloads that call them with the same inputs again and again, like simulations of
+the same transactions. Computation classes opt in with
+:meth:`~eth.vm.computation.BaseComputation.configure_precompile_result_cache`.
+"""
+from typing import (
+    Any,
+    Callable,
+    NamedTuple,
+    Tuple,
+)
+
+from eth_typing import (
+    Address,
+    Hash32,
+)
+from eth_utils import (
+    encode_hex,
+    keccak,
+)
+
+from eth._utils.address import (
+    force_bytes_to_address,
+)
+from eth.abc import (
+    ComputationAPI,
+)
+from eth.db.cache import (
+    BoundedLRU,
+    CacheStats,
+)
+
+PRECOMPILE_RESULT_CACHE_BYTES = 16 * 1024 * 1024
+
+# The precompiles whose results are cached by default: those that are expensive
+# compared to hashing their input
+CACHED_PRECOMPILE_ADDRESSES = tuple(
+    force_bytes_to_address(address)
+    for address in (
+        b"\x02",  # sha256
+        b"\x03",  # ripemd160
+        b"\x05",  # modexp
+        b"\x06",  # ecadd
+        b"\x07",  # ecmul
+        b"\x08",  # ecpairing
+    )
+)
+
+# Approximate size of a cached result besides its output: the key of an address and
+# a hash, and the tuple holding the result
+_RESULT_OVERHEAD = 20 + 32 + 100
+
+Precompile = Callable[[ComputationAPI], Any]
+ResultKey = Tuple[Address, Hash32]
+
+
+class PrecompileResult(NamedTuple):
+    precompile: Precompile
+    gas_used: int
+    output: bytes
+
+
+def _result_size(key: ResultKey, result: PrecompileResult) -> int:
+    return _RESULT_OVERHEAD + len(result.output)
+
+
+class PrecompileResultCache:
+    """
+    LRU of the gas used by and the output of successful precompile calls, by address
+    and hash of the input, bounded by the total size of the cached outputs.
+    """
+
+    def __init__(self, max_bytes: int = PRECOMPILE_RESULT_CACHE_BYTES) -> None:
+        self._results = BoundedLRU(
+            max_bytes=max_bytes,
+            on_evict=self._count_eviction,
+            entry_size=_result_size,
+        )
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: ResultKey, precompile: Precompile) -> PrecompileResult:
+        """
+        Return the cached result of ``precompile`` for ``key``, or raise a
+        ``KeyError`` if there is none.
+        """
+        try:
+            result = self._results[key]
+        except KeyError:
+            self._misses += 1
+            raise
+        if result.precompile is not precompile:
+            # Another fork's precompile at the same address, that may charge
+            # different gas
+            self._misses += 1
+            raise KeyError(key)
+        self._hits += 1
+        return result
+
+    def set(self, key: ResultKey, result: PrecompileResult) -> None:
+        self._results[key] = result
+
+    def _count_eviction(self, key: ResultKey, result: PrecompileResult) -> None:
+        self._evictions += 1
+
+    def clear(self) -> None:
+        self._results.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            rejections=0,
+            entries=len(self._results),
+            size_in_bytes=self._results.size_in_bytes,
+        )
+
+    def reset_stats(self) -> None:
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+
+class CachedPrecompile:
+    """
+    Run the precompile at ``address``, unless the result of a call with the same
+    input is cached. Cached results consume the same gas as the call did, and fail
+    the same way if there isn't enough gas. Failed calls are not cached.
+    """
+
+    def __init__(
+        self, address: Address, precompile: Precompile, cache: PrecompileResultCache
+    ) -> None:
+        self.address = address
+        self.precompile = precompile
+        self.cache = cache
+
+    def __call__(self, computation: ComputationAPI) -> ComputationAPI:
+        key = (self.address, Hash32(keccak(computation.msg.data_as_bytes)))
+        try:
+            result = self.cache.get(key, self.precompile)
+        except KeyError:
+            pass
+        else:
+            computation.consume_gas(
+                result.gas_used, reason=f"Cached result of {self!r}"
+            )
+            computation.output = result.output
+            return computation
+
+        gas_remaining = computation.get_gas_remaining()
+        self.precompile(computation)
+        self.cache.set(
+            key,
+            PrecompileResult(
+                self.precompile,
+                gas_remaining - computation.get_gas_remaining(),
+                computation.output,
+            ),
+        )
+        return computation
+
+    def __repr__(self) -> str:
+        return f"CachedPrecompile({encode_hex(self.address)}, {self.precompile!r})"
@@ -8,6 +8,7 @@ from .builders import (
     disable_dao_fork,
     disable_pow_check,
     enable_pow_mining,
+    enable_speculative_execution,
     fork_at,
     genesis,
     import_block,
@@ -15,6 +16,7 @@ from .builders import (
     mine_block,
     mine_blocks,
     name,
+    trust_inputs,
 )
 from .builders import (
     byzantium_at,
@@ -105,6 +107,12 @@ class API:
     enable_pow_mining = staticmethod(enable_pow_mining)
     disable_pow_check = staticmethod(disable_pow_check)
 
+    # Input validation config
+    trust_inputs = staticmethod(trust_inputs)
+
+    # Transaction execution config
+    enable_speculative_execution = staticmethod(enable_speculative_execution)
+
     #
     # Chain Instance Initialization
     #
@@ -1,4 +1,9 @@
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+)
 import functools
+import pickle
 import time
 from typing import (
     Any,
@@ -71,6 +76,9 @@ from eth.typing import (
 from eth.validation import (
     validate_vm_configuration,
 )
+from eth.vm.computation import (
+    BaseComputation,
+)
 from eth.vm.forks import (
     ArrowGlacierVM,
     BerlinVM,
@@ -90,6 +98,9 @@ from eth.vm.forks import (
     SpuriousDragonVM,
     TangerineWhistleVM,
 )
+from eth.vm.speculative import (
+    SpeculativeExecutionMixin,
+)
 
 
 def build(obj: Any, *applicators: Callable[..., Any]) -> Any:
@@ -348,6 +359,108 @@ def disable_pow_check(chain_class: Type[ChainAPI]) -> Type[ChainAPI]:
     return chain_class.configure(vm_configuration=no_pow_vms)
 
 
+def _without_input_validation(cls: Type[Any]) -> Type[Any]:
+    namespace: Dict[str, Any] = {"validate_inputs": False}
+    if "__slots__" in vars(cls):
+        # keep instances of slotted classes, like Memory, free of a __dict__
+        namespace["__slots__"] = ()
+    return type(cls.__name__, (cls,), namespace)
+
+
+@to_tuple
+def _mix_in_trusted_inputs(vm_configuration: VMConfiguration) -> Iterable[VMFork]:
+    for fork_block, vm_class in vm_configuration:
+        state_class = vm_class.get_state_class()
+        # only concrete computations are configurable and carry a memory class
+        computation_class = cast(Type[BaseComputation], state_class.computation_class)
+        trusted_computation_class = computation_class.configure(
+            validate_inputs=False,
+            _memory_class=_without_input_validation(computation_class._memory_class),
+        )
+        state_overrides: Dict[str, Any] = {
+            "account_db_class": _without_input_validation(
+                state_class.get_account_db_class()
+            ),
+            "computation_class": trusted_computation_class,
+        }
+        transient_storage_class = getattr(state_class, "_transient_storage_class", None)
+        if transient_storage_class is not None:
+            state_overrides["_transient_storage_class"] = _without_input_validation(
+                transient_storage_class
+            )
+
+        trusted_state_class = state_class.configure(**state_overrides)
+        yield fork_block, vm_class.configure(_state_class=trusted_state_class)
+
+
+@curry
+def trust_inputs(chain_class: Type[ChainAPI]) -> Type[ChainAPI]:
+    """
+    Skip re-validating addresses, storage slots and values, log entries and
+    memory offsets as they are passed between the VM's internal layers, for each
+    of the chain's vms. Transactions and blocks are still validated as usual.
+
+    .. note::
+
+        This is only safe for replaying blocks that are already known to be
+        valid, like when syncing a trusted chain or re-executing history.
+    """
+    if not chain_class.vm_configuration:
+        raise ValidationError("Chain class has no vm_configuration")
+
+    vm_configuration = _mix_in_trusted_inputs(chain_class.vm_configuration)
+    return chain_class.configure(vm_configuration=vm_configuration)
+
+
+@to_tuple
+def _mix_in_speculative_execution(
+    executor: Executor, vm_configuration: VMConfiguration
+) -> Iterable[VMFork]:
+    for fork_block, vm_class in vm_configuration:
+        state_class = vm_class.get_state_class()
+        if isinstance(executor, ProcessPoolExecutor):
+            try:
+                is_importable = pickle.loads(pickle.dumps(state_class)) is state_class
+            except pickle.PicklingError:
+                is_importable = False
+            if not is_importable:
+                raise ValidationError(
+                    f"State class {state_class!r} of {vm_class.__name__} must be "
+                    "importable, to speculate in worker processes"
+                )
+
+        vm_class_with_speculation = type(
+            vm_class.__name__,
+            (SpeculativeExecutionMixin, vm_class),
+            {"speculation_executor": executor},
+        )
+        yield fork_block, vm_class_with_speculation
+
+
+@curry
+def enable_speculative_execution(
+    executor: Executor, chain_class: Type[ChainAPI]
+) -> Type[ChainAPI]:
+    """
+    Speculatively execute all of the transactions of a block in ``executor``, and
+    reuse the results that don't conflict with earlier transactions of the block,
+    for each of the chain's vms. The resulting state and receipts are the same as
+    with in-order execution.
+
+    Pass a :class:`~concurrent.futures.ProcessPoolExecutor` to run transactions in
+    parallel. Its workers import each vm's state class by name, so this can't be
+    combined with builders that create state classes at runtime, like
+    :func:`trust_inputs`.
+    """
+    if not chain_class.vm_configuration:
+        raise ValidationError("Chain class has no vm_configuration")
+
+    vm_configuration = _mix_in_speculative_execution(
+        executor, chain_class.vm_configuration
+    )
+    return chain_class.configure(vm_configuration=vm_configuration)
+
+
 #
 # Initializers (initialization of chain state and chain class instantiation)
 #
@@ -1,3 +1,6 @@
+from concurrent.futures import (
+    Executor,
+)
 import contextlib
 import itertools
 import logging
@@ -39,6 +42,9 @@ from eth._utils.db import (
     get_block_header_by_hash,
     get_parent_header,
 )
+from eth._utils.transactions import (
+    recover_senders,
+)
 from eth.abc import (
     AtomicDatabaseAPI,
     BlockAndMetaWitness,
@@ -67,6 +73,9 @@ from eth.constants import (
     MAX_PREV_HEADER_DEPTH,
     MAX_UNCLES,
 )
+from eth.db.prefetch import (
+    StatePrefetcher,
+)
 from eth.db.trie import (
     make_trie_root_and_nodes,
 )
@@ -104,6 +113,14 @@ class VM(Configurable, VirtualMachineAPI):
     chaindb: ChainDatabaseAPI = None
     _state_class: Type[StateAPI] = None
 
+    # Recover the senders of imported blocks' transactions in this executor's
+    # workers, before executing them. If unset, recover them in-process.
+    sender_recovery_executor: ClassVar[Executor] = None
+
+    # Load the state that imported blocks will likely access ahead of executing
+    # them. If unset, state is only loaded when it is accessed.
+    state_prefetcher: ClassVar[StatePrefetcher] = None
+
     _state = None
     _block = None
 
@@ -377,18 +394,33 @@ class VM(Configurable, VirtualMachineAPI):
         # will increase the gas used in the final new_header.
         header = self.get_header().copy(gas_used=0)
 
+        # resolve all signatures up front, rather than one at a time during execution
+        recover_senders(block.transactions, self.sender_recovery_executor)
+
+        state_db = self.chaindb.db
+        prefetch = None
+        if self.state_prefetcher is not None:
+            prefetch = self.state_prefetcher.prefetch_block(
+                state_db, header.state_root, block.transactions
+            )
+            state_db = prefetch.db
+
         # we need to re-initialize the `state` to update the execution context.
         self._state = self.get_state_class()(
-            self.chaindb.db, execution_context, header.state_root
+            state_db, execution_context, header.state_root
         )
 
         # apply any block-related state processing
         self.block_preprocessing(block)
 
         # run all of the transactions.
-        new_header, receipts, _ = self.apply_all_transactions(
-            block.transactions, header
-        )
+        try:
+            new_header, receipts, _ = self.apply_all_transactions(
+                block.transactions, header
+            )
+        finally:
+            if prefetch is not None:
+                prefetch.stop()
 
         withdrawals = block.withdrawals if hasattr(block, "withdrawals") else None
         if withdrawals:
@@ -404,7 +436,12 @@ class VM(Configurable, VirtualMachineAPI):
         )
 
         processed_block = self.block_postprocessing(filled_block)
-        return self.mine_block(processed_block)
+        block_result = self.mine_block(processed_block)
+
+        if self.state_prefetcher is not None:
+            self.state_prefetcher.record_meta_witness(block_result.meta_witness)
+
+        return block_result
 
     def block_preprocessing(self, block: BlockAPI) -> None:
         """
@@ -741,6 +778,18 @@ class VM(Configurable, VirtualMachineAPI):
             )
             raise
 
+    def validate_seals(
+        self, headers: Sequence[BlockHeaderAPI], executor: Executor
+    ) -> None:
+        try:
+            self._consensus.validate_seals(headers, executor)
+        except ValidationError as exc:
+            self.cls_logger.debug(
+                f"Failed to validate seals on headers #{headers[0].block_number} to "
+                f"#{headers[-1].block_number}. Error: {exc}"
+            )
+            raise
+
     def validate_seal_extension(
         self, header: BlockHeaderAPI, parents: Iterable[BlockHeaderAPI]
     ) -> None:
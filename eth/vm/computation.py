@@ -6,6 +6,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Iterable,
     List,
     Optional,
     Tuple,
@@ -50,6 +51,15 @@ from eth.exceptions import (
     Halt,
     VMError,
 )
+from eth.precompiles.backends import (
+    check_precompile_backend,
+    get_precompile_backend,
+)
+from eth.precompiles.result_cache import (
+    CACHED_PRECOMPILE_ADDRESSES,
+    CachedPrecompile,
+    PrecompileResultCache,
+)
 from eth.typing import (
     BytesOrView,
 )
@@ -131,6 +141,11 @@ class BaseComputation(ComputationAPI, Configurable):
     # VM configuration
     opcodes: Dict[int, OpcodeAPI] = None
     _precompiles: Dict[Address, Callable[[ComputationAPI], ComputationAPI]] = None
+    _memory_class: Type[MemoryAPI] = Memory
+
+    # Set to False to skip re-validating arguments that opcodes have already
+    # bounded, like log entries and memory offsets popped off the stack.
+    validate_inputs: bool = True
 
     def __init__(
         self,
@@ -149,7 +164,7 @@ class BaseComputation(ComputationAPI, Configurable):
         self.accounts_to_delete = []
         self.beneficiaries = []
         self._stack = Stack()
-        self._memory = Memory()
+        self._memory = self._memory_class()
         self._log_entries = []
         self.data_floor_cost = 0
 
@@ -323,10 +338,11 @@ class BaseComputation(ComputationAPI, Configurable):
         topics: Tuple[int, ...],
         data: bytes,
     ) -> None:
-        validate_canonical_address(account, title="Log entry address")
-        for topic in topics:
-            validate_uint256(topic, title="Log entry topic")
-        validate_is_bytes(data, title="Log entry data")
+        if self.validate_inputs:
+            validate_canonical_address(account, title="Log entry address")
+            for topic in topics:
+                validate_uint256(topic, title="Log entry topic")
+            validate_is_bytes(data, title="Log entry data")
         self._log_entries.append(
             (self.transaction_context.get_next_log_counter(), account, topics, data)
         )
@@ -456,8 +472,9 @@ class BaseComputation(ComputationAPI, Configurable):
 
     # -- memory management -- #
     def extend_memory(self, start_position: int, size: int) -> None:
-        validate_uint256(start_position, title="Memory start position")
-        validate_uint256(size, title="Memory size")
+        if self.validate_inputs:
+            validate_uint256(start_position, title="Memory start position")
+            validate_uint256(size, title="Memory size")
 
         before_size = ceil32(len(self._memory))
         after_size = ceil32(start_position + size)
@@ -602,6 +619,58 @@ class BaseComputation(ComputationAPI, Configurable):
         else:
             return cls._precompiles
 
+    @classmethod
+    def configure_precompile_backend(cls, backend_name: str) -> Type[ComputationAPI]:
+        """
+        Return a subclass of this computation class whose precompiles are replaced by
+        those of the backend registered as ``backend_name``, if this class has a
+        precompile at the same address. Each replacement is checked against the
+        precompile it replaces first, and a
+        :class:`~eth.exceptions.PrecompileBackendMismatch` is raised if they differ.
+        """
+        reference_precompiles = cls.get_precompiles()
+        replacements = {
+            address: precompile
+            for address, precompile in get_precompile_backend(backend_name).items()
+            if address in reference_precompiles
+        }
+        for address, precompile in replacements.items():
+            # Precompiles only use the message and the gas meter of computations, so
+            # they are checked in base computations, which need no state
+            check_precompile_backend(
+                BaseComputation, address, reference_precompiles[address], precompile
+            )
+
+        return cls.configure(
+            __name__=f"{cls.__name__}[{backend_name}]",
+            _precompiles={**reference_precompiles, **replacements},
+        )
+
+    @classmethod
+    def configure_precompile_result_cache(
+        cls,
+        addresses: Iterable[Address] = CACHED_PRECOMPILE_ADDRESSES,
+        cache: PrecompileResultCache = None,
+    ) -> Type[ComputationAPI]:
+        """
+        Return a subclass of this computation class that caches the results of its
+        precompiles at ``addresses`` in ``cache``, or in a new cache of the default
+        size.
+        """
+        if cache is None:
+            cache = PrecompileResultCache()
+        precompiles = dict(cls.get_precompiles())
+        for address in addresses:
+            if address in precompiles:
+                precompiles[address] = CachedPrecompile(
+                    address, precompiles[address], cache
+                )
+
+        return cls.configure(
+            __name__=f"{cls.__name__}[cached]",
+            _precompiles=precompiles,
+        )
+
     def get_opcode_fn(self, opcode: int) -> OpcodeAPI:
         try:
             return self.opcodes[opcode]
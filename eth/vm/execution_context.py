@@ -1,4 +1,6 @@
 from typing import (
+    Any,
+    Dict,
     Iterable,
     Optional,
 )
@@ -104,3 +106,14 @@ class ExecutionContext(ExecutionContextAPI):
             )
         else:
             return self._excess_blob_gas
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The ancestor hashes are loaded lazily, by a generator that can't be
+        # pickled, so load all of them first
+        state = self.__dict__.copy()
+        state["_prev_hashes"] = tuple(self._prev_hashes)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._prev_hashes = CachedIterable(self._prev_hashes)
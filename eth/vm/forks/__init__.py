@@ -1,53 +1,29 @@
-from .tangerine_whistle import (
-    TangerineWhistleVM,
-)
-from .frontier import (
-    FrontierVM,
-)
-from .homestead import (
-    HomesteadVM,
-)
-from .spurious_dragon import (
-    SpuriousDragonVM,
-)
-from .byzantium import (
-    ByzantiumVM,
-)
-from .constantinople import (
-    ConstantinopleVM,
-)
-from .petersburg import (
-    PetersburgVM,
-)
-from .istanbul import (
-    IstanbulVM,
-)
-from .muir_glacier import (
-    MuirGlacierVM,
-)
-from .berlin import (
-    BerlinVM,
-)
-from .london import (
-    LondonVM,
-)
-from .arrow_glacier import (
-    ArrowGlacierVM,
-)
-from .gray_glacier import (
-    GrayGlacierVM,
-)
-from .paris import (
-    ParisVM,
-)
-from .shanghai import (
-    ShanghaiVM,
-)
-from .cancun import (
-    CancunVM,
-)
-from .prague import (
-    PragueVM,
+from eth._utils.module_loading import (
+    lazy_module_attributes,
 )
 
-LATEST_VM = PragueVM
+# A fork imports all the forks before it, so they are only imported when first
+# accessed
+__getattr__, __dir__ = lazy_module_attributes(
+    __name__,
+    {
+        "FrontierVM": ".frontier.FrontierVM",
+        "HomesteadVM": ".homestead.HomesteadVM",
+        "TangerineWhistleVM": ".tangerine_whistle.TangerineWhistleVM",
+        "SpuriousDragonVM": ".spurious_dragon.SpuriousDragonVM",
+        "ByzantiumVM": ".byzantium.ByzantiumVM",
+        "ConstantinopleVM": ".constantinople.ConstantinopleVM",
+        "PetersburgVM": ".petersburg.PetersburgVM",
+        "IstanbulVM": ".istanbul.IstanbulVM",
+        "MuirGlacierVM": ".muir_glacier.MuirGlacierVM",
+        "BerlinVM": ".berlin.BerlinVM",
+        "LondonVM": ".london.LondonVM",
+        "ArrowGlacierVM": ".arrow_glacier.ArrowGlacierVM",
+        "GrayGlacierVM": ".gray_glacier.GrayGlacierVM",
+        "ParisVM": ".paris.ParisVM",
+        "ShanghaiVM": ".shanghai.ShanghaiVM",
+        "CancunVM": ".cancun.CancunVM",
+        "PragueVM": ".prague.PragueVM",
+        "LATEST_VM": ".prague.PragueVM",
+    },
+)
@@ -1,8 +1,3 @@
-import math
-
-from eth_utils import (
-    big_endian_to_int,
-)
 from eth_utils.toolz import (
     merge,
 )
@@ -13,13 +8,14 @@ from eth._utils.address import (
 from eth._utils.numeric import (
     get_highest_bit_index,
 )
-from eth._utils.padding import (
-    zpad_right,
-)
 from eth.precompiles.modexp import (
+    extract_exponent_head,
     extract_lengths,
     modexp,
 )
+from eth.typing import (
+    BytesOrView,
+)
 from eth.vm.forks.berlin import (
     constants,
 )
@@ -35,16 +31,12 @@ from .opcodes import (
 
 def _calculate_multiplication_complexity(base_length: int, modulus_length: int) -> int:
     max_length = max(base_length, modulus_length)
-    words = math.ceil(max_length / 8)
+    words = -(-max_length // 8)
     return words**2
 
 
-def _calculate_iteration_count(
-    exponent_length: int, first_32_exponent_bytes: bytes
-) -> int:
-    first_32_exponent = big_endian_to_int(first_32_exponent_bytes)
-
-    highest_bit_index = get_highest_bit_index(first_32_exponent)
+def _calculate_iteration_count(exponent_length: int, exponent_head: int) -> int:
+    highest_bit_index = get_highest_bit_index(exponent_head)
 
     if exponent_length <= 32:
         iteration_count = highest_bit_index
@@ -54,19 +46,12 @@ def _calculate_iteration_count(
     return max(iteration_count, 1)
 
 
-def _compute_modexp_gas_fee_eip_2565(data: bytes) -> int:
+def _compute_modexp_gas_fee_eip_2565(data: BytesOrView) -> int:
     base_length, exponent_length, modulus_length = extract_lengths(data)
 
-    base_end_idx = 96 + base_length
-    exponent_end_idx = base_end_idx + exponent_length
-
-    first_32_exponent_bytes = zpad_right(
-        data[base_end_idx:exponent_end_idx],
-        to_size=min(exponent_length, 32),
-    )[:32]
     iteration_count = _calculate_iteration_count(
         exponent_length,
-        first_32_exponent_bytes,
+        extract_exponent_head(data, base_length, exponent_length),
     )
 
     multiplication_complexity = _calculate_multiplication_complexity(
@@ -23,9 +23,9 @@ BYZANTIUM_PRECOMPILES = merge(
     FRONTIER_PRECOMPILES,
     {
         force_bytes_to_address(b"\x05"): precompiles.modexp,
-        force_bytes_to_address(b"\x06"): precompiles.ecadd,
-        force_bytes_to_address(b"\x07"): precompiles.ecmul,
-        force_bytes_to_address(b"\x08"): precompiles.ecpairing,
+        force_bytes_to_address(b"\x06"): precompiles.LazyPrecompile("ecadd"),
+        force_bytes_to_address(b"\x07"): precompiles.LazyPrecompile("ecmul"),
+        force_bytes_to_address(b"\x08"): precompiles.LazyPrecompile("ecpairing"),
     },
 )
 
@@ -5,8 +5,8 @@ from toolz import (
 from eth._utils.address import (
     force_bytes_to_address,
 )
-from eth.precompiles.point_evaluation import (
-    point_evaluation_precompile,
+from eth.precompiles import (
+    LazyPrecompile,
 )
 from eth.vm.forks.shanghai.computation import (
     ShanghaiComputation,
@@ -22,9 +22,9 @@ from .opcodes import (
 CANCUN_PRECOMPILES = merge(
     ShanghaiComputation.get_precompiles(),
     {
-        force_bytes_to_address(
-            POINT_EVALUATION_PRECOMPILE_ADDRESS
-        ): point_evaluation_precompile,
+        force_bytes_to_address(POINT_EVALUATION_PRECOMPILE_ADDRESS): LazyPrecompile(
+            "point_evaluation_precompile"
+        ),
     },
 )
 
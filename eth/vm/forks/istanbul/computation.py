@@ -30,9 +30,14 @@ from .opcodes import (
 ISTANBUL_PRECOMPILES = merge(
     PETERSBURG_PRECOMPILES,
     {
-        force_bytes_to_address(b"\x06"): precompiles.ecadd(gas_cost=GAS_ECADD),
-        force_bytes_to_address(b"\x07"): precompiles.ecmul(gas_cost=GAS_ECMUL),
-        force_bytes_to_address(b"\x08"): precompiles.ecpairing(
+        force_bytes_to_address(b"\x06"): precompiles.LazyPrecompile(
+            "ecadd", gas_cost=GAS_ECADD
+        ),
+        force_bytes_to_address(b"\x07"): precompiles.LazyPrecompile(
+            "ecmul", gas_cost=GAS_ECMUL
+        ),
+        force_bytes_to_address(b"\x08"): precompiles.LazyPrecompile(
+            "ecpairing",
             gas_cost_base=GAS_ECPAIRING_BASE,
             gas_cost_per_point=GAS_ECPAIRING_PER_POINT,
         ),
@@ -4,13 +4,9 @@ from typing import (
     Type,
 )
 
-from eth_keys import (
-    keys,
-)
 from eth_typing import (
     Address,
 )
-import rlp
 
 from eth import (
     constants,
@@ -43,7 +39,6 @@ from eth.vm.forks.prague.constants import (
     DELEGATION_DESIGNATION_PREFIX,
     HISTORY_STORAGE_ADDRESS,
     HISTORY_STORAGE_CONTRACT_CODE,
-    MAGIC,
     PER_AUTH_BASE_COST,
     PER_EMPTY_ACCOUNT_BASE_COST,
     SET_CODE_TRANSACTION_TYPE,
@@ -129,11 +124,7 @@ class PragueState(CancunState):
                 auth.validate(self.execution_context.chain_id)
 
                 # 3. authority = ecrecover(msg, y_parity, r, s)
-                encoded = rlp.encode([auth.chain_id, auth.address, auth.nonce])
-                msg = MAGIC + encoded
-                signature = keys.Signature(vrs=(auth.y_parity, auth.r, auth.s))
-                public_key = signature.recover_public_key_from_msg(msg)
-                authority = Address(public_key.to_canonical_address())
+                authority = auth.authority
 
                 # 4. add authority to accessed addresses
                 self.mark_address_warm(authority)
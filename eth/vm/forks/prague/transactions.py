@@ -34,6 +34,7 @@ from rlp.sedes import (
 from eth._utils.transactions import (
     create_transaction_signature,
     extract_transaction_sender,
+    recover_signer,
     validate_transaction_signature,
 )
 from eth.abc import (
@@ -59,6 +60,9 @@ from eth.rlp.sedes import (
 from eth.rlp.transactions import (
     SignedTransactionMethods,
 )
+from eth.typing import (
+    VRS,
+)
 from eth.validation import (
     validate_canonical_address,
     validate_chain_id_is_current_or_zero,
@@ -96,6 +100,7 @@ from eth.vm.forks.london.transactions import (
 )
 
 from .constants import (
+    MAGIC,
     PER_EMPTY_ACCOUNT_BASE_COST,
     SET_CODE_TRANSACTION_TYPE,
 )
@@ -159,6 +164,14 @@ class Authorization(rlp.Serializable, SetCodeAuthorizationAPI):
             )
         validate_lt_secpk1n2(self.s)
 
+    def get_message_for_signing(self) -> bytes:
+        return MAGIC + rlp.encode([self.chain_id, self.address, self.nonce])
+
+    @cached_property
+    def authority(self) -> Address:
+        vrs = VRS((self.y_parity, self.r, self.s))
+        return recover_signer(vrs, self.get_message_for_signing())
+
 
 class SetCodeTransaction(
     rlp.Serializable, SignedTransactionMethods, SignedTransactionAPI
@@ -5,10 +5,8 @@ from eth_utils.toolz import (
 from eth import (
     constants,
 )
-from eth._utils.numeric import (
-    ceil8,
-    signed_to_unsigned,
-    unsigned_to_signed,
+from eth._utils import (
+    uint256,
 )
 from eth.abc import (
     ComputationAPI,
@@ -69,19 +67,9 @@ def smod(computation: ComputationAPI) -> None:
     """
     Signed Modulo
     """
-    value, mod = map(
-        unsigned_to_signed,
-        computation.stack_pop_ints(2),
-    )
-
-    pos_or_neg = -1 if value < 0 else 1
-
-    if mod == 0:
-        result = 0
-    else:
-        result = (abs(value) % abs(mod) * pos_or_neg) & constants.UINT_256_MAX
+    value, mod = computation.stack_pop_ints(2)
 
-    computation.stack_push_int(signed_to_unsigned(result))
+    computation.stack_push_int(uint256.smod(value, mod))
 
 
 def mul(computation: ComputationAPI) -> None:
@@ -90,7 +78,10 @@ def mul(computation: ComputationAPI) -> None:
     """
     left, right = computation.stack_pop_ints(2)
 
-    result = (left * right) & constants.UINT_256_MAX
+    if left < uint256.UINT_128_CEILING and right < uint256.UINT_128_CEILING:
+        result = left * right
+    else:
+        result = (left * right) & constants.UINT_256_MAX
 
     computation.stack_push_int(result)
 
@@ -126,19 +117,9 @@ def sdiv(computation: ComputationAPI) -> None:
     """
     Signed Division
     """
-    numerator, denominator = map(
-        unsigned_to_signed,
-        computation.stack_pop_ints(2),
-    )
-
-    pos_or_neg = -1 if numerator * denominator < 0 else 1
-
-    if denominator == 0:
-        result = 0
-    else:
-        result = pos_or_neg * (abs(numerator) // abs(denominator))
+    numerator, denominator = computation.stack_pop_ints(2)
 
-    computation.stack_push_int(signed_to_unsigned(result))
+    computation.stack_push_int(uint256.sdiv(numerator, denominator))
 
 
 @curry
@@ -148,18 +129,12 @@ def exp(computation: ComputationAPI, gas_per_byte: int) -> None:
     """
     base, exponent = computation.stack_pop_ints(2)
 
-    bit_size = exponent.bit_length()
-    byte_size = ceil8(bit_size) // 8
-
-    if exponent == 0:
-        result = 1
-    elif base == 0:
-        result = 0
-    else:
-        result = pow(base, exponent, constants.UINT_256_CEILING)
+    result = uint256.exp(base, exponent)
 
     computation.consume_gas(
-        gas_per_byte * byte_size,
+        uint256.get_exp_gas_by_byte_length(gas_per_byte)[
+            (exponent.bit_length() + 7) // 8
+        ],
         reason="EXP: exponent bytes",
     )
 
@@ -172,17 +147,7 @@ def signextend(computation: ComputationAPI) -> None:
     """
     bits, value = computation.stack_pop_ints(2)
 
-    if bits <= 31:
-        testbit = bits * 8 + 7
-        sign_bit = 1 << testbit
-        if value & sign_bit:
-            result = value | (constants.UINT_256_CEILING - sign_bit)
-        else:
-            result = value & (sign_bit - 1)
-    else:
-        result = value
-
-    computation.stack_push_int(result)
+    computation.stack_push_int(uint256.signextend(bits, value))
 
 
 def shl(computation: ComputationAPI) -> None:
@@ -218,11 +183,5 @@ def sar(computation: ComputationAPI) -> None:
     Arithmetic bitwise right shift
     """
     shift_length, value = computation.stack_pop_ints(2)
-    value = unsigned_to_signed(value)
-
-    if shift_length >= 256:
-        result = 0 if value >= 0 else constants.UINT_255_NEGATIVE_ONE
-    else:
-        result = (value >> shift_length) & constants.UINT_256_MAX
 
-    computation.stack_push_int(result)
+    computation.stack_push_int(uint256.sar(shift_length, value))
@@ -2,8 +2,7 @@ from eth import (
     constants,
 )
 from eth._utils.numeric import (
-    signed_to_unsigned,
-    unsigned_to_signed,
+    SIGN_BIT,
 )
 from eth.abc import (
     ComputationAPI,
@@ -42,34 +41,30 @@ def slt(computation: ComputationAPI) -> None:
     """
     Signed Lesser Comparison
     """
-    left, right = map(
-        unsigned_to_signed,
-        computation.stack_pop_ints(2),
-    )
+    left, right = computation.stack_pop_ints(2)
 
-    if left < right:
+    # flipping the sign bits orders words like the signed integers they encode
+    if (left ^ SIGN_BIT) < (right ^ SIGN_BIT):
         result = 1
     else:
         result = 0
 
-    computation.stack_push_int(signed_to_unsigned(result))
+    computation.stack_push_int(result)
 
 
 def sgt(computation: ComputationAPI) -> None:
     """
     Signed Greater Comparison
     """
-    left, right = map(
-        unsigned_to_signed,
-        computation.stack_pop_ints(2),
-    )
+    left, right = computation.stack_pop_ints(2)
 
-    if left > right:
+    # flipping the sign bits orders words like the signed integers they encode
+    if (left ^ SIGN_BIT) > (right ^ SIGN_BIT):
         result = 1
     else:
         result = 0
 
-    computation.stack_push_int(signed_to_unsigned(result))
+    computation.stack_push_int(result)
 
 
 def eq(computation: ComputationAPI) -> None:
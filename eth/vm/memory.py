@@ -18,6 +18,10 @@ class Memory(MemoryAPI):
     __slots__ = ["_bytes"]
     logger = logging.getLogger("eth.vm.memory.Memory")
 
+    # Set to False to skip bounds and type checks, when callers are trusted to
+    # extend memory before writing to it.
+    validate_inputs = True
+
     def __init__(self) -> None:
         self._bytes = bytearray()
 
@@ -46,11 +50,12 @@ class Memory(MemoryAPI):
 
     def write(self, start_position: int, size: int, value: bytes) -> None:
         if size:
-            validate_uint256(start_position)
-            validate_uint256(size)
-            validate_is_bytes(value)
-            validate_length(value, length=size)
-            validate_lte(start_position + size, maximum=len(self))
+            if self.validate_inputs:
+                validate_uint256(start_position)
+                validate_uint256(size)
+                validate_is_bytes(value)
+                validate_length(value, length=size)
+                validate_lte(start_position + size, maximum=len(self))
 
             self._bytes[start_position : start_position + len(value)] = value
 
@@ -64,10 +69,11 @@ class Memory(MemoryAPI):
         if length == 0:
             return
 
-        validate_uint256(destination)
-        validate_uint256(source)
-        validate_uint256(length)
-        validate_lte(max(destination, source) + length, maximum=len(self))
+        if self.validate_inputs:
+            validate_uint256(destination)
+            validate_uint256(source)
+            validate_uint256(length)
+            validate_lte(max(destination, source) + length, maximum=len(self))
 
         buf = memoryview(self._bytes)
         buf[destination : destination + length] = buf[source : source + length]
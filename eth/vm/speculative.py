@@ -0,0 +1,686 @@
+"""
+Optimistic execution of a block's transactions.
+
+Every transaction is first executed speculatively, in an executor's workers, on the
+block's pre-state, while recording the value of each piece of state (balance,
+nonce, code, existence or storage slot) that its computation touched, at the
+moment the computation started. Workers don't share the chain's database: they
+are sent the state root, the transaction and the trie nodes it will likely need,
+and ask for any other node they run into. They send back the recorded reads, the
+final value of every piece of state the computation wrote, and the outcome of the
+computation.
+
+Transactions are then applied in order, as usual. When a transaction's
+computation is about to run, the recorded values are compared against the actual
+state: if they all match, the computation would behave exactly as it did
+speculatively, so its writes are copied over and its outcome is reused.
+Otherwise, the computation is run again, on the actual state.
+
+Only the computation is speculated. Validating the transaction, charging for gas,
+refunds, paying the coinbase and clearing accounts always run in order, so
+transactions that only conflict through the coinbase's balance can still be
+reused.
+"""
+from collections import (
+    deque,
+)
+from concurrent.futures import (
+    Executor,
+    Future,
+)
+import functools
+import logging
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
+
+from eth_typing import (
+    Address,
+    Hash32,
+)
+from trie.exceptions import (
+    MissingTrieNode,
+)
+
+from eth.abc import (
+    AtomicDatabaseAPI,
+    BlockHeaderAPI,
+    ComputationAPI,
+    ExecutionContextAPI,
+    MessageAPI,
+    ReceiptAPI,
+    SignedTransactionAPI,
+    StateAPI,
+    TransactionContextAPI,
+    TransactionExecutorAPI,
+)
+from eth.db.atomic import (
+    AtomicDB,
+)
+from eth.db.backends.memory import (
+    MemoryDB,
+)
+from eth.db.prefetch import (
+    StatePrefetcher,
+)
+from eth.exceptions import (
+    VMError,
+)
+from eth.vm.base import (
+    VM,
+)
+from eth.vm.interrupt import (
+    MissingBytecode,
+)
+from eth.vm.state import (
+    BaseState,
+    BaseTransactionExecutor,
+)
+
+BALANCE = "balance"
+NONCE = "nonce"
+CODE = "code"
+EXISTS = "exists"
+
+# An account field, or a storage slot, of an account
+StateKey = Tuple[Address, Union[str, int]]
+
+# What a worker sends back: a speculation, the hash of a trie node or bytecode that
+# it needs, or None if the transaction can't be speculated
+SpeculationOutcome = Union["Speculation", Hash32, None]
+
+
+def _read_state_key(state: StateAPI, key: StateKey) -> Any:
+    address, field = key
+    if field == BALANCE:
+        return state.get_balance(address)
+    elif field == NONCE:
+        return state.get_nonce(address)
+    elif field == CODE:
+        return state.get_code_hash(address)
+    elif field == EXISTS:
+        return state.account_exists(address)
+    else:
+        return state.get_storage(address, cast(int, field))
+
+
+def _write_state_key(state: StateAPI, key: StateKey, value: Any) -> None:
+    address, field = key
+    if field == BALANCE:
+        state.set_balance(address, value)
+    elif field == NONCE:
+        state.set_nonce(address, value)
+    elif field == CODE:
+        state.set_code(address, value)
+    elif field == EXISTS:
+        state.touch_account(address)
+    else:
+        state.set_storage(address, cast(int, field), value)
+
+
+def _message_fingerprint(message: MessageAPI) -> Tuple[Any, ...]:
+    return (
+        message.gas,
+        message.to,
+        message.sender,
+        message.value,
+        bytes(message.data),
+        message.code,
+        message.depth,
+        message.storage_address,
+        message.code_address,
+        message.should_transfer_value,
+        message.is_static,
+        message.is_delegation,
+        message.refund,
+    )
+
+
+class SpeculativeStateMixin(BaseState):
+    """
+    Record the state that a computation reads and writes, between
+    :meth:`start_recording` and :meth:`stop_recording`. Must be mixed into a
+    :class:`~eth.vm.state.BaseState` subclass.
+    """
+
+    _is_recording = False
+    _observed: Dict[StateKey, Any] = None
+    _written: Set[StateKey] = None
+    _code_read: Set[Address] = None
+    _is_replayable = True
+
+    def start_recording(self) -> None:
+        self._observed = {}
+        self._written = set()
+        self._code_read = set()
+        self._is_replayable = True
+        self._is_recording = True
+
+    def stop_recording(
+        self,
+    ) -> Tuple[Dict[StateKey, Any], Set[StateKey], Set[Address], bool]:
+        self._is_recording = False
+        return self._observed, self._written, self._code_read, self._is_replayable
+
+    def _observe(self, address: Address, field: Union[str, int]) -> None:
+        key = (address, field)
+        if key not in self._observed:
+            self._is_recording = False
+            try:
+                self._observed[key] = _read_state_key(self, key)
+            finally:
+                self._is_recording = True
+
+    def _write(self, address: Address, field: Union[str, int]) -> None:
+        self._observe(address, field)
+        # any write may create the account
+        self._observe(address, EXISTS)
+        self._written.add((address, field))
+        self._written.add((address, EXISTS))
+
+    def get_balance(self, address: Address) -> int:
+        if self._is_recording:
+            self._observe(address, BALANCE)
+        return super().get_balance(address)
+
+    def set_balance(self, address: Address, balance: int) -> None:
+        if self._is_recording:
+            self._write(address, BALANCE)
+        super().set_balance(address, balance)
+
+    def get_nonce(self, address: Address) -> int:
+        if self._is_recording:
+            self._observe(address, NONCE)
+        return super().get_nonce(address)
+
+    def set_nonce(self, address: Address, nonce: int) -> None:
+        if self._is_recording:
+            self._write(address, NONCE)
+        super().set_nonce(address, nonce)
+
+    def increment_nonce(self, address: Address) -> None:
+        if self._is_recording:
+            self._write(address, NONCE)
+        super().increment_nonce(address)
+
+    def get_code(self, address: Address) -> bytes:
+        if self._is_recording:
+            self._observe(address, CODE)
+            # unlike its hash, the bytecode itself ends up in the block's witness
+            self._code_read.add(address)
+        return super().get_code(address)
+
+    def set_code(self, address: Address, code: bytes) -> None:
+        if self._is_recording:
+            self._write(address, CODE)
+        super().set_code(address, code)
+
+    def get_code_hash(self, address: Address) -> Hash32:
+        if self._is_recording:
+            self._observe(address, CODE)
+        return super().get_code_hash(address)
+
+    def delete_code(self, address: Address) -> None:
+        if self._is_recording:
+            self._write(address, CODE)
+        super().delete_code(address)
+
+    def has_code_or_nonce(self, address: Address) -> bool:
+        if self._is_recording:
+            self._observe(address, NONCE)
+            self._observe(address, CODE)
+        return super().has_code_or_nonce(address)
+
+    def account_exists(self, address: Address) -> bool:
+        if self._is_recording:
+            self._observe(address, EXISTS)
+        return super().account_exists(address)
+
+    def touch_account(self, address: Address) -> None:
+        if self._is_recording:
+            self._write(address, EXISTS)
+        super().touch_account(address)
+
+    def account_is_empty(self, address: Address) -> bool:
+        if self._is_recording:
+            self._observe(address, NONCE)
+            self._observe(address, CODE)
+            self._observe(address, BALANCE)
+        return super().account_is_empty(address)
+
+    def get_storage(
+        self, address: Address, slot: int, from_journal: bool = True
+    ) -> int:
+        # Storage isn't written before the computation starts, so the original
+        # value of a slot is the one observed on first access.
+        if self._is_recording:
+            self._observe(address, slot)
+        return super().get_storage(address, slot, from_journal)
+
+    def set_storage(self, address: Address, slot: int, value: int) -> None:
+        if self._is_recording:
+            self._write(address, slot)
+        super().set_storage(address, slot, value)
+
+    def delete_storage(self, address: Address) -> None:
+        # Wiping every slot can't be expressed as a set of key writes
+        self._is_replayable = False
+        super().delete_storage(address)
+
+    def delete_account(self, address: Address) -> None:
+        self._is_replayable = False
+        super().delete_account(address)
+
+
+class ComputationOutcome(NamedTuple):
+    """
+    How a computation and its child computations ended, without the state and
+    the EVM internals they ran with, so that it can be sent to another process.
+    Log entries are kept by :class:`Speculation`.
+    """
+
+    message: MessageAPI
+    error: Optional[VMError]
+    output: bytes
+    gas_remaining: int
+    gas_refunded: int
+    accounts_to_delete: Tuple[Address, ...]
+    beneficiaries: Tuple[Address, ...]
+    children: Tuple["ComputationOutcome", ...]
+
+    @classmethod
+    def from_computation(cls, computation: ComputationAPI) -> "ComputationOutcome":
+        gas_meter = computation.get_gas_meter()
+        return cls(
+            computation.msg,
+            computation.error if computation.is_error else None,
+            computation.output,
+            gas_meter.gas_remaining,
+            gas_meter.gas_refunded,
+            tuple(computation.accounts_to_delete),
+            tuple(computation.beneficiaries),
+            tuple(cls.from_computation(child) for child in computation.children),
+        )
+
+    def to_computation(
+        self, state: StateAPI, transaction_context: TransactionContextAPI
+    ) -> ComputationAPI:
+        """
+        Rebuild the finished computation on ``state``.
+        """
+        computation = state.get_computation(self.message, transaction_context)
+        gas_meter = computation.get_gas_meter()
+        gas_meter.gas_remaining = self.gas_remaining
+        gas_meter.gas_refunded = self.gas_refunded
+        if self.error is not None:
+            computation.error = self.error
+        computation.output = self.output
+        computation.accounts_to_delete.extend(self.accounts_to_delete)
+        computation.beneficiaries.extend(self.beneficiaries)
+        computation.children.extend(
+            child.to_computation(state, transaction_context) for child in self.children
+        )
+        return computation
+
+
+class Speculation:
+    """
+    The result of speculatively running a transaction's computation: the message
+    it ran, the state it read, the final values of the state it wrote, and how it
+    ended.
+    """
+
+    __slots__ = [
+        "outcome",
+        "log_entries",
+        "_message_fingerprint",
+        "_observed",
+        "_code_read",
+        "_writes",
+    ]
+
+    def __init__(
+        self,
+        outcome: ComputationOutcome,
+        log_entries: Tuple[Tuple[bytes, Tuple[int, ...], bytes], ...],
+        message_fingerprint: Tuple[Any, ...],
+        observed: Dict[StateKey, Any],
+        code_read: FrozenSet[Address],
+        writes: Dict[StateKey, Any],
+    ) -> None:
+        self.outcome = outcome
+        self.log_entries = log_entries
+        self._message_fingerprint = message_fingerprint
+        self._observed = observed
+        self._code_read = code_read
+        self._writes = writes
+
+    def is_valid_for(self, state: StateAPI, message: MessageAPI) -> bool:
+        """
+        Return whether running ``message`` on ``state`` would reproduce this
+        speculative computation exactly.
+        """
+        if _message_fingerprint(message) != self._message_fingerprint:
+            return False
+        return all(
+            _read_state_key(state, key) == value
+            for key, value in self._observed.items()
+        )
+
+    def apply_to(
+        self, state: StateAPI, transaction_context: TransactionContextAPI
+    ) -> ComputationAPI:
+        """
+        Copy the writes of the speculative computation to ``state``, and return
+        the computation, rebuilt on ``state``.
+        """
+        for address in self._code_read:
+            # load the bytecode like the computation did, for the block's witness
+            state.get_code(address)
+        for key, value in self._writes.items():
+            _write_state_key(state, key, value)
+
+        computation = self.outcome.to_computation(state, transaction_context)
+        for log_address, topics, data in self.log_entries:
+            computation.add_log_entry(Address(log_address), topics, data)
+        return computation
+
+
+def speculate_transaction(
+    state: SpeculativeStateMixin,
+    transaction: SignedTransactionAPI,
+) -> Optional[Speculation]:
+    """
+    Run the computation of ``transaction`` on ``state``, recording the state it
+    accesses. Return ``None`` if the transaction can't be speculated on this
+    state, for example because it depends on an earlier transaction of the same
+    sender.
+
+    Raise :class:`~trie.exceptions.MissingTrieNode` or
+    :class:`~eth.vm.interrupt.MissingBytecode` if ``state`` is missing data that
+    the transaction needs.
+    """
+    executor = state.get_transaction_executor()
+    try:
+        executor.validate_transaction(transaction)
+        message = executor.build_evm_message(transaction)
+        fingerprint = _message_fingerprint(message)
+
+        state.start_recording()
+        try:
+            computation = executor.build_computation(message, transaction)
+        finally:
+            observed, written, code_read, is_replayable = state.stop_recording()
+    except (MissingTrieNode, MissingBytecode):
+        raise
+    except Exception:
+        # Let the in-order execution hit, and report, any error
+        return None
+
+    if not is_replayable:
+        return None
+
+    writes = {}
+    for key in written:
+        final_value = _read_state_key(state, key)
+        if final_value == observed[key]:
+            # unchanged, or changed and then reverted
+            continue
+        elif key[1] == EXISTS and not final_value:
+            # Deleting an account can't be expressed as a set of key writes
+            return None
+        elif key[1] == CODE:
+            final_value = state.get_code(key[0])
+        writes[key] = final_value
+
+    return Speculation(
+        ComputationOutcome.from_computation(computation),
+        computation.get_log_entries(),
+        fingerprint,
+        observed,
+        frozenset(code_read),
+        writes,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_speculative_state_class(
+    state_class: Type[StateAPI],
+) -> Type[SpeculativeStateMixin]:
+    return type(state_class.__name__, (SpeculativeStateMixin, state_class), {})
+
+
+def _speculate_in_worker(
+    state_class: Type[StateAPI],
+    execution_context: ExecutionContextAPI,
+    state_root: Hash32,
+    transaction: SignedTransactionAPI,
+    nodes: Dict[bytes, bytes],
+) -> SpeculationOutcome:
+    db = AtomicDB(MemoryDB(dict(nodes)))
+    try:
+        # some states read accounts as they are created, like Cancun's system
+        # contracts
+        state = _get_speculative_state_class(state_class)(
+            db, execution_context, state_root
+        )
+        return speculate_transaction(state, transaction)
+    except MissingTrieNode as exc:
+        return Hash32(exc.missing_node_hash)
+    except MissingBytecode as exc:
+        return exc.missing_code_hash
+
+
+class _SpeculationRequest:
+    """
+    Speculate on a transaction in an executor. Each time the worker reports a
+    trie node or bytecode that it wasn't sent, load it, and try again.
+    """
+
+    logger = logging.getLogger("eth.vm.speculative._SpeculationRequest")
+
+    def __init__(
+        self,
+        executor: Executor,
+        db: AtomicDatabaseAPI,
+        speculate: Callable[..., SpeculationOutcome],
+        transaction: SignedTransactionAPI,
+        nodes: Dict[bytes, bytes],
+        max_missing_nodes: int,
+    ) -> None:
+        self._executor = executor
+        self._db = db
+        self._speculate = speculate
+        self._transaction = transaction
+        self._nodes = nodes
+        self._missing_nodes_left = max_missing_nodes
+        self._is_cancelled = False
+        self._worker_future: "Future[SpeculationOutcome]" = None
+
+        self.future: "Future[Optional[Speculation]]" = Future()
+        self.future.set_running_or_notify_cancel()
+        self._submit()
+
+    def cancel(self) -> None:
+        self._is_cancelled = True
+        self._worker_future.cancel()
+
+    def _submit(self) -> None:
+        try:
+            self._worker_future = self._executor.submit(
+                self._speculate, self._transaction, self._nodes
+            )
+        except RuntimeError:
+            # the executor was shut down
+            self.future.set_result(None)
+        else:
+            self._worker_future.add_done_callback(self._on_worker_done)
+
+    def _on_worker_done(self, worker_future: "Future[SpeculationOutcome]") -> None:
+        outcome: SpeculationOutcome = None
+        if not worker_future.cancelled():
+            try:
+                outcome = worker_future.result()
+            except Exception:
+                self.logger.debug("Speculation failed", exc_info=True)
+
+        if isinstance(outcome, bytes):
+            if self._is_cancelled or self._missing_nodes_left <= 0:
+                outcome = None
+            else:
+                try:
+                    self._nodes[outcome] = self._db[outcome]
+                except KeyError:
+                    outcome = None
+                else:
+                    self._missing_nodes_left -= 1
+                    self._submit()
+                    return
+
+        self.future.set_result(outcome)
+
+
+class ReplayingTransactionExecutorMixin(BaseTransactionExecutor):
+    """
+    Reuse a speculative computation instead of running the message, if it is
+    still valid for the executor's state. Must be mixed into a transaction
+    executor class.
+    """
+
+    def __init__(self, vm_state: StateAPI, speculation: Optional[Speculation]) -> None:
+        super().__init__(vm_state)
+        self._speculation = speculation
+
+    def build_computation(
+        self, message: MessageAPI, transaction: SignedTransactionAPI
+    ) -> ComputationAPI:
+        speculation = self._speculation
+        if speculation is not None and speculation.is_valid_for(self.vm_state, message):
+            transaction_context = self.vm_state.get_transaction_context(transaction)
+            return speculation.apply_to(self.vm_state, transaction_context)
+        else:
+            # type ignored because as a mixin, we expect to only use this with
+            # another class that properly implements build_computation
+            return super().build_computation(  # type: ignore[safe-super]
+                message, transaction
+            )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_replaying_executor_class(
+    executor_class: Type[TransactionExecutorAPI],
+) -> Type[ReplayingTransactionExecutorMixin]:
+    return type(
+        executor_class.__name__,
+        (ReplayingTransactionExecutorMixin, executor_class),
+        {},
+    )
+
+
+class SpeculativeExecutionMixin(VM):
+    """
+    A VM that speculatively runs all of the transactions passed to
+    :meth:`apply_all_transactions` in ``speculation_executor``, and then reuses
+    the speculative computations that don't conflict with earlier transactions.
+    Receipts and state are the same as with in-order execution.
+
+    Use a :class:`~concurrent.futures.ProcessPoolExecutor` to run computations in
+    parallel. Its workers must be able to import the VM's state class, so it can't
+    be a class created at runtime. Each worker is sent the state that the
+    :class:`~eth.db.prefetch.StatePrefetcher` expects its transaction to access,
+    and then up to ``max_missing_nodes_per_speculation`` more trie nodes or
+    bytecodes, one at a time, as it asks for them.
+
+    Sending a transaction and its outcome between processes costs more than
+    running a plain value transfer, so speculating only pays off for blocks whose
+    transactions spend most of their time running contract code.
+    """
+
+    speculation_executor: Executor = None
+    max_missing_nodes_per_speculation: int = 32
+
+    _pending_speculations: Deque[
+        Tuple[SignedTransactionAPI, _SpeculationRequest]
+    ] = None
+
+    def apply_all_transactions(
+        self, transactions: Sequence[SignedTransactionAPI], base_header: BlockHeaderAPI
+    ) -> Tuple[BlockHeaderAPI, Tuple[ReceiptAPI, ...], Tuple[ComputationAPI, ...]]:
+        if self.speculation_executor is None:
+            raise AttributeError(
+                f"No `speculation_executor` has been set for {type(self).__name__}"
+            )
+
+        execution_context = self.state.execution_context
+        # Load the ancestor hashes now, rather than concurrently, from each thread
+        # that pickles the execution context for a worker process
+        tuple(execution_context.prev_hashes)
+
+        # Speculate on the pre-state of the block. Any change made before the first
+        # transaction, like a system call, is caught when validating speculations.
+        speculate = functools.partial(
+            _speculate_in_worker,
+            self.get_state_class(),
+            execution_context,
+            base_header.state_root,
+        )
+        prefetcher = self.state_prefetcher or StatePrefetcher()
+        db = self.chaindb.db
+        self._pending_speculations = deque(
+            (
+                transaction,
+                _SpeculationRequest(
+                    self.speculation_executor,
+                    db,
+                    speculate,
+                    transaction,
+                    prefetcher.read_likely_state(
+                        db, base_header.state_root, (transaction,)
+                    ),
+                    self.max_missing_nodes_per_speculation,
+                ),
+            )
+            for transaction in transactions
+        )
+        try:
+            return super().apply_all_transactions(transactions, base_header)
+        finally:
+            for _, request in self._pending_speculations:
+                request.cancel()
+            self._pending_speculations = None
+
+    def apply_transaction(
+        self, header: BlockHeaderAPI, transaction: SignedTransactionAPI
+    ) -> Tuple[ReceiptAPI, ComputationAPI]:
+        pending = self._pending_speculations
+        if not pending or pending[0][0] is not transaction:
+            return super().apply_transaction(header, transaction)
+
+        _, request = pending.popleft()
+        speculation = request.future.result()
+
+        self.validate_transaction_against_header(header, transaction)
+
+        # Mark current state as un-revertable, since new transaction is starting...
+        self.state.lock_changes()
+
+        executor_class = _get_replaying_executor_class(
+            self.state.transaction_executor_class
+        )
+        computation = executor_class(self.state, speculation)(transaction)
+        receipt = self.make_receipt(header, transaction, computation, self.state)
+        self.validate_receipt(receipt)
+
+        return receipt, computation
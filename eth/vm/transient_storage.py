@@ -25,6 +25,8 @@ EMPTY_VALUE = b""  # note: stack.to_int(b"") == 0
 
 
 class TransientStorage(TransientStorageAPI):
+    validate_inputs = True
+
     def __init__(self) -> None:
         self._db = JournalDB(MemoryDB())
 
@@ -33,16 +35,18 @@ class TransientStorage(TransientStorageAPI):
         return address + int_to_big_endian(slot)
 
     def get_transient_storage(self, address: Address, slot: int) -> bytes:
-        validate_canonical_address(address)
-        validate_uint256(slot)
+        if self.validate_inputs:
+            validate_canonical_address(address)
+            validate_uint256(slot)
 
         key = self._get_key(address, slot)
         return self._db.get(key, EMPTY_VALUE)
 
     def set_transient_storage(self, address: Address, slot: int, value: bytes) -> None:
-        validate_canonical_address(address)
-        validate_uint256(slot)
-        validate_is_bytes(value)  # JournalDB requires `bytes` values
+        if self.validate_inputs:
+            validate_canonical_address(address)
+            validate_uint256(slot)
+            validate_is_bytes(value)  # JournalDB requires `bytes` values
 
         key = self._get_key(address, slot)
         self._db[key] = value
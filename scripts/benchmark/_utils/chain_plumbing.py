@@ -3,6 +3,7 @@ from typing import (
     Dict,
     Iterable,
     Tuple,
+    Type,
 )
 
 from eth_keys import (
@@ -15,13 +16,35 @@ from eth_utils import (
     decode_hex,
     to_wei,
 )
+from eth_utils.toolz import (
+    merge,
+)
 
 from eth import (
     constants,
 )
+from eth.abc import (
+    VirtualMachineAPI,
+)
+from eth.chains.base import (
+    MiningChain,
+)
 from eth.chains.mainnet import (
     BaseMainnetChain,
 )
+from eth.db.atomic import (
+    AtomicDB,
+)
+from eth.tools.builder.chain import (
+    build,
+    disable_pow_check,
+    fork_at,
+    genesis,
+    trust_inputs,
+)
+from eth.vm.forks import (
+    ParisVM,
+)
 
 ALL_VM = [vm for _, vm in BaseMainnetChain.vm_configuration]
 
@@ -67,3 +90,47 @@ DEFAULT_GENESIS_STATE = [
 ]
 
 GenesisState = Iterable[Tuple[Address, Dict[str, Any]]]
+
+
+def get_chain(
+    vm: Type[VirtualMachineAPI],
+    genesis_state: GenesisState,
+    trusted: bool = False,
+) -> MiningChain:
+    if issubclass(vm, ParisVM):
+        # proof-of-stake headers have fixed ``difficulty`` and ``nonce`` values
+        genesis_params = merge(
+            GENESIS_PARAMS,
+            {
+                "difficulty": constants.POST_MERGE_DIFFICULTY,
+                "nonce": constants.POST_MERGE_NONCE,
+            },
+        )
+    else:
+        genesis_params = GENESIS_PARAMS
+
+    chain_class = build(
+        MiningChain,
+        fork_at(vm, constants.GENESIS_BLOCK_NUMBER),
+        disable_pow_check(),
+    )
+    if trusted:
+        chain_class = trust_inputs(chain_class)
+
+    return build(
+        chain_class,
+        genesis(db=AtomicDB(), params=genesis_params, state=genesis_state),
+    )
+
+
+def get_all_chains(
+    genesis_state: GenesisState = DEFAULT_GENESIS_STATE,
+    trusted: bool = False,
+) -> Iterable[MiningChain]:
+    """
+    Yield a fresh chain for each mainnet fork. Pass ``trusted=True`` to skip
+    re-validating inputs inside the VM, see
+    :func:`~eth.tools.builder.chain.trust_inputs`.
+    """
+    for vm in ALL_VM:
+        yield get_chain(vm, genesis_state, trusted)
@@ -120,3 +120,47 @@ def print_default_benchmark_total_line(stat: DefaultStat) -> None:
 def print_final_benchmark_total_line(stat: DefaultStat) -> None:
     logging.info(HASH_UNDERLINE + "\n")
     print_default_benchmark_total_line(stat)
+
+
+class MicroStat(NamedTuple):
+    caption: str = ""
+    total_ops: int = 0
+    total_seconds: float = 0
+
+    @property
+    def ops_per_second(self) -> float:
+        return self.total_ops / self.total_seconds
+
+    @property
+    def microseconds_per_op(self) -> float:
+        return self.total_seconds * 1e6 / self.total_ops
+
+
+MICRO_REPORT_TABLE_LENGTH = 88
+MICRO_SINGLE_UNDERLINE = "-" * MICRO_REPORT_TABLE_LENGTH
+MICRO_DOUBLE_UNDERLINE = "=" * MICRO_REPORT_TABLE_LENGTH
+
+
+def print_micro_benchmark_result_header() -> None:
+    logging.info(MICRO_SINGLE_UNDERLINE)
+    logging.info(
+        bold_white(
+            f"|{'variant':^31}|{'total seconds':^16}|{'total ops':^12}"
+            f"|{'ops / second':^12}|{'µs / op':^11}|"
+        )
+    )
+    logging.info(MICRO_SINGLE_UNDERLINE)
+
+
+def print_micro_benchmark_stat_line(stat: MicroStat) -> None:
+    logging.info(
+        f"|{stat.caption:^31}"
+        f"|{stat.total_seconds:^16.3f}"
+        f"|{stat.total_ops:^12}"
+        f"|{stat.ops_per_second:^12,.0f}"
+        f"|{stat.microseconds_per_op:^11,.2f}|"
+    )
+
+
+def print_micro_benchmark_total_line() -> None:
+    logging.info(MICRO_DOUBLE_UNDERLINE + "\n")
@@ -0,0 +1,69 @@
+from typing import (
+    Callable,
+    Dict,
+)
+
+from eth_typing import (
+    Address,
+)
+
+from eth.db.account import (
+    AccountDB,
+)
+from eth.db.atomic import (
+    AtomicDB,
+)
+
+from .base_benchmark import (
+    BaseMicroBenchmark,
+)
+
+
+def _delta_balance(account_db: AccountDB, address: Address, delta: int) -> None:
+    account_db.set_balance(address, account_db.get_balance(address) + delta)
+
+
+class AccountUpdateBenchmark(BaseMicroBenchmark):
+    """
+    The account updates of simple value transfers: buy gas, bump the sender nonce,
+    move the value and pay the coinbase. The state root is only made once at the
+    end, to keep trie hashing from dominating the measurement.
+    """
+
+    def __init__(self, num_blocks: int = 20, txs_per_block: int = 500) -> None:
+        self.num_blocks = num_blocks
+        self.txs_per_block = txs_per_block
+
+    @property
+    def name(self) -> str:
+        return "Account balance and nonce updates"
+
+    def get_variants(self) -> Dict[str, Callable[[], int]]:
+        return {
+            "value transfers": self.value_transfers,
+        }
+
+    def value_transfers(self) -> int:
+        account_db = AccountDB(AtomicDB())
+        coinbase = Address(b"\xcc" * 20)
+        senders = [Address(idx.to_bytes(20, "big")) for idx in range(1, 101)]
+        recipients = [
+            Address(idx.to_bytes(20, "big")) for idx in range(1000, 1000 + 1000)
+        ]
+        for sender in senders:
+            account_db.set_balance(sender, 10**30)
+
+        for block_idx in range(self.num_blocks):
+            for tx_idx in range(self.txs_per_block):
+                sender = senders[tx_idx % len(senders)]
+                recipient = recipients[(block_idx + tx_idx) % len(recipients)]
+                checkpoint = account_db.record()
+                _delta_balance(account_db, sender, -21000)
+                account_db.increment_nonce(sender)
+                _delta_balance(account_db, sender, -1)
+                _delta_balance(account_db, recipient, 1)
+                _delta_balance(account_db, coinbase, 21000)
+                account_db.commit(checkpoint)
+                account_db.lock_changes()
+        account_db.make_state_root()
+        return self.num_blocks * self.txs_per_block
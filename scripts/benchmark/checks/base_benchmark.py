@@ -6,6 +6,8 @@ import logging
 from typing import (
     Any,
     Callable,
+    Dict,
+    Tuple,
 )
 
 from scripts.benchmark._utils.meters import (
@@ -14,9 +16,13 @@ from scripts.benchmark._utils.meters import (
 )
 from scripts.benchmark._utils.reporting import (
     DefaultStat,
+    MicroStat,
     print_default_benchmark_result_header,
     print_default_benchmark_stat_line,
     print_default_benchmark_total_line,
+    print_micro_benchmark_result_header,
+    print_micro_benchmark_stat_line,
+    print_micro_benchmark_total_line,
 )
 from scripts.benchmark._utils.shellart import (
     bold_yellow,
@@ -51,3 +57,39 @@ class BaseBenchmark(ABC):
 
     def as_timed_result(self, fn: Callable[..., Any] = None) -> TimedResult:
         return time_call(fn)
+
+
+class BaseMicroBenchmark(ABC):
+    """
+    Time a single operation across several implementations ("variants") of it, like
+    a reference implementation and an optimized one.
+    """
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        raise NotImplementedError("Must be implemented by subclasses")
+
+    @abstractmethod
+    def get_variants(self) -> Dict[str, Callable[[], int]]:
+        """
+        Return a mapping of variant name to a callable that runs the benchmarked
+        workload once, and returns the number of operations it performed.
+        """
+        raise NotImplementedError("Must be implemented by subclasses")
+
+    def run(self) -> Tuple[MicroStat, ...]:
+        logging.info(bold_yellow(f"Starting micro benchmark: {self.name}\n"))
+        print_micro_benchmark_result_header()
+        stats = []
+        for caption, workload in self.get_variants().items():
+            timed_result = time_call(workload)
+            stat = MicroStat(
+                caption=caption,
+                total_ops=timed_result.wrapped_value,
+                total_seconds=timed_result.duration,
+            )
+            print_micro_benchmark_stat_line(stat)
+            stats.append(stat)
+        print_micro_benchmark_total_line()
+        return tuple(stats)
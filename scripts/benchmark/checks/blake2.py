@@ -0,0 +1,82 @@
+from typing import (
+    Callable,
+    Dict,
+)
+
+from eth._utils.blake2.coders import (
+    extract_blake2b_parameters,
+)
+from eth._utils.blake2.compression import (
+    blake2b_compress,
+)
+
+from .base_benchmark import (
+    BaseMicroBenchmark,
+)
+
+try:
+    from blake2b import (
+        compress as native_blake2b_compress,
+    )
+except ImportError:
+    native_blake2b_compress = None
+
+# EIP-152 test vector 5, without its number of rounds
+EIP152_INPUT_WITHOUT_ROUNDS = bytes.fromhex(
+    "48c9bdf267e6096a3ba7ca8485ae67bb2bf894fe72f36e3cf1361d5f3af54fa5"
+    "d182e6ad7f520e511f6c3e2b8c68059b6bbd41fbabd9831f79217e1319cde05b"
+    "6162630000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0300000000000000000000000000000001"
+)
+
+
+class Blake2bBenchmark(BaseMicroBenchmark):
+    """
+    Run the BLAKE2b F function of the blake2b precompile with the 12 rounds of
+    BLAKE2b hashing, and with the many rounds that an EIP-152 call can pay for, with
+    the pure-Python implementation and the ``blake2b`` extension, if it is
+    installed. Operations are rounds.
+    """
+
+    def __init__(self, num_calls: int = 2000, num_rounds: int = 100000) -> None:
+        self.num_calls = num_calls
+        self.num_rounds = num_rounds
+
+    @property
+    def name(self) -> str:
+        return "BLAKE2b F function"
+
+    def get_variants(self) -> Dict[str, Callable[[], int]]:
+        variants = {
+            "Python, 12 rounds": self._make_variant(blake2b_compress, 12),
+            f"Python, {self.num_rounds} rounds": self._make_variant(
+                blake2b_compress, self.num_rounds
+            ),
+        }
+        if native_blake2b_compress is not None:
+            variants["blake2b, 12 rounds"] = self._make_variant(
+                native_blake2b_compress, 12
+            )
+            variants[f"blake2b, {self.num_rounds} rounds"] = self._make_variant(
+                native_blake2b_compress, self.num_rounds
+            )
+        return variants
+
+    def _make_variant(
+        self, compress: Callable[..., bytes], num_rounds: int
+    ) -> Callable[[], int]:
+        parameters = extract_blake2b_parameters(
+            num_rounds.to_bytes(4, "big") + EIP152_INPUT_WITHOUT_ROUNDS
+        )
+        # calls with many rounds take as long as many calls with few rounds
+        num_calls = max(1, self.num_calls * 12 // num_rounds)
+
+        def run_compress() -> int:
+            for _ in range(num_calls):
+                compress(*parameters)
+            return num_calls * num_rounds
+
+        return run_compress
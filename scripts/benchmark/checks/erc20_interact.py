@@ -56,11 +56,14 @@ W3_TX_DEFAULTS = {"gas": 0, "gasPrice": 0}
 
 
 class BaseERC20Benchmark(BaseBenchmark):
-    def __init__(self, num_blocks: int = 2, num_tx: int = 50) -> None:
+    def __init__(
+        self, num_blocks: int = 2, num_tx: int = 50, trust_inputs: bool = False
+    ) -> None:
         super().__init__()
 
         self.num_blocks = num_blocks
         self.num_tx = num_tx
+        self.trust_inputs = trust_inputs
         self.contract_interface = get_compiled_contract(
             pathlib.Path(CONTRACT_FILE), CONTRACT_NAME
         )
@@ -68,6 +71,12 @@ class BaseERC20Benchmark(BaseBenchmark):
         self.addr1 = Web3.toChecksumAddress(FUNDED_ADDRESS)
         self.addr2 = Web3.toChecksumAddress(SECOND_ADDRESS)
 
+    def _describe(self, name: str) -> str:
+        if self.trust_inputs:
+            return f"{name} (trusted inputs)"
+        else:
+            return name
+
     def _setup_benchmark(self, chain: MiningChain) -> None:
         """
         This hook can be overwritten to perform preparations on the chain
@@ -80,7 +89,7 @@ class BaseERC20Benchmark(BaseBenchmark):
 
     def execute(self) -> DefaultStat:
         total_stat = DefaultStat()
-        for chain in get_all_chains():
+        for chain in get_all_chains(trusted=self.trust_inputs):
             # Perform prepartions on the chain that do not count into the
             # benchmark time
             self._setup_benchmark(chain)
@@ -233,14 +242,14 @@ class BaseERC20Benchmark(BaseBenchmark):
 
 
 class ERC20DeployBenchmark(BaseERC20Benchmark):
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(self, trust_inputs: bool = False) -> None:
+        super().__init__(trust_inputs=trust_inputs)
         # Can only fit 2 deployments in a block
         self.num_tx = 2
 
     @property
     def name(self) -> str:
-        return "ERC20 deployment"
+        return self._describe("ERC20 deployment")
 
     def _setup_benchmark(self, chain: MiningChain) -> None:
         self._next_nonce = None
@@ -253,13 +262,13 @@ class ERC20DeployBenchmark(BaseERC20Benchmark):
 
 
 class ERC20TransferBenchmark(BaseERC20Benchmark):
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(self, trust_inputs: bool = False) -> None:
+        super().__init__(trust_inputs=trust_inputs)
         self._next_nonce = None
 
     @property
     def name(self) -> str:
-        return "ERC20 Transfer"
+        return self._describe("ERC20 Transfer")
 
     def _setup_benchmark(self, chain: MiningChain) -> None:
         self._next_nonce = None
@@ -278,12 +287,12 @@ class ERC20TransferBenchmark(BaseERC20Benchmark):
 
 
 class ERC20ApproveBenchmark(BaseERC20Benchmark):
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(self, trust_inputs: bool = False) -> None:
+        super().__init__(trust_inputs=trust_inputs)
 
     @property
     def name(self) -> str:
-        return "ERC20 Approve"
+        return self._describe("ERC20 Approve")
 
     def _setup_benchmark(self, chain: MiningChain) -> None:
         self._next_nonce = None
@@ -301,12 +310,12 @@ class ERC20ApproveBenchmark(BaseERC20Benchmark):
 
 
 class ERC20TransferFromBenchmark(BaseERC20Benchmark):
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(self, trust_inputs: bool = False) -> None:
+        super().__init__(trust_inputs=trust_inputs)
 
     @property
     def name(self) -> str:
-        return "ERC20 TransferFrom"
+        return self._describe("ERC20 TransferFrom")
 
     def _setup_benchmark(self, chain: MiningChain) -> None:
         self._next_nonce = None
@@ -0,0 +1,142 @@
+import functools
+from pathlib import (
+    Path,
+)
+from types import (
+    ModuleType,
+)
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Tuple,
+)
+
+from eth_utils import (
+    ValidationError,
+    decode_hex,
+    encode_hex,
+)
+import rlp
+
+from eth.abc import (
+    BlockHeaderAPI,
+)
+from eth.consensus import (
+    ethash,
+)
+from eth.consensus.pow import (
+    get_dataset,
+)
+from eth.rlp.headers import (
+    BlockHeader,
+)
+
+from .base_benchmark import (
+    BaseMicroBenchmark,
+)
+
+try:
+    from eth.consensus import (
+        ethash_numpy,
+    )
+except ImportError:
+    ethash_numpy = None
+
+ROPSTEN_EPOCH_HEADERS_PATH = (
+    Path(__file__).parents[3] / "tests" / "rlp-fixtures" / "ropston_epoch_headers.rlp"
+)
+
+
+def load_ropsten_epoch_headers() -> Tuple[BlockHeaderAPI, ...]:
+    with open(ROPSTEN_EPOCH_HEADERS_PATH) as fixture_file:
+        return tuple(
+            rlp.decode(decode_hex(line.strip()), sedes=BlockHeader)
+            for line in fixture_file
+            if not line.startswith("#")
+        )
+
+
+class EthashBenchmark(BaseMicroBenchmark):
+    """
+    Generate the epoch cache of the first ropsten epoch header, and check its proof
+    of work, with the pure-Python reference implementation of Ethash, and with the
+    NumPy one, if it is installed.
+
+    Each implementation's proof-of-work checks use the cache that it generated.
+    With NumPy, also time the generation of part of the full dataset, and if the
+    full dataset of the epoch was generated in ``ETHASH_CACHE_DIR``, with
+    :func:`~eth.consensus.pow.generate_dataset`, time the checks against it.
+    """
+
+    def __init__(self, num_checks: int = 10, num_dataset_items: int = 2**14) -> None:
+        self.num_checks = num_checks
+        self.num_dataset_items = num_dataset_items
+        self.header = load_ropsten_epoch_headers()[0]
+        self._caches: Dict[str, Any] = {}
+
+    @property
+    def name(self) -> str:
+        return "Ethash cache generation and proof-of-work check"
+
+    def get_variants(self) -> Dict[str, Callable[[], int]]:
+        implementations = {"pure Python": ethash}
+        if ethash_numpy is not None:
+            implementations["NumPy"] = ethash_numpy
+
+        variants = {}
+        for caption, implementation in implementations.items():
+            variants[f"mkcache, {caption}"] = functools.partial(
+                self._make_cache, caption, implementation
+            )
+        for caption, implementation in implementations.items():
+            variants[f"hashimoto_light, {caption}"] = functools.partial(
+                self._check_pow, caption, implementation
+            )
+
+        if ethash_numpy is not None:
+            variants["dataset items, NumPy"] = self._fill_dataset
+            dataset = get_dataset(self.header.block_number)
+            if dataset is not None:
+                variants["hashimoto, full dataset"] = functools.partial(
+                    self._check_pow_with_dataset, dataset
+                )
+        return variants
+
+    def _make_cache(self, caption: str, implementation: ModuleType) -> int:
+        self._caches[caption] = implementation.mkcache(self.header.block_number)
+        return 1
+
+    def _check_pow(self, caption: str, implementation: ModuleType) -> int:
+        header = self.header
+        full_size = ethash.get_dataset_full_size(header.block_number)
+        for _ in range(self.num_checks):
+            mining_output = implementation.hashimoto_light(
+                full_size, self._caches[caption], header.mining_hash, header.nonce
+            )
+            self._validate_mix_digest(caption, mining_output["mix_digest"])
+        return self.num_checks
+
+    def _fill_dataset(self) -> int:
+        buffer = bytearray(self.num_dataset_items * ethash.HASH_BYTES)
+        ethash_numpy.fill_dataset(
+            buffer, self._caches["NumPy"], 0, self.num_dataset_items
+        )
+        return self.num_dataset_items
+
+    def _check_pow_with_dataset(self, dataset: Any) -> int:
+        header = self.header
+        full_size = ethash.get_dataset_full_size(header.block_number)
+        for _ in range(self.num_checks):
+            mining_output = ethash_numpy.hashimoto(
+                full_size, dataset, header.mining_hash, header.nonce
+            )
+            self._validate_mix_digest("full dataset", mining_output["mix_digest"])
+        return self.num_checks
+
+    def _validate_mix_digest(self, caption: str, mix_digest: bytes) -> None:
+        if mix_digest != self.header.mix_hash:
+            raise ValidationError(
+                f"{caption} Ethash computed the mix hash {encode_hex(mix_digest)} "
+                f"for {self.header}"
+            )
@@ -0,0 +1,82 @@
+from typing import (
+    Callable,
+    Dict,
+    Tuple,
+)
+
+from eth.abc import (
+    BlockHeaderAPI,
+)
+from eth.constants import (
+    GENESIS_DIFFICULTY,
+    GENESIS_GAS_LIMIT,
+)
+from eth.db.atomic import (
+    AtomicDB,
+)
+from eth.db.header import (
+    HeaderDB,
+)
+from eth.rlp.headers import (
+    BlockHeader,
+)
+
+from .base_benchmark import (
+    BaseMicroBenchmark,
+)
+
+
+def make_header_chain(length: int) -> Tuple[BlockHeaderAPI, ...]:
+    header = BlockHeader(
+        difficulty=GENESIS_DIFFICULTY,
+        block_number=0,
+        gas_limit=GENESIS_GAS_LIMIT,
+    )
+    headers = [header]
+    for block_number in range(1, length):
+        header = BlockHeader(
+            difficulty=GENESIS_DIFFICULTY,
+            block_number=block_number,
+            gas_limit=GENESIS_GAS_LIMIT,
+            parent_hash=header.hash,
+            timestamp=block_number,
+        )
+        headers.append(header)
+    return tuple(headers)
+
+
+class HeaderImportBenchmark(BaseMicroBenchmark):
+    """
+    Import a chain of headers that extends the canonical chain, as header-first sync
+    does, one header at a time, and as a stream of segments.
+    """
+
+    def __init__(self, num_headers: int = 20000) -> None:
+        self.headers = make_header_chain(num_headers)
+
+    @property
+    def name(self) -> str:
+        return "Header chain import"
+
+    def get_variants(self) -> Dict[str, Callable[[], int]]:
+        return {
+            "persist_header, one at a time": self._persist_headers,
+            "persist_header_stream": self._persist_header_stream,
+        }
+
+    def _persist_headers(self) -> int:
+        headerdb = HeaderDB(AtomicDB())
+        for header in self.headers:
+            headerdb.persist_header(header)
+        self._validate_head(headerdb)
+        return len(self.headers)
+
+    def _persist_header_stream(self) -> int:
+        headerdb = HeaderDB(AtomicDB())
+        headerdb.persist_header_stream(iter(self.headers))
+        self._validate_head(headerdb)
+        return len(self.headers)
+
+    def _validate_head(self, headerdb: HeaderDB) -> None:
+        if headerdb.get_canonical_head() != self.headers[-1]:
+            raise AssertionError("The last imported header is not the canonical head")
@@ -19,17 +19,21 @@ from .base_benchmark import (
 
 
 class ImportEmptyBlocksBenchmark(BaseBenchmark):
-    def __init__(self, num_blocks: int = 500) -> None:
+    def __init__(self, num_blocks: int = 500, trust_inputs: bool = False) -> None:
         self.num_blocks = num_blocks
+        self.trust_inputs = trust_inputs
 
     @property
     def name(self) -> str:
-        return "Empty block import"
+        if self.trust_inputs:
+            return "Empty block import (trusted inputs)"
+        else:
+            return "Empty block import"
 
     def execute(self) -> DefaultStat:
         total_stat = DefaultStat()
 
-        for chain in get_all_chains():
+        for chain in get_all_chains(trusted=self.trust_inputs):
             val = self.as_timed_result(
                 lambda chain=chain: self.import_empty_blocks(chain, self.num_blocks)
             )
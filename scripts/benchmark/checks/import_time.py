@@ -0,0 +1,69 @@
+import subprocess
+import sys
+from typing import (
+    Callable,
+    Dict,
+    Tuple,
+)
+
+from .base_benchmark import (
+    BaseMicroBenchmark,
+)
+
+HEAVY_MODULES = ("py_ecc", "ckzg")
+
+# Modules to import, with the modules that importing them must not load
+IMPORT_CASES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("eth", ("eth.chains.base", "eth.vm.forks.frontier") + HEAVY_MODULES),
+    ("eth.db.atomic", ("eth.vm.forks.frontier",) + HEAVY_MODULES),
+    ("eth.vm.forks.frontier", ("eth.vm.forks.byzantium",) + HEAVY_MODULES),
+    ("eth.vm.forks.prague", HEAVY_MODULES),
+    ("eth.chains.mainnet", HEAVY_MODULES),
+)
+
+CHECK_LOADED_MODULES = """
+import sys
+import {module}
+print(" ".join(name for name in {unexpected!r} if name in sys.modules))
+"""
+
+
+class ImportTimeBenchmark(BaseMicroBenchmark):
+    """
+    Import modules of py-evm in new interpreters, including the time the interpreter
+    takes to start, which the ``python`` variant measures alone. Raise if an import
+    loads a module that it should only load when it is first used, like the
+    cryptography libraries of the precompiles.
+    """
+
+    def __init__(self, num_imports: int = 5) -> None:
+        self.num_imports = num_imports
+
+    @property
+    def name(self) -> str:
+        return "Import time"
+
+    def get_variants(self) -> Dict[str, Callable[[], int]]:
+        variants = {"python": self._make_variant("sys", ())}
+        for module, unexpected in IMPORT_CASES:
+            variants[f"import {module}"] = self._make_variant(module, unexpected)
+        return variants
+
+    def _make_variant(
+        self, module: str, unexpected: Tuple[str, ...]
+    ) -> Callable[[], int]:
+        code = CHECK_LOADED_MODULES.format(module=module, unexpected=unexpected)
+
+        def run_imports() -> int:
+            for _ in range(self.num_imports):
+                loaded = subprocess.run(
+                    [sys.executable, "-c", code],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                ).stdout.split()
+                if loaded:
+                    raise RuntimeError(f"Importing {module} loaded {', '.join(loaded)}")
+            return self.num_imports
+
+        return run_imports
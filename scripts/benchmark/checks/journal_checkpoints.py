@@ -0,0 +1,78 @@
+from typing import (
+    Callable,
+    Dict,
+    Type,
+)
+
+from eth.db.backends.memory import (
+    MemoryDB,
+)
+from eth.db.journal import (
+    JournalDB,
+    UndoLogJournalDB,
+)
+
+from .base_benchmark import (
+    BaseMicroBenchmark,
+)
+
+
+class JournalCheckpointBenchmark(BaseMicroBenchmark):
+    """
+    Mimic a deep call stack: every frame records a checkpoint, writes a few storage
+    keys, calls into the next frame, and then commits (or, every
+    ``discard_every`` frames, discards) its checkpoint.
+    """
+
+    def __init__(
+        self,
+        num_rounds: int = 200,
+        call_depth: int = 64,
+        writes_per_frame: int = 16,
+        discard_every: int = 8,
+    ) -> None:
+        self.num_rounds = num_rounds
+        self.call_depth = call_depth
+        self.writes_per_frame = writes_per_frame
+        self.discard_every = discard_every
+
+    @property
+    def name(self) -> str:
+        return "Journal checkpoints in deep call stacks"
+
+    def get_variants(self) -> Dict[str, Callable[[], int]]:
+        expected_diff = self._run_call_stacks(JournalDB).diff()
+        actual_diff = self._run_call_stacks(UndoLogJournalDB).diff()
+        if expected_diff != actual_diff:
+            raise AssertionError("UndoLogJournalDB diverged from JournalDB")
+
+        return {
+            "JournalDB": lambda: self._count_ops(JournalDB),
+            "UndoLogJournalDB": lambda: self._count_ops(UndoLogJournalDB),
+        }
+
+    def _count_ops(self, journal_db_class: Type[JournalDB]) -> int:
+        self._run_call_stacks(journal_db_class)
+        return self.num_rounds * self.call_depth
+
+    def _run_call_stacks(self, journal_db_class: Type[JournalDB]) -> JournalDB:
+        journal_db = journal_db_class(MemoryDB())
+        for round_idx in range(self.num_rounds):
+            self._call(journal_db, round_idx, 0)
+        return journal_db
+
+    def _call(self, journal_db: JournalDB, round_idx: int, depth: int) -> None:
+        if depth == self.call_depth:
+            return
+
+        checkpoint = journal_db.record()
+        for write_idx in range(self.writes_per_frame):
+            key = (depth * self.writes_per_frame + write_idx).to_bytes(32, "big")
+            journal_db[key] = round_idx.to_bytes(32, "big")
+
+        self._call(journal_db, round_idx, depth + 1)
+
+        if depth % self.discard_every == self.discard_every - 1:
+            journal_db.discard(checkpoint)
+        else:
+            journal_db.commit(checkpoint)
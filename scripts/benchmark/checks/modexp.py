@@ -0,0 +1,132 @@
+from typing import (
+    Callable,
+    Dict,
+    Tuple,
+)
+
+from eth._utils.address import (
+    force_bytes_to_address,
+)
+from eth.precompiles.backends import (
+    run_precompile,
+)
+from eth.precompiles.modexp import (
+    extract_lengths,
+    read_padded_int,
+)
+from eth.vm.computation import (
+    BaseComputation,
+)
+from eth.vm.forks.berlin.computation import (
+    _compute_modexp_gas_fee_eip_2565,
+)
+from eth.vm.forks.prague.computation import (
+    PragueComputation,
+)
+
+from .base_benchmark import (
+    BaseMicroBenchmark,
+)
+
+try:
+    import gmpy2
+except ImportError:
+    gmpy2 = None
+
+MODEXP_ADDRESS = force_bytes_to_address(b"\x05")
+
+
+def encode_modexp_input(base: bytes, exponent: bytes, modulus: bytes) -> bytes:
+    return (
+        len(base).to_bytes(32, "big")
+        + len(exponent).to_bytes(32, "big")
+        + len(modulus).to_bytes(32, "big")
+        + base
+        + exponent
+        + modulus
+    )
+
+
+# Inputs that take the longest to run for the gas that EIP-2565 charges them: large
+# odd moduli with short exponents, and the longest exponents that stay cheap
+EIP_2565_WORST_CASES: Tuple[Tuple[str, bytes], ...] = (
+    (
+        "512-byte modulus, exponent 0x10001",
+        encode_modexp_input(b"\xfe" * 512, b"\x01\x00\x01", b"\xff" * 512),
+    ),
+    (
+        "512-byte modulus, exponent 3",
+        encode_modexp_input(b"\xfe" * 512, b"\x03", b"\xff" * 512),
+    ),
+    (
+        "256-byte modulus, 32-byte exponent",
+        encode_modexp_input(b"\xfe" * 256, b"\xff" * 32, b"\xff" * 256),
+    ),
+    (
+        "32-byte modulus, 32-byte exponent",
+        encode_modexp_input(b"\xfe" * 32, b"\xff" * 32, b"\xff" * 32),
+    ),
+    (
+        "8-byte modulus, 128-byte exponent",
+        encode_modexp_input(b"\xfe" * 8, b"\xff" * 128, b"\xff" * 8),
+    ),
+)
+
+
+class ModexpBenchmark(BaseMicroBenchmark):
+    """
+    Run the modexp precompile of Prague with the inputs that are slowest for the gas
+    that they pay, and only their exponentiation, with the builtin ``pow`` and with
+    ``gmpy2``, if it is installed.
+    """
+
+    def __init__(self, num_calls: int = 50) -> None:
+        self.num_calls = num_calls
+
+    @property
+    def name(self) -> str:
+        return "MODEXP worst cases"
+
+    def get_variants(self) -> Dict[str, Callable[[], int]]:
+        powmods: Dict[str, Callable[[int, int, int], int]] = {"pow": pow}
+        if gmpy2 is not None:
+            powmods["gmpy2"] = gmpy2.powmod
+
+        variants = {}
+        for case_name, data in EIP_2565_WORST_CASES:
+            gas = _compute_modexp_gas_fee_eip_2565(data)
+            variants[
+                f"precompile, {case_name} ({gas} gas)"
+            ] = self._make_precompile_variant(data)
+            for powmod_name, powmod in powmods.items():
+                variants[f"{powmod_name}, {case_name}"] = self._make_powmod_variant(
+                    data, powmod
+                )
+        return variants
+
+    def _make_precompile_variant(self, data: bytes) -> Callable[[], int]:
+        precompile = PragueComputation.get_precompiles()[MODEXP_ADDRESS]
+
+        def run_modexp() -> int:
+            for _ in range(self.num_calls):
+                run_precompile(BaseComputation, precompile, data, MODEXP_ADDRESS)
+            return self.num_calls
+
+        return run_modexp
+
+    def _make_powmod_variant(
+        self, data: bytes, powmod: Callable[[int, int, int], int]
+    ) -> Callable[[], int]:
+        base_length, exponent_length, modulus_length = extract_lengths(data)
+        base = read_padded_int(data, 96, base_length)
+        exponent = read_padded_int(data, 96 + base_length, exponent_length)
+        modulus = read_padded_int(
+            data, 96 + base_length + exponent_length, modulus_length
+        )
+
+        def run_powmod() -> int:
+            for _ in range(self.num_calls):
+                powmod(base, exponent, modulus)
+            return self.num_calls
+
+        return run_powmod
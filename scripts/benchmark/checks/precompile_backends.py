@@ -0,0 +1,68 @@
+from typing import (
+    Callable,
+    Dict,
+)
+
+from eth_typing import (
+    Address,
+)
+
+from eth.precompiles.backends import (
+    Precompile,
+    get_precompile_backend,
+    get_precompile_backend_names,
+    get_self_test_inputs,
+    run_precompile,
+)
+from eth.vm.computation import (
+    BaseComputation,
+)
+from eth.vm.forks.prague.computation import (
+    PragueComputation,
+)
+
+from .base_benchmark import (
+    BaseMicroBenchmark,
+)
+
+
+class PrecompileBackendBenchmark(BaseMicroBenchmark):
+    """
+    Run the self-test inputs of the Prague precompiles with their reference
+    implementation, and with each registered backend that implements them.
+    """
+
+    def __init__(self, num_rounds: int = 3) -> None:
+        self.num_rounds = num_rounds
+
+    @property
+    def name(self) -> str:
+        return "Precompile backends"
+
+    def get_variants(self) -> Dict[str, Callable[[], int]]:
+        reference_precompiles = PragueComputation.get_precompiles()
+        variants = {}
+        for address, precompile in reference_precompiles.items():
+            variants[f"reference {precompile.__name__}"] = self._make_variant(
+                address, precompile
+            )
+            for backend_name in get_precompile_backend_names():
+                backend = get_precompile_backend(backend_name)
+                if address in backend:
+                    variants[
+                        f"{backend_name} {precompile.__name__}"
+                    ] = self._make_variant(address, backend[address])
+        return variants
+
+    def _make_variant(
+        self, address: Address, precompile: Precompile
+    ) -> Callable[[], int]:
+        inputs = get_self_test_inputs(address)
+
+        def run_inputs() -> int:
+            for _ in range(self.num_rounds):
+                for data in inputs:
+                    run_precompile(BaseComputation, precompile, data, address)
+            return self.num_rounds * len(inputs)
+
+        return run_inputs
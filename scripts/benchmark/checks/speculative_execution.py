@@ -0,0 +1,173 @@
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+)
+import functools
+from typing import (
+    Callable,
+    Dict,
+    Tuple,
+)
+
+from eth_keys import (
+    keys,
+)
+from eth_typing import (
+    Address,
+)
+from eth_utils import (
+    to_wei,
+)
+from eth_utils.toolz import (
+    merge,
+)
+import rlp
+
+from eth.abc import (
+    BlockAPI,
+)
+from eth.chains.base import (
+    MiningChain,
+)
+from eth.db.atomic import (
+    AtomicDB,
+)
+from eth.tools.builder.chain import (
+    build,
+    disable_pow_check,
+    enable_speculative_execution,
+    fork_at,
+    genesis,
+)
+from eth.vm.forks import (
+    LondonVM,
+)
+from scripts.benchmark._utils.chain_plumbing import (
+    GENESIS_PARAMS,
+)
+from scripts.benchmark._utils.reporting import (
+    MicroStat,
+)
+from tests.tools.factories.transaction import (
+    new_transaction,
+)
+
+from .base_benchmark import (
+    BaseMicroBenchmark,
+)
+
+CONTRACT_ADDRESS = Address(b"\x77" * 20)
+
+# every chain must have the same genesis, to import the same block
+SPECULATION_GENESIS_PARAMS = merge(GENESIS_PARAMS, {"timestamp": 1501851927})
+
+# Count down from the initial stack value to zero, without touching any state
+LOOP_CODE = bytes(
+    [
+        0x5B,  # JUMPDEST (offset 0x03 after the initial PUSH2)
+        0x60,  # PUSH1 1
+        0x01,
+        0x90,  # SWAP1
+        0x03,  # SUB
+        0x80,  # DUP1
+        0x60,  # PUSH1 3
+        0x03,
+        0x57,  # JUMPI
+        0x00,  # STOP
+    ]
+)
+
+
+class SpeculativeExecutionBenchmark(BaseMicroBenchmark):
+    """
+    Import a block of independent, computation-heavy contract calls, one per
+    sender, in order, and with speculative execution in worker processes. Each
+    call only runs a loop, so the speculative results are always reused.
+
+    Speculating runs the calls in parallel, so it only pays off with several CPUs.
+    """
+
+    def __init__(
+        self,
+        num_transactions: int = 16,
+        iterations_per_call: int = 2000,
+        num_workers: int = 4,
+    ) -> None:
+        self.num_transactions = num_transactions
+        self.iterations_per_call = iterations_per_call
+        self.num_workers = num_workers
+        self._sender_keys = [
+            keys.PrivateKey(index.to_bytes(32, "big"))
+            for index in range(1, num_transactions + 1)
+        ]
+
+    @property
+    def name(self) -> str:
+        return "Block import with speculative execution"
+
+    def run(self) -> Tuple[MicroStat, ...]:
+        with ProcessPoolExecutor(self.num_workers) as executor:
+            # start the workers ahead of time, so that isn't measured
+            list(executor.map(abs, range(self.num_workers)))
+            self._executor = executor
+            return super().run()
+
+    def get_variants(self) -> Dict[str, Callable[[], int]]:
+        block = self._mine_block()
+        in_order_chain = self._new_chain()
+        speculative_chain = self._new_chain(self._executor)
+        return {
+            "in order": functools.partial(self._import_block, in_order_chain, block),
+            f"speculative, {self.num_workers} processes": functools.partial(
+                self._import_block, speculative_chain, block
+            ),
+        }
+
+    def _new_chain(self, executor: Executor = None) -> MiningChain:
+        code = bytes([0x61]) + self.iterations_per_call.to_bytes(2, "big") + LOOP_CODE
+        genesis_state = {
+            key.public_key.to_canonical_address(): {
+                "balance": to_wei(10, "ether"),
+                "nonce": 0,
+                "code": b"",
+                "storage": {},
+            }
+            for key in self._sender_keys
+        }
+        genesis_state[CONTRACT_ADDRESS] = {
+            "balance": 0,
+            "nonce": 0,
+            "code": code,
+            "storage": {},
+        }
+
+        chain_class = build(MiningChain, fork_at(LondonVM, 0), disable_pow_check())
+        if executor is not None:
+            chain_class = enable_speculative_execution(executor, chain_class)
+        return build(
+            chain_class,
+            genesis(
+                db=AtomicDB(), params=SPECULATION_GENESIS_PARAMS, state=genesis_state
+            ),
+        )
+
+    def _mine_block(self) -> BlockAPI:
+        chain = self._new_chain()
+        vm = chain.get_vm()
+        transactions = [
+            new_transaction(
+                vm,
+                key.public_key.to_canonical_address(),
+                CONTRACT_ADDRESS,
+                private_key=key,
+                gas=200_000,
+            )
+            for key in self._sender_keys
+        ]
+        import_result, _, _ = chain.mine_all(transactions)
+        return import_result.imported_block
+
+    def _import_block(self, chain: MiningChain, block: BlockAPI) -> int:
+        fresh_block = rlp.decode(rlp.encode(block), sedes=type(block))
+        chain.import_block(fresh_block)
+        return len(block.transactions)
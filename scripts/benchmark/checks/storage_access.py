@@ -0,0 +1,84 @@
+from typing import (
+    Callable,
+    Dict,
+)
+
+from eth_typing import (
+    Address,
+)
+
+from eth.db.account import (
+    AccountDB,
+)
+from eth.db.atomic import (
+    AtomicDB,
+)
+
+from .base_benchmark import (
+    BaseMicroBenchmark,
+)
+
+STORAGE_ADDRESS = Address(b"\x55" * 20)
+
+
+class StorageAccessBenchmark(BaseMicroBenchmark):
+    """
+    SLOAD/SSTORE-heavy access to a single account's storage, with a checkpoint per
+    simulated transaction, and a state root calculation at the end of each block.
+    """
+
+    def __init__(
+        self,
+        num_blocks: int = 20,
+        txs_per_block: int = 20,
+        slots_per_tx: int = 100,
+        reads_per_slot: int = 4,
+    ) -> None:
+        self.num_blocks = num_blocks
+        self.txs_per_block = txs_per_block
+        self.slots_per_tx = slots_per_tx
+        self.reads_per_slot = reads_per_slot
+
+    @property
+    def name(self) -> str:
+        return "Account storage SLOAD/SSTORE"
+
+    def get_variants(self) -> Dict[str, Callable[[], int]]:
+        return {
+            "SSTORE + SLOAD, warm slots": self.sload_sstore,
+            "SLOAD, persisted slots": self.sload_persisted,
+        }
+
+    def _num_txs(self) -> int:
+        return self.num_blocks * self.txs_per_block
+
+    def sload_sstore(self) -> int:
+        account_db = AccountDB(AtomicDB())
+        for block_idx in range(self.num_blocks):
+            for tx_idx in range(self.txs_per_block):
+                checkpoint = account_db.record()
+                for slot in range(self.slots_per_tx):
+                    for _ in range(self.reads_per_slot):
+                        account_db.get_storage(STORAGE_ADDRESS, slot)
+                    account_db.set_storage(
+                        STORAGE_ADDRESS, slot, block_idx * tx_idx + slot + 1
+                    )
+                account_db.commit(checkpoint)
+                account_db.lock_changes()
+            account_db.make_state_root()
+        return self._num_txs() * self.slots_per_tx * (self.reads_per_slot + 1)
+
+    def sload_persisted(self) -> int:
+        db = AtomicDB()
+        setup_db = AccountDB(db)
+        for slot in range(self.slots_per_tx):
+            setup_db.set_storage(STORAGE_ADDRESS, slot, slot + 1)
+        setup_db.persist()
+
+        account_db = AccountDB(db, setup_db.state_root)
+        for _ in range(self._num_txs()):
+            for slot in range(self.slots_per_tx):
+                for _ in range(self.reads_per_slot):
+                    account_db.get_storage(STORAGE_ADDRESS, slot)
+            account_db.lock_changes()
+        return self._num_txs() * self.slots_per_tx * self.reads_per_slot
@@ -0,0 +1,103 @@
+from typing import (
+    Callable,
+    Dict,
+)
+
+from eth_typing import (
+    Address,
+)
+
+from eth.vm.forks import (
+    CancunVM,
+)
+from eth.vm.message import (
+    Message,
+)
+from scripts.benchmark._utils.chain_plumbing import (
+    DEFAULT_GENESIS_STATE,
+    FUNDED_ADDRESS,
+    get_chain,
+)
+
+from .base_benchmark import (
+    BaseMicroBenchmark,
+)
+
+CONTRACT_ADDRESS = Address(b"\x66" * 20)
+
+# Count down from the initial stack value, and for each counter value ``n``:
+# SSTORE and SLOAD slot ``n``, MSTORE at offset ``n`` and emit it with LOG0
+LOOP_CODE = bytes(
+    [
+        0x5B,  # JUMPDEST (offset 0x03 after the initial PUSH2)
+        0x80,  # DUP1
+        0x80,  # DUP1
+        0x55,  # SSTORE
+        0x80,  # DUP1
+        0x54,  # SLOAD
+        0x50,  # POP
+        0x80,  # DUP1
+        0x80,  # DUP1
+        0x52,  # MSTORE
+        0x60,  # PUSH1 32
+        0x20,
+        0x81,  # DUP2
+        0xA0,  # LOG0
+        0x60,  # PUSH1 1
+        0x01,
+        0x90,  # SWAP1
+        0x03,  # SUB
+        0x80,  # DUP1
+        0x60,  # PUSH1 3
+        0x03,
+        0x57,  # JUMPI
+        0x00,  # STOP
+    ]
+)
+
+
+class TrustedInputsBenchmark(BaseMicroBenchmark):
+    """
+    Run a contract loop of SSTORE, SLOAD, MSTORE and LOG0 in a Cancun VM, with and
+    without :func:`~eth.tools.builder.chain.trust_inputs`.
+    """
+
+    def __init__(self, num_calls: int = 50, iterations_per_call: int = 200) -> None:
+        self.num_calls = num_calls
+        self.iterations_per_call = iterations_per_call
+
+    @property
+    def name(self) -> str:
+        return "Contract execution with trusted inputs"
+
+    def get_variants(self) -> Dict[str, Callable[[], int]]:
+        return {
+            "validated inputs": lambda: self._run_calls(trusted=False),
+            "trusted inputs": lambda: self._run_calls(trusted=True),
+        }
+
+    def _run_calls(self, trusted: bool) -> int:
+        chain = get_chain(CancunVM, DEFAULT_GENESIS_STATE, trusted)
+        state = chain.get_vm().state
+        code = bytes([0x61]) + self.iterations_per_call.to_bytes(2, "big") + LOOP_CODE
+        state.set_code(CONTRACT_ADDRESS, code)
+
+        for _ in range(self.num_calls):
+            message = Message(
+                gas=10_000_000,
+                to=CONTRACT_ADDRESS,
+                sender=FUNDED_ADDRESS,
+                value=0,
+                data=b"",
+                code=code,
+            )
+            transaction_context = state.get_transaction_context_class()(
+                gas_price=0,
+                origin=FUNDED_ADDRESS,
+            )
+            computation = state.computation_class.apply_message(
+                state, message, transaction_context
+            )
+            computation.raise_if_error()
+
+        return self.num_calls * self.iterations_per_call
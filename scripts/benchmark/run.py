@@ -74,12 +74,15 @@ def run() -> None:
     benchmarks = [
         MineEmptyBlocksBenchmark(),
         ImportEmptyBlocksBenchmark(),
+        ImportEmptyBlocksBenchmark(trust_inputs=True),
         SimpleValueTransferBenchmark(TO_EXISTING_ADDRESS_CONFIG),
         SimpleValueTransferBenchmark(TO_NON_EXISTING_ADDRESS_CONFIG),
         ERC20DeployBenchmark(),
         ERC20TransferBenchmark(),
         ERC20ApproveBenchmark(),
         ERC20TransferFromBenchmark(),
+        ERC20TransferBenchmark(trust_inputs=True),
+        ERC20TransferFromBenchmark(trust_inputs=True),
         DOSContractDeployBenchmark(),
         DOSContractSstoreUint64Benchmark(),
         DOSContractCreateEmptyContractBenchmark(),
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+
+import logging
+import sys
+
+from checks.account_access import (
+    AccountUpdateBenchmark,
+)
+from checks.blake2 import (
+    Blake2bBenchmark,
+)
+from checks.ethash import (
+    EthashBenchmark,
+)
+from checks.header_import import (
+    HeaderImportBenchmark,
+)
+from checks.import_time import (
+    ImportTimeBenchmark,
+)
+from checks.journal_checkpoints import (
+    JournalCheckpointBenchmark,
+)
+from checks.modexp import (
+    ModexpBenchmark,
+)
+from checks.precompile_backends import (
+    PrecompileBackendBenchmark,
+)
+from checks.speculative_execution import (
+    SpeculativeExecutionBenchmark,
+)
+from checks.storage_access import (
+    StorageAccessBenchmark,
+)
+from checks.trusted_inputs import (
+    TrustedInputsBenchmark,
+)
+
+from eth._utils.version import (
+    construct_evm_runtime_identifier,
+)
+
+
+def run() -> None:
+    """
+    Run the micro benchmarks, which compare alternative implementations of a single
+    operation. Pass benchmark class names as arguments to only run those.
+    """
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logging.info(construct_evm_runtime_identifier() + "\n")
+
+    benchmarks = [
+        JournalCheckpointBenchmark(),
+        StorageAccessBenchmark(),
+        AccountUpdateBenchmark(),
+        TrustedInputsBenchmark(),
+        SpeculativeExecutionBenchmark(),
+        EthashBenchmark(),
+        HeaderImportBenchmark(),
+        PrecompileBackendBenchmark(),
+        Blake2bBenchmark(),
+        ModexpBenchmark(),
+        ImportTimeBenchmark(),
+    ]
+
+    selected = set(sys.argv[1:])
+    for benchmark in benchmarks:
+        if not selected or type(benchmark).__name__ in selected:
+            benchmark.run()
+
+
+if __name__ == "__main__":
+    run()
@@ -46,6 +46,7 @@ extras_require = {
     "eth-extra": [
         "blake2b-py>=0.2.0",
         "coincurve>=18.0.0",
+        "numpy>=1.22.0",
     ],
     "test": [
         "factory-boy>=3.0.0",
@@ -35,6 +35,7 @@ from eth.tools.builder.chain import (
     shanghai_at,
     spurious_dragon_at,
     tangerine_whistle_at,
+    trust_inputs,
 )
 from eth.tools.builder.chain.builders import (
     prague_at,
@@ -192,3 +193,37 @@ def test_chain_builder_chain_id():
         chain_id(1234),
     )
     assert chain.chain_id == 1234
+
+
+@pytest.mark.parametrize("fork_fn", (frontier_at, cancun_at))
+def test_chain_builder_trust_inputs(fork_fn):
+    chain_class = build(MiningChain, fork_fn(0), trust_inputs())
+    ((_, vm_class),) = chain_class.vm_configuration
+    state_class = vm_class.get_state_class()
+    computation_class = state_class.computation_class
+
+    assert state_class.get_account_db_class().validate_inputs is False
+    assert computation_class.validate_inputs is False
+    assert computation_class._memory_class.validate_inputs is False
+    assert vars(computation_class._memory_class)["__slots__"] == ()
+    if hasattr(state_class, "_transient_storage_class"):
+        assert state_class._transient_storage_class.validate_inputs is False
+
+    # the original classes are left untouched
+    original_state_class = (
+        build(MiningChain, fork_fn(0)).vm_configuration[0][1].get_state_class()
+    )
+    assert original_state_class.get_account_db_class().validate_inputs is True
+    assert original_state_class.computation_class.validate_inputs is True
+
+
+def test_chain_builder_trust_inputs_mines_blocks():
+    chain = build(
+        MiningChain,
+        frontier_at(0),
+        disable_pow_check(),
+        trust_inputs(),
+        genesis(),
+    )
+    block = chain.mine_block()
+    assert block.number == 1
@@ -0,0 +1,217 @@
+import pytest
+from concurrent.futures import (
+    ThreadPoolExecutor,
+)
+import threading
+
+from eth_keys import (
+    keys,
+)
+from eth_utils import (
+    ValidationError,
+    decode_hex,
+    to_wei,
+)
+import rlp
+
+from eth.chains.base import (
+    Chain,
+    MiningChain,
+)
+from eth.tools.builder.chain import (
+    api,
+)
+from eth.vm.forks import (
+    LondonVM,
+)
+from tests.tools.factories.transaction import (
+    new_transaction,
+)
+
+NUM_BLOCKS = 8
+
+SENDER_KEY = keys.PrivateKey(b"\x01" * 32)
+SENDER = SENDER_KEY.public_key.to_canonical_address()
+RECIPIENT = decode_hex("0xa94f5374fce5edbc8e2a8697c15331677e6ebf0c")
+
+
+def _new_chain():
+    return api.build(
+        MiningChain,
+        api.fork_at(LondonVM, 0),
+        api.disable_pow_check(),
+        api.genesis(
+            params={"gas_limit": 3141592, "timestamp": 1501851927},
+            state={SENDER: {"balance": to_wei(10, "ether")}},
+        ),
+    )
+
+
+@pytest.fixture(scope="module")
+def blocks():
+    chain = _new_chain()
+    mined_blocks = []
+    for nonce in range(NUM_BLOCKS):
+        transaction = new_transaction(
+            chain.get_vm(), SENDER, RECIPIENT, nonce + 1, SENDER_KEY, nonce=nonce
+        )
+        import_result, _, _ = chain.mine_all([transaction])
+        mined_blocks.append(import_result.imported_block)
+    return tuple(mined_blocks)
+
+
+@pytest.mark.parametrize("use_executor", (False, True))
+@pytest.mark.parametrize("max_pending", (1, 3, 16))
+def test_import_blocks_matches_import_block(blocks, use_executor, max_pending):
+    expected_chain = _new_chain()
+    expected_results = [expected_chain.import_block(block) for block in blocks]
+
+    chain = _new_chain()
+    if use_executor:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(
+                chain.import_blocks(blocks, executor=executor, max_pending=max_pending)
+            )
+    else:
+        results = list(chain.import_blocks(blocks, max_pending=max_pending))
+
+    assert [result.imported_block for result in results] == list(blocks)
+    for result, expected in zip(results, expected_results):
+        assert result.imported_block == expected.imported_block
+        assert result.new_canonical_blocks == expected.new_canonical_blocks
+        assert result.old_canonical_blocks == expected.old_canonical_blocks
+        assert result.meta_witness.hashes == expected.meta_witness.hashes
+
+    assert chain.get_canonical_head() == expected_chain.get_canonical_head()
+    # the mining header's timestamp is taken from the clock, so only check its parent
+    assert chain.header.parent_hash == expected_chain.header.parent_hash
+    for block in blocks:
+        assert chain.get_canonical_block_by_number(block.number) == block
+        for transaction in block.transactions:
+            assert chain.get_canonical_transaction(transaction.hash) == transaction
+
+
+def test_import_blocks_decodes_encoded_blocks(blocks):
+    chain = _new_chain()
+    encoded_blocks = [rlp.encode(block) for block in blocks]
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(chain.import_blocks(encoded_blocks, executor=executor))
+
+    assert [result.imported_block for result in results] == list(blocks)
+    assert chain.get_canonical_head() == blocks[-1].header
+
+
+def _hold_writer_until_executed(monkeypatch, num_blocks):
+    """
+    Make the writer wait until ``num_blocks`` blocks were executed, so that the
+    blocks executed meanwhile are batched together, whatever the timing.
+    """
+    executed = []
+    batch_sizes = []
+    blocks_executed = threading.Event()
+    original_execute = Chain._execute_block
+    original_persist = Chain._persist_block_batch
+
+    def execute(chain, block, *args):
+        executed.append(block.number)
+        if len(executed) == num_blocks:
+            blocks_executed.set()
+        return original_execute(chain, block, *args)
+
+    def held_persist(chain, blocks_to_write, *args):
+        batch_sizes.append(len(blocks_to_write))
+        assert blocks_executed.wait(timeout=10)
+        return original_persist(chain, blocks_to_write, *args)
+
+    monkeypatch.setattr(Chain, "_execute_block", execute)
+    monkeypatch.setattr(Chain, "_persist_block_batch", held_persist)
+    return executed, batch_sizes
+
+
+def test_import_blocks_bounds_pending_blocks(blocks, monkeypatch):
+    max_pending = 2
+    # the first block's write is held until the pipeline has to wait for it
+    executed, batch_sizes = _hold_writer_until_executed(monkeypatch, 1 + max_pending)
+
+    results = _new_chain().import_blocks(blocks, max_pending=max_pending)
+
+    # nothing happens until the results are consumed
+    assert executed == []
+
+    first_result = next(results)
+    assert first_result.imported_block == blocks[0]
+    assert len(executed) <= 1 + max_pending
+
+    remaining_results = list(results)
+    assert len(remaining_results) == NUM_BLOCKS - 1
+    assert executed == [block.number for block in blocks]
+    # the held writer got several executed blocks per batch, but never too many
+    assert batch_sizes[:2] == [1, max_pending]
+    assert max(batch_sizes) == max_pending
+    assert sum(batch_sizes) == NUM_BLOCKS
+
+
+def test_import_blocks_persists_blocks_before_a_failure(blocks):
+    failing_index = 5
+    bad_header = blocks[failing_index].header.copy(gas_used=1)
+    bad_blocks = list(blocks)
+    bad_blocks[failing_index] = blocks[failing_index].copy(header=bad_header)
+
+    chain = _new_chain()
+    results = []
+    with pytest.raises(ValidationError):
+        for result in chain.import_blocks(bad_blocks, max_pending=2):
+            results.append(result)
+
+    assert [result.imported_block for result in results] == list(blocks[:failing_index])
+    assert chain.get_canonical_head() == blocks[failing_index - 1].header
+    assert chain.header.block_number == failing_index + 1
+    assert not chain.chaindb.header_exists(bad_header.hash)
+    assert not chain.chaindb.header_exists(blocks[failing_index].hash)
+
+
+def test_import_blocks_persists_valid_blocks_of_a_failing_batch(blocks, monkeypatch):
+    max_pending = 4
+    failing_index = 3
+    original_validate_uncles = Chain.validate_uncles
+
+    def validate_uncles(chain, block):
+        if block.number == blocks[failing_index].number:
+            raise ValidationError("Invalid uncles")
+        return original_validate_uncles(chain, block)
+
+    monkeypatch.setattr(Chain, "validate_uncles", validate_uncles)
+    # the blocks before and after the invalid one are written in the same batch
+    _, batch_sizes = _hold_writer_until_executed(monkeypatch, 1 + max_pending)
+
+    chain = _new_chain()
+    results = []
+    with pytest.raises(ValidationError, match="Invalid uncles"):
+        for result in chain.import_blocks(blocks, max_pending=max_pending):
+            results.append(result)
+
+    assert batch_sizes[:2] == [1, max_pending]
+    assert [result.imported_block for result in results] == list(blocks[:failing_index])
+    assert chain.get_canonical_head() == blocks[failing_index - 1].header
+    assert chain.header.block_number == failing_index + 1
+    for block in blocks[failing_index:]:
+        assert not chain.chaindb.header_exists(block.hash)
+
+
+def test_import_blocks_stopped_early_leaves_no_headers(blocks, monkeypatch):
+    _hold_writer_until_executed(monkeypatch, 3)
+
+    chain = _new_chain()
+    results = chain.import_blocks(blocks, max_pending=2)
+    next(results)
+    results.close()
+
+    head_number = chain.get_canonical_head().block_number
+    for block in blocks:
+        assert chain.chaindb.header_exists(block.hash) is (block.number <= head_number)
+
+
+def test_import_blocks_requires_known_parent(blocks):
+    chain = _new_chain()
+    with pytest.raises(ValidationError, match="before importing its parent"):
+        list(chain.import_blocks(blocks[1:]))
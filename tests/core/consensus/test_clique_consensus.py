@@ -1,4 +1,8 @@
 import pytest
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
 
 from eth_keys import (
     keys,
@@ -22,15 +26,23 @@ from eth.consensus.clique import (
     CliqueConsensus,
     CliqueConsensusContext,
     VoteAction,
+    snapshot_manager as snapshot_manager_module,
 )
 from eth.consensus.clique._utils import (
     get_block_signer,
     sign_block_header,
 )
 from eth.consensus.clique.constants import (
+    EPOCH_LENGTH,
     SIGNATURE_LENGTH,
     VANITY_LENGTH,
 )
+from eth.consensus.clique.exceptions import (
+    SnapshotNotFound,
+)
+from eth.consensus.clique.snapshot_manager import (
+    SnapshotManager,
+)
 from eth.constants import (
     ZERO_ADDRESS,
 )
@@ -218,8 +230,7 @@ def validate_seal_and_get_snapshot(clique, header):
     return clique.get_snapshot(header)
 
 
-@pytest.fixture
-def paragon_chain(base_db):
+def make_paragon_chain(base_db, consensus_context_class=CliqueConsensusContext):
     vms = (
         (
             0,
@@ -234,12 +245,17 @@ def paragon_chain(base_db):
 
     chain = MiningChain.configure(
         vm_configuration=clique_vms,
-        consensus_context_class=CliqueConsensusContext,
+        consensus_context_class=consensus_context_class,
         chain_id=5,
     ).from_genesis(base_db, PARAGON_GENESIS_PARAMS, PARAGON_GENESIS_STATE)
     return chain
 
 
+@pytest.fixture
+def paragon_chain(base_db):
+    return make_paragon_chain(base_db)
+
+
 def get_clique(chain, header=None):
     if header:
         vm = chain.get_vm(header)
@@ -328,6 +344,104 @@ def test_can_persist_and_restore_snapshot_from_db(paragon_chain):
     assert snapshot == revived
 
 
+class FrequentSnapshotsContext(CliqueConsensusContext):
+    snapshot_persist_interval = 2
+
+
+def test_persists_snapshots_at_interval(base_db):
+    chain = make_paragon_chain(base_db, FrequentSnapshotsContext)
+    voting_chain = alice_nominates_bob_and_ron_then_they_kick_her(chain)
+
+    clique = get_clique(chain)
+    for header in voting_chain:
+        validate_seal_and_get_snapshot(clique, header)
+
+    snapshot_manager = clique._snapshot_manager
+    for header in voting_chain:
+        if header.block_number % 2 == 0:
+            snapshot = snapshot_manager.get_snapshot_from_db(header.hash)
+            assert snapshot == clique.get_snapshot(header)
+        else:
+            with pytest.raises(SnapshotNotFound):
+                snapshot_manager.get_snapshot_from_db(header.hash)
+
+
+def test_restores_snapshot_from_last_persisted_one(base_db, monkeypatch):
+    chain = make_paragon_chain(base_db, FrequentSnapshotsContext)
+    voting_chain = alice_nominates_bob_and_ron_then_they_kick_her(chain)
+
+    clique = get_clique(chain)
+    for header in voting_chain:
+        chain.chaindb.persist_header(header)
+        validate_seal_and_get_snapshot(clique, header)
+
+    # A new manager, as after a restart, only has the snapshots in the database
+    snapshot_manager = SnapshotManager(chain.chaindb, EPOCH_LENGTH, persist_interval=2)
+    applied_headers = []
+    apply = snapshot_manager.apply
+
+    def record_apply(snapshot, header):
+        applied_headers.append(header)
+        return apply(snapshot, header)
+
+    monkeypatch.setattr(snapshot_manager, "apply", record_apply)
+
+    head = voting_chain[-1]
+    snapshot = snapshot_manager.get_or_create_snapshot(head.block_number, head.hash)
+
+    assert snapshot == clique.get_snapshot(head)
+    assert snapshot.signers == {BOB, RON}
+    assert applied_headers == [head]
+
+
+def test_memoizes_block_signers(paragon_chain, monkeypatch):
+    voting_chain = alice_nominates_bob_and_ron_then_they_kick_her(paragon_chain)
+    recovered_headers = []
+
+    def record_get_block_signer(header):
+        recovered_headers.append(header)
+        return get_block_signer(header)
+
+    monkeypatch.setattr(
+        snapshot_manager_module, "get_block_signer", record_get_block_signer
+    )
+
+    snapshot_manager = get_clique(paragon_chain)._snapshot_manager
+    for _ in range(2):
+        assert snapshot_manager.get_block_signer(voting_chain[1]) == ALICE
+
+    assert recovered_headers == [voting_chain[1]]
+
+
+@pytest.mark.parametrize(
+    "executor_class",
+    (
+        ThreadPoolExecutor,
+        ProcessPoolExecutor,
+    ),
+)
+def test_recovers_signers_in_executor(base_db, executor_class):
+    with executor_class(max_workers=2) as executor:
+        context_class = type(
+            "ExecutorCliqueConsensusContext",
+            (CliqueConsensusContext,),
+            {"signer_recovery_executor": executor},
+        )
+        chain = make_paragon_chain(base_db, context_class)
+        voting_chain = alice_nominates_bob_and_ron_then_they_kick_her(chain)
+        for header in voting_chain[:5]:
+            chain.chaindb.persist_header(header)
+
+        clique = get_clique(chain)
+        snapshot = validate_seal_and_get_snapshot(clique, voting_chain[5])
+
+    assert snapshot.signers == {BOB, RON}
+
+    # all headers are votes, and the signers of re-applied ones were recovered
+    signers = clique._snapshot_manager._signers
+    assert all(header.hash in signers for header in voting_chain[:6])
+
+
 def test_revert_previous_nominate(paragon_chain):
     head = paragon_chain.get_canonical_head()
     clique = get_clique(paragon_chain)
@@ -0,0 +1,78 @@
+import pytest
+
+from eth_hash.auto import (
+    keccak,
+)
+
+from eth.consensus import (
+    ethash,
+)
+
+np = pytest.importorskip("numpy")
+ethash_numpy = pytest.importorskip("eth.consensus.ethash_numpy")
+
+# A cache this small takes milliseconds to generate with the reference code
+SMALL_CACHE_SIZE = 509 * ethash.HASH_BYTES
+BLOCK_NUMBER = 2 * ethash.EPOCH_LENGTH + 1
+
+
+@pytest.fixture
+def small_caches(monkeypatch):
+    monkeypatch.setattr(ethash, "get_cache_size", lambda block_number: SMALL_CACHE_SIZE)
+    monkeypatch.setattr(
+        ethash_numpy, "get_cache_size", lambda block_number: SMALL_CACHE_SIZE
+    )
+    return ethash.mkcache(BLOCK_NUMBER), ethash_numpy.mkcache(BLOCK_NUMBER)
+
+
+def test_mkcache_matches_reference(small_caches):
+    reference_cache, cache = small_caches
+
+    assert cache.dtype == np.uint32
+    assert cache.shape == (len(reference_cache), 16)
+    assert tuple(map(tuple, cache.tolist())) == reference_cache
+
+
+@pytest.mark.parametrize("index", (0, 1, 508, 509, 123456, 2**24 + 7, 2**32 - 1))
+def test_calc_dataset_item_matches_reference(small_caches, index):
+    reference_cache, cache = small_caches
+
+    expected = ethash.calc_dataset_item(reference_cache, index)
+    assert tuple(ethash_numpy.calc_dataset_item(cache, index).tolist()) == expected
+
+
+def test_calc_dataset_items_in_lockstep(small_caches):
+    _, cache = small_caches
+    indices = np.array([3, 1000, 3, 2**20], dtype=np.uint32)
+
+    items = ethash_numpy.calc_dataset_items(cache, indices)
+
+    for index, item in zip(indices.tolist(), items):
+        assert (item == ethash_numpy.calc_dataset_item(cache, index)).all()
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_hashimoto_light_matches_reference(small_caches, seed):
+    reference_cache, cache = small_caches
+    header_hash = keccak(seed.to_bytes(32, "big"))
+    nonce = keccak(header_hash)[:8]
+    full_size = ethash.get_dataset_full_size(BLOCK_NUMBER)
+
+    expected = ethash.hashimoto_light(full_size, reference_cache, header_hash, nonce)
+    actual = ethash_numpy.hashimoto_light(full_size, cache, header_hash, nonce)
+    assert actual == expected
+
+
+@pytest.mark.parametrize(
+    "v1, v2",
+    (
+        (0, 0),
+        (1, 2**32 - 1),
+        (2**32 - 1, 2**32 - 1),
+        (0x12345678, 0x9ABCDEF0),
+    ),
+)
+def test_fnv_matches_reference(v1, v2):
+    actual = ethash_numpy.fnv(np.array([v1], dtype=np.uint32), np.uint32(v2))
+    assert actual.dtype == np.uint32
+    assert actual.tolist() == [ethash.fnv(v1, v2)]
@@ -0,0 +1,114 @@
+import pytest
+from collections import (
+    OrderedDict,
+)
+
+from eth.consensus import (
+    ethash,
+    pow,
+)
+
+# A cache this small takes milliseconds to generate
+SMALL_CACHE_SIZE = 509 * ethash.HASH_BYTES
+BLOCK_NUMBER = 3 * ethash.EPOCH_LENGTH + 1
+
+
+@pytest.fixture(autouse=True)
+def small_caches(monkeypatch):
+    monkeypatch.setattr(pow, "cache_by_epoch", OrderedDict())
+    monkeypatch.setattr(pow, "_cache_dir", None)
+    monkeypatch.delenv(pow.CACHE_DIR_ENV_VAR, raising=False)
+
+    def get_cache_size(block_number):
+        return SMALL_CACHE_SIZE
+
+    monkeypatch.setattr(ethash, "get_cache_size", get_cache_size)
+    monkeypatch.setattr(pow, "get_cache_size", get_cache_size)
+    try:
+        from eth.consensus import (
+            ethash_numpy,
+        )
+    except ImportError:
+        pass
+    else:
+        monkeypatch.setattr(ethash_numpy, "get_cache_size", get_cache_size)
+
+
+def _forget_caches_in_memory(monkeypatch):
+    monkeypatch.setattr(pow, "cache_by_epoch", OrderedDict())
+
+    def mkcache(block_number):
+        raise AssertionError("The cache should have been loaded from disk")
+
+    monkeypatch.setattr(pow, "mkcache", mkcache)
+
+
+def _get_cache_path(cache_dir):
+    (cache_path,) = cache_dir.iterdir()
+    return cache_path
+
+
+def test_get_cache_loads_persisted_cache(tmp_path, monkeypatch):
+    pow.set_cache_dir(tmp_path)
+    generated_cache = pow.get_cache(BLOCK_NUMBER)
+
+    cache_path = _get_cache_path(tmp_path)
+    assert cache_path.name == f"cache-R{pow.CACHE_FILE_REVISION}-3"
+    assert cache_path.read_bytes() == pow.cache_to_bytes(generated_cache)
+
+    _forget_caches_in_memory(monkeypatch)
+    loaded_cache = pow.get_cache(BLOCK_NUMBER)
+    assert pow.cache_to_bytes(loaded_cache) == pow.cache_to_bytes(generated_cache)
+    assert len(loaded_cache) == len(generated_cache)
+
+
+def test_get_cache_dir_from_environment(tmp_path, monkeypatch):
+    monkeypatch.setenv(pow.CACHE_DIR_ENV_VAR, str(tmp_path / "ethash"))
+    generated_cache = pow.get_cache(BLOCK_NUMBER)
+
+    _forget_caches_in_memory(monkeypatch)
+    loaded_cache = pow.get_cache(BLOCK_NUMBER)
+    assert pow.cache_to_bytes(loaded_cache) == pow.cache_to_bytes(generated_cache)
+
+
+def test_get_cache_replaces_truncated_file(tmp_path):
+    pow.set_cache_dir(tmp_path)
+    cache_path = tmp_path / f"cache-R{pow.CACHE_FILE_REVISION}-3"
+    cache_path.write_bytes(b"\x01" * 100)
+
+    cache = pow.get_cache(BLOCK_NUMBER)
+
+    assert len(cache) == SMALL_CACHE_SIZE // ethash.HASH_BYTES
+    assert cache_path.read_bytes() == pow.cache_to_bytes(cache)
+    assert _get_cache_path(tmp_path) == cache_path
+
+
+def test_get_cache_still_works_if_cache_dir_is_unusable(tmp_path):
+    not_a_dir = tmp_path / "file"
+    not_a_dir.write_bytes(b"")
+    pow.set_cache_dir(not_a_dir)
+
+    cache = pow.get_cache(BLOCK_NUMBER)
+
+    assert len(cache) == SMALL_CACHE_SIZE // ethash.HASH_BYTES
+
+
+def test_get_cache_removes_temporary_file_if_it_cant_be_written(tmp_path, monkeypatch):
+    pow.set_cache_dir(tmp_path)
+
+    def replace(*args):
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(pow.os, "replace", replace)
+    cache = pow.get_cache(BLOCK_NUMBER)
+
+    assert len(cache) == SMALL_CACHE_SIZE // ethash.HASH_BYTES
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_get_cache_without_cache_dir_keeps_caches_in_memory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pow.get_cache(BLOCK_NUMBER)
+
+    assert pow.get_cache_dir() is None
+    assert list(tmp_path.iterdir()) == []
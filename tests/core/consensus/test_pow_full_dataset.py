@@ -0,0 +1,157 @@
+import pytest
+from collections import (
+    OrderedDict,
+)
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+
+from eth_hash.auto import (
+    keccak,
+)
+from eth_utils import (
+    ValidationError,
+)
+
+from eth.consensus import (
+    ethash,
+    pow,
+)
+
+np = pytest.importorskip("numpy")
+ethash_numpy = pytest.importorskip("eth.consensus.ethash_numpy")
+
+# Sizes this small take a fraction of a second to generate
+SMALL_CACHE_SIZE = 509 * ethash.HASH_BYTES
+SMALL_DATASET_SIZE = 8192 * ethash.HASH_BYTES
+BLOCK_NUMBER = 3 * ethash.EPOCH_LENGTH + 1
+
+
+@pytest.fixture(autouse=True)
+def small_sizes(monkeypatch, tmp_path):
+    monkeypatch.setattr(pow, "cache_by_epoch", OrderedDict())
+    monkeypatch.setattr(pow, "dataset_by_epoch", OrderedDict())
+    monkeypatch.setattr(pow, "_missing_dataset_paths", set())
+    monkeypatch.setattr(pow, "_cache_dir", tmp_path)
+    monkeypatch.setattr(pow, "DATASET_ITEMS_PER_TASK", 1000)
+
+    def get_cache_size(block_number):
+        return SMALL_CACHE_SIZE
+
+    def get_dataset_full_size(block_number):
+        return SMALL_DATASET_SIZE
+
+    monkeypatch.setattr(pow, "get_cache_size", get_cache_size)
+    monkeypatch.setattr(ethash_numpy, "get_cache_size", get_cache_size)
+    monkeypatch.setattr(pow, "get_dataset_full_size", get_dataset_full_size)
+
+
+@pytest.mark.parametrize(
+    "executor_class", (None, ThreadPoolExecutor, ProcessPoolExecutor)
+)
+def test_generate_dataset(executor_class):
+    assert pow.get_dataset(BLOCK_NUMBER) is None
+
+    if executor_class is None:
+        dataset_path = pow.generate_dataset(BLOCK_NUMBER)
+    else:
+        # forked worker processes inherit the small sizes
+        with executor_class(max_workers=2) as executor:
+            dataset_path = pow.generate_dataset(BLOCK_NUMBER, executor)
+
+    assert dataset_path.stat().st_size == SMALL_DATASET_SIZE
+    dataset = pow.get_dataset(BLOCK_NUMBER)
+    assert dataset.shape == (SMALL_DATASET_SIZE // ethash.HASH_BYTES, 16)
+
+    cache = pow.get_cache(BLOCK_NUMBER)
+    indices = np.arange(len(dataset), dtype=np.uint32)
+    assert (dataset == ethash_numpy.calc_dataset_items(cache, indices)).all()
+
+
+def test_check_pow_uses_generated_dataset(monkeypatch):
+    mining_hash = keccak(b"header")
+    nonce, mix_hash = pow.mine_pow_nonce(BLOCK_NUMBER, mining_hash, 2)
+    pow.generate_dataset(BLOCK_NUMBER)
+
+    def hashimoto_light(*args):
+        raise AssertionError("The proof of work should be checked against the dataset")
+
+    monkeypatch.setattr(pow, "hashimoto_light", hashimoto_light)
+    pow.check_pow(BLOCK_NUMBER, mining_hash, mix_hash, nonce, 2)
+    with pytest.raises(ValidationError, match="mix hash mismatch"):
+        pow.check_pow(BLOCK_NUMBER, mining_hash, keccak(mix_hash), nonce, 2)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_hashimoto_matches_hashimoto_light(seed):
+    pow.generate_dataset(BLOCK_NUMBER)
+    header_hash = keccak(seed.to_bytes(32, "big"))
+    nonce = keccak(header_hash)[:8]
+
+    expected = ethash_numpy.hashimoto_light(
+        SMALL_DATASET_SIZE, pow.get_cache(BLOCK_NUMBER), header_hash, nonce
+    )
+    actual = ethash_numpy.hashimoto(
+        SMALL_DATASET_SIZE, pow.get_dataset(BLOCK_NUMBER), header_hash, nonce
+    )
+    assert actual == expected
+
+
+def test_missing_dataset_is_looked_up_once(monkeypatch):
+    lookups = []
+    original_load_file = pow._load_file
+
+    def load_file(path, size):
+        lookups.append(path)
+        return original_load_file(path, size)
+
+    monkeypatch.setattr(pow, "_load_file", load_file)
+    assert pow.get_dataset(BLOCK_NUMBER) is None
+    assert pow.get_dataset(BLOCK_NUMBER) is None
+    assert len(lookups) == 1
+
+    pow.generate_dataset(BLOCK_NUMBER)
+    assert pow.get_dataset(BLOCK_NUMBER) is not None
+
+
+def test_generate_dataset_is_done_once(monkeypatch):
+    dataset_path = pow.generate_dataset(BLOCK_NUMBER)
+
+    def fill_dataset_file(*args):
+        raise AssertionError("The dataset was already generated")
+
+    monkeypatch.setattr(pow, "fill_dataset_file", fill_dataset_file)
+    assert pow.generate_dataset(BLOCK_NUMBER) == dataset_path
+
+
+def test_failed_generation_leaves_no_dataset(monkeypatch, tmp_path):
+    def fill_dataset_file(*args):
+        raise MemoryError
+
+    monkeypatch.setattr(pow, "fill_dataset_file", fill_dataset_file)
+    with pytest.raises(MemoryError):
+        pow.generate_dataset(BLOCK_NUMBER)
+
+    assert pow.get_dataset(BLOCK_NUMBER) is None
+    assert not any(path.name.startswith("full-") for path in tmp_path.iterdir())
+
+
+def test_dataset_that_cant_be_allocated_leaves_no_file(monkeypatch, tmp_path):
+    pow.get_cache(BLOCK_NUMBER)
+    cache_files = set(tmp_path.iterdir())
+    monkeypatch.setattr(pow, "get_dataset_full_size", lambda block_number: -1)
+
+    with pytest.raises(OSError):
+        pow.generate_dataset(BLOCK_NUMBER)
+
+    assert set(tmp_path.iterdir()) == cache_files
+
+
+def test_generate_dataset_requires_cache_dir(monkeypatch):
+    monkeypatch.setattr(pow, "_cache_dir", None)
+    monkeypatch.delenv(pow.CACHE_DIR_ENV_VAR, raising=False)
+
+    with pytest.raises(ValueError, match="cache directory"):
+        pow.generate_dataset(BLOCK_NUMBER)
+    assert pow.get_dataset(BLOCK_NUMBER) is None
@@ -1,8 +1,16 @@
 import pytest
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
 import random
 import threading
 import time
 
+from eth_utils import (
+    ValidationError,
+)
+
 from eth.chains.base import (
     MiningChain,
 )
@@ -12,6 +20,7 @@ from eth.chains.mainnet import (
 from eth.consensus.pow import (
     EPOCH_LENGTH,
     check_pow,
+    check_pow_seals,
     get_cache,
 )
 from eth.tools.builder.chain import (
@@ -20,6 +29,9 @@ from eth.tools.builder.chain import (
 from eth.tools.mining import (
     POWMiningMixin,
 )
+from eth.vm.forks import (
+    LondonVM,
+)
 
 TEST_NUM_CACHES = 3
 
@@ -70,6 +82,18 @@ def test_pow_across_epochs(ropsten_epoch_headers):
     _concurrently_run_to_completion(check, 2)
 
 
+def test_check_pow_on_ropsten_header(ropsten_epoch_headers):
+    # the first header is from epoch 0, whose cache the mining tests need as well
+    header = next(iter(ropsten_epoch_headers))
+    check_pow(
+        header.block_number,
+        header.mining_hash,
+        header.mix_hash,
+        header.nonce,
+        header.difficulty,
+    )
+
+
 @pytest.mark.parametrize(
     "base_vm_class",
     MINING_MAINNET_VMS,
@@ -90,3 +114,74 @@ def test_mining_tools_proof_of_work_mining(base_vm_class):
         block.header.nonce,
         block.header.difficulty,
     )
+
+
+@pytest.fixture(scope="module")
+def pow_mined_chain():
+    vm_class = type("LondonPOWMiningVM", (POWMiningMixin, LondonVM), {})
+
+    class ChainClass(MiningChain):
+        vm_configuration = ((0, vm_class),)
+
+    chain = genesis(ChainClass)
+    for _ in range(4):
+        chain.mine_block(difficulty=3)
+    return chain
+
+
+def _get_headers(chain):
+    head_number = chain.get_canonical_head().block_number
+    return tuple(
+        chain.get_canonical_block_header_by_number(number)
+        for number in range(head_number + 1)
+    )
+
+
+@pytest.mark.parametrize("executor_class", (ThreadPoolExecutor, ProcessPoolExecutor))
+def test_validate_chain_checks_seals_in_executor(pow_mined_chain, executor_class):
+    root, *descendants = _get_headers(pow_mined_chain)
+
+    # forked worker processes inherit the epoch cache, which was already generated
+    with executor_class(max_workers=2) as executor:
+        pow_mined_chain.validate_chain(root, tuple(descendants), executor=executor)
+
+
+def test_validate_chain_reports_first_bad_seal_from_executor(pow_mined_chain):
+    root, *descendants = _get_headers(pow_mined_chain)
+    bad_header = descendants[-1].copy(nonce=b"\xff" * 8)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        with pytest.raises(ValidationError, match="mix hash mismatch"):
+            pow_mined_chain.validate_chain(
+                root, tuple(descendants[:-1]) + (bad_header,), executor=executor
+            )
+
+
+def test_validate_chain_links_headers_before_checking_seals(pow_mined_chain):
+    root, *descendants = _get_headers(pow_mined_chain)
+    unlinked_header = descendants[1].copy(parent_hash=b"\x00" * 32)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        with pytest.raises(ValidationError, match="Invalid header chain"):
+            pow_mined_chain.validate_chain(
+                root, (descendants[0], unlinked_header), executor=executor
+            )
+
+
+def test_check_pow_seals_validates_every_seal(pow_mined_chain):
+    headers = _get_headers(pow_mined_chain)[1:]
+    seals = [
+        (
+            header.block_number,
+            header.mining_hash,
+            header.mix_hash,
+            header.nonce,
+            header.difficulty,
+        )
+        for header in headers
+    ]
+    check_pow_seals(seals)
+
+    bad_seals = seals[:1] + [seals[1][:3] + (b"\xff" * 8,) + seals[1][4:]]
+    with pytest.raises(ValidationError, match="mix hash mismatch"):
+        check_pow_seals(bad_seals)
@@ -0,0 +1,136 @@
+import pytest
+import itertools
+import random
+
+from eth._utils import (
+    uint256,
+)
+from eth._utils.numeric import (
+    signed_to_unsigned,
+    unsigned_to_signed,
+)
+from eth.constants import (
+    UINT_255_MAX,
+    UINT_256_CEILING,
+    UINT_256_MAX,
+)
+
+EDGE_WORDS = (
+    0,
+    1,
+    2,
+    3,
+    255,
+    256,
+    2**64,
+    2**128 - 1,
+    2**128,
+    UINT_255_MAX,
+    UINT_255_MAX + 1,
+    UINT_255_MAX + 2,
+    UINT_256_MAX - 1,
+    UINT_256_MAX,
+)
+
+
+def random_words(seed, count=200):
+    rng = random.Random(seed)
+    return tuple(
+        rng.getrandbits(rng.choice((8, 64, 128, 255, 256))) for _ in range(count)
+    )
+
+
+def word_pairs(seed):
+    random_pairs = zip(random_words(seed), random_words(seed + 1))
+    return tuple(itertools.product(EDGE_WORDS, repeat=2)) + tuple(random_pairs)
+
+
+# Definitions of the yellow paper, with Python integers
+def reference_signed(value):
+    return value if value <= UINT_255_MAX else value - UINT_256_CEILING
+
+
+def reference_unsigned(value):
+    return value + UINT_256_CEILING if value < 0 else value
+
+
+def reference_sdiv(numerator, denominator):
+    numerator, denominator = reference_signed(numerator), reference_signed(denominator)
+    if denominator == 0:
+        return 0
+    sign = -1 if numerator * denominator < 0 else 1
+    return reference_unsigned(sign * (abs(numerator) // abs(denominator)) % 2**256)
+
+
+def reference_smod(value, mod):
+    value, mod = reference_signed(value), reference_signed(mod)
+    if mod == 0:
+        return 0
+    sign = -1 if value < 0 else 1
+    return reference_unsigned(sign * (abs(value) % abs(mod)))
+
+
+def reference_exp(base, exponent):
+    return pow(base, exponent, UINT_256_CEILING)
+
+
+def reference_signextend(bits, value):
+    if bits > 31:
+        return value
+    sign_bit = 1 << (bits * 8 + 7)
+    if value & sign_bit:
+        return value | (UINT_256_CEILING - sign_bit)
+    else:
+        return value & (sign_bit - 1)
+
+
+def reference_sar(shift_length, value):
+    return reference_unsigned(reference_signed(value) >> min(shift_length, 256))
+
+
+@pytest.mark.parametrize("value", EDGE_WORDS + random_words(0))
+def test_signed_conversions(value):
+    assert unsigned_to_signed(value) == reference_signed(value)
+    assert signed_to_unsigned(unsigned_to_signed(value)) == value
+
+
+@pytest.mark.parametrize(
+    "kernel, reference",
+    (
+        (uint256.sdiv, reference_sdiv),
+        (uint256.smod, reference_smod),
+        (uint256.exp, reference_exp),
+        (uint256.sar, reference_sar),
+    ),
+)
+def test_kernel_matches_reference(kernel, reference):
+    for left, right in word_pairs(seed=1):
+        assert kernel(left, right) == reference(left, right), (left, right)
+
+
+def test_small_exp_operands():
+    for base, exponent in itertools.product(range(5), (0, 1, 2, 255, 256, 257)):
+        assert uint256.exp(base, exponent) == reference_exp(base, exponent)
+
+
+def test_signextend_matches_reference():
+    for bits in tuple(range(34)) + (UINT_256_MAX,):
+        for value in EDGE_WORDS + random_words(bits, count=20):
+            assert uint256.signextend(bits, value) == reference_signextend(bits, value)
+
+
+def test_sar_of_shifts_past_the_word():
+    for shift_length in (255, 256, 257, UINT_256_MAX):
+        for value in EDGE_WORDS:
+            assert uint256.sar(shift_length, value) == reference_sar(
+                shift_length, value
+            )
+
+
+def test_exp_gas_by_byte_length():
+    gas_by_byte_length = uint256.get_exp_gas_by_byte_length(50)
+
+    assert len(gas_by_byte_length) == 33
+    for exponent in EDGE_WORDS:
+        byte_length = len(exponent.to_bytes(32, "big").lstrip(b"\x00"))
+        assert gas_by_byte_length[(exponent.bit_length() + 7) // 8] == 50 * byte_length
@@ -0,0 +1,117 @@
+import pytest
+import random
+
+from py_ecc.optimized_bls12_381.optimized_curve import (
+    G1,
+    G2,
+    Z1,
+    Z2,
+    curve_order,
+    multiply,
+    neg,
+    normalize,
+)
+
+from eth.precompiles.bls12_381.bls12_381_g1 import (
+    decode_g1_scalar_pair,
+    g1_optimized_3d_to_bytes,
+)
+from eth.precompiles.bls12_381.bls12_381_g2 import (
+    decode_G2_scalar_pair,
+    g2_optimized_3d_to_bytes,
+)
+from eth.precompiles.bls12_381.msm import (
+    MAX_WINDOW_SIZE,
+    get_window_size,
+    multi_scalar_multiply,
+    naive_multi_scalar_multiply,
+)
+
+
+def make_pairs(generator, k, seed):
+    rng = random.Random(seed)
+    return tuple(
+        (multiply(generator, rng.randrange(1, curve_order)), rng.randrange(2**256))
+        for _ in range(k)
+    )
+
+
+def assert_points_eq(actual, expected):
+    assert normalize(actual) == normalize(expected)
+
+
+@pytest.mark.parametrize("generator", (G1, G2), ids=("G1", "G2"))
+@pytest.mark.parametrize("k", (1, 2, 3, 7, 16, 33))
+def test_msm_matches_naive_msm(generator, k):
+    pairs = make_pairs(generator, k, seed=k)
+
+    assert_points_eq(multi_scalar_multiply(pairs), naive_multi_scalar_multiply(pairs))
+
+
+@pytest.mark.parametrize(
+    "generator, infinity",
+    (
+        (G1, Z1),
+        (G2, Z2),
+    ),
+    ids=("G1", "G2"),
+)
+def test_msm_edge_cases(generator, infinity):
+    point = multiply(generator, 5)
+    pairs = (
+        (point, 0),
+        (point, 1),
+        (point, curve_order),
+        (point, curve_order + 2),
+        (point, 2**256 - 1),
+        (neg(point), 3),
+        (infinity, 2**255),
+        (generator, curve_order - 1),
+    )
+
+    assert_points_eq(multi_scalar_multiply(pairs), naive_multi_scalar_multiply(pairs))
+
+
+@pytest.mark.parametrize("generator", (G1, G2), ids=("G1", "G2"))
+def test_msm_of_cancelling_pairs_is_infinity(generator):
+    pairs = ((generator, 7), (neg(generator), 7))
+
+    result = multi_scalar_multiply(pairs)
+
+    assert result[2] == generator[2].zero()
+
+
+def test_msm_precompile_encoding():
+    # G1 and G2 pairs as encoded in the input of the MSM precompiles
+    g1_pairs = make_pairs(G1, 4, seed=0)
+    g1_input = b"".join(
+        g1_optimized_3d_to_bytes(point) + scalar.to_bytes(32, "big")
+        for point, scalar in g1_pairs
+    )
+    decoded_g1_pairs = tuple(
+        decode_g1_scalar_pair(g1_input[start : start + 160])
+        for start in range(0, len(g1_input), 160)
+    )
+    assert g1_optimized_3d_to_bytes(
+        multi_scalar_multiply(decoded_g1_pairs)
+    ) == g1_optimized_3d_to_bytes(naive_multi_scalar_multiply(g1_pairs))
+
+    g2_pairs = make_pairs(G2, 4, seed=0)
+    g2_input = b"".join(
+        g2_optimized_3d_to_bytes(point) + scalar.to_bytes(32, "big")
+        for point, scalar in g2_pairs
+    )
+    decoded_g2_pairs = tuple(
+        decode_G2_scalar_pair(g2_input[start : start + 288])
+        for start in range(0, len(g2_input), 288)
+    )
+    assert g2_optimized_3d_to_bytes(
+        multi_scalar_multiply(decoded_g2_pairs)
+    ) == g2_optimized_3d_to_bytes(naive_multi_scalar_multiply(g2_pairs))
+
+
+def test_window_size_grows_with_k():
+    window_sizes = [get_window_size(k) for k in (1, 8, 128, 4096, 2**20)]
+
+    assert window_sizes == sorted(window_sizes)
+    assert 1 <= window_sizes[0] and window_sizes[-1] <= MAX_WINDOW_SIZE
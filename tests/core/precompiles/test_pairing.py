@@ -0,0 +1,143 @@
+import pytest
+
+from eth_utils import (
+    ValidationError,
+)
+from py_ecc import (
+    optimized_bn128 as bn128,
+)
+from py_ecc.bls.hash_to_curve import (
+    map_to_curve_G1,
+    map_to_curve_G2,
+)
+from py_ecc.fields import (
+    optimized_bls12_381_FQ as BLS12_FQ,
+    optimized_bls12_381_FQ2 as BLS12_FQ2,
+)
+from py_ecc.optimized_bls12_381 import (
+    optimized_curve as bls12_381,
+)
+
+from eth._utils.bn128 import (
+    is_in_g2_subgroup as is_in_bn128_g2_subgroup,
+)
+from eth.precompiles.backends import (
+    run_precompile,
+)
+from eth.precompiles.bls12_381 import (
+    bls12_pairing_check,
+)
+from eth.precompiles.bls12_381.bls12_381_g1 import (
+    g1_optimized_3d_to_bytes,
+    is_in_g1_subgroup,
+)
+from eth.precompiles.bls12_381.bls12_381_g2 import (
+    g2_optimized_3d_to_bytes,
+    is_in_g2_subgroup,
+)
+from eth.precompiles.ecpairing import (
+    _ecpairing,
+)
+from eth.vm.computation import (
+    BaseComputation,
+)
+
+
+def run_pairing_check(data):
+    is_error, output, _ = run_precompile(BaseComputation, bls12_pairing_check, data)
+    assert not is_error
+    return output
+
+
+def bn128_fq2_sqrt(value):
+    # The field modulus is 3 mod 4, https://eprint.iacr.org/2012/685 algorithm 9
+    field_modulus = bn128.field_modulus
+    a1 = value ** ((field_modulus - 3) // 4)
+    alpha = a1 * a1 * value
+    if alpha == -bn128.FQ2.one():
+        return bn128.FQ2([0, 1]) * a1 * value
+    else:
+        return (bn128.FQ2.one() + alpha) ** ((field_modulus - 1) // 2) * a1 * value
+
+
+def bn128_twist_point_outside_g2():
+    for coord in range(1, 100):
+        x = bn128.FQ2([coord, 1])
+        y = bn128_fq2_sqrt(x**3 + bn128.b2)
+        if y * y == x**3 + bn128.b2:
+            return (x, y, bn128.FQ2.one())
+
+
+def encode_bn128_pair(p1, p2):
+    x1, y1 = bn128.normalize(p1)
+    x2, y2 = bn128.normalize(p2)
+    return b"".join(
+        coord.to_bytes(32, "big")
+        for coord in (
+            int(x1),
+            int(y1),
+            x2.coeffs[1],
+            x2.coeffs[0],
+            y2.coeffs[1],
+            y2.coeffs[0],
+        )
+    )
+
+
+def test_bn128_g2_subgroup_check():
+    assert is_in_bn128_g2_subgroup(bn128.multiply(bn128.G2, 12345))
+    assert is_in_bn128_g2_subgroup(bn128.Z2)
+
+    point = bn128_twist_point_outside_g2()
+    assert bn128.is_on_curve(point, bn128.b2)
+    assert not bn128.is_inf(bn128.multiply(point, bn128.curve_order))
+    assert not is_in_bn128_g2_subgroup(point)
+
+
+def test_ecpairing_of_cancelling_pairs():
+    p1 = bn128.multiply(bn128.G1, 7)
+    p2 = bn128.multiply(bn128.G2, 11)
+
+    assert _ecpairing(encode_bn128_pair(p1, p2) + encode_bn128_pair(bn128.neg(p1), p2))
+    assert not _ecpairing(encode_bn128_pair(p1, p2) + encode_bn128_pair(p1, p2))
+
+
+def test_ecpairing_rejects_point_outside_g2():
+    data = encode_bn128_pair(bn128.G1, bn128_twist_point_outside_g2())
+
+    with pytest.raises(ValidationError, match="G2 subgroup"):
+        _ecpairing(data)
+
+
+def test_bls12_subgroup_checks():
+    assert is_in_g1_subgroup(bls12_381.multiply(bls12_381.G1, 12345))
+    assert is_in_g1_subgroup(bls12_381.Z1)
+    assert not is_in_g1_subgroup(map_to_curve_G1(BLS12_FQ(3)))
+
+    assert is_in_g2_subgroup(bls12_381.multiply(bls12_381.G2, 12345))
+    assert is_in_g2_subgroup(bls12_381.Z2)
+    assert not is_in_g2_subgroup(map_to_curve_G2(BLS12_FQ2((3, 4))))
+
+
+def test_bls12_pairing_check():
+    p1 = bls12_381.multiply(bls12_381.G1, 7)
+    p2 = bls12_381.multiply(bls12_381.G2, 11)
+    pair = g1_optimized_3d_to_bytes(p1) + g2_optimized_3d_to_bytes(p2)
+    cancelling_pair = g1_optimized_3d_to_bytes(
+        bls12_381.neg(p1)
+    ) + g2_optimized_3d_to_bytes(p2)
+
+    assert run_pairing_check(pair + cancelling_pair) == b"\x00" * 31 + b"\x01"
+    assert run_pairing_check(pair + pair) == b"\x00" * 32
+
+
+def test_bls12_pairing_check_rejects_point_outside_g2():
+    point = map_to_curve_G2(BLS12_FQ2((3, 4)))
+    data = g1_optimized_3d_to_bytes(bls12_381.G1) + g2_optimized_3d_to_bytes(point)
+
+    is_error, output, gas_remaining = run_precompile(
+        BaseComputation, bls12_pairing_check, data
+    )
+    assert is_error
+    assert output == b""
+    assert gas_remaining == 0
@@ -0,0 +1,105 @@
+import pytest
+from concurrent.futures import (
+    ThreadPoolExecutor,
+)
+
+from ckzg import (
+    blob_to_kzg_commitment,
+    compute_kzg_proof,
+)
+
+from eth.exceptions import (
+    VMError,
+)
+from eth.precompiles import (
+    point_evaluation,
+)
+from eth.precompiles.point_evaluation import (
+    get_trusted_setup,
+    kzg_to_versioned_hash,
+    verify_point_evaluation,
+    verify_point_evaluations,
+)
+from eth.vm.forks.cancun.constants import (
+    FIELD_ELEMENTS_PER_BLOB,
+)
+
+BLOB = b"".join(
+    index.to_bytes(32, "big") for index in range(1, FIELD_ELEMENTS_PER_BLOB + 1)
+)
+
+
+@pytest.fixture(scope="module")
+def point_evaluation_input():
+    trusted_setup = get_trusted_setup()
+    commitment = blob_to_kzg_commitment(BLOB, trusted_setup)
+    z = (2**64).to_bytes(32, "big")
+    proof, y = compute_kzg_proof(BLOB, z, trusted_setup)
+    return kzg_to_versioned_hash(commitment) + z + y + commitment + proof
+
+
+def test_verify_point_evaluation(point_evaluation_input):
+    verify_point_evaluation(point_evaluation_input)
+
+
+@pytest.mark.parametrize(
+    "corrupt, message",
+    (
+        (lambda input_: input_[:-1], "invalid input length"),
+        (lambda input_: bytes(32) + input_[32:], "does not match versioned hash"),
+        (lambda input_: input_[:64] + bytes(32) + input_[96:], "verification failed"),
+    ),
+)
+def test_verify_point_evaluation_rejects_invalid_input(
+    point_evaluation_input, corrupt, message
+):
+    with pytest.raises(VMError, match=message):
+        verify_point_evaluation(corrupt(point_evaluation_input))
+
+
+def test_verify_point_evaluations(point_evaluation_input):
+    invalid_input = (
+        point_evaluation_input[:64] + bytes(32) + point_evaluation_input[96:]
+    )
+
+    results = verify_point_evaluations(
+        (point_evaluation_input, invalid_input, point_evaluation_input)
+    )
+
+    assert results == (True, False, True)
+
+
+def test_trusted_setup_is_loaded_once(monkeypatch):
+    loaded = []
+
+    def load_trusted_setup(path, precompute):
+        loaded.append(precompute)
+        return object()
+
+    monkeypatch.setattr(point_evaluation, "load_trusted_setup", load_trusted_setup)
+    monkeypatch.setattr(point_evaluation, "_trusted_setup", None)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        trusted_setups = set(executor.map(lambda _: get_trusted_setup(), range(16)))
+
+    assert len(trusted_setups) == 1
+    assert loaded == [0]
+
+
+def test_set_trusted_setup_precompute_reloads_setup(monkeypatch):
+    loaded = []
+
+    def load_trusted_setup(path, precompute):
+        loaded.append(precompute)
+        return object()
+
+    monkeypatch.setattr(point_evaluation, "load_trusted_setup", load_trusted_setup)
+    monkeypatch.setattr(point_evaluation, "_trusted_setup", None)
+    monkeypatch.setattr(point_evaluation, "_trusted_setup_precompute", 0)
+
+    first_setup = get_trusted_setup()
+    point_evaluation.set_trusted_setup_precompute(8)
+    second_setup = get_trusted_setup()
+
+    assert first_setup is not second_setup
+    assert loaded == [0, 8]
@@ -0,0 +1,122 @@
+import pytest
+
+from eth_utils import (
+    encode_hex,
+)
+
+from eth._utils.address import (
+    force_bytes_to_address,
+)
+from eth.exceptions import (
+    PrecompileBackendMismatch,
+    VMError,
+)
+from eth.precompiles import (
+    blake2b_fcompress,
+    ecadd,
+    identity,
+)
+from eth.precompiles.backends import (
+    BLAKE2B_ADDRESS,
+    ECADD_ADDRESS,
+    check_precompile_backend,
+    get_precompile_backend_names,
+    register_precompile_backend,
+)
+from eth.vm.computation import (
+    BaseComputation,
+)
+from eth.vm.forks.prague.computation import (
+    PragueComputation,
+)
+
+IDENTITY_ADDRESS = force_bytes_to_address(b"\x04")
+
+
+@pytest.fixture(autouse=True)
+def precompile_backends(monkeypatch):
+    monkeypatch.setattr("eth.precompiles.backends._precompile_backends", {})
+
+
+def copy_data(computation):
+    # Same output and gas as the identity precompile
+    computation.consume_gas(15 + 3 * ((len(computation.msg.data) + 31) // 32), "")
+    computation.output = bytes(computation.msg.data)
+    return computation
+
+
+def copy_data_without_gas(computation):
+    computation.output = bytes(computation.msg.data)
+    return computation
+
+
+def truncate_data(computation):
+    identity(computation)
+    computation.output = computation.output[:32]
+    return computation
+
+
+def test_configure_precompile_backend():
+    register_precompile_backend(
+        "fast",
+        {
+            IDENTITY_ADDRESS: copy_data,
+            # not a precompile of Prague, so it is ignored
+            force_bytes_to_address(b"\xff"): copy_data,
+        },
+    )
+
+    computation_class = PragueComputation.configure_precompile_backend("fast")
+
+    assert get_precompile_backend_names() == ("fast",)
+    assert issubclass(computation_class, PragueComputation)
+    assert computation_class.__name__ == "PragueComputation[fast]"
+    precompiles = computation_class.get_precompiles()
+    assert precompiles[IDENTITY_ADDRESS] is copy_data
+    assert force_bytes_to_address(b"\xff") not in precompiles
+    assert {
+        address: precompile
+        for address, precompile in precompiles.items()
+        if address != IDENTITY_ADDRESS
+    } == {
+        address: precompile
+        for address, precompile in PragueComputation.get_precompiles().items()
+        if address != IDENTITY_ADDRESS
+    }
+    assert PragueComputation.get_precompiles()[IDENTITY_ADDRESS] is identity
+
+
+@pytest.mark.parametrize("candidate", (copy_data_without_gas, truncate_data))
+def test_configure_precompile_backend_rejects_mismatch(candidate):
+    register_precompile_backend("wrong", {IDENTITY_ADDRESS: candidate})
+
+    with pytest.raises(PrecompileBackendMismatch, match=encode_hex(IDENTITY_ADDRESS)):
+        PragueComputation.configure_precompile_backend("wrong")
+
+
+def test_configure_unknown_precompile_backend():
+    with pytest.raises(KeyError, match="unknown"):
+        PragueComputation.configure_precompile_backend("unknown")
+
+
+@pytest.mark.parametrize(
+    "address, reference",
+    (
+        (ECADD_ADDRESS, ecadd),
+        (BLAKE2B_ADDRESS, blake2b_fcompress),
+    ),
+)
+def test_check_precompile_backend_of_reference(address, reference):
+    check_precompile_backend(BaseComputation, address, reference, reference)
+
+
+def test_check_precompile_backend_detects_errors():
+    def reject_rounds(computation):
+        if computation.msg.data[:4] != bytes(4):
+            raise VMError("rounds are not supported")
+        return blake2b_fcompress(computation)
+
+    with pytest.raises(PrecompileBackendMismatch, match="is_error"):
+        check_precompile_backend(
+            BaseComputation, BLAKE2B_ADDRESS, blake2b_fcompress, reject_rounds
+        )
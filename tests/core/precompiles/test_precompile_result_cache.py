@@ -0,0 +1,144 @@
+import pytest
+import functools
+
+from eth._utils.address import (
+    force_bytes_to_address,
+)
+from eth.precompiles import (
+    backends,
+    ecadd,
+    identity,
+    sha256,
+)
+from eth.precompiles.result_cache import (
+    CACHED_PRECOMPILE_ADDRESSES,
+    CachedPrecompile,
+    PrecompileResultCache,
+)
+from eth.vm.computation import (
+    BaseComputation,
+)
+from eth.vm.forks.prague.computation import (
+    PragueComputation,
+)
+
+SHA256_ADDRESS = force_bytes_to_address(b"\x02")
+IDENTITY_ADDRESS = force_bytes_to_address(b"\x04")
+ECADD_ADDRESS = force_bytes_to_address(b"\x06")
+
+
+run_precompile = functools.partial(backends.run_precompile, BaseComputation)
+
+
+def sha256_of(data):
+    return run_precompile(sha256, data)[1]
+
+
+@pytest.fixture
+def cache():
+    return PrecompileResultCache()
+
+
+@pytest.mark.parametrize("data", (b"", b"\x01" * 100))
+def test_cached_results_match_uncached_results(cache, data):
+    cached_sha256 = CachedPrecompile(SHA256_ADDRESS, sha256, cache)
+    expected = run_precompile(sha256, data)
+
+    assert run_precompile(cached_sha256, data) == expected
+    assert cache.stats.misses == 1
+    assert run_precompile(cached_sha256, data) == expected
+    assert run_precompile(cached_sha256, data) == expected
+
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.entries) == (2, 1, 1)
+
+
+def test_cached_results_charge_gas_like_uncached_results(cache):
+    cached_sha256 = CachedPrecompile(SHA256_ADDRESS, sha256, cache)
+    data = b"\x01" * 100
+    run_precompile(cached_sha256, data)
+    gas_used = backends.SELF_TEST_GAS - run_precompile(sha256, data)[2]
+
+    # just enough gas, and not enough
+    assert run_precompile(cached_sha256, data, gas=gas_used) == (
+        False,
+        sha256_of(data),
+        0,
+    )
+    assert run_precompile(cached_sha256, data, gas=gas_used - 1) == (True, b"", 0)
+    assert cache.stats.hits == 2
+
+
+def test_failed_calls_are_not_cached(cache):
+    cached_ecadd = CachedPrecompile(ECADD_ADDRESS, ecadd, cache)
+    # (1, 1) is not on the curve
+    data = (1).to_bytes(32, "big") * 2 + bytes(64)
+
+    assert run_precompile(cached_ecadd, data) == run_precompile(ecadd, data)
+    assert run_precompile(cached_ecadd, data)[0]
+    assert cache.stats.entries == 0
+
+
+def test_results_of_other_precompiles_at_the_same_address_are_misses(cache):
+    run_precompile(CachedPrecompile(IDENTITY_ADDRESS, identity, cache), b"\x01")
+
+    def expensive_identity(computation):
+        computation.consume_gas(1000, reason="Expensive identity")
+        return identity(computation)
+
+    assert run_precompile(
+        CachedPrecompile(IDENTITY_ADDRESS, expensive_identity, cache), b"\x01"
+    ) == run_precompile(expensive_identity, b"\x01")
+    assert cache.stats.hits == 0
+
+
+def test_cache_is_bounded_by_bytes():
+    cache = PrecompileResultCache(max_bytes=1000)
+    cached_identity = CachedPrecompile(IDENTITY_ADDRESS, identity, cache)
+
+    for length in range(10):
+        run_precompile(cached_identity, bytes([length]) * 200)
+
+    stats = cache.stats
+    assert stats.size_in_bytes <= 1000
+    assert stats.entries < 10
+    assert stats.evictions == 10 - stats.entries
+
+    # the most recent result is still cached
+    run_precompile(cached_identity, bytes([9]) * 200)
+    assert cache.stats.hits == 1
+
+
+def test_configure_precompile_result_cache(cache):
+    computation_class = PragueComputation.configure_precompile_result_cache(
+        addresses=(SHA256_ADDRESS, force_bytes_to_address(b"\xff")),
+        cache=cache,
+    )
+
+    precompiles = computation_class.get_precompiles()
+    assert isinstance(precompiles[SHA256_ADDRESS], CachedPrecompile)
+    assert precompiles[SHA256_ADDRESS].precompile is sha256
+    assert precompiles[SHA256_ADDRESS].cache is cache
+    assert force_bytes_to_address(b"\xff") not in precompiles
+    assert {
+        address: precompile
+        for address, precompile in precompiles.items()
+        if address != SHA256_ADDRESS
+    } == {
+        address: precompile
+        for address, precompile in PragueComputation.get_precompiles().items()
+        if address != SHA256_ADDRESS
+    }
+    assert PragueComputation.get_precompiles()[SHA256_ADDRESS] is sha256
+
+
+def test_configure_precompile_result_cache_defaults():
+    computation_class = PragueComputation.configure_precompile_result_cache()
+
+    precompiles = computation_class.get_precompiles()
+    cached_addresses = {
+        address
+        for address, precompile in precompiles.items()
+        if isinstance(precompile, CachedPrecompile)
+    }
+    assert cached_addresses == set(CACHED_PRECOMPILE_ADDRESSES)
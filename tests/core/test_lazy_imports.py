@@ -0,0 +1,108 @@
+import pytest
+import subprocess
+import sys
+
+import eth
+from eth import (
+    precompiles,
+)
+from eth._utils.address import (
+    force_bytes_to_address,
+)
+from eth.chains.mainnet import (
+    MainnetChain,
+)
+from eth.precompiles import (
+    LazyPrecompile,
+)
+from eth.precompiles.backends import (
+    ECADD_ADDRESS,
+    get_self_test_inputs,
+    run_precompile,
+)
+from eth.vm.computation import (
+    BaseComputation,
+)
+from eth.vm.forks import (
+    LATEST_VM,
+    PragueVM,
+)
+from eth.vm.forks.prague.computation import (
+    PragueComputation,
+)
+
+LOADED_MODULES = """
+import sys
+{statements}
+print(" ".join(name for name in {modules!r} if name in sys.modules))
+"""
+
+
+def get_loaded_modules(statements, modules):
+    code = LOADED_MODULES.format(statements=statements, modules=modules)
+    return subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout.split()
+
+
+def test_import_eth_does_not_load_chains_or_crypto_libraries():
+    assert (
+        get_loaded_modules(
+            "import eth", ("eth.chains.base", "eth.vm.forks.frontier", "py_ecc", "ckzg")
+        )
+        == []
+    )
+
+
+def test_crypto_libraries_load_on_first_precompile_call():
+    statements = """
+from eth.precompiles.backends import ECADD_ADDRESS, get_self_test_inputs, run_precompile
+from eth.vm.computation import BaseComputation
+from eth.vm.forks.prague.computation import PragueComputation
+print(" ".join(name for name in ("py_ecc", "ckzg") if name in sys.modules))
+precompile = PragueComputation.get_precompiles()[ECADD_ADDRESS]
+run_precompile(BaseComputation, precompile, get_self_test_inputs(ECADD_ADDRESS)[0])
+"""
+    assert get_loaded_modules(statements, ("py_ecc", "ckzg")) == ["py_ecc"]
+
+
+def test_lazy_attributes():
+    assert eth.MainnetChain is MainnetChain
+    assert LATEST_VM is PragueVM
+    assert {"MainnetChain", "__version__"} <= set(dir(eth))
+    assert {"LATEST_VM", "FrontierVM", "PragueVM"} <= set(dir(eth.vm.forks))
+
+    with pytest.raises(AttributeError, match="UnknownChain"):
+        eth.UnknownChain
+
+
+def test_lazy_precompiles_are_not_hidden_by_their_modules():
+    # importing the module first binds it to the package, which must not hide the
+    # precompile of the same name
+    statements = """
+import eth.precompiles.ecpairing
+from eth.precompiles import ecpairing
+assert ecpairing is sys.modules["eth.precompiles.ecpairing"].ecpairing
+"""
+    assert get_loaded_modules(statements, ("py_ecc",)) == ["py_ecc"]
+
+
+@pytest.mark.parametrize("data", get_self_test_inputs(ECADD_ADDRESS))
+def test_lazy_precompile_matches_precompile(data):
+    lazy_ecadd = PragueComputation.get_precompiles()[ECADD_ADDRESS]
+    assert isinstance(lazy_ecadd, LazyPrecompile)
+
+    ecadd = precompiles.ecadd(gas_cost=150)
+    assert run_precompile(BaseComputation, lazy_ecadd, data) == run_precompile(
+        BaseComputation, ecadd, data
+    )
+    assert lazy_ecadd.resolve() is lazy_ecadd.resolve()
+
+
+def test_lazy_precompile_repr():
+    assert repr(LazyPrecompile("ecadd", gas_cost=150)) == (
+        "LazyPrecompile('ecadd', gas_cost=150)"
+    )
+    assert PragueComputation.get_precompiles()[
+        force_bytes_to_address(b"\x0b")
+    ].name == ("bls12_g1_add")
@@ -0,0 +1,96 @@
+import pytest
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+
+from eth_keys import (
+    keys,
+)
+from eth_keys.exceptions import (
+    BadSignature,
+)
+
+from eth._utils.transactions import (
+    recover_senders,
+)
+from eth.vm.forks.frontier.transactions import (
+    FrontierTransaction,
+)
+from eth.vm.forks.prague.transactions import (
+    Authorization,
+    PragueTransactionBuilder,
+)
+
+SENDER_KEY = keys.PrivateKey(b"\x01" * 32)
+AUTHORITY_KEY = keys.PrivateKey(b"\x02" * 32)
+
+
+def _signed_authorization(nonce):
+    unsigned = Authorization(1, b"\x42" * 20, nonce, 0, 0, 0)
+    signature = AUTHORITY_KEY.sign_msg(unsigned.get_message_for_signing())
+    y_parity, r, s = signature.vrs
+    return unsigned.copy(y_parity=y_parity, r=r, s=s)
+
+
+def _make_transactions():
+    builder = PragueTransactionBuilder()
+    legacy_transactions = [
+        builder.create_unsigned_transaction(
+            nonce=nonce,
+            gas_price=1,
+            gas=21000,
+            to=b"\x10" * 20,
+            value=1,
+            data=b"",
+        ).as_signed_transaction(SENDER_KEY)
+        for nonce in range(20)
+    ]
+    set_code_transaction = builder.new_unsigned_set_code_transaction(
+        chain_id=1,
+        nonce=20,
+        max_priority_fee_per_gas=1,
+        max_fee_per_gas=1,
+        gas=100000,
+        to=b"\x10" * 20,
+        value=0,
+        data=b"",
+        access_list=[],
+        authorization_list=[_signed_authorization(0), _signed_authorization(1)],
+    ).as_signed_transaction(SENDER_KEY, chain_id=1)
+    return legacy_transactions + [set_code_transaction]
+
+
+@pytest.mark.parametrize(
+    "executor_class",
+    (None, ThreadPoolExecutor, ProcessPoolExecutor),
+)
+def test_recover_senders(executor_class):
+    transactions = _make_transactions()
+
+    if executor_class is None:
+        recover_senders(transactions)
+    else:
+        with executor_class(max_workers=2) as executor:
+            recover_senders(transactions, executor)
+
+    expected_sender = SENDER_KEY.public_key.to_canonical_address()
+    expected_authority = AUTHORITY_KEY.public_key.to_canonical_address()
+    for transaction in transactions:
+        assert vars(transaction)["sender"] == expected_sender
+    for authorization in transactions[-1].authorization_list:
+        assert vars(authorization)["authority"] == expected_authority
+
+
+def test_recover_senders_skips_invalid_signatures():
+    valid_transaction = _make_transactions()[0]
+    invalid_transaction = FrontierTransaction(
+        0, 1, 21000, b"\x10" * 20, 1, b"", 27, 0, 0
+    )
+
+    recover_senders([valid_transaction, invalid_transaction])
+
+    assert "sender" in vars(valid_transaction)
+    assert "sender" not in vars(invalid_transaction)
+    with pytest.raises(BadSignature):
+        invalid_transaction.sender
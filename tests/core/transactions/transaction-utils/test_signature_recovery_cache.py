@@ -0,0 +1,156 @@
+import pytest
+
+from eth_keys import (
+    keys,
+)
+from eth_keys.exceptions import (
+    BadSignature,
+)
+from eth_utils import (
+    keccak,
+)
+
+from eth._utils.padding import (
+    pad32,
+)
+from eth._utils.signatures import (
+    SignatureRecoveryCache,
+    get_signature_recovery_cache,
+)
+from eth._utils.transactions import (
+    extract_transaction_sender,
+)
+from eth.constants import (
+    GAS_ECRECOVER,
+    ZERO_ADDRESS,
+)
+from eth.precompiles import (
+    ecrecover,
+)
+from eth.vm.computation import (
+    BaseComputation,
+)
+from eth.vm.forks.frontier.transactions import (
+    FrontierTransaction,
+)
+from eth.vm.message import (
+    Message,
+)
+from eth.vm.transaction_context import (
+    BaseTransactionContext,
+)
+
+PRIVATE_KEY = keys.PrivateKey(b"\x01" * 32)
+SIGNER = PRIVATE_KEY.public_key.to_canonical_address()
+
+
+@pytest.fixture(autouse=True)
+def signature_recovery_cache(monkeypatch):
+    cache = SignatureRecoveryCache(max_size=4)
+    monkeypatch.setattr("eth._utils.signatures._signature_recovery_cache", cache)
+    return cache
+
+
+def run_ecrecover(data):
+    message = Message(
+        to=ZERO_ADDRESS,
+        sender=ZERO_ADDRESS,
+        value=0,
+        data=data,
+        code=b"",
+        gas=10**6,
+    )
+    transaction_context = BaseTransactionContext(gas_price=1, origin=ZERO_ADDRESS)
+    computation = BaseComputation(None, message, transaction_context)
+    ecrecover(computation)
+    return computation
+
+
+def make_ecrecover_input(message_hash, signature):
+    v, r, s = signature.vrs
+    return message_hash + b"".join(
+        value.to_bytes(32, "big") for value in (v + 27, r, s)
+    )
+
+
+def make_transaction(nonce):
+    return FrontierTransaction.create_unsigned_transaction(
+        nonce=nonce,
+        gas_price=1,
+        gas=21000,
+        to=b"\x10" * 20,
+        value=1,
+        data=b"",
+    ).as_signed_transaction(PRIVATE_KEY)
+
+
+def test_get_signature_recovery_cache(signature_recovery_cache):
+    assert get_signature_recovery_cache() is signature_recovery_cache
+
+
+def test_transaction_sender_recovery_is_cached(signature_recovery_cache):
+    transaction = make_transaction(0)
+
+    assert extract_transaction_sender(transaction) == SIGNER
+    assert extract_transaction_sender(transaction) == SIGNER
+
+    stats = signature_recovery_cache.stats
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+    assert stats.hit_rate == 0.5
+
+
+def test_ecrecover_shares_cache_with_sender_recovery(signature_recovery_cache):
+    transaction = make_transaction(0)
+    message_hash = keccak(transaction.get_message_for_signing())
+    signature = PRIVATE_KEY.sign_msg_hash(message_hash)
+    data = make_ecrecover_input(message_hash, signature)
+
+    assert extract_transaction_sender(transaction) == SIGNER
+    computation = run_ecrecover(data)
+
+    assert computation.output == pad32(SIGNER)
+    assert computation.get_gas_used() == GAS_ECRECOVER
+    assert signature_recovery_cache.stats.hits == 1
+
+    # hits are charged the same gas as misses
+    signature_recovery_cache.clear()
+    computation = run_ecrecover(data)
+    assert computation.output == pad32(SIGNER)
+    assert computation.get_gas_used() == GAS_ECRECOVER
+    assert signature_recovery_cache.stats.misses == 2
+
+
+def test_signature_recovery_cache_is_bounded(signature_recovery_cache):
+    transactions = [make_transaction(nonce) for nonce in range(6)]
+    for transaction in transactions:
+        assert extract_transaction_sender(transaction) == SIGNER
+
+    stats = signature_recovery_cache.stats
+    assert (stats.entries, stats.evictions, stats.misses) == (4, 2, 6)
+
+    # the oldest signatures were evicted
+    extract_transaction_sender(transactions[0])
+    extract_transaction_sender(transactions[-1])
+    assert signature_recovery_cache.stats.misses == 7
+    assert signature_recovery_cache.stats.hits == 1
+
+    signature_recovery_cache.resize(2)
+    assert signature_recovery_cache.stats.entries == 2
+    assert signature_recovery_cache.max_size == 2
+
+    signature_recovery_cache.reset_stats()
+    stats = signature_recovery_cache.stats
+    assert (stats.hits, stats.misses, stats.evictions) == (0, 0, 0)
+
+
+def test_invalid_signatures_are_not_cached(signature_recovery_cache):
+    # no point on the curve has an x coordinate of 5
+    data = make_ecrecover_input(b"\x01" * 32, keys.Signature(vrs=(0, 5, 1)))
+    with pytest.raises(BadSignature):
+        keys.Signature(vrs=(0, 5, 1)).recover_public_key_from_msg_hash(b"\x01" * 32)
+
+    computation = run_ecrecover(data)
+
+    assert computation.output == b""
+    assert computation.get_gas_used() == GAS_ECRECOVER
+    assert signature_recovery_cache.stats.entries == 0
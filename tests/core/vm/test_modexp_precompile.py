@@ -9,6 +9,8 @@ from eth_utils import (
 from eth.precompiles.modexp import (
     _compute_modexp_gas_fee_eip_198,
     _modexp,
+    extract_lengths,
+    read_padded_int,
 )
 from eth.vm.forks.berlin.computation import (
     _compute_modexp_gas_fee_eip_2565,
@@ -51,3 +53,51 @@ def test_modexp_gas_fee_calculation_eip_2565(data, expected):
 def test_modexp_result(data, expected):
     actual = _modexp(data)
     assert actual == expected
+
+
+@pytest.mark.parametrize("data,expected", modexp_result())
+def test_modexp_result_of_memoryview(data, expected):
+    assert _modexp(memoryview(data)) == expected
+    assert _compute_modexp_gas_fee_eip_2565(
+        memoryview(data)
+    ) == _compute_modexp_gas_fee_eip_2565(data)
+
+
+@pytest.mark.parametrize(
+    "data,start,length,expected",
+    (
+        (b"\x01\x02\x03", 0, 3, 0x010203),
+        (b"\x01\x02\x03", 1, 4, 0x02030000),
+        (b"\x01\x02\x03", 3, 2, 0),
+        (b"\x01\x02\x03", 2**256, 32, 0),
+        (b"\x01\x02\x03", 0, 0, 0),
+    ),
+)
+def test_read_padded_int(data, start, length, expected):
+    assert read_padded_int(data, start, length) == expected
+    assert read_padded_int(memoryview(data), start, length) == expected
+
+
+def test_modexp_of_truncated_input():
+    # lengths of 1, 1 and 2, with the last byte of the modulus missing
+    data = (
+        (1).to_bytes(32, "big")
+        + (1).to_bytes(32, "big")
+        + (2).to_bytes(32, "big")
+        + b"\x03\x05\x07"
+    )
+    assert _modexp(data) == pow(3, 5, 0x0700)
+
+
+def test_gmpy2_powmod_matches_pow():
+    gmpy2 = pytest.importorskip("gmpy2")
+
+    for data, expected in modexp_result():
+        base_length, exponent_length, modulus_length = extract_lengths(data)
+        modulus = read_padded_int(
+            data, 96 + base_length + exponent_length, modulus_length
+        )
+        if base_length and modulus:
+            base = read_padded_int(data, 96, base_length)
+            exponent = read_padded_int(data, 96 + base_length, exponent_length)
+            assert int(gmpy2.powmod(base, exponent, modulus)) == expected
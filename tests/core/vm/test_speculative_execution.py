@@ -0,0 +1,185 @@
+import pytest
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+
+from eth_keys import (
+    keys,
+)
+from eth_utils import (
+    ValidationError,
+    decode_hex,
+    to_wei,
+)
+import rlp
+
+from eth.chains.base import (
+    MiningChain,
+)
+from eth.tools.builder.chain import (
+    api,
+)
+from eth.vm.forks import (
+    BerlinVM,
+    ByzantiumVM,
+    CancunVM,
+    LondonVM,
+)
+from eth.vm.speculative import (
+    Speculation,
+)
+from tests.tools.factories.transaction import (
+    new_transaction,
+)
+
+SENDER_KEYS = [keys.PrivateKey(bytes([index]) * 32) for index in range(1, 5)]
+SENDERS = [key.public_key.to_canonical_address() for key in SENDER_KEYS]
+
+COUNTER_ADDRESS = decode_hex("0x000000000000000000000000000000000000c0de")
+# Add 1 to storage slot 0: PUSH1 0 SLOAD PUSH1 1 ADD PUSH1 0 SSTORE STOP
+COUNTER_CODE = decode_hex("0x60005460010160005500")
+
+# Only ever called through the proxy, so its bytecode is only loaded by a CALL
+INNER_COUNTER_ADDRESS = decode_hex("0x000000000000000000000000000000000000c0d1")
+PROXY_ADDRESS = decode_hex("0x000000000000000000000000000000000000face")
+# CALL the inner counter with all gas left and no data, then STOP
+PROXY_CODE = (
+    decode_hex("0x60006000600060006000")
+    + b"\x73"
+    + INNER_COUNTER_ADDRESS
+    + decode_hex("0x5af15000")
+)
+
+
+def _build_chain(vm_class, *applicators):
+    genesis_params = {"gas_limit": 3141592, "timestamp": 1501851927}
+    if vm_class is CancunVM:
+        genesis_params.update(difficulty=0, nonce=b"\x00" * 8)
+
+    genesis_state = {
+        sender: {"balance": to_wei(10, "ether"), "nonce": 0, "code": b"", "storage": {}}
+        for sender in SENDERS
+    }
+    contracts = (
+        (COUNTER_ADDRESS, COUNTER_CODE),
+        (INNER_COUNTER_ADDRESS, COUNTER_CODE),
+        (PROXY_ADDRESS, PROXY_CODE),
+    )
+    for address, code in contracts:
+        genesis_state[address] = {
+            "balance": 0,
+            "nonce": 0,
+            "code": code,
+            "storage": {},
+        }
+    return api.build(
+        MiningChain,
+        api.fork_at(vm_class, 0),
+        api.disable_pow_check(),
+        *applicators,
+        api.genesis(params=genesis_params, state=genesis_state),
+    )
+
+
+def _make_transactions(vm):
+    def transaction(sender_index, to, amount, nonce):
+        return new_transaction(
+            vm,
+            SENDERS[sender_index],
+            to,
+            amount,
+            SENDER_KEYS[sender_index],
+            nonce=nonce,
+        )
+
+    recipient = decode_hex("0x00000000000000000000000000000000000000aa")
+    return [
+        # increments the inner counter through the proxy
+        transaction(3, PROXY_ADDRESS, 0, nonce=0),
+        # independent transfers
+        transaction(0, recipient, 1, nonce=0),
+        transaction(1, SENDERS[2], 2, nonce=0),
+        # both touch the counter's storage
+        transaction(2, COUNTER_ADDRESS, 0, nonce=0),
+        transaction(0, COUNTER_ADDRESS, 0, nonce=1),
+        # sender of an earlier transaction sends again
+        transaction(1, recipient, 3, nonce=1),
+    ]
+
+
+def _copy_block(block):
+    return rlp.decode(rlp.encode(block), sedes=type(block))
+
+
+@pytest.mark.parametrize("vm_class", (ByzantiumVM, BerlinVM, LondonVM, CancunVM))
+@pytest.mark.parametrize("executor_class", (ThreadPoolExecutor, ProcessPoolExecutor))
+def test_speculative_import_matches_sequential(vm_class, executor_class, monkeypatch):
+    mining_chain = _build_chain(vm_class)
+    transactions = _make_transactions(mining_chain.get_vm())
+    import_result, receipts, _ = mining_chain.mine_all(transactions)
+    block = import_result.imported_block
+
+    sequential_result = _build_chain(vm_class).import_block(_copy_block(block))
+
+    reused = []
+    original_apply_to = Speculation.apply_to
+
+    def apply_to(speculation, *args):
+        reused.append(speculation)
+        return original_apply_to(speculation, *args)
+
+    monkeypatch.setattr(Speculation, "apply_to", apply_to)
+
+    with executor_class(max_workers=4) as executor:
+        speculative_chain = _build_chain(
+            vm_class, api.enable_speculative_execution(executor)
+        )
+        speculative_result = speculative_chain.import_block(_copy_block(block))
+
+    imported_block = speculative_result.imported_block
+    assert imported_block.header.state_root == block.header.state_root
+    assert imported_block.header.receipt_root == block.header.receipt_root
+    assert imported_block.header.gas_used == block.header.gas_used
+
+    counter_state = speculative_chain.get_vm().state
+    assert counter_state.get_storage(COUNTER_ADDRESS, 0) == 2
+    assert counter_state.get_storage(INNER_COUNTER_ADDRESS, 0) == 1
+
+    meta_witness = speculative_result.meta_witness
+    expected_meta_witness = sequential_result.meta_witness
+    assert meta_witness.hashes == expected_meta_witness.hashes
+    assert meta_witness.accounts_queried == expected_meta_witness.accounts_queried
+    assert INNER_COUNTER_ADDRESS in meta_witness.account_bytecodes_queried
+    assert (
+        meta_witness.account_bytecodes_queried
+        == expected_meta_witness.account_bytecodes_queried
+    )
+    for address in meta_witness.accounts_queried:
+        assert meta_witness.get_slots_queried(
+            address
+        ) == expected_meta_witness.get_slots_queried(address)
+
+    # the first transaction of each sender doesn't conflict with anything earlier
+    assert len(reused) >= 2
+    assert len(reused) < len(transactions)
+
+
+def test_speculative_execution_requires_vm_configuration():
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        with pytest.raises(ValidationError):
+            api.build(
+                MiningChain.configure(vm_configuration=()),
+                api.enable_speculative_execution(executor),
+            )
+
+
+def test_speculating_in_processes_requires_importable_state_class():
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        with pytest.raises(ValidationError, match="must be importable"):
+            api.build(
+                MiningChain,
+                api.fork_at(LondonVM, 0),
+                api.trust_inputs(),
+                api.enable_speculative_execution(executor),
+            )
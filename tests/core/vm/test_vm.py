@@ -1,4 +1,7 @@
 import pytest
+from concurrent.futures import (
+    ThreadPoolExecutor,
+)
 
 from eth_utils import (
     ValidationError,
@@ -16,6 +19,9 @@ from eth.chains.mainnet import (
     MAINNET_VMS,
     MINING_MAINNET_VMS,
 )
+from eth.db.prefetch import (
+    StatePrefetcher,
+)
 from eth.tools.builder.chain import (
     api,
 )
@@ -146,6 +152,87 @@ def test_import_block(chain, funded_address, funded_address_private_key):
     assert block.transactions == (tx,)
 
 
+def test_import_block_recovers_senders_in_executor(
+    chain, funded_address, funded_address_private_key, monkeypatch
+):
+    recipient = decode_hex("0xa94f5374fce5edbc8e2a8697c15331677e6ebf0c")
+    transactions = [
+        new_transaction(
+            chain.get_vm(),
+            funded_address,
+            recipient,
+            amount,
+            funded_address_private_key,
+            nonce=nonce,
+        )
+        for nonce, amount in enumerate(range(100, 103))
+    ]
+    if isinstance(chain, MiningChain):
+        pending_header = chain.header
+        import_result, _, _ = chain.mine_all(transactions)
+        new_block = import_result.imported_block
+    else:
+        new_block, _, _ = chain.build_block_with_transactions_and_withdrawals(
+            transactions
+        )
+        pending_header = chain.create_header_from_parent(chain.get_canonical_head())
+
+    # decode a fresh copy of the block, with no senders recovered yet
+    block_class = type(new_block)
+    fresh_block = rlp.decode(rlp.encode(new_block), sedes=block_class)
+    assert not any("sender" in vars(tx) for tx in fresh_block.transactions)
+
+    validation_vm = chain.get_vm(pending_header)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        monkeypatch.setattr(type(validation_vm), "sender_recovery_executor", executor)
+        block, _ = validation_vm.import_block(fresh_block)
+
+    assert block.transactions == new_block.transactions
+    assert all(vars(tx)["sender"] == funded_address for tx in fresh_block.transactions)
+
+
+def test_import_block_with_state_prefetcher(
+    chain, funded_address, funded_address_private_key, monkeypatch
+):
+    recipient = decode_hex("0xa94f5374fce5edbc8e2a8697c15331677e6ebf0c")
+    transaction = new_transaction(
+        chain.get_vm(), funded_address, recipient, 100, funded_address_private_key
+    )
+    if isinstance(chain, MiningChain):
+        pending_header = chain.header
+        import_result, _, _ = chain.mine_all([transaction])
+        new_block = import_result.imported_block
+    else:
+        new_block, _, _ = chain.build_block_with_transactions_and_withdrawals(
+            [transaction]
+        )
+        pending_header = chain.create_header_from_parent(chain.get_canonical_head())
+
+    expected_block, _ = chain.get_vm(pending_header).import_block(new_block)
+
+    validation_vm = chain.get_vm(pending_header)
+    # prefetch synchronously, so that execution finds everything in the cache
+    prefetcher = StatePrefetcher()
+    prefetches = []
+    original_prefetch_block = prefetcher.prefetch_block
+
+    def prefetch_block(*args):
+        prefetch = original_prefetch_block(*args)
+        prefetches.append(prefetch)
+        return prefetch
+
+    monkeypatch.setattr(prefetcher, "prefetch_block", prefetch_block)
+    monkeypatch.setattr(type(validation_vm), "state_prefetcher", prefetcher)
+    block, meta_witness = validation_vm.import_block(new_block)
+
+    assert block == expected_block
+    assert funded_address in meta_witness.accounts_queried
+
+    # the sender's and recipient's trie nodes were served by the prefetch cache
+    (prefetch,) = prefetches
+    assert prefetch.db.hits >= 2
+
+
 def test_validate_header_succeeds_but_pow_fails(
     pow_consensus_chain,
     noproof_consensus_mining_chain,
@@ -6,12 +6,18 @@ from eth_hash.auto import (
 from eth_utils import (
     ValidationError,
 )
+import rlp
+from trie import (
+    HexaryTrie,
+)
 
 from eth.constants import (
+    BLANK_ROOT_HASH,
     EMPTY_SHA3,
 )
 from eth.db.account import (
     AccountDB,
+    AccountRecord,
 )
 from eth.db.atomic import (
     AtomicDB,
@@ -19,6 +25,9 @@ from eth.db.atomic import (
 from eth.db.backends.memory import (
     MemoryDB,
 )
+from eth.rlp.accounts import (
+    Account,
+)
 
 ADDRESS = b"\xaa" * 20
 OTHER_ADDRESS = b"\xbb" * 20
@@ -138,6 +147,40 @@ def test_accounts(state):
         state.account_has_code_or_nonce(INVALID_ADDRESS)
 
 
+@pytest.mark.parametrize(
+    "nonce, balance, storage_root, code_hash",
+    (
+        (0, 0, BLANK_ROOT_HASH, EMPTY_SHA3),
+        (1, 2**256 - 1, keccak(b"storage"), keccak(b"code")),
+        (2**64 - 1, 0x80, BLANK_ROOT_HASH, keccak(b"")),
+    ),
+)
+def test_account_record_matches_account_rlp(nonce, balance, storage_root, code_hash):
+    account = Account(nonce, balance, storage_root, code_hash)
+    record = AccountRecord(nonce, balance, storage_root, code_hash)
+
+    assert record.to_rlp() == rlp.encode(account)
+    assert AccountRecord.from_rlp(rlp.encode(account)) == record
+
+
+def test_account_db_state_root_matches_rlp_encoded_trie(account_db):
+    account_db.set_balance(ADDRESS, 10)
+    account_db.increment_nonce(ADDRESS)
+    account_db.set_code(OTHER_ADDRESS, b"\x60\x00")
+    account_db.set_storage(OTHER_ADDRESS, 1, 1)
+    state_root = account_db.make_state_root()
+
+    expected_trie = HexaryTrie(MemoryDB())
+    expected_trie[keccak(ADDRESS)] = rlp.encode(Account(nonce=1, balance=10))
+    expected_trie[keccak(OTHER_ADDRESS)] = rlp.encode(
+        Account(
+            storage_root=account_db._get_storage_root(OTHER_ADDRESS),
+            code_hash=keccak(b"\x60\x00"),
+        )
+    )
+    assert state_root == expected_trie.root_hash
+
+
 def test_storage(account_db):
     assert account_db.get_storage(ADDRESS, 0) == 0
 
@@ -185,6 +228,29 @@ def test_account_db_storage_root(account_db):
     assert account_db.get_storage(OTHER_ADDRESS, 3) == 5
 
 
+def test_account_db_storage_root_matches_rlp_encoded_trie(account_db):
+    slot_values = {0: 1, 1: 2**256 - 1, 2**255: 0x80, 2**256 - 1: 0x7F}
+    for slot, value in slot_values.items():
+        account_db.set_storage(ADDRESS, slot, value)
+    # zeroed slots are removed from the trie
+    account_db.set_storage(ADDRESS, 5, 3)
+    account_db.set_storage(ADDRESS, 5, 0)
+    account_db.make_state_root()
+
+    expected_trie = HexaryTrie(MemoryDB())
+    for slot, value in slot_values.items():
+        expected_trie[keccak(slot.to_bytes(32, "big"))] = rlp.encode(value)
+
+    storage_root = account_db._get_storage_root(ADDRESS)
+    assert storage_root == expected_trie.root_hash
+
+    account_db.persist()
+    reloaded_db = AccountDB(account_db._raw_store_db, account_db.state_root)
+    for slot, value in slot_values.items():
+        assert reloaded_db.get_storage(ADDRESS, slot) == value
+    assert reloaded_db.get_storage(ADDRESS, 5) == 0
+
+
 def test_account_db_update_then_make_root_then_read(account_db):
     assert account_db.get_storage(ADDRESS, 1) == 0
     account_db.set_storage(ADDRESS, 1, 2)
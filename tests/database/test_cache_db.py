@@ -0,0 +1,155 @@
+import pytest
+
+from eth.db.backends.memory import (
+    MemoryDB,
+)
+from eth.db.cache import (
+    CacheDB,
+    TinyLFUAdmission,
+)
+
+
+@pytest.fixture
+def base_db():
+    return MemoryDB({bytes([idx]): bytes([idx]) * 10 for idx in range(32)})
+
+
+def test_cache_db_counts_hits_and_misses(base_db):
+    cache_db = CacheDB(base_db)
+
+    assert cache_db[b"\x01"] == b"\x01" * 10
+    assert cache_db[b"\x01"] == b"\x01" * 10
+    assert cache_db[b"\x02"] == b"\x02" * 10
+
+    stats = cache_db.stats
+    assert stats.hits == 1
+    assert stats.misses == 2
+    assert stats.evictions == 0
+    assert stats.entries == 2
+    assert stats.size_in_bytes == 22
+    assert stats.hit_rate == pytest.approx(1 / 3)
+
+
+def test_cache_db_missing_key(base_db):
+    cache_db = CacheDB(base_db)
+
+    with pytest.raises(KeyError):
+        cache_db[b"missing"]
+    assert b"missing" not in cache_db._cached_values
+    assert cache_db.stats.misses == 1
+
+
+def test_cache_db_counts_evictions(base_db):
+    cache_db = CacheDB(base_db, cache_size=2)
+
+    for idx in range(5):
+        cache_db[bytes([idx])]
+
+    stats = cache_db.stats
+    assert stats.evictions == 3
+    assert stats.entries == 2
+
+
+def test_cache_db_bounded_by_bytes(base_db):
+    # each entry is 1 byte of key and 10 bytes of value
+    cache_db = CacheDB(base_db, max_bytes=35)
+
+    for idx in range(10):
+        cache_db[bytes([idx])]
+
+    stats = cache_db.stats
+    assert stats.entries == 3
+    assert stats.size_in_bytes == 33
+    assert stats.evictions == 7
+
+    # the most recently used entries are kept
+    assert cache_db[b"\x09"] == b"\x09" * 10
+    assert cache_db.stats.hits == 1
+
+
+def test_cache_db_does_not_cache_oversized_values(base_db):
+    base_db[b"big"] = b"\xff" * 100
+    cache_db = CacheDB(base_db, max_bytes=50)
+
+    cache_db[b"\x01"]
+    assert cache_db[b"big"] == b"\xff" * 100
+    assert cache_db.stats.entries == 1
+    assert cache_db.stats.size_in_bytes == 11
+
+
+def test_cache_db_write_through(base_db):
+    cache_db = CacheDB(base_db, max_bytes=100)
+
+    cache_db[b"new"] = b"value"
+    assert base_db[b"new"] == b"value"
+    assert cache_db[b"new"] == b"value"
+    assert cache_db.stats.hits == 1
+
+    del cache_db[b"new"]
+    assert b"new" not in base_db
+    with pytest.raises(KeyError):
+        cache_db[b"new"]
+
+
+@pytest.mark.parametrize("max_bytes", (None, 44))
+def test_cache_db_admission_keeps_hot_entries_through_scan(base_db, max_bytes):
+    cache_db = CacheDB(
+        base_db,
+        cache_size=4,
+        max_bytes=max_bytes,
+        admission_policy=TinyLFUAdmission(width=256),
+    )
+
+    hot_keys = [bytes([idx]) for idx in range(4)]
+    for _ in range(3):
+        for key in hot_keys:
+            cache_db[key]
+
+    # a one-off scan over other keys must not displace the hot keys
+    for idx in range(4, 32):
+        cache_db[bytes([idx])]
+
+    hits_before = cache_db.stats.hits
+    for key in hot_keys:
+        cache_db[key]
+    assert cache_db.stats.hits == hits_before + len(hot_keys)
+    assert cache_db.stats.rejections > 0
+
+
+def test_cache_db_reset_keeps_stats(base_db):
+    cache_db = CacheDB(base_db, max_bytes=100)
+    cache_db[b"\x01"]
+    cache_db.reset_cache()
+
+    assert cache_db.stats.entries == 0
+    assert cache_db.stats.misses == 1
+
+    cache_db.reset_stats()
+    assert cache_db.stats.misses == 0
+
+
+def test_cache_db_admission_compares_against_every_victim():
+    small_keys = [bytes([idx]) for idx in range(4)]
+    base_db = MemoryDB({key: key * 9 for key in small_keys})
+    base_db[b"large"] = b"\xff" * 35
+    cache_db = CacheDB(
+        base_db, max_bytes=40, admission_policy=TinyLFUAdmission(width=256)
+    )
+
+    # the oldest entry is only read once, the others are hot
+    for key in small_keys:
+        cache_db[key]
+    for _ in range(3):
+        for key in small_keys[1:]:
+            cache_db[key]
+
+    # the large value beats the oldest entry, but would evict all of them
+    for _ in range(2):
+        cache_db[b"large"]
+    assert cache_db.stats.rejections == 2
+    assert cache_db.stats.evictions == 0
+
+    hits_before = cache_db.stats.hits
+    for key in small_keys:
+        cache_db[key]
+    assert cache_db.stats.hits == hits_before + len(small_keys)
@@ -302,6 +302,51 @@ def test_chaindb_persist_block(chaindb, block):
     assert chaindb.exists(block_to_hash_key)
 
 
+def test_chaindb_persist_blocks_matches_persist_block(base_db):
+    genesis = FrontierBlock(BlockHeader(difficulty=1, block_number=0, gas_limit=1))
+    genesis = genesis.copy(header=set_empty_root(None, genesis.header))
+    blocks = [genesis]
+    for _ in range(3):
+        child_header = BlockHeader(
+            difficulty=1,
+            block_number=blocks[-1].number + 1,
+            gas_limit=1,
+            parent_hash=blocks[-1].hash,
+            timestamp=blocks[-1].header.timestamp + 1,
+        )
+        blocks.append(FrontierBlock(set_empty_root(None, child_header)))
+
+    sequential_db = ChainDB(AtomicDB())
+    expected_changes = tuple(sequential_db.persist_block(block) for block in blocks)
+
+    batch_db = ChainDB(base_db)
+    assert batch_db.persist_blocks(blocks) == expected_changes
+    assert batch_db.get_canonical_head() == sequential_db.get_canonical_head()
+    for block in blocks:
+        assert batch_db.get_score(block.hash) == sequential_db.get_score(block.hash)
+
+
+def test_chaindb_persist_blocks_is_atomic(chaindb):
+    genesis = FrontierBlock(BlockHeader(difficulty=1, block_number=0, gas_limit=1))
+    genesis = genesis.copy(header=set_empty_root(chaindb, genesis.header))
+    orphan = FrontierBlock(
+        set_empty_root(
+            chaindb,
+            BlockHeader(
+                difficulty=1,
+                block_number=5,
+                gas_limit=1,
+                parent_hash=b"\x01" * 32,
+                timestamp=1,
+            ),
+        )
+    )
+
+    with pytest.raises(ParentNotFound):
+        chaindb.persist_blocks([genesis, orphan])
+    assert not chaindb.header_exists(genesis.hash)
+
+
 def test_chaindb_get_score(chaindb):
     genesis = BlockHeader(difficulty=1, block_number=0, gas_limit=0)
     chaindb.persist_header(genesis)
@@ -926,6 +926,52 @@ def test_headerdb_persist_header_chain_disallows_non_contiguous_chain(
         headerdb.persist_header_chain(non_contiguous_headers)
 
 
+@pytest.mark.parametrize("segment_size", (1, 3, 20))
+def test_headerdb_persist_header_stream(headerdb, genesis_header, segment_size):
+    headerdb.persist_header(genesis_header)
+    headers = mk_header_chain(genesis_header, length=10)
+
+    new_canonical, old_canonical = headerdb.persist_header_stream(
+        iter(headers), segment_size=segment_size
+    )
+
+    assert new_canonical == headers
+    assert old_canonical == ()
+    assert_is_canonical_chain(headerdb, headers)
+    assert headerdb.get_header_chain_gaps() == ((), 11)
+
+
+def test_headerdb_persist_header_stream_switches_canonical_chain(
+    headerdb, genesis_header
+):
+    headerdb.persist_header(genesis_header)
+    chain_a = mk_header_chain(genesis_header, 5)
+    chain_b = mk_header_chain(genesis_header, 9)
+    headerdb.persist_header_chain(chain_a)
+
+    new_canonical, old_canonical = headerdb.persist_header_stream(
+        chain_b, segment_size=4
+    )
+
+    assert new_canonical == chain_b
+    assert old_canonical == chain_a
+    assert_is_canonical_chain(headerdb, chain_b)
+
+
+def test_headerdb_persist_header_stream_keeps_persisted_segments(
+    headerdb, genesis_header
+):
+    headerdb.persist_header(genesis_header)
+    headers = mk_header_chain(genesis_header, length=6)
+    non_contiguous_headers = headers[:4] + headers[5:]
+
+    with pytest.raises(ValidationError, match="Non-contiguous chain"):
+        headerdb.persist_header_stream(non_contiguous_headers, segment_size=3)
+
+    assert_is_canonical_chain(headerdb, headers[:3])
+    assert not headerdb.header_exists(headers[3].hash)
+
+
 def test_headerdb_persist_header_returns_new_canonical_chain(headerdb, genesis_header):
     gen_result, _ = headerdb.persist_header(genesis_header)
     assert gen_result == (genesis_header,)
@@ -20,6 +20,7 @@ from eth.db.backends.memory import (
 )
 from eth.db.journal import (
     JournalDB,
+    UndoLogJournalDB,
 )
 from eth.db.slow_journal import (
     JournalDB as SlowJournalDB,
@@ -34,9 +35,14 @@ def memory_db():
     return MemoryDB()
 
 
+@pytest.fixture(params=[JournalDB, UndoLogJournalDB])
+def journal_db_class(request):
+    return request.param
+
+
 @pytest.fixture
-def journal_db(memory_db):
-    return JournalDB(memory_db)
+def journal_db(memory_db, journal_db_class):
+    return journal_db_class(memory_db)
 
 
 def test_delete_removes_data_from_underlying_db_after_persist(journal_db, memory_db):
@@ -499,10 +505,10 @@ def test_journal_db_diff_application_mimics_persist(journal_db, memory_db, actio
     assert memory_db == diff_test_db
 
 
-def test_journal_persist_delete_fail_then_persist():
+def test_journal_persist_delete_fail_then_persist(journal_db_class):
     db = {b"delete-me": b"val"}
 
-    journal_db = JournalDB(db)
+    journal_db = journal_db_class(db)
 
     del journal_db[b"delete-me"]
 
@@ -543,14 +549,14 @@ class MemoryDBSetRaisesMissingData(MemoryDB):
         (MemoryDBSetRaisesMissingData, EVMMissingData),
     ),
 )
-def test_journal_persist_set_fail(db_class, expected_exception):
+def test_journal_persist_set_fail(db_class, expected_exception, journal_db_class):
     memory_db = db_class()
 
     # make sure test is set up correctly
     with pytest.raises(expected_exception):
         memory_db[b"failing-to-set-key"] = b"val"
 
-    journal_db = JournalDB(memory_db)
+    journal_db = journal_db_class(memory_db)
 
     journal_db[b"failing-to-set-key"] = b"val"
 
@@ -566,11 +572,11 @@ def test_journal_persist_set_fail(db_class, expected_exception):
     ),
 )
 def test_journal_persist_set_fail_leaves_checkpoint_in_place(
-    db_class, expected_exception
+    db_class, expected_exception, journal_db_class
 ):
     memory_db = db_class()
 
-    journal_db = JournalDB(memory_db)
+    journal_db = journal_db_class(memory_db)
 
     journal_db[b"failing-to-set-key"] = b"val"
     with pytest.raises(expected_exception):
@@ -587,11 +593,13 @@ def test_journal_persist_set_fail_leaves_checkpoint_in_place(
         (MemoryDBSetRaisesMissingData, EVMMissingData),
     ),
 )
-def test_journal_persist_set_fail_then_persist(db_class, expected_exception):
+def test_journal_persist_set_fail_then_persist(
+    db_class, expected_exception, journal_db_class
+):
     original_data = {b"data-to-delete": b"val"}
     memory_db = db_class(original_data)
 
-    journal_db = JournalDB(memory_db)
+    journal_db = journal_db_class(memory_db)
 
     journal_db[b"failing-to-set-key"] = b"val"
     with pytest.raises(expected_exception):
@@ -730,6 +738,9 @@ class JournalComparison(RuleBasedStateMachine):
     values = Bundle("values")
     checkpoints = Bundle("checkpoints")
 
+    def _slow_has_checkpoint(self, checkpoint):
+        return self.slow_journal.has_changeset(checkpoint)
+
     @rule(target=keys, k=st.binary())
     def add_key(self, k):
         return k
@@ -764,7 +775,7 @@ class JournalComparison(RuleBasedStateMachine):
     @rule(c=checkpoints)
     def commit(self, c):
         slow_checkpoint, fast_checkpoint = c
-        if not self.slow_journal.has_changeset(slow_checkpoint):
+        if not self._slow_has_checkpoint(slow_checkpoint):
             assert not self.fast_journal.has_checkpoint(fast_checkpoint)
             return
         else:
@@ -775,12 +786,14 @@ class JournalComparison(RuleBasedStateMachine):
     @rule(c=checkpoints)
     def discard(self, c):
         slow_checkpoint, fast_checkpoint = c
-        if not self.slow_journal.has_changeset(slow_checkpoint):
+        if not self._slow_has_checkpoint(slow_checkpoint):
             assert not self.fast_journal.has_checkpoint(fast_checkpoint)
         else:
             self.slow_journal.discard(slow_checkpoint)
             self.fast_journal.discard(fast_checkpoint)
             assert self.slow_journal.diff() == self.fast_journal.diff()
+            if isinstance(self.slow_journal, JournalDB):
+                assert self.slow_journal.has_clear() == self.fast_journal.has_clear()
 
     @rule()
     def flatten(self):
@@ -796,6 +809,44 @@ class JournalComparison(RuleBasedStateMachine):
 
 
 JournalComparison.TestCase.settings = settings(
-    max_examples=200, stateful_step_count=100
+    max_examples=200,
+    stateful_step_count=100,
+    suppress_health_check=(HealthCheck.too_slow,),
 )
 TestJournalComparison = JournalComparison.TestCase
+
+
+class UndoLogJournalComparison(JournalComparison):
+    """
+    Compare the changeset-based JournalDB against the undo-log-based one.
+    """
+
+    def __init__(self):
+        RuleBasedStateMachine.__init__(self)
+        self.slow_wrapped = {}
+        self.slow_journal = JournalDB(self.slow_wrapped)
+        self.fast_wrapped = {}
+        self.fast_journal = UndoLogJournalDB(self.fast_wrapped)
+
+    def _slow_has_checkpoint(self, checkpoint):
+        return self.slow_journal.has_checkpoint(checkpoint)
+
+    @rule()
+    def clear(self):
+        self.slow_journal.clear()
+        self.fast_journal.clear()
+        assert self.slow_journal.has_clear() == self.fast_journal.has_clear()
+        assert self.slow_journal.diff() == self.fast_journal.diff()
+
+    @rule(k=JournalComparison.keys)
+    def get(self, k):
+        assert (k in self.slow_journal) == (k in self.fast_journal)
+        assert self.slow_journal.get(k) == self.fast_journal.get(k)
+
+
+UndoLogJournalComparison.TestCase.settings = settings(
+    max_examples=200,
+    stateful_step_count=100,
+    suppress_health_check=(HealthCheck.too_slow,),
+)
+TestUndoLogJournalComparison = UndoLogJournalComparison.TestCase
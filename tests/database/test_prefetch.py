@@ -0,0 +1,182 @@
+import pytest
+from concurrent.futures import (
+    ThreadPoolExecutor,
+)
+from typing import (
+    NamedTuple,
+)
+
+from eth_utils import (
+    decode_hex,
+)
+
+from eth.constants import (
+    CREATE_CONTRACT_ADDRESS,
+)
+from eth.db.account import (
+    AccountDB,
+)
+from eth.db.atomic import (
+    AtomicDB,
+)
+from eth.db.backends.memory import (
+    MemoryDB,
+)
+from eth.db.prefetch import (
+    StatePrefetcher,
+    get_constant_storage_slots,
+)
+from eth.db.witness import (
+    AccountQueryTracker,
+    MetaWitness,
+)
+
+SENDER = b"\x01" * 20
+CONTRACT = b"\x02" * 20
+LISTED = b"\x03" * 20
+
+# PUSH1 0x07 SLOAD PUSH2 0x0102 SSTORE PUSH1 0x54 STOP
+CONTRACT_CODE = decode_hex("0x600754610102556054" + "00")
+
+
+class ReadCountingDB(MemoryDB):
+    def __init__(self) -> None:
+        super().__init__()
+        self.reads = 0
+
+    def __getitem__(self, key: bytes) -> bytes:
+        self.reads += 1
+        return super().__getitem__(key)
+
+
+class FakeTransaction(NamedTuple):
+    sender: bytes
+    to: bytes
+    access_list: tuple = ()
+
+
+@pytest.fixture
+def counting_db():
+    return ReadCountingDB()
+
+
+@pytest.fixture
+def state_root(counting_db):
+    account_db = AccountDB(AtomicDB(counting_db))
+    account_db.set_balance(SENDER, 10**18)
+    account_db.set_code(CONTRACT, CONTRACT_CODE)
+    for slot in range(1, 300):
+        account_db.set_storage(CONTRACT, slot, slot)
+        account_db.set_storage(LISTED, slot, slot)
+    account_db.persist()
+    return account_db.state_root
+
+
+def _read_state(account_db):
+    return (
+        account_db.get_balance(SENDER),
+        account_db.get_code(CONTRACT),
+        account_db.get_storage(CONTRACT, 7),
+        account_db.get_storage(CONTRACT, 0x0102),
+        account_db.get_storage(LISTED, 42),
+    )
+
+
+@pytest.mark.parametrize(
+    "code, expected_slots",
+    (
+        (b"", set()),
+        (CONTRACT_CODE, {7, 0x0102}),
+        # the SLOAD is push data, not an instruction
+        (decode_hex("0x60016154540000"), set()),
+        # the slot is computed, not pushed right before
+        (decode_hex("0x6001600101546000"), set()),
+        # truncated push data at the end of the code
+        (decode_hex("0x61"), set()),
+    ),
+)
+def test_get_constant_storage_slots(code, expected_slots):
+    assert get_constant_storage_slots(code) == expected_slots
+
+
+@pytest.mark.parametrize("use_executor", (False, True))
+def test_prefetched_state_is_read_from_cache(counting_db, state_root, use_executor):
+    transactions = [
+        FakeTransaction(SENDER, CONTRACT),
+        FakeTransaction(SENDER, CREATE_CONTRACT_ADDRESS, ((LISTED, (42,)),)),
+    ]
+    expected_state = _read_state(AccountDB(AtomicDB(counting_db), state_root))
+
+    if use_executor:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            prefetch = StatePrefetcher(executor).prefetch_block(
+                AtomicDB(counting_db), state_root, transactions
+            )
+        # leaving the executor's context waited for prefetching to finish
+    else:
+        prefetch = StatePrefetcher().prefetch_block(
+            AtomicDB(counting_db), state_root, transactions
+        )
+
+    reads_before_execution = counting_db.reads
+    assert _read_state(AccountDB(prefetch.db, state_root)) == expected_state
+    assert counting_db.reads == reads_before_execution
+
+
+def test_stopped_prefetch_still_reads_through(counting_db, state_root):
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        prefetcher = StatePrefetcher(executor)
+        prefetch = prefetcher.prefetch_block(
+            AtomicDB(counting_db), state_root, [FakeTransaction(SENDER, CONTRACT)]
+        )
+        prefetch.stop()
+
+    expected_state = _read_state(AccountDB(AtomicDB(counting_db), state_root))
+    assert _read_state(AccountDB(prefetch.db, state_root)) == expected_state
+
+
+def test_hot_slots_are_learned_from_meta_witness(counting_db, state_root):
+    prefetcher = StatePrefetcher(max_hot_slots_per_account=2)
+    prefetcher.record_meta_witness(
+        MetaWitness(
+            set(),
+            {
+                LISTED: AccountQueryTracker(False, frozenset({5, 6, 7})),
+                SENDER: AccountQueryTracker(False, frozenset()),
+            },
+        )
+    )
+    assert prefetcher.get_hot_slots(LISTED) == {5, 6}
+    assert prefetcher.get_hot_slots(SENDER) == frozenset()
+
+    prefetch = prefetcher.prefetch_block(
+        AtomicDB(counting_db), state_root, [FakeTransaction(SENDER, LISTED)]
+    )
+    reads_before_execution = counting_db.reads
+    account_db = AccountDB(prefetch.db, state_root)
+    assert account_db.get_storage(LISTED, 5) == 5
+    assert account_db.get_storage(LISTED, 6) == 6
+    assert counting_db.reads == reads_before_execution
+
+
+def _meta_witness_for_slots(address, slots):
+    return MetaWitness(set(), {address: AccountQueryTracker(False, frozenset(slots))})
+
+
+def test_hot_slots_are_the_most_accessed_across_blocks():
+    prefetcher = StatePrefetcher(max_hot_slots_per_account=2)
+    for slots in ({1, 50, 60}, {50, 60}, {2, 50}):
+        prefetcher.record_meta_witness(_meta_witness_for_slots(LISTED, slots))
+
+    # not the lowest slots, nor only those of the latest block
+    assert prefetcher.get_hot_slots(LISTED) == {50, 60}
+
+    # slots that stop being accessed cool down
+    for _ in range(3):
+        prefetcher.record_meta_witness(_meta_witness_for_slots(LISTED, {1, 2}))
+    assert prefetcher.get_hot_slots(LISTED) == {1, 2}
+
+
+def test_hot_slot_decay_must_be_a_fraction():
+    with pytest.raises(ValueError):
+        StatePrefetcher(hot_slot_decay=1)